@@ -0,0 +1,98 @@
+"""
+Builds the pre-indexed snapshot of the bundled model cost map in `MODEL_COST_MAP_CACHE_DIR` - loaded on `import litellm`.
+
+`import litellm` writes the snapshot itself on first use - run this ahead of time, e.g. when building a docker image, so the first import is fast too.
+
+python3 ci_cd/build_model_cost_map_snapshot.py              # (re)build the snapshot
+python3 ci_cd/build_model_cost_map_snapshot.py --benchmark  # compare loading the json vs. the snapshot - doesn't write the snapshot
+"""
+
+import argparse
+import gc
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, ".")
+
+from litellm.litellm_core_utils import get_model_cost_map  # noqa: E402
+from litellm.litellm_core_utils.get_model_cost_map import (  # noqa: E402
+    build_model_cost_map_snapshot,
+    build_model_cost_provider_index,
+)
+
+MODEL_COST_MAP_PATH = "litellm/model_prices_and_context_window_backup.json"
+
+
+def get_snapshot_path() -> str:
+    return os.path.join(
+        get_model_cost_map.MODEL_COST_MAP_CACHE_DIR,
+        get_model_cost_map.MODEL_COST_MAP_SNAPSHOT_FILE_NAME,
+    )
+
+
+def _measure(fn, runs: int = 20):
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start_time = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start_time) / runs * 1000, peak_memory / 1024 / 1024
+
+
+def benchmark() -> None:
+    """
+    Benchmarks a snapshot built in a temporary directory - the snapshot in `MODEL_COST_MAP_CACHE_DIR` isn't touched.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "model_cost_map_snapshot.pickle")
+        build_model_cost_map_snapshot(
+            model_cost_map_path=MODEL_COST_MAP_PATH, snapshot_path=snapshot_path
+        )
+
+        def _load_json():
+            with open(MODEL_COST_MAP_PATH, "rb") as f:
+                model_cost_map = json.loads(f.read())
+            return build_model_cost_provider_index(model_cost_map)
+
+        def _load_snapshot():
+            with open(MODEL_COST_MAP_PATH, "rb") as f:
+                hashlib.sha256(f.read()).hexdigest()
+            with open(snapshot_path, "rb") as f:
+                return pickle.load(f)
+
+        for name, fn in (
+            ("json + provider index", _load_json),
+            ("snapshot", _load_snapshot),
+        ):
+            load_time, peak_memory = _measure(fn)
+            print(f"{name:<24} {load_time:8.2f} ms  peak memory {peak_memory:6.1f} MiB")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--benchmark", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark()
+        return 0
+
+    snapshot_path = get_snapshot_path()
+    build_model_cost_map_snapshot(
+        model_cost_map_path=MODEL_COST_MAP_PATH, snapshot_path=snapshot_path
+    )
+    print(f"Built {snapshot_path}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,11 @@ import warnings
 
 warnings.filterwarnings("ignore", message=".*conflict with protected namespace.*")
 ### INIT VARIABLES ####################
+import importlib
+import sys
 import threading
 import os
-from typing import Callable, List, Optional, Dict, Union, Any, Literal, get_args, TYPE_CHECKING
+from typing import Callable, List, Optional, Dict, Union, Any, Literal, get_args, TYPE_CHECKING, Tuple
 from litellm.types.integrations.datadog_llm_obs import DatadogLLMObsInitParams
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.caching.caching import Cache, DualCache, RedisCache, InMemoryCache
@@ -79,6 +81,9 @@ from litellm.types.proxy.management_endpoints.ui_sso import (
 from litellm.types.utils import StandardKeyGenerationConfig, LlmProviders
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.logging_callback_manager import LoggingCallbackManager
+from litellm.litellm_core_utils.logging_payload_size_policy import (
+    LoggingPayloadSizePolicy,
+)
 import httpx
 import dotenv
 from litellm.llms.custom_httpx.async_client_cleanup import register_async_client_cleanup
@@ -171,6 +176,9 @@ pre_call_rules: List[Callable] = []
 post_call_rules: List[Callable] = []
 turn_off_message_logging: Optional[bool] = False
 log_raw_request_response: bool = False
+logging_payload_size_policy: Optional[LoggingPayloadSizePolicy] = (
+    None  # if set, large values (e.g. embeddings, base64 images) in the standard logging payload + original_response are summarized
+)
 redact_messages_in_exceptions: Optional[bool] = False
 redact_user_api_key_info: Optional[bool] = False
 filter_invalid_headers: Optional[bool] = False
@@ -190,6 +198,9 @@ telemetry = True
 max_tokens: int = DEFAULT_MAX_TOKENS  # OpenAI Defaults
 drop_params = bool(os.getenv("LITELLM_DROP_PARAMS", False))
 modify_params = bool(os.getenv("LITELLM_MODIFY_PARAMS", False))
+disable_inline_async_request_setup: bool = (
+    False  # if True, async calls always build the request in the default executor
+)
 retry = True
 ### AUTH ###
 api_key: Optional[str] = None
@@ -384,9 +395,16 @@ _key_management_settings: KeyManagementSettings = KeyManagementSettings()
 #### PII MASKING ####
 output_parse_pii: bool = False
 #############################################
-from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_map
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_model_cost_map,
+    get_model_cost_provider_index,
+    load_local_model_cost_map,
+    refresh_model_cost_map,
+    start_model_cost_map_refresh,
+)
 
-model_cost = get_model_cost_map(url=model_cost_map_url)
+# bundled / cached map - the hosted map is loaded in the background, see `start_model_cost_map_refresh` below
+model_cost = load_local_model_cost_map()
 custom_prompt_dict: Dict[str, dict] = {}
 check_provider_endpoint = False
 
@@ -551,162 +569,125 @@ def is_openai_finetune_model(key: str) -> bool:
     return key.startswith("ft:") and not key.count(":") > 1
 
 
-def add_known_models():
-    for key, value in model_cost.items():
-        if value.get("litellm_provider") == "openai" and not is_openai_finetune_model(
-            key
-        ):
-            open_ai_chat_completion_models.append(key)
-        elif value.get("litellm_provider") == "text-completion-openai":
-            open_ai_text_completion_models.append(key)
-        elif value.get("litellm_provider") == "azure_text":
-            azure_text_models.append(key)
-        elif value.get("litellm_provider") == "cohere":
-            cohere_models.append(key)
-        elif value.get("litellm_provider") == "cohere_chat":
-            cohere_chat_models.append(key)
-        elif value.get("litellm_provider") == "mistral":
-            mistral_chat_models.append(key)
-        elif value.get("litellm_provider") == "anthropic":
-            anthropic_models.append(key)
-        elif value.get("litellm_provider") == "empower":
-            empower_models.append(key)
-        elif value.get("litellm_provider") == "openrouter":
-            openrouter_models.append(key)
-        elif value.get("litellm_provider") == "datarobot":
-            datarobot_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-text-models":
-            vertex_text_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-text-models":
-            vertex_code_text_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-language-models":
-            vertex_language_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-vision-models":
-            vertex_vision_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-chat-models":
-            vertex_chat_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
-            vertex_code_chat_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-embedding-models":
-            vertex_embedding_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-anthropic_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_anthropic_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-llama_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_llama3_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-mistral_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_mistral_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-ai21_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_ai21_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-image-models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_image_models.append(key)
-        elif value.get("litellm_provider") == "ai21":
-            if value.get("mode") == "chat":
+# litellm_provider -> name of the provider model list its models are added to (by `add_known_models`)
+_provider_model_list_names: Dict[str, str] = {
+    "openai": "open_ai_chat_completion_models",
+    "text-completion-openai": "open_ai_text_completion_models",
+    "azure_text": "azure_text_models",
+    "cohere": "cohere_models",
+    "cohere_chat": "cohere_chat_models",
+    "mistral": "mistral_chat_models",
+    "anthropic": "anthropic_models",
+    "empower": "empower_models",
+    "openrouter": "openrouter_models",
+    "datarobot": "datarobot_models",
+    "vertex_ai-text-models": "vertex_text_models",
+    "vertex_ai-code-text-models": "vertex_code_text_models",
+    "vertex_ai-language-models": "vertex_language_models",
+    "vertex_ai-vision-models": "vertex_vision_models",
+    "vertex_ai-chat-models": "vertex_chat_models",
+    "vertex_ai-code-chat-models": "vertex_code_chat_models",
+    "vertex_ai-embedding-models": "vertex_embedding_models",
+    "vertex_ai-anthropic_models": "vertex_anthropic_models",
+    "vertex_ai-llama_models": "vertex_llama3_models",
+    "vertex_ai-mistral_models": "vertex_mistral_models",
+    "vertex_ai-ai21_models": "vertex_ai_ai21_models",
+    "vertex_ai-image-models": "vertex_ai_image_models",
+    "ai21": "ai21_models",
+    "nlp_cloud": "nlp_cloud_models",
+    "aleph_alpha": "aleph_alpha_models",
+    "bedrock": "bedrock_models",
+    "bedrock_converse": "bedrock_converse_models",
+    "deepinfra": "deepinfra_models",
+    "perplexity": "perplexity_models",
+    "watsonx": "watsonx_models",
+    "gemini": "gemini_models",
+    "fireworks_ai": "fireworks_ai_models",
+    "fireworks_ai-embedding-models": "fireworks_ai_embedding_models",
+    "text-completion-codestral": "text_completion_codestral_models",
+    "xai": "xai_models",
+    "deepseek": "deepseek_models",
+    "meta_llama": "llama_models",
+    "nscale": "nscale_models",
+    "azure_ai": "azure_ai_models",
+    "voyage": "voyage_models",
+    "lodash": "lodash_models",
+    "infinity": "infinity_models",
+    "databricks": "databricks_models",
+    "cloudflare": "cloudflare_models",
+    "codestral": "codestral_models",
+    "friendliai": "friendliai_models",
+    "palm": "palm_models",
+    "groq": "groq_models",
+    "azure": "azure_models",
+    "anyscale": "anyscale_models",
+    "cerebras": "cerebras_models",
+    "galadriel": "galadriel_models",
+    "sambanova": "sambanova_models",
+    "novita": "novita_models",
+    "nebius-chat-models": "nebius_models",
+    "nebius-embedding-models": "nebius_embedding_models",
+    "assemblyai": "assemblyai_models",
+    "jina_ai": "jina_ai_models",
+    "snowflake": "snowflake_models",
+    "featherless_ai": "featherless_ai_models",
+    "deepgram": "deepgram_models",
+    "elevenlabs": "elevenlabs_models",
+    "dashscope": "dashscope_models",
+    "moonshot": "moonshot_models",
+    "v0": "v0_models",
+    "morph": "morph_models",
+    "lambda_ai": "lambda_ai_models",
+    "hyperbolic": "hyperbolic_models",
+    "recraft": "recraft_models",
+}
+# providers whose model cost keys are prefixed with "vertex_ai/" - not part of the model name
+_vertex_ai_prefixed_providers = {
+    "vertex_ai-anthropic_models",
+    "vertex_ai-llama_models",
+    "vertex_ai-mistral_models",
+    "vertex_ai-ai21_models",
+    "vertex_ai-image-models",
+}
+
+
+def _is_known_model(litellm_provider: str, key: str) -> bool:
+    if litellm_provider == "openai":
+        return not is_openai_finetune_model(key)
+    elif litellm_provider == "bedrock":
+        return not is_bedrock_pricing_only_model(key)
+    elif litellm_provider == "fireworks_ai":
+        # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
+        return "-to-" not in key and "fireworks-ai-default" not in key
+    elif litellm_provider == "fireworks_ai-embedding-models":
+        # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
+        return "-to-" not in key
+    return True
+
+
+def add_known_models(model_cost_map: Optional[Dict] = None):
+    """
+    Adds the models of `model_cost_map` (default: `litellm.model_cost`) to the provider model lists.
+
+    Single pass over the provider index of the map - each provider's models go to its list in `_provider_model_list_names`.
+    """
+    if model_cost_map is None:
+        model_cost_map = model_cost
+    _globals = globals()
+    for litellm_provider, keys in get_model_cost_provider_index(model_cost_map).items():
+        model_list_name = _provider_model_list_names.get(litellm_provider)
+        if model_list_name is None:
+            continue
+        provider_models: List = _globals[model_list_name]
+        for key in keys:
+            if not _is_known_model(litellm_provider=litellm_provider, key=key):
+                continue
+            if litellm_provider in _vertex_ai_prefixed_providers:
+                key = key.replace("vertex_ai/", "")
+            if litellm_provider == "ai21" and model_cost_map[key].get("mode") == "chat":
                 ai21_chat_models.append(key)
             else:
-                ai21_models.append(key)
-        elif value.get("litellm_provider") == "nlp_cloud":
-            nlp_cloud_models.append(key)
-        elif value.get("litellm_provider") == "aleph_alpha":
-            aleph_alpha_models.append(key)
-        elif value.get(
-            "litellm_provider"
-        ) == "bedrock" and not is_bedrock_pricing_only_model(key):
-            bedrock_models.append(key)
-        elif value.get("litellm_provider") == "bedrock_converse":
-            bedrock_converse_models.append(key)
-        elif value.get("litellm_provider") == "deepinfra":
-            deepinfra_models.append(key)
-        elif value.get("litellm_provider") == "perplexity":
-            perplexity_models.append(key)
-        elif value.get("litellm_provider") == "watsonx":
-            watsonx_models.append(key)
-        elif value.get("litellm_provider") == "gemini":
-            gemini_models.append(key)
-        elif value.get("litellm_provider") == "fireworks_ai":
-            # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
-            if "-to-" not in key and "fireworks-ai-default" not in key:
-                fireworks_ai_models.append(key)
-        elif value.get("litellm_provider") == "fireworks_ai-embedding-models":
-            # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
-            if "-to-" not in key:
-                fireworks_ai_embedding_models.append(key)
-        elif value.get("litellm_provider") == "text-completion-codestral":
-            text_completion_codestral_models.append(key)
-        elif value.get("litellm_provider") == "xai":
-            xai_models.append(key)
-        elif value.get("litellm_provider") == "deepseek":
-            deepseek_models.append(key)
-        elif value.get("litellm_provider") == "meta_llama":
-            llama_models.append(key)
-        elif value.get("litellm_provider") == "nscale":
-            nscale_models.append(key)
-        elif value.get("litellm_provider") == "azure_ai":
-            azure_ai_models.append(key)
-        elif value.get("litellm_provider") == "voyage":
-            voyage_models.append(key)
-        elif value.get("litellm_provider") == "lodash":
-            lodash_models.append(key)
-        elif value.get("litellm_provider") == "infinity":
-            infinity_models.append(key)
-        elif value.get("litellm_provider") == "databricks":
-            databricks_models.append(key)
-        elif value.get("litellm_provider") == "cloudflare":
-            cloudflare_models.append(key)
-        elif value.get("litellm_provider") == "codestral":
-            codestral_models.append(key)
-        elif value.get("litellm_provider") == "friendliai":
-            friendliai_models.append(key)
-        elif value.get("litellm_provider") == "palm":
-            palm_models.append(key)
-        elif value.get("litellm_provider") == "groq":
-            groq_models.append(key)
-        elif value.get("litellm_provider") == "azure":
-            azure_models.append(key)
-        elif value.get("litellm_provider") == "anyscale":
-            anyscale_models.append(key)
-        elif value.get("litellm_provider") == "cerebras":
-            cerebras_models.append(key)
-        elif value.get("litellm_provider") == "galadriel":
-            galadriel_models.append(key)
-        elif value.get("litellm_provider") == "sambanova":
-            sambanova_models.append(key)
-        elif value.get("litellm_provider") == "novita":
-            novita_models.append(key)
-        elif value.get("litellm_provider") == "nebius-chat-models":
-            nebius_models.append(key)
-        elif value.get("litellm_provider") == "nebius-embedding-models":
-            nebius_embedding_models.append(key)
-        elif value.get("litellm_provider") == "assemblyai":
-            assemblyai_models.append(key)
-        elif value.get("litellm_provider") == "jina_ai":
-            jina_ai_models.append(key)
-        elif value.get("litellm_provider") == "snowflake":
-            snowflake_models.append(key)
-        elif value.get("litellm_provider") == "featherless_ai":
-            featherless_ai_models.append(key)
-        elif value.get("litellm_provider") == "deepgram":
-            deepgram_models.append(key)
-        elif value.get("litellm_provider") == "elevenlabs":
-            elevenlabs_models.append(key)
-        elif value.get("litellm_provider") == "dashscope":
-            dashscope_models.append(key)
-        elif value.get("litellm_provider") == "moonshot":
-            moonshot_models.append(key)
-        elif value.get("litellm_provider") == "v0":
-            v0_models.append(key)
-        elif value.get("litellm_provider") == "morph":
-            morph_models.append(key)
-        elif value.get("litellm_provider") == "lambda_ai":
-            lambda_ai_models.append(key)
-        elif value.get("litellm_provider") == "hyperbolic":
-            hyperbolic_models.append(key)
-        elif value.get("litellm_provider") == "recraft":
-            recraft_models.append(key)
+                provider_models.append(key)
 
 
 add_known_models()
@@ -967,234 +948,778 @@ ALL_LITELLM_RESPONSE_TYPES = [
     TextCompletionResponse,
 ]
 
-from .llms.bytez.chat.transformation import BytezChatConfig
-from .llms.custom_llm import CustomLLM
-from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
-from .llms.openai_like.chat.handler import OpenAILikeChatConfig
-from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
-from .llms.galadriel.chat.transformation import GaladrielChatConfig
-from .llms.github.chat.transformation import GithubChatConfig
-from .llms.empower.chat.transformation import EmpowerChatConfig
-from .llms.huggingface.chat.transformation import HuggingFaceChatConfig
-from .llms.huggingface.embedding.transformation import HuggingFaceEmbeddingConfig
-from .llms.oobabooga.chat.transformation import OobaboogaConfig
-from .llms.maritalk import MaritalkConfig
-from .llms.openrouter.chat.transformation import OpenrouterConfig
-from .llms.datarobot.chat.transformation import DataRobotConfig
-from .llms.anthropic.chat.transformation import AnthropicConfig
-from .llms.anthropic.common_utils import AnthropicModelInfo
-from .llms.groq.stt.transformation import GroqSTTConfig
-from .llms.anthropic.completion.transformation import AnthropicTextConfig
-from .llms.triton.completion.transformation import TritonConfig
-from .llms.triton.completion.transformation import TritonGenerateConfig
-from .llms.triton.completion.transformation import TritonInferConfig
-from .llms.triton.embedding.transformation import TritonEmbeddingConfig
-from .llms.huggingface.rerank.transformation import HuggingFaceRerankConfig
-from .llms.databricks.chat.transformation import DatabricksConfig
-from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
-from .llms.predibase.chat.transformation import PredibaseConfig
-from .llms.replicate.chat.transformation import ReplicateConfig
-from .llms.cohere.completion.transformation import CohereTextConfig as CohereConfig
-from .llms.snowflake.chat.transformation import SnowflakeConfig
-from .llms.cohere.rerank.transformation import CohereRerankConfig
-from .llms.cohere.rerank_v2.transformation import CohereRerankV2Config
-from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
-from .llms.infinity.rerank.transformation import InfinityRerankConfig
-from .llms.jina_ai.rerank.transformation import JinaAIRerankConfig
-from .llms.clarifai.chat.transformation import ClarifaiConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig, AI21ChatConfig as AI21Config
-from .llms.meta_llama.chat.transformation import LlamaAPIConfig
-from .llms.anthropic.experimental_pass_through.messages.transformation import (
-    AnthropicMessagesConfig,
-)
-from .llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaude3MessagesConfig,
-)
-from .llms.together_ai.chat import TogetherAIConfig
-from .llms.together_ai.completion.transformation import TogetherAITextCompletionConfig
-from .llms.cloudflare.chat.transformation import CloudflareChatConfig
-from .llms.novita.chat.transformation import NovitaConfig
-from .llms.deprecated_providers.palm import (
-    PalmConfig,
-)  # here to prevent breaking changes
-from .llms.nlp_cloud.chat.handler import NLPCloudConfig
-from .llms.petals.completion.transformation import PetalsConfig
-from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
-from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
-    VertexGeminiConfig,
-    VertexGeminiConfig as VertexAIConfig,
-)
-from .llms.gemini.common_utils import GeminiModelInfo
-from .llms.gemini.chat.transformation import (
-    GoogleAIStudioGeminiConfig,
-    GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
-)
-
-
-from .llms.vertex_ai.vertex_embeddings.transformation import (
-    VertexAITextEmbeddingConfig,
-)
-
-vertexAITextEmbeddingConfig = VertexAITextEmbeddingConfig()
-
-from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
-    VertexAIAnthropicConfig,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
-    VertexAILlama3Config,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
-    VertexAIAi21Config,
-)
-from .llms.ollama.chat.transformation import OllamaChatConfig
-from .llms.ollama.completion.transformation import OllamaConfig
-from .llms.sagemaker.completion.transformation import SagemakerConfig
-from .llms.sagemaker.chat.transformation import SagemakerChatConfig
-from .llms.bedrock.chat.invoke_handler import (
-    AmazonCohereChatConfig,
-    bedrock_tool_name_mappings,
-)
-
-from .llms.bedrock.common_utils import (
-    AmazonBedrockGlobalConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
-    AmazonAI21Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
-    AmazonInvokeNovaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
-    AmazonAnthropicConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaude3Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
-    AmazonCohereConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
-    AmazonLlamaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation import (
-    AmazonDeepSeekR1Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
-    AmazonMistralConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
-    AmazonTitanConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
-    AmazonInvokeConfig,
-)
-
-from .llms.bedrock.image.amazon_stability1_transformation import AmazonStabilityConfig
-from .llms.bedrock.image.amazon_stability3_transformation import AmazonStability3Config
-from .llms.bedrock.image.amazon_nova_canvas_transformation import AmazonNovaCanvasConfig
-from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
-from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
-    AmazonTitanMultimodalEmbeddingG1Config,
-)
-from .llms.bedrock.embed.amazon_titan_v2_transformation import (
-    AmazonTitanV2Config,
-)
-from .llms.cohere.chat.transformation import CohereChatConfig
-from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
-from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
-from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
-from .llms.deepinfra.chat.transformation import DeepInfraConfig
-from .llms.deepgram.audio_transcription.transformation import (
-    DeepgramAudioTranscriptionConfig,
-)
-from .llms.topaz.common_utils import TopazModelInfo
-from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
-from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
-from .llms.groq.chat.transformation import GroqChatConfig
-from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
-from .llms.lodash.embedding.transformation import LodashEmbeddingConfig
-from .llms.infinity.embedding.transformation import InfinityEmbeddingConfig
-from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
-from .llms.mistral.chat.transformation import MistralConfig
-from .llms.openai.responses.transformation import OpenAIResponsesAPIConfig
-from .llms.azure.responses.transformation import AzureOpenAIResponsesAPIConfig
-from .llms.openai.chat.o_series_transformation import (
-    OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
-    OpenAIOSeriesConfig,
-)
-
-from .llms.snowflake.chat.transformation import SnowflakeConfig
-
-openaiOSeriesConfig = OpenAIOSeriesConfig()
-from .llms.openai.chat.gpt_transformation import (
-    OpenAIGPTConfig,
-)
-from .llms.openai.transcriptions.whisper_transformation import (
-    OpenAIWhisperAudioTranscriptionConfig,
-)
-from .llms.openai.transcriptions.gpt_transformation import (
-    OpenAIGPTAudioTranscriptionConfig,
-)
-
-openAIGPTConfig = OpenAIGPTConfig()
-from .llms.openai.chat.gpt_audio_transformation import (
-    OpenAIGPTAudioConfig,
-)
+### PROVIDER CONFIGS ###
+# imported on first access of `litellm.<name>` (see `__getattr__` below) - not on `import litellm`
+_lazy_imports: Dict[str, Tuple[str, str]] = {
+    "BytezChatConfig": (".llms.bytez.chat.transformation", "BytezChatConfig"),
+    "CustomLLM": (".llms.custom_llm", "CustomLLM"),
+    "AmazonConverseConfig": (
+        ".llms.bedrock.chat.converse_transformation",
+        "AmazonConverseConfig",
+    ),
+    "OpenAILikeChatConfig": (".llms.openai_like.chat.handler", "OpenAILikeChatConfig"),
+    "AiohttpOpenAIChatConfig": (
+        ".llms.aiohttp_openai.chat.transformation",
+        "AiohttpOpenAIChatConfig",
+    ),
+    "GaladrielChatConfig": (
+        ".llms.galadriel.chat.transformation",
+        "GaladrielChatConfig",
+    ),
+    "GithubChatConfig": (".llms.github.chat.transformation", "GithubChatConfig"),
+    "EmpowerChatConfig": (".llms.empower.chat.transformation", "EmpowerChatConfig"),
+    "HuggingFaceChatConfig": (
+        ".llms.huggingface.chat.transformation",
+        "HuggingFaceChatConfig",
+    ),
+    "HuggingFaceEmbeddingConfig": (
+        ".llms.huggingface.embedding.transformation",
+        "HuggingFaceEmbeddingConfig",
+    ),
+    "OobaboogaConfig": (".llms.oobabooga.chat.transformation", "OobaboogaConfig"),
+    "MaritalkConfig": (".llms.maritalk", "MaritalkConfig"),
+    "OpenrouterConfig": (".llms.openrouter.chat.transformation", "OpenrouterConfig"),
+    "DataRobotConfig": (".llms.datarobot.chat.transformation", "DataRobotConfig"),
+    "AnthropicConfig": (".llms.anthropic.chat.transformation", "AnthropicConfig"),
+    "AnthropicModelInfo": (".llms.anthropic.common_utils", "AnthropicModelInfo"),
+    "GroqSTTConfig": (".llms.groq.stt.transformation", "GroqSTTConfig"),
+    "AnthropicTextConfig": (
+        ".llms.anthropic.completion.transformation",
+        "AnthropicTextConfig",
+    ),
+    "TritonConfig": (".llms.triton.completion.transformation", "TritonConfig"),
+    "TritonGenerateConfig": (
+        ".llms.triton.completion.transformation",
+        "TritonGenerateConfig",
+    ),
+    "TritonInferConfig": (
+        ".llms.triton.completion.transformation",
+        "TritonInferConfig",
+    ),
+    "TritonEmbeddingConfig": (
+        ".llms.triton.embedding.transformation",
+        "TritonEmbeddingConfig",
+    ),
+    "HuggingFaceRerankConfig": (
+        ".llms.huggingface.rerank.transformation",
+        "HuggingFaceRerankConfig",
+    ),
+    "DatabricksConfig": (".llms.databricks.chat.transformation", "DatabricksConfig"),
+    "DatabricksEmbeddingConfig": (
+        ".llms.databricks.embed.transformation",
+        "DatabricksEmbeddingConfig",
+    ),
+    "PredibaseConfig": (".llms.predibase.chat.transformation", "PredibaseConfig"),
+    "ReplicateConfig": (".llms.replicate.chat.transformation", "ReplicateConfig"),
+    "CohereConfig": (".llms.cohere.completion.transformation", "CohereTextConfig"),
+    "SnowflakeConfig": (".llms.snowflake.chat.transformation", "SnowflakeConfig"),
+    "CohereRerankConfig": (".llms.cohere.rerank.transformation", "CohereRerankConfig"),
+    "CohereRerankV2Config": (
+        ".llms.cohere.rerank_v2.transformation",
+        "CohereRerankV2Config",
+    ),
+    "AzureAIRerankConfig": (
+        ".llms.azure_ai.rerank.transformation",
+        "AzureAIRerankConfig",
+    ),
+    "InfinityRerankConfig": (
+        ".llms.infinity.rerank.transformation",
+        "InfinityRerankConfig",
+    ),
+    "JinaAIRerankConfig": (".llms.jina_ai.rerank.transformation", "JinaAIRerankConfig"),
+    "ClarifaiConfig": (".llms.clarifai.chat.transformation", "ClarifaiConfig"),
+    "AI21ChatConfig": (".llms.ai21.chat.transformation", "AI21ChatConfig"),
+    "AI21Config": (".llms.ai21.chat.transformation", "AI21ChatConfig"),
+    "LlamaAPIConfig": (".llms.meta_llama.chat.transformation", "LlamaAPIConfig"),
+    "AnthropicMessagesConfig": (
+        ".llms.anthropic.experimental_pass_through.messages.transformation",
+        "AnthropicMessagesConfig",
+    ),
+    "AmazonAnthropicClaude3MessagesConfig": (
+        ".llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation",
+        "AmazonAnthropicClaude3MessagesConfig",
+    ),
+    "TogetherAIConfig": (".llms.together_ai.chat", "TogetherAIConfig"),
+    "TogetherAITextCompletionConfig": (
+        ".llms.together_ai.completion.transformation",
+        "TogetherAITextCompletionConfig",
+    ),
+    "CloudflareChatConfig": (
+        ".llms.cloudflare.chat.transformation",
+        "CloudflareChatConfig",
+    ),
+    "NovitaConfig": (".llms.novita.chat.transformation", "NovitaConfig"),
+    "PalmConfig": (".llms.deprecated_providers.palm", "PalmConfig"),
+    "NLPCloudConfig": (".llms.nlp_cloud.chat.handler", "NLPCloudConfig"),
+    "PetalsConfig": (".llms.petals.completion.transformation", "PetalsConfig"),
+    "AlephAlphaConfig": (".llms.deprecated_providers.aleph_alpha", "AlephAlphaConfig"),
+    "VertexGeminiConfig": (
+        ".llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexGeminiConfig",
+    ),
+    "VertexAIConfig": (
+        ".llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexGeminiConfig",
+    ),
+    "GeminiModelInfo": (".llms.gemini.common_utils", "GeminiModelInfo"),
+    "GoogleAIStudioGeminiConfig": (
+        ".llms.gemini.chat.transformation",
+        "GoogleAIStudioGeminiConfig",
+    ),
+    "GeminiConfig": (".llms.gemini.chat.transformation", "GoogleAIStudioGeminiConfig"),
+    "VertexAITextEmbeddingConfig": (
+        ".llms.vertex_ai.vertex_embeddings.transformation",
+        "VertexAITextEmbeddingConfig",
+    ),
+    "VertexAIAnthropicConfig": (
+        ".llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation",
+        "VertexAIAnthropicConfig",
+    ),
+    "VertexAILlama3Config": (
+        ".llms.vertex_ai.vertex_ai_partner_models.llama3.transformation",
+        "VertexAILlama3Config",
+    ),
+    "VertexAIAi21Config": (
+        ".llms.vertex_ai.vertex_ai_partner_models.ai21.transformation",
+        "VertexAIAi21Config",
+    ),
+    "OllamaChatConfig": (".llms.ollama.chat.transformation", "OllamaChatConfig"),
+    "OllamaConfig": (".llms.ollama.completion.transformation", "OllamaConfig"),
+    "SagemakerConfig": (".llms.sagemaker.completion.transformation", "SagemakerConfig"),
+    "SagemakerChatConfig": (
+        ".llms.sagemaker.chat.transformation",
+        "SagemakerChatConfig",
+    ),
+    "AmazonCohereChatConfig": (
+        ".llms.bedrock.chat.invoke_handler",
+        "AmazonCohereChatConfig",
+    ),
+    "bedrock_tool_name_mappings": (
+        ".llms.bedrock.chat.invoke_handler",
+        "bedrock_tool_name_mappings",
+    ),
+    "AmazonBedrockGlobalConfig": (
+        ".llms.bedrock.common_utils",
+        "AmazonBedrockGlobalConfig",
+    ),
+    "AmazonAI21Config": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation",
+        "AmazonAI21Config",
+    ),
+    "AmazonInvokeNovaConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_nova_transformation",
+        "AmazonInvokeNovaConfig",
+    ),
+    "AmazonAnthropicConfig": (
+        ".llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation",
+        "AmazonAnthropicConfig",
+    ),
+    "AmazonAnthropicClaude3Config": (
+        ".llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation",
+        "AmazonAnthropicClaude3Config",
+    ),
+    "AmazonCohereConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation",
+        "AmazonCohereConfig",
+    ),
+    "AmazonLlamaConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_llama_transformation",
+        "AmazonLlamaConfig",
+    ),
+    "AmazonDeepSeekR1Config": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation",
+        "AmazonDeepSeekR1Config",
+    ),
+    "AmazonMistralConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation",
+        "AmazonMistralConfig",
+    ),
+    "AmazonTitanConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_titan_transformation",
+        "AmazonTitanConfig",
+    ),
+    "AmazonInvokeConfig": (
+        ".llms.bedrock.chat.invoke_transformations.base_invoke_transformation",
+        "AmazonInvokeConfig",
+    ),
+    "AmazonStabilityConfig": (
+        ".llms.bedrock.image.amazon_stability1_transformation",
+        "AmazonStabilityConfig",
+    ),
+    "AmazonStability3Config": (
+        ".llms.bedrock.image.amazon_stability3_transformation",
+        "AmazonStability3Config",
+    ),
+    "AmazonNovaCanvasConfig": (
+        ".llms.bedrock.image.amazon_nova_canvas_transformation",
+        "AmazonNovaCanvasConfig",
+    ),
+    "AmazonTitanG1Config": (
+        ".llms.bedrock.embed.amazon_titan_g1_transformation",
+        "AmazonTitanG1Config",
+    ),
+    "AmazonTitanMultimodalEmbeddingG1Config": (
+        ".llms.bedrock.embed.amazon_titan_multimodal_transformation",
+        "AmazonTitanMultimodalEmbeddingG1Config",
+    ),
+    "AmazonTitanV2Config": (
+        ".llms.bedrock.embed.amazon_titan_v2_transformation",
+        "AmazonTitanV2Config",
+    ),
+    "CohereChatConfig": (".llms.cohere.chat.transformation", "CohereChatConfig"),
+    "BedrockCohereEmbeddingConfig": (
+        ".llms.bedrock.embed.cohere_transformation",
+        "BedrockCohereEmbeddingConfig",
+    ),
+    "OpenAIConfig": (".llms.openai.openai", "OpenAIConfig"),
+    "MistralEmbeddingConfig": (".llms.openai.openai", "MistralEmbeddingConfig"),
+    "OpenAIImageVariationConfig": (
+        ".llms.openai.image_variations.transformation",
+        "OpenAIImageVariationConfig",
+    ),
+    "DeepInfraConfig": (".llms.deepinfra.chat.transformation", "DeepInfraConfig"),
+    "DeepgramAudioTranscriptionConfig": (
+        ".llms.deepgram.audio_transcription.transformation",
+        "DeepgramAudioTranscriptionConfig",
+    ),
+    "TopazModelInfo": (".llms.topaz.common_utils", "TopazModelInfo"),
+    "TopazImageVariationConfig": (
+        ".llms.topaz.image_variations.transformation",
+        "TopazImageVariationConfig",
+    ),
+    "OpenAITextCompletionConfig": (
+        ".llms.openai.completion.transformation",
+        "OpenAITextCompletionConfig",
+    ),
+    "GroqChatConfig": (".llms.groq.chat.transformation", "GroqChatConfig"),
+    "VoyageEmbeddingConfig": (
+        ".llms.voyage.embedding.transformation",
+        "VoyageEmbeddingConfig",
+    ),
+    "LodashEmbeddingConfig": (
+        ".llms.lodash.embedding.transformation",
+        "LodashEmbeddingConfig",
+    ),
+    "InfinityEmbeddingConfig": (
+        ".llms.infinity.embedding.transformation",
+        "InfinityEmbeddingConfig",
+    ),
+    "AzureAIStudioConfig": (
+        ".llms.azure_ai.chat.transformation",
+        "AzureAIStudioConfig",
+    ),
+    "MistralConfig": (".llms.mistral.chat.transformation", "MistralConfig"),
+    "OpenAIResponsesAPIConfig": (
+        ".llms.openai.responses.transformation",
+        "OpenAIResponsesAPIConfig",
+    ),
+    "AzureOpenAIResponsesAPIConfig": (
+        ".llms.azure.responses.transformation",
+        "AzureOpenAIResponsesAPIConfig",
+    ),
+    "OpenAIO1Config": (
+        ".llms.openai.chat.o_series_transformation",
+        "OpenAIOSeriesConfig",
+    ),
+    "OpenAIOSeriesConfig": (
+        ".llms.openai.chat.o_series_transformation",
+        "OpenAIOSeriesConfig",
+    ),
+    "OpenAIGPTConfig": (".llms.openai.chat.gpt_transformation", "OpenAIGPTConfig"),
+    "OpenAIWhisperAudioTranscriptionConfig": (
+        ".llms.openai.transcriptions.whisper_transformation",
+        "OpenAIWhisperAudioTranscriptionConfig",
+    ),
+    "OpenAIGPTAudioTranscriptionConfig": (
+        ".llms.openai.transcriptions.gpt_transformation",
+        "OpenAIGPTAudioTranscriptionConfig",
+    ),
+    "OpenAIGPTAudioConfig": (
+        ".llms.openai.chat.gpt_audio_transformation",
+        "OpenAIGPTAudioConfig",
+    ),
+    "NvidiaNimConfig": (".llms.nvidia_nim.chat.transformation", "NvidiaNimConfig"),
+    "NvidiaNimEmbeddingConfig": (".llms.nvidia_nim.embed", "NvidiaNimEmbeddingConfig"),
+    "FeatherlessAIConfig": (
+        ".llms.featherless_ai.chat.transformation",
+        "FeatherlessAIConfig",
+    ),
+    "CerebrasConfig": (".llms.cerebras.chat", "CerebrasConfig"),
+    "SambanovaConfig": (".llms.sambanova.chat", "SambanovaConfig"),
+    "FireworksAIConfig": (
+        ".llms.fireworks_ai.chat.transformation",
+        "FireworksAIConfig",
+    ),
+    "FireworksAITextCompletionConfig": (
+        ".llms.fireworks_ai.completion.transformation",
+        "FireworksAITextCompletionConfig",
+    ),
+    "FireworksAIAudioTranscriptionConfig": (
+        ".llms.fireworks_ai.audio_transcription.transformation",
+        "FireworksAIAudioTranscriptionConfig",
+    ),
+    "FireworksAIEmbeddingConfig": (
+        ".llms.fireworks_ai.embed.fireworks_ai_transformation",
+        "FireworksAIEmbeddingConfig",
+    ),
+    "FriendliaiChatConfig": (
+        ".llms.friendliai.chat.transformation",
+        "FriendliaiChatConfig",
+    ),
+    "JinaAIEmbeddingConfig": (
+        ".llms.jina_ai.embedding.transformation",
+        "JinaAIEmbeddingConfig",
+    ),
+    "XAIChatConfig": (".llms.xai.chat.transformation", "XAIChatConfig"),
+    "XAIModelInfo": (".llms.xai.common_utils", "XAIModelInfo"),
+    "VolcEngineConfig": (".llms.volcengine", "VolcEngineConfig"),
+    "CodestralTextCompletionConfig": (
+        ".llms.codestral.completion.transformation",
+        "CodestralTextCompletionConfig",
+    ),
+    "AzureOpenAIError": (".llms.azure.azure", "AzureOpenAIError"),
+    "AzureOpenAIAssistantsAPIConfig": (
+        ".llms.azure.azure",
+        "AzureOpenAIAssistantsAPIConfig",
+    ),
+    "AzureOpenAIConfig": (".llms.azure.chat.gpt_transformation", "AzureOpenAIConfig"),
+    "AzureOpenAITextConfig": (
+        ".llms.azure.completion.transformation",
+        "AzureOpenAITextConfig",
+    ),
+    "HostedVLLMChatConfig": (
+        ".llms.hosted_vllm.chat.transformation",
+        "HostedVLLMChatConfig",
+    ),
+    "LlamafileChatConfig": (
+        ".llms.llamafile.chat.transformation",
+        "LlamafileChatConfig",
+    ),
+    "LiteLLMProxyChatConfig": (
+        ".llms.litellm_proxy.chat.transformation",
+        "LiteLLMProxyChatConfig",
+    ),
+    "VLLMConfig": (".llms.vllm.completion.transformation", "VLLMConfig"),
+    "DeepSeekChatConfig": (".llms.deepseek.chat.transformation", "DeepSeekChatConfig"),
+    "LMStudioChatConfig": (".llms.lm_studio.chat.transformation", "LMStudioChatConfig"),
+    "LmStudioEmbeddingConfig": (
+        ".llms.lm_studio.embed.transformation",
+        "LmStudioEmbeddingConfig",
+    ),
+    "NscaleConfig": (".llms.nscale.chat.transformation", "NscaleConfig"),
+    "PerplexityChatConfig": (
+        ".llms.perplexity.chat.transformation",
+        "PerplexityChatConfig",
+    ),
+    "AzureOpenAIO1Config": (
+        ".llms.azure.chat.o_series_transformation",
+        "AzureOpenAIO1Config",
+    ),
+    "IBMWatsonXAIConfig": (
+        ".llms.watsonx.completion.transformation",
+        "IBMWatsonXAIConfig",
+    ),
+    "IBMWatsonXChatConfig": (
+        ".llms.watsonx.chat.transformation",
+        "IBMWatsonXChatConfig",
+    ),
+    "IBMWatsonXEmbeddingConfig": (
+        ".llms.watsonx.embed.transformation",
+        "IBMWatsonXEmbeddingConfig",
+    ),
+    "GithubCopilotConfig": (
+        ".llms.github_copilot.chat.transformation",
+        "GithubCopilotConfig",
+    ),
+    "NebiusConfig": (".llms.nebius.chat.transformation", "NebiusConfig"),
+    "DashScopeChatConfig": (
+        ".llms.dashscope.chat.transformation",
+        "DashScopeChatConfig",
+    ),
+    "MoonshotChatConfig": (".llms.moonshot.chat.transformation", "MoonshotChatConfig"),
+    "V0ChatConfig": (".llms.v0.chat.transformation", "V0ChatConfig"),
+    "MorphChatConfig": (".llms.morph.chat.transformation", "MorphChatConfig"),
+    "LambdaAIChatConfig": (".llms.lambda_ai.chat.transformation", "LambdaAIChatConfig"),
+    "HyperbolicChatConfig": (
+        ".llms.hyperbolic.chat.transformation",
+        "HyperbolicChatConfig",
+    ),
+    # provider handlers, previously imported by `litellm.main`
+    "AnthropicChatCompletion": (".llms.anthropic.chat", "AnthropicChatCompletion"),
+    "AzureAIEmbedding": (".llms.azure_ai.embed", "AzureAIEmbedding"),
+    "AzureAudioTranscription": (
+        ".llms.azure.audio_transcriptions",
+        "AzureAudioTranscription",
+    ),
+    "AzureChatCompletion": (".llms.azure.azure", "AzureChatCompletion"),
+    "AzureOpenAIO1ChatCompletion": (
+        ".llms.azure.chat.o_series_handler",
+        "AzureOpenAIO1ChatCompletion",
+    ),
+    "AzureTextCompletion": (".llms.azure.completion.handler", "AzureTextCompletion"),
+    "BaseLLMAIOHTTPHandler": (
+        ".llms.custom_httpx.aiohttp_handler",
+        "BaseLLMAIOHTTPHandler",
+    ),
+    "BaseLLMHTTPHandler": (".llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"),
+    "BedrockConverseLLM": (".llms.bedrock.chat", "BedrockConverseLLM"),
+    "BedrockEmbedding": (".llms.bedrock.embed.embedding", "BedrockEmbedding"),
+    "BedrockImageGeneration": (
+        ".llms.bedrock.image.image_handler",
+        "BedrockImageGeneration",
+    ),
+    "BedrockLLM": (".llms.bedrock.chat", "BedrockLLM"),
+    "CodestralTextCompletion": (
+        ".llms.codestral.completion.handler",
+        "CodestralTextCompletion",
+    ),
+    "DatabricksEmbeddingHandler": (
+        ".llms.databricks.embed.handler",
+        "DatabricksEmbeddingHandler",
+    ),
+    "GroqChatCompletion": (".llms.groq.chat.handler", "GroqChatCompletion"),
+    "HuggingFaceEmbedding": (
+        ".llms.huggingface.embedding.handler",
+        "HuggingFaceEmbedding",
+    ),
+    "OpenAIAudioTranscription": (
+        ".llms.openai.transcriptions.handler",
+        "OpenAIAudioTranscription",
+    ),
+    "OpenAIChatCompletion": (".llms.openai.openai", "OpenAIChatCompletion"),
+    "OpenAIImageVariationsHandler": (
+        ".llms.openai.image_variations.handler",
+        "OpenAIImageVariationsHandler",
+    ),
+    "OpenAILikeChatHandler": (
+        ".llms.openai_like.chat.handler",
+        "OpenAILikeChatHandler",
+    ),
+    "OpenAILikeEmbeddingHandler": (
+        ".llms.openai_like.embedding.handler",
+        "OpenAILikeEmbeddingHandler",
+    ),
+    "OpenAITextCompletion": (".llms.openai.completion.handler", "OpenAITextCompletion"),
+    "PredibaseChatCompletion": (
+        ".llms.predibase.chat.handler",
+        "PredibaseChatCompletion",
+    ),
+    "SagemakerChatHandler": (".llms.sagemaker.chat.handler", "SagemakerChatHandler"),
+    "SagemakerLLM": (".llms.sagemaker.completion.handler", "SagemakerLLM"),
+    "VertexAIModelGardenModels": (
+        ".llms.vertex_ai.vertex_model_garden.main",
+        "VertexAIModelGardenModels",
+    ),
+    "VertexAIPartnerModels": (
+        ".llms.vertex_ai.vertex_ai_partner_models.main",
+        "VertexAIPartnerModels",
+    ),
+    "VertexEmbedding": (
+        ".llms.vertex_ai.vertex_embeddings.embedding_handler",
+        "VertexEmbedding",
+    ),
+    "VertexLLM": (
+        ".llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexLLM",
+    ),
+    "WatsonXChatHandler": (".llms.watsonx.chat.handler", "WatsonXChatHandler"),
+    "run_server": (".proxy.proxy_cli", "run_server"),
+}
+# module level config instances, created on first access
+_lazy_instances: Dict[str, str] = {
+    "vertexAITextEmbeddingConfig": "VertexAITextEmbeddingConfig",
+    "openaiOSeriesConfig": "OpenAIOSeriesConfig",
+    "openAIGPTConfig": "OpenAIGPTConfig",
+    "openAIGPTAudioConfig": "OpenAIGPTAudioConfig",
+    "nvidiaNimConfig": "NvidiaNimConfig",
+    "nvidiaNimEmbeddingConfig": "NvidiaNimEmbeddingConfig",
+}
 
-openAIGPTAudioConfig = OpenAIGPTAudioConfig()
+if TYPE_CHECKING:
+    from .llms.bytez.chat.transformation import BytezChatConfig
+    from .llms.custom_llm import CustomLLM
+    from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
+    from .llms.openai_like.chat.handler import OpenAILikeChatConfig
+    from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
+    from .llms.galadriel.chat.transformation import GaladrielChatConfig
+    from .llms.github.chat.transformation import GithubChatConfig
+    from .llms.empower.chat.transformation import EmpowerChatConfig
+    from .llms.huggingface.chat.transformation import HuggingFaceChatConfig
+    from .llms.huggingface.embedding.transformation import HuggingFaceEmbeddingConfig
+    from .llms.oobabooga.chat.transformation import OobaboogaConfig
+    from .llms.maritalk import MaritalkConfig
+    from .llms.openrouter.chat.transformation import OpenrouterConfig
+    from .llms.datarobot.chat.transformation import DataRobotConfig
+    from .llms.anthropic.chat.transformation import AnthropicConfig
+    from .llms.anthropic.common_utils import AnthropicModelInfo
+    from .llms.groq.stt.transformation import GroqSTTConfig
+    from .llms.anthropic.completion.transformation import AnthropicTextConfig
+    from .llms.triton.completion.transformation import TritonConfig
+    from .llms.triton.completion.transformation import TritonGenerateConfig
+    from .llms.triton.completion.transformation import TritonInferConfig
+    from .llms.triton.embedding.transformation import TritonEmbeddingConfig
+    from .llms.huggingface.rerank.transformation import HuggingFaceRerankConfig
+    from .llms.databricks.chat.transformation import DatabricksConfig
+    from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
+    from .llms.predibase.chat.transformation import PredibaseConfig
+    from .llms.replicate.chat.transformation import ReplicateConfig
+    from .llms.cohere.completion.transformation import CohereTextConfig as CohereConfig
+    from .llms.snowflake.chat.transformation import SnowflakeConfig
+    from .llms.cohere.rerank.transformation import CohereRerankConfig
+    from .llms.cohere.rerank_v2.transformation import CohereRerankV2Config
+    from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
+    from .llms.infinity.rerank.transformation import InfinityRerankConfig
+    from .llms.jina_ai.rerank.transformation import JinaAIRerankConfig
+    from .llms.clarifai.chat.transformation import ClarifaiConfig
+    from .llms.ai21.chat.transformation import (
+        AI21ChatConfig,
+        AI21ChatConfig as AI21Config,
+    )
+    from .llms.meta_llama.chat.transformation import LlamaAPIConfig
+    from .llms.anthropic.experimental_pass_through.messages.transformation import (
+        AnthropicMessagesConfig,
+    )
+    from .llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaude3MessagesConfig,
+    )
+    from .llms.together_ai.chat import TogetherAIConfig
+    from .llms.together_ai.completion.transformation import (
+        TogetherAITextCompletionConfig,
+    )
+    from .llms.cloudflare.chat.transformation import CloudflareChatConfig
+    from .llms.novita.chat.transformation import NovitaConfig
+    from .llms.deprecated_providers.palm import (
+        PalmConfig,
+    )  # here to prevent breaking changes
+    from .llms.nlp_cloud.chat.handler import NLPCloudConfig
+    from .llms.petals.completion.transformation import PetalsConfig
+    from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
+    from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
+        VertexGeminiConfig,
+        VertexGeminiConfig as VertexAIConfig,
+    )
+    from .llms.gemini.common_utils import GeminiModelInfo
+    from .llms.gemini.chat.transformation import (
+        GoogleAIStudioGeminiConfig,
+        GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
+    )
+    from .llms.vertex_ai.vertex_embeddings.transformation import (
+        VertexAITextEmbeddingConfig,
+    )
+
+    vertexAITextEmbeddingConfig = VertexAITextEmbeddingConfig()
+    from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
+        VertexAIAnthropicConfig,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
+        VertexAILlama3Config,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
+        VertexAIAi21Config,
+    )
+    from .llms.ollama.chat.transformation import OllamaChatConfig
+    from .llms.ollama.completion.transformation import OllamaConfig
+    from .llms.sagemaker.completion.transformation import SagemakerConfig
+    from .llms.sagemaker.chat.transformation import SagemakerChatConfig
+    from .llms.bedrock.chat.invoke_handler import (
+        AmazonCohereChatConfig,
+        bedrock_tool_name_mappings,
+    )
+    from .llms.bedrock.common_utils import (
+        AmazonBedrockGlobalConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
+        AmazonAI21Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
+        AmazonInvokeNovaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
+        AmazonAnthropicConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaude3Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
+        AmazonCohereConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
+        AmazonLlamaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation import (
+        AmazonDeepSeekR1Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
+        AmazonMistralConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
+        AmazonTitanConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
+        AmazonInvokeConfig,
+    )
+    from .llms.bedrock.image.amazon_stability1_transformation import (
+        AmazonStabilityConfig,
+    )
+    from .llms.bedrock.image.amazon_stability3_transformation import (
+        AmazonStability3Config,
+    )
+    from .llms.bedrock.image.amazon_nova_canvas_transformation import (
+        AmazonNovaCanvasConfig,
+    )
+    from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
+    from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
+        AmazonTitanMultimodalEmbeddingG1Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_v2_transformation import (
+        AmazonTitanV2Config,
+    )
+    from .llms.cohere.chat.transformation import CohereChatConfig
+    from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
+    from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
+    from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
+    from .llms.deepinfra.chat.transformation import DeepInfraConfig
+    from .llms.deepgram.audio_transcription.transformation import (
+        DeepgramAudioTranscriptionConfig,
+    )
+    from .llms.topaz.common_utils import TopazModelInfo
+    from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
+    from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
+    from .llms.groq.chat.transformation import GroqChatConfig
+    from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
+    from .llms.lodash.embedding.transformation import LodashEmbeddingConfig
+    from .llms.infinity.embedding.transformation import InfinityEmbeddingConfig
+    from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
+    from .llms.mistral.chat.transformation import MistralConfig
+    from .llms.openai.responses.transformation import OpenAIResponsesAPIConfig
+    from .llms.azure.responses.transformation import AzureOpenAIResponsesAPIConfig
+    from .llms.openai.chat.o_series_transformation import (
+        OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
+        OpenAIOSeriesConfig,
+    )
+    from .llms.snowflake.chat.transformation import SnowflakeConfig
+
+    openaiOSeriesConfig = OpenAIOSeriesConfig()
+    from .llms.openai.chat.gpt_transformation import (
+        OpenAIGPTConfig,
+    )
+    from .llms.openai.transcriptions.whisper_transformation import (
+        OpenAIWhisperAudioTranscriptionConfig,
+    )
+    from .llms.openai.transcriptions.gpt_transformation import (
+        OpenAIGPTAudioTranscriptionConfig,
+    )
+
+    openAIGPTConfig = OpenAIGPTConfig()
+    from .llms.openai.chat.gpt_audio_transformation import (
+        OpenAIGPTAudioConfig,
+    )
+
+    openAIGPTAudioConfig = OpenAIGPTAudioConfig()
+    from .llms.nvidia_nim.chat.transformation import NvidiaNimConfig
+    from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
+
+    nvidiaNimConfig = NvidiaNimConfig()
+    nvidiaNimEmbeddingConfig = NvidiaNimEmbeddingConfig()
+    from .llms.featherless_ai.chat.transformation import FeatherlessAIConfig
+    from .llms.cerebras.chat import CerebrasConfig
+    from .llms.sambanova.chat import SambanovaConfig
+    from .llms.ai21.chat.transformation import AI21ChatConfig
+    from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
+    from .llms.fireworks_ai.completion.transformation import (
+        FireworksAITextCompletionConfig,
+    )
+    from .llms.fireworks_ai.audio_transcription.transformation import (
+        FireworksAIAudioTranscriptionConfig,
+    )
+    from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
+        FireworksAIEmbeddingConfig,
+    )
+    from .llms.friendliai.chat.transformation import FriendliaiChatConfig
+    from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
+    from .llms.xai.chat.transformation import XAIChatConfig
+    from .llms.xai.common_utils import XAIModelInfo
+    from .llms.volcengine import VolcEngineConfig
+    from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
+    from .llms.azure.azure import (
+        AzureOpenAIError,
+        AzureOpenAIAssistantsAPIConfig,
+    )
+    from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
+    from .llms.azure.completion.transformation import AzureOpenAITextConfig
+    from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
+    from .llms.llamafile.chat.transformation import LlamafileChatConfig
+    from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
+    from .llms.vllm.completion.transformation import VLLMConfig
+    from .llms.deepseek.chat.transformation import DeepSeekChatConfig
+    from .llms.lm_studio.chat.transformation import LMStudioChatConfig
+    from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
+    from .llms.nscale.chat.transformation import NscaleConfig
+    from .llms.perplexity.chat.transformation import PerplexityChatConfig
+    from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
+    from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
+    from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
+    from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
+    from .llms.github_copilot.chat.transformation import GithubCopilotConfig
+    from .llms.nebius.chat.transformation import NebiusConfig
+    from .llms.dashscope.chat.transformation import DashScopeChatConfig
+    from .llms.moonshot.chat.transformation import MoonshotChatConfig
+    from .llms.v0.chat.transformation import V0ChatConfig
+    from .llms.morph.chat.transformation import MorphChatConfig
+    from .llms.lambda_ai.chat.transformation import LambdaAIChatConfig
+    from .llms.hyperbolic.chat.transformation import HyperbolicChatConfig
+    from .llms.anthropic.chat import AnthropicChatCompletion
+    from .llms.azure_ai.embed import AzureAIEmbedding
+    from .llms.azure.audio_transcriptions import AzureAudioTranscription
+    from .llms.azure.azure import AzureChatCompletion
+    from .llms.azure.chat.o_series_handler import AzureOpenAIO1ChatCompletion
+    from .llms.azure.completion.handler import AzureTextCompletion
+    from .llms.custom_httpx.aiohttp_handler import BaseLLMAIOHTTPHandler
+    from .llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
+    from .llms.bedrock.chat import BedrockConverseLLM
+    from .llms.bedrock.embed.embedding import BedrockEmbedding
+    from .llms.bedrock.image.image_handler import BedrockImageGeneration
+    from .llms.bedrock.chat import BedrockLLM
+    from .llms.codestral.completion.handler import CodestralTextCompletion
+    from .llms.databricks.embed.handler import DatabricksEmbeddingHandler
+    from .llms.groq.chat.handler import GroqChatCompletion
+    from .llms.huggingface.embedding.handler import HuggingFaceEmbedding
+    from .llms.openai.transcriptions.handler import OpenAIAudioTranscription
+    from .llms.openai.openai import OpenAIChatCompletion
+    from .llms.openai.image_variations.handler import OpenAIImageVariationsHandler
+    from .llms.openai_like.chat.handler import OpenAILikeChatHandler
+    from .llms.openai_like.embedding.handler import OpenAILikeEmbeddingHandler
+    from .llms.openai.completion.handler import OpenAITextCompletion
+    from .llms.predibase.chat.handler import PredibaseChatCompletion
+    from .llms.sagemaker.chat.handler import SagemakerChatHandler
+    from .llms.sagemaker.completion.handler import SagemakerLLM
+    from .llms.vertex_ai.vertex_model_garden.main import VertexAIModelGardenModels
+    from .llms.vertex_ai.vertex_ai_partner_models.main import VertexAIPartnerModels
+    from .llms.vertex_ai.vertex_embeddings.embedding_handler import VertexEmbedding
+    from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import VertexLLM
+    from .llms.watsonx.chat.handler import WatsonXChatHandler
+    from .proxy.proxy_cli import run_server
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the provider configs in `_lazy_imports` / creates the instances in `_lazy_instances` on first access.
+    """
+    if name in _lazy_imports:
+        module_name, attr_name = _lazy_imports[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    elif name in _lazy_instances:
+        value = getattr(sys.modules[__name__], _lazy_instances[name])()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache it - later accesses don't go through `__getattr__`
+    return globals().setdefault(name, value)
 
-from .llms.nvidia_nim.chat.transformation import NvidiaNimConfig
-from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
 
-nvidiaNimConfig = NvidiaNimConfig()
-nvidiaNimEmbeddingConfig = NvidiaNimEmbeddingConfig()
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_imports) | set(_lazy_instances))
 
-from .llms.featherless_ai.chat.transformation import FeatherlessAIConfig
-from .llms.cerebras.chat import CerebrasConfig
-from .llms.sambanova.chat import SambanovaConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig
-from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
-from .llms.fireworks_ai.completion.transformation import FireworksAITextCompletionConfig
-from .llms.fireworks_ai.audio_transcription.transformation import (
-    FireworksAIAudioTranscriptionConfig,
-)
-from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
-    FireworksAIEmbeddingConfig,
-)
-from .llms.friendliai.chat.transformation import FriendliaiChatConfig
-from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
-from .llms.xai.chat.transformation import XAIChatConfig
-from .llms.xai.common_utils import XAIModelInfo
-from .llms.volcengine import VolcEngineConfig
-from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
-from .llms.azure.azure import (
-    AzureOpenAIError,
-    AzureOpenAIAssistantsAPIConfig,
-)
 
-from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
-from .llms.azure.completion.transformation import AzureOpenAITextConfig
-from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
-from .llms.llamafile.chat.transformation import LlamafileChatConfig
-from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
-from .llms.vllm.completion.transformation import VLLMConfig
-from .llms.deepseek.chat.transformation import DeepSeekChatConfig
-from .llms.lm_studio.chat.transformation import LMStudioChatConfig
-from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
-from .llms.nscale.chat.transformation import NscaleConfig
-from .llms.perplexity.chat.transformation import PerplexityChatConfig
-from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
-from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
-from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
-from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
-from .llms.github_copilot.chat.transformation import GithubCopilotConfig
-from .llms.nebius.chat.transformation import NebiusConfig
-from .llms.dashscope.chat.transformation import DashScopeChatConfig
-from .llms.moonshot.chat.transformation import MoonshotChatConfig
-from .llms.v0.chat.transformation import V0ChatConfig
-from .llms.morph.chat.transformation import MorphChatConfig
-from .llms.lambda_ai.chat.transformation import LambdaAIChatConfig
-from .llms.hyperbolic.chat.transformation import HyperbolicChatConfig
 from .main import *  # type: ignore
 from .integrations import *
 from .llms.custom_httpx.async_client_cleanup import close_litellm_async_clients
@@ -1221,7 +1746,6 @@ from .exceptions import (
     MockException,
 )
 from .budget_manager import BudgetManager
-from .proxy.proxy_cli import run_server
 from .router import Router
 from .assistants.main import *
 from .batches.main import *
@@ -1236,6 +1760,7 @@ from .fine_tuning.main import *
 from .files.main import *
 from .scheduler import *
 from .cost_calculator import response_cost_calculator, cost_per_token
+from .litellm_core_utils.llm_cost_calc.bulk_cost import bulk_cost_per_token
 
 ### ADAPTERS ###
 from .types.adapter import AdapterItem
@@ -1263,3 +1788,7 @@ global_disable_no_log_param: bool = False
 
 ### PASSTHROUGH ###
 from .passthrough import allm_passthrough_route, llm_passthrough_route
+
+### MODEL COST MAP ###
+# fetch the hosted model cost map without blocking the import
+start_model_cost_map_refresh()
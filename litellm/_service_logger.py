@@ -6,9 +6,6 @@ import litellm
 from litellm._logging import verbose_logger
 
 from .integrations.custom_logger import CustomLogger
-from .integrations.datadog.datadog import DataDogLogger
-from .integrations.opentelemetry import OpenTelemetry
-from .integrations.prometheus_services import PrometheusServicesLogger
 from .types.services import ServiceLoggerPayload, ServiceTypes
 
 if TYPE_CHECKING:
@@ -16,6 +13,8 @@ if TYPE_CHECKING:
 
     from litellm.proxy._types import UserAPIKeyAuth
 
+    from .integrations.opentelemetry import OpenTelemetry
+
     Span = Union[_Span, Any]
     OTELClass = OpenTelemetry
 else:
@@ -36,6 +35,10 @@ class ServiceLogging(CustomLogger):
         self.mock_testing_sync_failure_hook = 0
         self.mock_testing_async_failure_hook = 0
         if "prometheus_system" in litellm.service_callback:
+            from litellm.integrations.prometheus_services import (
+                PrometheusServicesLogger,
+            )
+
             self.prometheusServicesLogger = PrometheusServicesLogger()
 
     def service_success_hook(
@@ -130,6 +133,9 @@ class ServiceLogging(CustomLogger):
         )
 
         for callback in litellm.service_callback:
+            from litellm.integrations.datadog.datadog import DataDogLogger
+            from litellm.integrations.opentelemetry import OpenTelemetry
+
             if callback == "prometheus_system":
                 await self.init_prometheus_services_logger_if_none()
                 await self.prometheusServicesLogger.async_service_success_hook(
@@ -167,6 +173,8 @@ class ServiceLogging(CustomLogger):
         initializes prometheusServicesLogger if it is None or no attribute exists on ServiceLogging Object
 
         """
+        from litellm.integrations.prometheus_services import PrometheusServicesLogger
+
         if not hasattr(self, "prometheusServicesLogger"):
             self.prometheusServicesLogger = PrometheusServicesLogger()
         elif self.prometheusServicesLogger is None:
@@ -190,6 +198,7 @@ class ServiceLogging(CustomLogger):
         initializes otel_logger if it is None or no attribute exists on ServiceLogging Object
 
         """
+        from litellm.integrations.opentelemetry import OpenTelemetry
         from litellm.proxy.proxy_server import open_telemetry_logger
 
         if not hasattr(self, "otel_logger"):
@@ -236,6 +245,9 @@ class ServiceLogging(CustomLogger):
         )
 
         for callback in litellm.service_callback:
+            from litellm.integrations.datadog.datadog import DataDogLogger
+            from litellm.integrations.opentelemetry import OpenTelemetry
+
             if callback == "prometheus_system":
                 await self.init_prometheus_services_logger_if_none()
                 await self.prometheusServicesLogger.async_service_failure_hook(
@@ -21,15 +21,18 @@ from litellm.utils import (
     supports_httpx_timeout,
 )
 
-from ..llms.azure.assistants import AzureAssistantsAPI
-from ..llms.openai.openai import OpenAIAssistantsAPI
+from ..litellm_core_utils.lazy_loading import lazy_instance
 from ..types.llms.openai import *
 from ..types.router import *
 from .utils import get_optional_params_add_message
 
 ####### ENVIRONMENT VARIABLES ###################
-openai_assistants_api = OpenAIAssistantsAPI()
-azure_assistants_api = AzureAssistantsAPI()
+openai_assistants_api = lazy_instance(
+    "litellm.llms.openai.openai", "OpenAIAssistantsAPI"
+)
+azure_assistants_api = lazy_instance(
+    "litellm.llms.azure.assistants", "AzureAssistantsAPI"
+)
 
 ### ASSISTANTS ###
 
@@ -5,7 +5,9 @@ import litellm
 from litellm._logging import print_verbose
 from litellm.utils import get_optional_params
 
-from ..llms.vllm.completion import handler as vllm_handler
+from ..litellm_core_utils.lazy_loading import lazy_module
+
+vllm_handler = lazy_module("litellm.llms.vllm.completion.handler")
 
 
 def batch_completion(
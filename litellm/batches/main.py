@@ -19,11 +19,8 @@ from typing import Any, Coroutine, Dict, Literal, Optional, Union
 import httpx
 
 import litellm
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.llms.azure.batches.handler import AzureBatchesAPI
-from litellm.llms.openai.openai import OpenAIBatchesAPI
-from litellm.llms.vertex_ai.batches.handler import VertexAIBatchPrediction
-from litellm.llms.anthropic.batches.handler import AnthropicBatchesAPI
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.llms.openai import (
     Batch,
@@ -36,10 +33,20 @@ from litellm.types.utils import LiteLLMBatch
 from litellm.utils import client, get_litellm_params, supports_httpx_timeout
 
 ####### ENVIRONMENT VARIABLES ###################
-openai_batches_instance = OpenAIBatchesAPI()
-azure_batches_instance = AzureBatchesAPI()
-vertex_ai_batches_instance = VertexAIBatchPrediction(gcs_bucket_name="")
-anthropic_batches_instance = AnthropicBatchesAPI()
+openai_batches_instance = lazy_instance(
+    "litellm.llms.openai.openai", "OpenAIBatchesAPI"
+)
+azure_batches_instance = lazy_instance(
+    "litellm.llms.azure.batches.handler", "AzureBatchesAPI"
+)
+vertex_ai_batches_instance = lazy_instance(
+    "litellm.llms.vertex_ai.batches.handler",
+    "VertexAIBatchPrediction",
+    gcs_bucket_name="",
+)
+anthropic_batches_instance = lazy_instance(
+    "litellm.llms.anthropic.batches.handler", "AnthropicBatchesAPI"
+)
 #################################################
 
 
@@ -0,0 +1,204 @@
+"""
+Replays a cached chat completion as a stream.
+
+When a streamed response is added to the cache, the length of each streamed content / reasoning
+delta is stored next to it (`CachedStreamChunkBoundaries`). On a cache hit with `stream=True`,
+`CachedStreamReplay` splits the cached message at those boundaries, so clients see the same
+chunking as the original stream.
+
+`CustomStreamWrapper` passes replayed chunks straight through (no provider chunk parsing), and the
+proxy can send the pre-serialized `sse_frames` as-is.
+
+Pacing between chunks is controlled by `CACHED_STREAMING_REPLAY_CHUNK_DELAY` (default: no delay),
+or per request via `cache={"stream-chunk-delay": <seconds>}`.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from litellm.types.caching import CachedStreamChunkBoundaries
+from litellm.types.utils import ModelResponseStream, Usage
+
+# message fields split at the recorded chunk boundaries, in the order they are streamed
+_CHUNKED_MESSAGE_FIELDS = ("reasoning_content", "content")
+
+# message fields replayed in a single chunk
+_SINGLE_CHUNK_MESSAGE_FIELDS = (
+    "tool_calls",
+    "function_call",
+    "thinking_blocks",
+    "audio",
+    "annotations",
+    "provider_specific_fields",
+)
+
+
+class CachedStreamReplay:
+    def __init__(
+        self,
+        response_object: dict,
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None,
+        chunk_delay: float = 0.0,
+    ):
+        self.response_object = response_object
+        self.stream_chunk_boundaries: CachedStreamChunkBoundaries = (
+            stream_chunk_boundaries or {}
+        )
+        self.chunk_delay = chunk_delay
+        self._chunk_dicts: Optional[List[dict]] = None
+        self._sse_frames: Optional[List[str]] = None
+        self._index = 0
+
+    @staticmethod
+    def can_replay(response_object: Any) -> bool:
+        """
+        Only single-choice chat completions are replayed - everything else uses `convert_to_streaming_response`.
+        """
+        if not isinstance(response_object, dict):
+            return False
+        choices = response_object.get("choices")
+        return (
+            isinstance(choices, list)
+            and len(choices) == 1
+            and isinstance(choices[0], dict)
+            and isinstance(choices[0].get("message"), dict)
+        )
+
+    @property
+    def chunk_dicts(self) -> List[dict]:
+        """
+        The replayed chunks, in the OpenAI `chat.completion.chunk` format (without usage).
+        """
+        if self._chunk_dicts is None:
+            self._chunk_dicts = self._build_chunk_dicts()
+        return self._chunk_dicts
+
+    @property
+    def sse_frames(self) -> List[str]:
+        """
+        Pre-serialized `data: {...}\\n\\n` frames - one per chunk, `[DONE]` not included.
+        """
+        if self._sse_frames is None:
+            self._sse_frames = [
+                "data: {}\n\n".format(json.dumps(chunk_dict, separators=(",", ":")))
+                for chunk_dict in self.chunk_dicts
+            ]
+        return self._sse_frames
+
+    def __len__(self) -> int:
+        return len(self.chunk_dicts)
+
+    # Sync iterator
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> ModelResponseStream:
+        if self._index >= len(self.chunk_dicts):
+            raise StopIteration
+        if self._index > 0 and self.chunk_delay > 0:
+            time.sleep(self.chunk_delay)
+        return self._next_chunk()
+
+    # Async iterator
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> ModelResponseStream:
+        if self._index >= len(self.chunk_dicts):
+            raise StopAsyncIteration
+        if self._index > 0 and self.chunk_delay > 0:
+            await asyncio.sleep(self.chunk_delay)
+        return self._next_chunk()
+
+    def _next_chunk(self) -> ModelResponseStream:
+        chunk_dict = self.chunk_dicts[self._index]
+        self._index += 1
+        chunk = ModelResponseStream(**chunk_dict)
+        usage = self.response_object.get("usage")
+        if self._index == len(self.chunk_dicts) and isinstance(usage, dict):
+            # used for logging / cost tracking - `CustomStreamWrapper` removes it from the returned chunk
+            setattr(chunk, "usage", Usage(**usage))
+        return chunk
+
+    def _build_chunk_dicts(self) -> List[dict]:
+        response = self.response_object
+        choice = response["choices"][0]
+        message: Dict[str, Any] = choice["message"]
+
+        base_chunk: Dict[str, Any] = {
+            "id": response.get("id"),
+            "object": "chat.completion.chunk",
+            "created": response.get("created"),
+            "model": response.get("model"),
+        }
+        if response.get("system_fingerprint") is not None:
+            base_chunk["system_fingerprint"] = response["system_fingerprint"]
+
+        deltas: List[Dict[str, Any]] = []
+        for field in _CHUNKED_MESSAGE_FIELDS:
+            value = message.get(field)
+            if not value or not isinstance(value, str):
+                continue
+            for piece in _split_at_boundaries(
+                value, self.stream_chunk_boundaries.get(field)
+            ):
+                deltas.append({field: piece})
+
+        single_chunk_delta: Dict[str, Any] = {}
+        for field in _SINGLE_CHUNK_MESSAGE_FIELDS:
+            value = message.get(field)
+            if value is None:
+                continue
+            if field == "tool_calls" and isinstance(value, list):
+                value = [
+                    {**tool_call, "index": tool_call.get("index", index)}
+                    for index, tool_call in enumerate(value)
+                ]
+            single_chunk_delta[field] = value
+        if single_chunk_delta:
+            deltas.append(single_chunk_delta)
+
+        if not deltas:
+            deltas.append({"content": ""})
+        deltas[0] = {"role": message.get("role") or "assistant", **deltas[0]}
+
+        chunk_dicts = [
+            {**base_chunk, "choices": [{"index": 0, "delta": delta}]}
+            for delta in deltas
+        ]
+        chunk_dicts.append(
+            {
+                **base_chunk,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {},
+                        "finish_reason": choice.get("finish_reason") or "stop",
+                    }
+                ],
+            }
+        )
+        return chunk_dicts
+
+
+def _split_at_boundaries(value: str, lengths: Optional[List[int]]) -> List[str]:
+    """
+    Split `value` into pieces of the given lengths. Anything left over is returned as a final piece.
+    """
+    if not lengths:
+        return [value]
+    pieces: List[str] = []
+    start = 0
+    value_length = len(value)
+    for length in lengths:
+        if start >= value_length:
+            break
+        if length <= 0:
+            continue
+        pieces.append(value[start : start + length])
+        start += length
+    if start < value_length:
+        pieces.append(value[start:])
+    return pieces
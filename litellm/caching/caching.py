@@ -453,6 +453,17 @@ class Cache:
                     )  # Convert string to dictionary
             except Exception:
                 cached_response = ast.literal_eval(cached_response)  # type: ignore
+            if (
+                isinstance(cached_response, dict)
+                and cached_result.get("stream_chunk_boundaries") is not None
+            ):
+                # popped off again in `LLMCachingHandler`, used to replay streaming cache hits
+                cached_response = {
+                    **cached_response,
+                    CACHED_STREAM_CHUNK_BOUNDARIES_KEY: cached_result[
+                        "stream_chunk_boundaries"
+                    ],
+                }
             return cached_response
         return cached_result
 
@@ -525,6 +536,7 @@ class Cache:
         Common implementation across sync + async add_cache functions
         """
         try:
+            stream_chunk_boundaries = kwargs.pop("stream_chunk_boundaries", None)
             if "cache_key" in kwargs:
                 cache_key = kwargs["cache_key"]
             else:
@@ -544,6 +556,8 @@ class Cache:
                             kwargs["ttl"] = v
 
                 cached_data = {"timestamp": time.time(), "response": result}
+                if stream_chunk_boundaries is not None:
+                    cached_data["stream_chunk_boundaries"] = stream_chunk_boundaries
                 return cache_key, cached_data, kwargs
             else:
                 raise Exception("cache key is None")
@@ -35,8 +35,14 @@ from pydantic import BaseModel
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
+from litellm.caching.cached_stream_replay import CachedStreamReplay
 from litellm.caching.caching import S3Cache
-from litellm.types.caching import CachedEmbedding
+from litellm.constants import CACHED_STREAMING_REPLAY_CHUNK_DELAY
+from litellm.types.caching import (
+    CACHED_STREAM_CHUNK_BOUNDARIES_KEY,
+    CachedEmbedding,
+    CachedStreamChunkBoundaries,
+)
 from litellm.litellm_core_utils.logging_utils import (
     _assemble_complete_response_from_streaming_chunks,
 )
@@ -611,6 +617,16 @@ class LLMCachingHandler:
         """
         from litellm.utils import convert_to_model_response_object
 
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None
+        if (
+            isinstance(cached_result, dict)
+            and CACHED_STREAM_CHUNK_BOUNDARIES_KEY in cached_result
+        ):
+            cached_result = dict(cached_result)
+            stream_chunk_boundaries = cached_result.pop(
+                CACHED_STREAM_CHUNK_BOUNDARIES_KEY
+            )
+
         if (
             call_type == CallTypes.acompletion.value
             or call_type == CallTypes.completion.value
@@ -621,6 +637,8 @@ class LLMCachingHandler:
                     call_type=call_type,
                     logging_obj=logging_obj,
                     model=model,
+                    stream_chunk_boundaries=stream_chunk_boundaries,
+                    chunk_delay=self._get_cached_stream_chunk_delay(kwargs),
                 )
             else:
                 cached_result = convert_to_model_response_object(
@@ -688,15 +706,30 @@ class LLMCachingHandler:
         call_type: str,
         logging_obj: LiteLLMLoggingObj,
         model: str,
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None,
+        chunk_delay: float = CACHED_STREAMING_REPLAY_CHUNK_DELAY,
     ) -> CustomStreamWrapper:
+        """
+        Chat completions are replayed with `CachedStreamReplay` - chunked at the boundaries of the
+        original stream, and passed through `CustomStreamWrapper` without provider chunk parsing.
+        """
         from litellm.utils import (
             CustomStreamWrapper,
             convert_to_streaming_response,
             convert_to_streaming_response_async,
         )
 
-        _stream_cached_result: Union[AsyncGenerator, Generator]
+        _stream_cached_result: Union[AsyncGenerator, Generator, CachedStreamReplay]
         if (
+            call_type == CallTypes.acompletion.value
+            or call_type == CallTypes.completion.value
+        ) and CachedStreamReplay.can_replay(cached_result):
+            _stream_cached_result = CachedStreamReplay(
+                response_object=cached_result,
+                stream_chunk_boundaries=stream_chunk_boundaries,
+                chunk_delay=chunk_delay,
+            )
+        elif (
             call_type == CallTypes.acompletion.value
             or call_type == CallTypes.atext_completion.value
         ):
@@ -714,12 +747,28 @@ class LLMCachingHandler:
             logging_obj=logging_obj,
         )
 
+    @staticmethod
+    def _get_cached_stream_chunk_delay(kwargs: Dict[str, Any]) -> float:
+        """
+        Delay between replayed chunks - `cache={"stream-chunk-delay": ...}` or `CACHED_STREAMING_REPLAY_CHUNK_DELAY`
+        """
+        cache_control_args = kwargs.get("cache") or {}
+        chunk_delay = (
+            cache_control_args.get("stream-chunk-delay")
+            if isinstance(cache_control_args, dict)
+            else None
+        )
+        if chunk_delay is None:
+            return CACHED_STREAMING_REPLAY_CHUNK_DELAY
+        return float(chunk_delay)
+
     async def async_set_cache(
         self,
         result: Any,
         original_function: Callable,
         kwargs: Dict[str, Any],
         args: Optional[Tuple[Any, ...]] = None,
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None,
     ):
         """
         Internal method to check the type of the result & cache used and adds the result to the cache accordingly
@@ -729,6 +778,7 @@ class LLMCachingHandler:
             original_function: Callable:
             kwargs: Dict[str, Any]:
             args: Optional[Tuple[Any, ...]] = None:
+            stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None: chunk boundaries of a streamed response, stored with it
 
         Returns:
             None
@@ -750,6 +800,8 @@ class LLMCachingHandler:
         if self._should_store_result_in_cache(
             original_function=original_function, kwargs=new_kwargs
         ):
+            if stream_chunk_boundaries is not None:
+                new_kwargs["stream_chunk_boundaries"] = stream_chunk_boundaries
             if (
                 isinstance(result, litellm.ModelResponse)
                 or isinstance(result, litellm.EmbeddingResponse)
@@ -786,6 +838,7 @@ class LLMCachingHandler:
         result: Any,
         kwargs: Dict[str, Any],
         args: Optional[Tuple[Any, ...]] = None,
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None,
     ):
         """
         Sync internal method to add the result to the cache
@@ -804,6 +857,8 @@ class LLMCachingHandler:
         if self._should_store_result_in_cache(
             original_function=self.original_function, kwargs=new_kwargs
         ):
+            if stream_chunk_boundaries is not None:
+                new_kwargs["stream_chunk_boundaries"] = stream_chunk_boundaries
             litellm.cache.add_cache(result, **new_kwargs)
 
         return
@@ -846,13 +901,18 @@ class LLMCachingHandler:
             return True
         return False
 
-    async def _add_streaming_response_to_cache(self, processed_chunk: ModelResponse):
+    async def _add_streaming_response_to_cache(
+        self,
+        processed_chunk: ModelResponse,
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None,
+    ):
         """
         Internal method to add the streaming response to the cache
 
 
         - If 'streaming_chunk' has a 'finish_reason' then assemble a litellm.ModelResponse object
         - Else append the chunk to self.async_streaming_chunks
+        - `stream_chunk_boundaries` are stored with the response, for replaying cache hits
 
         """
 
@@ -872,9 +932,14 @@ class LLMCachingHandler:
                 result=complete_streaming_response,
                 original_function=self.original_function,
                 kwargs=self.request_kwargs,
+                stream_chunk_boundaries=stream_chunk_boundaries,
             )
 
-    def _sync_add_streaming_response_to_cache(self, processed_chunk: ModelResponse):
+    def _sync_add_streaming_response_to_cache(
+        self,
+        processed_chunk: ModelResponse,
+        stream_chunk_boundaries: Optional[CachedStreamChunkBoundaries] = None,
+    ):
         """
         Sync internal method to add the streaming response to the cache
         """
@@ -894,6 +959,7 @@ class LLMCachingHandler:
             self.sync_set_cache(
                 result=complete_streaming_response,
                 kwargs=self.request_kwargs,
+                stream_chunk_boundaries=stream_chunk_boundaries,
             )
 
     def _update_litellm_logging_obj_environment(
@@ -15,6 +15,14 @@ DEFAULT_SQS_BATCH_SIZE = int(os.getenv("DEFAULT_SQS_BATCH_SIZE", 512))
 SQS_SEND_MESSAGE_ACTION = "SendMessage"
 SQS_API_VERSION = "2012-11-05"
 DEFAULT_MAX_RETRIES = int(os.getenv("DEFAULT_MAX_RETRIES", 2))
+# providers whose sync request setup does no blocking I/O - run on the event loop for async calls
+INLINE_ASYNC_REQUEST_SETUP_PROVIDERS = frozenset(
+    provider.strip()
+    for provider in os.getenv(
+        "INLINE_ASYNC_REQUEST_SETUP_PROVIDERS", "openai,text-completion-openai"
+    ).split(",")
+    if provider.strip()
+)
 DEFAULT_MAX_RECURSE_DEPTH = int(os.getenv("DEFAULT_MAX_RECURSE_DEPTH", 100))
 DEFAULT_MAX_RECURSE_DEPTH_SENSITIVE_DATA_MASKER = int(
     os.getenv("DEFAULT_MAX_RECURSE_DEPTH_SENSITIVE_DATA_MASKER", 10)
@@ -73,6 +81,22 @@ MAX_IN_MEMORY_QUEUE_FLUSH_COUNT = int(
     os.getenv("MAX_IN_MEMORY_QUEUE_FLUSH_COUNT", 1000)
 )
 ###############################################################################################
+########## Logging dispatcher constants - success/failure logging off the request path ##########
+LOGGING_WORKER_COUNT = int(os.getenv("LOGGING_WORKER_COUNT", 8))
+LOGGING_WORKER_MAX_QUEUE_SIZE = int(os.getenv("LOGGING_WORKER_MAX_QUEUE_SIZE", 10000))
+LOGGING_WORKER_QUEUE_FULL_POLICY = os.getenv(
+    "LOGGING_WORKER_QUEUE_FULL_POLICY", "drop"
+)  # for logging that opted in to being dropped: "drop" - discard it when the queue is full, "spill" - run it on the shared thread pool
+LOGGING_WORKER_FLUSH_TIMEOUT_SECONDS = float(
+    os.getenv("LOGGING_WORKER_FLUSH_TIMEOUT_SECONDS", 5)
+)
+########## Logging payload size policy - see litellm_core_utils/logging_payload_size_policy.py ##########
+LOGGING_PAYLOAD_MAX_STR_LENGTH = int(os.getenv("LOGGING_PAYLOAD_MAX_STR_LENGTH", 10000))
+LOGGING_PAYLOAD_MAX_LIST_LENGTH = int(
+    os.getenv("LOGGING_PAYLOAD_MAX_LIST_LENGTH", 1000)
+)
+LOGGING_PAYLOAD_PREVIEW_LENGTH = int(os.getenv("LOGGING_PAYLOAD_PREVIEW_LENGTH", 100))
+###############################################################################################
 MINIMUM_PROMPT_CACHE_TOKEN_COUNT = int(
     os.getenv("MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 1024)
 )  # minimum number of tokens to cache a prompt by Anthropic
@@ -138,6 +162,27 @@ REPEATED_STREAMING_CHUNK_LIMIT = int(
     os.getenv("REPEATED_STREAMING_CHUNK_LIMIT", 100)
 )  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
 DEFAULT_MAX_LRU_CACHE_SIZE = int(os.getenv("DEFAULT_MAX_LRU_CACHE_SIZE", 16))
+MAX_LLM_PROVIDER_CACHE_SIZE = int(os.getenv("MAX_LLM_PROVIDER_CACHE_SIZE", 2048))
+MAX_OPTIONAL_PARAMS_PLAN_CACHE_SIZE = int(
+    os.getenv("MAX_OPTIONAL_PARAMS_PLAN_CACHE_SIZE", 2048)
+)
+MAX_MODEL_COST_KEY_INDEX_SIZE = int(os.getenv("MAX_MODEL_COST_KEY_INDEX_SIZE", 4096))
+MAX_PRICE_RECORD_CACHE_SIZE = int(os.getenv("MAX_PRICE_RECORD_CACHE_SIZE", 4096))
+SECRET_RESOLUTION_MAX_WORKERS = int(
+    os.getenv("SECRET_RESOLUTION_MAX_WORKERS", 8)
+)  # threads resolving a batch of `os.environ/` values from a secret manager, e.g. at router init / config load
+MAX_DECRYPTED_VALUE_CACHE_SIZE = int(os.getenv("MAX_DECRYPTED_VALUE_CACHE_SIZE", 10000))
+DECRYPTED_VALUE_CACHE_TTL = int(
+    os.getenv("DECRYPTED_VALUE_CACHE_TTL", 600)
+)  # seconds a decrypted db value is reused before decrypting it again, 0 = no caching
+MODEL_COST_MAP_REFRESH_INTERVAL = int(
+    os.getenv("MODEL_COST_MAP_REFRESH_INTERVAL", 0)
+)  # seconds between background refreshes of the hosted model cost map, 0 = refresh once on import
+MODEL_COST_MAP_REFRESH_TIMEOUT = float(os.getenv("MODEL_COST_MAP_REFRESH_TIMEOUT", 5))
+MODEL_COST_MAP_CACHE_DIR = os.getenv(
+    "MODEL_COST_MAP_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "litellm"),
+)  # on-disk cache of the last good copy of the hosted model cost map + the snapshot of the bundled one
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", 0.5))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", 8.0))
 JITTER = float(os.getenv("JITTER", 0.75))
@@ -172,6 +217,9 @@ TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
+CACHED_STREAMING_REPLAY_CHUNK_DELAY = float(
+    os.getenv("CACHED_STREAMING_REPLAY_CHUNK_DELAY", 0)
+)
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 512)
 )
@@ -870,6 +918,9 @@ PROMETHEUS_EMIT_BUDGET_METRICS_JOB_NAME = "prometheus_emit_budget_metrics"
 SPEND_LOG_CLEANUP_JOB_NAME = "spend_log_cleanup"
 SPEND_LOG_RUN_LOOPS = int(os.getenv("SPEND_LOG_RUN_LOOPS", 500))
 SPEND_LOG_CLEANUP_BATCH_SIZE = int(os.getenv("SPEND_LOG_CLEANUP_BATCH_SIZE", 1000))
+SPEND_LOG_RECALCULATE_BATCH_SIZE = int(
+    os.getenv("SPEND_LOG_RECALCULATE_BATCH_SIZE", 1000)
+)
 DEFAULT_CRON_JOB_LOCK_TTL_SECONDS = int(
     os.getenv("DEFAULT_CRON_JOB_LOCK_TTL_SECONDS", 60)
 )  # 1 minute
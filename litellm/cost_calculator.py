@@ -14,6 +14,11 @@ from litellm.constants import (
     DEFAULT_MAX_LRU_CACHE_SIZE,
     DEFAULT_REPLICATE_GPU_PRICE_PER_SECOND,
 )
+from litellm.litellm_core_utils.llm_cost_calc.price_record import (
+    PRICE_RECORD_PROVIDERS,
+    cost_from_usage,
+    get_price_record,
+)
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
 )
@@ -128,6 +133,44 @@ def _cost_per_token_custom_pricing_helper(
     return None
 
 
+def _get_model_cost_key_for_cost_per_token(
+    model: str, custom_llm_provider: Optional[str], region_name: Optional[str]
+) -> str:
+    """
+    Code block that formats model to lookup in litellm.model_cost
+    Option1. model = "bedrock/ap-northeast-1/anthropic.claude-instant-v1". This is the most accurate since it is region based. Should always be option 1
+    Option2. model = "openai/gpt-4"       - model = provider/model
+    Option3. model = "anthropic.claude-3" - model = model
+
+    Returns `model` if none of the options is in litellm.model_cost.
+    """
+    model_cost_ref = litellm.model_cost
+    model_with_provider = model
+    if custom_llm_provider is not None:
+        model_with_provider = custom_llm_provider + "/" + model
+        if region_name is not None:
+            model_with_provider_and_region = (
+                f"{custom_llm_provider}/{region_name}/{model}"
+            )
+            if (
+                model_with_provider_and_region in model_cost_ref
+            ):  # use region based pricing, if it's available
+                model_with_provider = model_with_provider_and_region
+    model_without_prefix = model.split("/", 1)[-1]
+
+    if (
+        model_with_provider in model_cost_ref
+    ):  # Option 2. use model with provider, model = "openai/gpt-4"
+        return model_with_provider
+    elif model in model_cost_ref:  # Option 1. use model passed, model="gpt-4"
+        return model
+    elif (
+        model_without_prefix in model_cost_ref
+    ):  # Option 3. if user passed model="bedrock/anthropic.claude-3", use model="anthropic.claude-3"
+        return model_without_prefix
+    return model
+
+
 def cost_per_token(  # noqa: PLR0915
     model: str = "",
     prompt_tokens: int = 0,
@@ -202,19 +245,10 @@ def cost_per_token(  # noqa: PLR0915
     # given
     prompt_tokens_cost_usd_dollar: float = 0
     completion_tokens_cost_usd_dollar: float = 0
-    model_cost_ref = litellm.model_cost
-    model_with_provider = model
-    if custom_llm_provider is not None:
-        model_with_provider = custom_llm_provider + "/" + model
-        if region_name is not None:
-            model_with_provider_and_region = (
-                f"{custom_llm_provider}/{region_name}/{model}"
-            )
-            if (
-                model_with_provider_and_region in model_cost_ref
-            ):  # use region based pricing, if it's available
-                model_with_provider = model_with_provider_and_region
-    else:
+    model_cost_key = _get_model_cost_key_for_cost_per_token(
+        model=model, custom_llm_provider=custom_llm_provider, region_name=region_name
+    )
+    if custom_llm_provider is None:
         _, custom_llm_provider, _, _ = litellm.get_llm_provider(model=model)
     model_without_prefix = model
     model_parts = model.split("/", 1)
@@ -222,22 +256,7 @@ def cost_per_token(  # noqa: PLR0915
         model_without_prefix = model_parts[1]
     else:
         model_without_prefix = model
-    """
-    Code block that formats model to lookup in litellm.model_cost
-    Option1. model = "bedrock/ap-northeast-1/anthropic.claude-instant-v1". This is the most accurate since it is region based. Should always be option 1
-    Option2. model = "openai/gpt-4"       - model = provider/model
-    Option3. model = "anthropic.claude-3" - model = model
-    """
-    if (
-        model_with_provider in model_cost_ref
-    ):  # Option 2. use model with provider, model = "openai/gpt-4"
-        model = model_with_provider
-    elif model in model_cost_ref:  # Option 1. use model passed, model="gpt-4"
-        model = model
-    elif (
-        model_without_prefix in model_cost_ref
-    ):  # Option 3. if user passed model="bedrock/anthropic.claude-3", use model="anthropic.claude-3"
-        model = model_without_prefix
+    model = model_cost_key
 
     # see this https://learn.microsoft.com/en-us/azure/ai-services/openai/concepts/models
     if call_type == "speech" or call_type == "aspeech":
@@ -1075,6 +1094,116 @@ def response_cost_calculator(
         raise e
 
 
+def price_record_response_cost(
+    response_object: Any,
+    model: str,
+    custom_llm_provider: Optional[str],
+    call_type: str,
+    optional_params: dict,
+    cache_hit: Optional[bool] = None,
+    base_model: Optional[str] = None,
+    custom_pricing: Optional[bool] = None,
+    standard_built_in_tools_params: Optional[StandardBuiltInToolsParams] = None,
+    router_model_id: Optional[str] = None,
+) -> Optional[float]:
+    """
+    Fast path for `response_cost_calculator` - prices a chat completion from a router deployment with its compiled price record.
+
+    Returns None if the response isn't priced per token with `generic_cost_per_token` - use `response_cost_calculator` instead.
+    """
+    if (
+        router_model_id is None
+        or cache_hit is True
+        or (call_type != "completion" and call_type != "acompletion")
+        or not isinstance(response_object, ModelResponse)
+    ):
+        return None
+    usage = getattr(response_object, "usage", None)
+    if not isinstance(usage, Usage):
+        return None
+    hidden_params = response_object._hidden_params
+    additional_headers = hidden_params.get("additional_headers") or {}
+    if (
+        "llm_provider-x-litellm-response-cost" in additional_headers
+        or hidden_params.get("region_name") is not None
+    ):
+        return None
+
+    selected_model = _select_model_name_for_cost_calc(
+        model=model,
+        completion_response=response_object,
+        custom_llm_provider=custom_llm_provider,
+        custom_pricing=custom_pricing,
+        base_model=base_model,
+        router_model_id=router_model_id,
+    )
+    custom_llm_provider = hidden_params.get(
+        "custom_llm_provider", custom_llm_provider or None
+    )
+    if (
+        selected_model is None
+        or custom_llm_provider not in PRICE_RECORD_PROVIDERS
+        or "togethercomputer" in selected_model
+        or "together_ai" in selected_model
+        or "replicate" in selected_model
+    ):
+        return None
+    price_record = get_price_record(
+        model=_get_model_cost_key_for_cost_per_token(
+            model=selected_model,
+            custom_llm_provider=custom_llm_provider,
+            region_name=None,
+        ),
+        custom_llm_provider=custom_llm_provider,
+    )
+    if price_record is None:
+        return None
+
+    response_object._hidden_params["optional_params"] = optional_params
+    prompt_tokens_cost_usd_dollar, completion_tokens_cost_usd_dollar = cost_from_usage(
+        price_record=price_record, usage=usage
+    )
+    _final_cost = prompt_tokens_cost_usd_dollar + completion_tokens_cost_usd_dollar
+    _final_cost += StandardBuiltInToolCostTracking.get_cost_for_built_in_tools(
+        model=selected_model,
+        response_object=response_object,
+        usage=usage,
+        standard_built_in_tools_params=standard_built_in_tools_params,
+        custom_llm_provider=custom_llm_provider,
+    )
+    return _final_cost
+
+
+def compile_deployment_price_records(
+    model: str,
+    custom_llm_provider: str,
+    model_id: Optional[str] = None,
+    custom_pricing: Optional[bool] = None,
+) -> None:
+    """
+    Compile the price records `price_record_response_cost` uses for a router deployment - called when the Router adds the deployment.
+    """
+    if custom_llm_provider not in PRICE_RECORD_PROVIDERS:
+        return
+    selected_model = _select_model_name_for_cost_calc(
+        model=model,
+        completion_response=None,
+        custom_llm_provider=custom_llm_provider,
+        custom_pricing=custom_pricing,
+        router_model_id=model_id,
+    )
+    if selected_model is None:
+        return
+    get_price_record(
+        model=_get_model_cost_key_for_cost_per_token(
+            model=selected_model,
+            custom_llm_provider=custom_llm_provider,
+            region_name=None,
+        ),
+        custom_llm_provider=custom_llm_provider,
+    )
+
+
 def rerank_cost(
     model: str,
     custom_llm_provider: Optional[str],
@@ -12,16 +12,13 @@ from functools import partial
 from typing import Any, Coroutine, Dict, Literal, Optional, Union, cast
 
 import httpx
+from openai.types import FileDeleted, FileObject
 
 import litellm
 from litellm import get_secret_str
 from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.llms.azure.files.handler import AzureOpenAIFilesAPI
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
-from litellm.llms.openai.openai import FileDeleted, FileObject, OpenAIFilesAPI
-from litellm.llms.vertex_ai.files.handler import VertexAIFilesHandler
-from litellm.llms.anthropic.files.handler import AnthropicFilesHandler
 from litellm.types.llms.openai import (
     CreateFileRequest,
     FileContentRequest,
@@ -38,13 +35,21 @@ from litellm.utils import (
     supports_httpx_timeout,
 )
 
-base_llm_http_handler = BaseLLMHTTPHandler()
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 
 ####### ENVIRONMENT VARIABLES ###################
-openai_files_instance = OpenAIFilesAPI()
-azure_files_instance = AzureOpenAIFilesAPI()
-vertex_ai_files_instance = VertexAIFilesHandler()
-anthropic_files_instance = AnthropicFilesHandler()
+openai_files_instance = lazy_instance("litellm.llms.openai.openai", "OpenAIFilesAPI")
+azure_files_instance = lazy_instance(
+    "litellm.llms.azure.files.handler", "AzureOpenAIFilesAPI"
+)
+vertex_ai_files_instance = lazy_instance(
+    "litellm.llms.vertex_ai.files.handler", "VertexAIFilesHandler"
+)
+anthropic_files_instance = lazy_instance(
+    "litellm.llms.anthropic.files.handler", "AnthropicFilesHandler"
+)
 #################################################
 
 
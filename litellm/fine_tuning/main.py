@@ -18,9 +18,7 @@ import httpx
 
 import litellm
 from litellm._logging import verbose_logger
-from litellm.llms.azure.fine_tuning.handler import AzureOpenAIFineTuningAPI
-from litellm.llms.openai.fine_tuning.handler import OpenAIFineTuningAPI
-from litellm.llms.vertex_ai.fine_tuning.handler import VertexFineTuningAPI
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.llms.openai import FineTuningJobCreate, Hyperparameters
 from litellm.types.router import *
@@ -28,9 +26,15 @@ from litellm.types.utils import LiteLLMFineTuningJob
 from litellm.utils import client, supports_httpx_timeout
 
 ####### ENVIRONMENT VARIABLES ###################
-openai_fine_tuning_apis_instance = OpenAIFineTuningAPI()
-azure_fine_tuning_apis_instance = AzureOpenAIFineTuningAPI()
-vertex_fine_tuning_apis_instance = VertexFineTuningAPI()
+openai_fine_tuning_apis_instance = lazy_instance(
+    "litellm.llms.openai.fine_tuning.handler", "OpenAIFineTuningAPI"
+)
+azure_fine_tuning_apis_instance = lazy_instance(
+    "litellm.llms.azure.fine_tuning.handler", "AzureOpenAIFineTuningAPI"
+)
+vertex_fine_tuning_apis_instance = lazy_instance(
+    "litellm.llms.vertex_ai.fine_tuning.handler", "VertexFineTuningAPI"
+)
 #################################################
 
 
@@ -1,5 +1,4 @@
 import asyncio
-import contextvars
 from functools import partial
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, Optional, Union
 
@@ -11,11 +10,12 @@ from litellm.constants import request_timeout
 
 # Import the adapter for fallback to completion format
 from litellm.google_genai.adapters.handler import GenerateContentToCompletionHandler
+from litellm.litellm_core_utils.async_request_setup import run_request_setup
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.llms.base_llm.google_genai.transformation import (
     BaseGoogleGenAIGenerateContentConfig,
 )
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from litellm.types.router import GenericLiteLLMParams
 from litellm.utils import ProviderConfigManager, client
 
@@ -35,7 +35,9 @@ else:
 
 ####### ENVIRONMENT VARIABLES ###################
 # Initialize any necessary instances or variables here
-base_llm_http_handler = BaseLLMHTTPHandler()
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 #################################################
 
 
@@ -221,7 +223,6 @@ async def agenerate_content(
     """
     local_vars = locals()
     try:
-        loop = asyncio.get_event_loop()
         kwargs["agenerate_content"] = True
 
         # get custom llm provider so we can use this for mapping exceptions
@@ -245,9 +246,11 @@ async def agenerate_content(
             **kwargs,
         )
 
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
 
         if asyncio.iscoroutine(init_response):
             response = await init_response
@@ -10,15 +10,18 @@ from litellm import Logging, client, exception_type, get_litellm_params
 from litellm.constants import DEFAULT_IMAGE_ENDPOINT_MODEL
 from litellm.constants import request_timeout as DEFAULT_REQUEST_TIMEOUT
 from litellm.exceptions import LiteLLMUnknownProvider
+from litellm.litellm_core_utils.async_request_setup import run_request_setup
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.litellm_core_utils.mock_functions import mock_image_generation
 from litellm.llms.base_llm import BaseImageEditConfig, BaseImageGenerationConfig
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from litellm.llms.custom_llm import CustomLLM
 
 #################### Initialize provider clients ####################
-llm_http_handler: BaseLLMHTTPHandler = BaseLLMHTTPHandler()
+llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 from litellm.main import (
     azure_chat_completions,
     base_llm_aiohttp_handler,
@@ -63,7 +66,6 @@ async def aimage_generation(*args, **kwargs) -> ImageResponse:
     Returns:
     - `response` (Any): The response returned by the `image_generation` function.
     """
-    loop = asyncio.get_event_loop()
     model = args[0] if len(args) > 0 else kwargs["model"]
     ### PASS ARGS TO Image Generation ###
     kwargs["aimg_generation"] = True
@@ -72,16 +74,16 @@ async def aimage_generation(*args, **kwargs) -> ImageResponse:
         # Use a partial function to pass your keyword arguments
         func = partial(image_generation, *args, **kwargs)
 
-        # Add the context to the function
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-
         _, custom_llm_provider, _, _ = get_llm_provider(
             model=model, api_base=kwargs.get("api_base", None)
         )
 
         # Await normally
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
 
         response: Optional[ImageResponse] = None
         if isinstance(init_response, dict):
@@ -6,6 +6,7 @@ from typing import (
     Any,
     AsyncGenerator,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Optional,
@@ -16,6 +17,9 @@ from typing import (
 from pydantic import BaseModel
 
 from litellm.caching.caching import DualCache
+from litellm.litellm_core_utils.logging_payload_size_policy import (
+    LoggingPayloadSizePolicy,
+)
 from litellm.types.integrations.argilla import ArgillaItem
 from litellm.types.llms.openai import AllMessageValues, ChatCompletionRequest
 from litellm.types.utils import (
@@ -57,6 +61,16 @@ else:
 
 class CustomLogger:  # https://docs.litellm.ai/docs/observability/custom_callback#callback-class
     # Class variables or attributes
+
+    # `StandardLoggingPayload` fields this callback reads from `kwargs["standard_logging_object"]`
+    # - None: all fields (default)
+    # - frozenset(): the callback doesn't use the payload
+    # The payload is only built if a callback needs it, and the (large) `response` field only if a callback reads it.
+    standard_logging_payload_fields: Optional[FrozenSet[str]] = None
+
+    # if set, large values (e.g. embeddings, base64 images) in the StandardLoggingPayload passed to this callback are summarized
+    logging_payload_size_policy: Optional[LoggingPayloadSizePolicy] = None
+
     def __init__(
         self, 
         turn_off_message_logging: bool = False,
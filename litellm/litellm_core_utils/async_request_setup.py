@@ -0,0 +1,80 @@
+"""
+Runs the synchronous request setup of an async entrypoint (e.g. `completion(..., acompletion=True)`).
+
+The sync function only builds the params, provider config and returns the coroutine for the http call.
+For requests where this setup does no blocking I/O (mock responses, openai-compatible providers) it is
+run directly on the event loop - skipping the default executor thread handoff, which otherwise becomes a
+hidden concurrency cap under load.
+
+Everything else still runs in the default executor - e.g. providers fetching credentials or image urls
+during setup, and any request whose setup may block outside the provider code: secrets read from a key
+management system, or sync pre-call callbacks (`litellm.input_callback` functions / integrations, and
+`CustomLogger.log_pre_api_call`) which `Logging.pre_call` runs during setup.
+
+Set `litellm.disable_inline_async_request_setup = True` to always use the executor.
+"""
+
+import asyncio
+import contextvars
+from functools import partial
+from typing import Any, Callable, Optional
+
+import litellm
+from litellm.constants import INLINE_ASYNC_REQUEST_SETUP_PROVIDERS
+from litellm.integrations.custom_logger import CustomLogger
+
+# request kwargs that short-circuit the provider call
+_MOCK_REQUEST_KWARGS = ("mock_response", "mock_tool_calls")
+
+
+def should_run_request_setup_inline(
+    custom_llm_provider: Optional[str], request_kwargs: dict
+) -> bool:
+    """
+    Returns True if the sync request setup can safely run on the event loop.
+    """
+    if litellm.disable_inline_async_request_setup is True:
+        return False
+    if litellm._key_management_system is not None:
+        return False
+    if _has_sync_pre_call_callbacks(request_kwargs=request_kwargs):
+        return False
+    for mock_kwarg in _MOCK_REQUEST_KWARGS:
+        if request_kwargs.get(mock_kwarg) is not None:
+            return True
+    return custom_llm_provider in INLINE_ASYNC_REQUEST_SETUP_PROVIDERS
+
+
+def _has_sync_pre_call_callbacks(request_kwargs: dict) -> bool:
+    """
+    Returns True if a callback may run blocking code in `Logging.pre_call` during setup.
+    """
+    if request_kwargs.get("callbacks"):
+        return True
+    for callback in litellm.input_callback + litellm.callbacks:  # type: ignore
+        if not isinstance(callback, CustomLogger):  # string integration / function
+            return True
+        if litellm.logging_callback_manager.callback_overrides_hook(
+            callback, "log_pre_api_call"
+        ):
+            return True
+    return False
+
+
+async def run_request_setup(
+    func: Callable[..., Any],
+    custom_llm_provider: Optional[str],
+    request_kwargs: dict,
+) -> Any:
+    """
+    Runs `func` (the sync entrypoint, with its args bound) in a copy of the current context.
+
+    Runs inline on the event loop if `should_run_request_setup_inline`, else in the default executor.
+    """
+    ctx = contextvars.copy_context()
+    if should_run_request_setup_inline(
+        custom_llm_provider=custom_llm_provider, request_kwargs=request_kwargs
+    ):
+        return ctx.run(func)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(ctx.run, func))
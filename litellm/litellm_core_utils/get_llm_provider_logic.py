@@ -1,13 +1,86 @@
-from typing import Optional, Tuple
+from typing import Dict, Literal, Optional, Tuple
 
 import httpx
 
 import litellm
-from litellm.constants import REPLICATE_MODEL_NAME_WITH_ID_LENGTH
+from litellm.constants import (
+    MAX_LLM_PROVIDER_CACHE_SIZE,
+    REPLICATE_MODEL_NAME_WITH_ID_LENGTH,
+)
+from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_version
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 from ..types.router import LiteLLM_Params
 
+# how a cached resolution derives `dynamic_api_key` from the caller's `api_key`:
+# - "none": always None
+# - "os_environ": `os.environ/` keys are resolved, anything else -> None
+# - "os_environ_or_api_key": `os.environ/` keys are resolved, anything else is returned as passed in
+LLMProviderCacheApiKeyHandling = Literal["none", "os_environ", "os_environ_or_api_key"]
+
+# (model, custom_llm_provider, api_base) -> (model, custom_llm_provider, api key handling)
+#
+# Only results that don't depend on secrets / env vars are cached - whether the provider read its api_base / api key
+# from the environment is recorded when the entry is built. `api_key` is never part of the key.
+_llm_provider_cache: Dict[
+    Tuple[str, Optional[str], Optional[str]],
+    Tuple[str, str, LLMProviderCacheApiKeyHandling],
+] = {}
+_llm_provider_cache_model_cost_version: Optional[Tuple[int, int]] = None
+
+
+def invalidate_llm_provider_cache() -> None:
+    """
+    Clear the memoized provider resolution - called when models are registered / the provider lists change.
+    """
+    _llm_provider_cache.clear()
+
+
+def _get_cached_llm_provider(
+    cache_key: Tuple[str, Optional[str], Optional[str]],
+) -> Optional[Tuple[str, str, LLMProviderCacheApiKeyHandling]]:
+    global _llm_provider_cache_model_cost_version
+    model_cost_version = get_model_cost_version()
+    if model_cost_version != _llm_provider_cache_model_cost_version:
+        _llm_provider_cache.clear()
+        _llm_provider_cache_model_cost_version = model_cost_version
+        return None
+    return _llm_provider_cache.get(cache_key)
+
+
+def _set_cached_llm_provider(
+    cache_key: Optional[Tuple[str, Optional[str], Optional[str]]],
+    model: str,
+    custom_llm_provider: str,
+    api_key_handling: LLMProviderCacheApiKeyHandling = "os_environ",
+) -> None:
+    if cache_key is None:
+        return
+    if len(_llm_provider_cache) >= MAX_LLM_PROVIDER_CACHE_SIZE:
+        _llm_provider_cache.clear()
+    _llm_provider_cache[cache_key] = (
+        model,
+        custom_llm_provider,
+        api_key_handling,
+    )
+
+
+def _get_cached_dynamic_api_key(
+    api_key: Optional[str], api_key_handling: LLMProviderCacheApiKeyHandling
+) -> Optional[str]:
+    """
+    Same `dynamic_api_key` the uncached resolution returned for this `api_key`
+    """
+    if api_key_handling == "none":
+        return None
+    if api_key and api_key.startswith("os.environ/"):
+        dynamic_api_key = get_secret_str(api_key)
+        if dynamic_api_key is not None:
+            return dynamic_api_key
+    if api_key_handling == "os_environ_or_api_key":
+        return api_key
+    return None
+
 
 def _is_non_openai_azure_model(model: str) -> bool:
     try:
@@ -118,6 +191,20 @@ def get_llm_provider(  # noqa: PLR0915
             api_base = litellm_params.api_base
             api_key = litellm_params.api_key
 
+        ## MEMOIZED RESOLUTION ##
+        cache_key: Optional[Tuple[str, Optional[str], Optional[str]]] = None
+        if isinstance(model, str) and (api_base is None or isinstance(api_base, str)):
+            cache_key = (model, custom_llm_provider, api_base)
+            cached_provider = _get_cached_llm_provider(cache_key)
+            if cached_provider is not None:
+                _model, _custom_llm_provider, api_key_handling = cached_provider
+                return (
+                    _model,
+                    _custom_llm_provider,
+                    _get_cached_dynamic_api_key(api_key, api_key_handling),
+                    api_base,
+                )
+
         dynamic_api_key = None
         # check if llm provider provided
         # AZURE AI-Studio Logic - Azure AI Studio supports AZURE/Cohere
@@ -125,6 +212,12 @@ def get_llm_provider(  # noqa: PLR0915
         if model.split("/", 1)[0] == "azure":
             if _is_non_openai_azure_model(model):
                 custom_llm_provider = "openai"
+                _set_cached_llm_provider(
+                    cache_key,
+                    model,
+                    custom_llm_provider,
+                    api_key_handling="none",
+                )
                 return model, custom_llm_provider, dynamic_api_key, api_base
 
         ### Handle cases when custom_llm_provider is set to cohere/command-r-plus but it should use cohere_chat route
@@ -151,12 +244,20 @@ def get_llm_provider(  # noqa: PLR0915
             and len(model.split("/"))
             > 1  # handle edge case where user passes in `litellm --model mistral` https://github.com/BerriAI/litellm/issues/1351
         ):
-            return _get_openai_compatible_provider_info(
+            provider_info, resolved_from_env = _resolve_openai_compatible_provider_info(
                 model=model,
                 api_base=api_base,
                 api_key=api_key,
                 dynamic_api_key=dynamic_api_key,
             )
+            if not resolved_from_env:
+                _set_cached_llm_provider(
+                    cache_key,
+                    model=provider_info[0],
+                    custom_llm_provider=provider_info[1],
+                    api_key_handling="os_environ_or_api_key",
+                )
+            return provider_info
         elif model.split("/", 1)[0] in litellm.provider_list:
             custom_llm_provider = model.split("/", 1)[0]
             model = model.split("/", 1)[1]
@@ -170,6 +271,7 @@ def get_llm_provider(  # noqa: PLR0915
                         dynamic_api_key
                     )
                 )
+            _set_cached_llm_provider(cache_key, model, custom_llm_provider)
             return model, custom_llm_provider, dynamic_api_key, api_base
         # check if api base is a known openai compatible endpoint
         if api_base:
@@ -319,6 +421,7 @@ def get_llm_provider(  # noqa: PLR0915
         ## ai21
         elif model in litellm.ai21_chat_models or model in litellm.ai21_models:
             custom_llm_provider = "ai21_chat"
+            cache_key = None  # api_base / api key are read from the environment
             api_base = (
                 api_base
                 or get_secret("AI21_API_BASE")
@@ -388,6 +491,7 @@ def get_llm_provider(  # noqa: PLR0915
                     dynamic_api_key
                 )
             )
+        _set_cached_llm_provider(cache_key, model, custom_llm_provider)
         return model, custom_llm_provider, dynamic_api_key, api_base
     except Exception as e:
         if isinstance(e, litellm.exceptions.BadRequestError):
@@ -408,7 +512,7 @@ def get_llm_provider(  # noqa: PLR0915
             )
 
 
-def _get_openai_compatible_provider_info(  # noqa: PLR0915
+def _get_openai_compatible_provider_info(
     model: str,
     api_base: Optional[str],
     api_key: Optional[str],
@@ -422,9 +526,32 @@ def _get_openai_compatible_provider_info(  # noqa: PLR0915
             dynamic_api_key: Optional[str]
             api_base: Optional[str]
     """
+    provider_info, _ = _resolve_openai_compatible_provider_info(
+        model=model,
+        api_base=api_base,
+        api_key=api_key,
+        dynamic_api_key=dynamic_api_key,
+    )
+    return provider_info
+
+
+def _resolve_openai_compatible_provider_info(  # noqa: PLR0915
+    model: str,
+    api_base: Optional[str],
+    api_key: Optional[str],
+    dynamic_api_key: Optional[str],
+) -> Tuple[Tuple[str, str, Optional[str], Optional[str]], bool]:
+    """
+    Returns:
+        Tuple[Tuple[str, str, Optional[str], Optional[str]], bool]:
+            (model, custom_llm_provider, dynamic_api_key, api_base) - see `_get_openai_compatible_provider_info`
+            resolved_from_env: True if the provider has its own branch below, i.e. api_base / api key may come from
+                the environment or provider defaults - `get_llm_provider` doesn't cache these
+    """
 
     custom_llm_provider = model.split("/", 1)[0]
     model = model.split("/", 1)[1]
+    resolved_from_env = True
 
     if custom_llm_provider == "perplexity":
         # perplexity is openai compatible, we just need to set this to custom_openai and have the api_base be https://api.perplexity.ai
@@ -435,7 +562,7 @@ def _get_openai_compatible_provider_info(  # noqa: PLR0915
             api_base, api_key
         )
     elif custom_llm_provider == "aiohttp_openai":
-        return model, "aiohttp_openai", api_key, api_base
+        return (model, "aiohttp_openai", api_key, api_base), resolved_from_env
     elif custom_llm_provider == "anyscale":
         # anyscale is openai compatible, we just need to set this to custom_openai and have the api_base be https://api.endpoints.anyscale.com/v1
         api_base = api_base or get_secret_str("ANYSCALE_API_BASE") or "https://api.endpoints.anyscale.com/v1"  # type: ignore
@@ -721,6 +848,8 @@ def _get_openai_compatible_provider_info(  # noqa: PLR0915
         ) = litellm.HyperbolicChatConfig()._get_openai_compatible_provider_info(
             api_base, api_key
         )
+    else:
+        resolved_from_env = False
 
     if api_base is not None and not isinstance(api_base, str):
         raise Exception("api base needs to be a string. api_base={}".format(api_base))
@@ -732,4 +861,4 @@ def _get_openai_compatible_provider_info(  # noqa: PLR0915
         )
     if dynamic_api_key is None and api_key is not None:
         dynamic_api_key = api_key
-    return model, custom_llm_provider, dynamic_api_key, api_base
+    return (model, custom_llm_provider, dynamic_api_key, api_base), resolved_from_env
@@ -1,6 +1,10 @@
 """
 Pulls the cost + context window + provider route for known models from https://github.com/BerriAI/litellm/blob/main/model_prices_and_context_window.json
 
+On import, litellm loads the local model cost map - the last good copy of the hosted map cached on disk, else the backup bundled with the package - without any network call.
+The hosted map is then fetched in a background thread (with ETag / If-Modified-Since) and merged into `litellm.model_cost` in place once it's loaded,
+so modules that did `from litellm import model_cost` see the refreshed prices too.
+
 This can be disabled by setting the LITELLM_LOCAL_MODEL_COST_MAP environment variable to True.
 
 ```
@@ -8,24 +12,170 @@ export LITELLM_LOCAL_MODEL_COST_MAP=True
 ```
 """
 
+import hashlib
+import json
 import os
+import pickle
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    MODEL_COST_MAP_CACHE_DIR,
+    MODEL_COST_MAP_REFRESH_INTERVAL,
+    MODEL_COST_MAP_REFRESH_TIMEOUT,
+)
 
-def get_model_cost_map(url: str) -> dict:
-    if (
+BUNDLED_MODEL_COST_MAP_FILE_NAME = "model_prices_and_context_window_backup.json"
+MODEL_COST_MAP_SNAPSHOT_FILE_NAME = "model_prices_and_context_window_backup.pickle"
+MODEL_COST_MAP_CACHE_FILE_NAME = "model_prices_and_context_window.json"
+MODEL_COST_MAP_CACHE_METADATA_FILE_NAME = "model_prices_and_context_window.meta.json"
+
+
+def _use_local_model_cost_map() -> bool:
+    return bool(
         os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False)
         or os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == "True"
-    ):
-        import importlib.resources
-        import json
+    )
 
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
+
+def get_bundled_model_cost_map() -> dict:
+    """
+    The model cost map bundled with the package - `model_prices_and_context_window_backup.json`
+
+    Loaded from its snapshot in `MODEL_COST_MAP_CACHE_DIR` if the snapshot was built from the same json,
+    else the json is parsed and the snapshot is written for the next import.
+    """
+    global _snapshot_provider_index
+    import importlib.resources
+
+    if hasattr(importlib.resources, "files"):
+        content_bytes = (
+            importlib.resources.files("litellm")
+            .joinpath(BUNDLED_MODEL_COST_MAP_FILE_NAME)
+            .read_bytes()
+        )
+    else:  # python 3.8
+        with importlib.resources.open_binary(
+            "litellm", BUNDLED_MODEL_COST_MAP_FILE_NAME
         ) as f:
-            content = json.load(f)
-            return content
+            content_bytes = f.read()
+    source_sha256 = hashlib.sha256(content_bytes).hexdigest()
+    snapshot = _load_model_cost_map_snapshot(source_sha256=source_sha256)
+    if snapshot is None:
+        snapshot = _build_model_cost_map_snapshot(content_bytes=content_bytes)
+        _write_model_cost_map_snapshot(
+            snapshot=snapshot,
+            snapshot_path=_get_cache_file_path(MODEL_COST_MAP_SNAPSHOT_FILE_NAME),
+        )
+    _snapshot_provider_index = (snapshot["model_cost"], snapshot["provider_index"])
+    return snapshot["model_cost"]
+
+
+######### MODEL COST MAP SNAPSHOT #########
+# Parsing the bundled json and walking all of its entries to fill the provider model lists is on the import path of litellm.
+# The first import pickles the parsed map together with its provider -> models index into `MODEL_COST_MAP_CACHE_DIR` - it isn't
+# shipped with the package. `ci_cd/build_model_cost_map_snapshot.py` builds it ahead of time, e.g. when building a docker image.
+# The snapshot is only used if the sha256 of the bundled json matches - a stale snapshot is rebuilt from the json.
+
+MODEL_COST_MAP_SNAPSHOT_VERSION = 1
+# the newest protocol every supported python version can load
+MODEL_COST_MAP_SNAPSHOT_PICKLE_PROTOCOL = 4
+
+# (model cost map, its provider index) of the last loaded snapshot - used by the first `get_model_cost_provider_index` call for that map
+_snapshot_provider_index: Optional[Tuple[dict, Dict[str, List[str]]]] = None
+
+
+def build_model_cost_provider_index(model_cost_map: dict) -> Dict[str, List[str]]:
+    """
+    litellm_provider -> the model cost keys of the provider, in model cost map order
+    """
+    provider_index: Dict[str, List[str]] = {}
+    for key, value in model_cost_map.items():
+        litellm_provider = value.get("litellm_provider")
+        if isinstance(litellm_provider, str):
+            provider_index.setdefault(litellm_provider, []).append(key)
+    return provider_index
+
+
+def get_model_cost_provider_index(model_cost_map: dict) -> Dict[str, List[str]]:
+    """
+    The provider index of `model_cost_map` - precomputed if `model_cost_map` was just loaded from the snapshot.
+    """
+    global _snapshot_provider_index
+    if _snapshot_provider_index is not None:
+        snapshot_model_cost, provider_index = _snapshot_provider_index
+        _snapshot_provider_index = None
+        if snapshot_model_cost is model_cost_map:
+            return provider_index
+    return build_model_cost_provider_index(model_cost_map)
+
+
+def build_model_cost_map_snapshot(model_cost_map_path: str, snapshot_path: str) -> None:
+    """
+    Builds the snapshot of the model cost map json at `model_cost_map_path`.
+    """
+    with open(model_cost_map_path, "rb") as f:
+        content_bytes = f.read()
+    _write_model_cost_map_snapshot(
+        snapshot=_build_model_cost_map_snapshot(content_bytes=content_bytes),
+        snapshot_path=snapshot_path,
+    )
+
+
+def _build_model_cost_map_snapshot(content_bytes: bytes) -> dict:
+    model_cost_map = json.loads(content_bytes)
+    return {
+        "version": MODEL_COST_MAP_SNAPSHOT_VERSION,
+        "source_sha256": hashlib.sha256(content_bytes).hexdigest(),
+        "model_cost": model_cost_map,
+        "provider_index": build_model_cost_provider_index(model_cost_map),
+    }
+
+
+def _write_model_cost_map_snapshot(snapshot: dict, snapshot_path: str) -> None:
+    """
+    Atomically replaces the snapshot at `snapshot_path` - best effort, e.g. the cache dir may be read-only.
+    """
+    try:
+        os.makedirs(os.path.dirname(snapshot_path) or ".", exist_ok=True)
+        tmp_snapshot_path = "{}.{}.tmp".format(snapshot_path, os.getpid())
+        with open(tmp_snapshot_path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=MODEL_COST_MAP_SNAPSHOT_PICKLE_PROTOCOL)
+        os.replace(tmp_snapshot_path, snapshot_path)
+    except Exception as e:
+        verbose_logger.debug(
+            "litellm.get_model_cost_map: unable to write the model cost map snapshot - {}".format(
+                str(e)
+            )
+        )
+
+
+def _load_model_cost_map_snapshot(source_sha256: str) -> Optional[dict]:
+    """
+    Returns the snapshot in `MODEL_COST_MAP_CACHE_DIR`, None if it's missing or wasn't built from the json with `source_sha256`.
+    """
+    try:
+        with open(_get_cache_file_path(MODEL_COST_MAP_SNAPSHOT_FILE_NAME), "rb") as f:
+            # written by litellm to the user's own cache dir, same as the cached hosted model cost map
+            snapshot = pickle.load(f)
+    except Exception:
+        return None
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != MODEL_COST_MAP_SNAPSHOT_VERSION
+        or snapshot.get("source_sha256") != source_sha256
+    ):
+        return None
+    return snapshot
+
+
+def get_model_cost_map(url: str) -> dict:
+    if _use_local_model_cost_map():
+        return get_bundled_model_cost_map()
 
     try:
         response = httpx.get(
@@ -35,11 +185,283 @@ def get_model_cost_map(url: str) -> dict:
         content = response.json()
         return content
     except Exception:
-        import importlib.resources
-        import json
+        return get_bundled_model_cost_map()
 
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
+
+######### LOCAL MODEL COST MAP + BACKGROUND REFRESH #########
+
+# guards refreshing `litellm.model_cost` against concurrent `register_model` calls
+_model_cost_map_lock = threading.RLock()
+# model_cost key -> fields set by `register_model`, re-applied on top of a refreshed model cost map
+_registered_model_cost: Dict[str, dict] = {}
+# "cache" if the current model cost map was loaded from the on-disk cache - i.e. its ETag / Last-Modified can be sent with the refresh
+_model_cost_map_source: Optional[str] = None
+_model_cost_map_refresh_thread: Optional[threading.Thread] = None
+# (url, interval) of the running refresh thread - restarted with the same arguments in forked processes
+_model_cost_map_refresh_args: Optional[Tuple[Optional[str], int]] = None
+
+
+def _get_cache_file_path(file_name: str) -> str:
+    return os.path.join(MODEL_COST_MAP_CACHE_DIR, file_name)
+
+
+def _is_valid_model_cost_map(content) -> bool:
+    return isinstance(content, dict) and len(content) > 0
+
+
+def _read_cached_model_cost_map() -> Optional[dict]:
+    """
+    Returns the last good copy of the hosted model cost map, None if there's no cache or it's older than the installed package.
+    """
+    cache_file_path = _get_cache_file_path(MODEL_COST_MAP_CACHE_FILE_NAME)
+    try:
+        bundled_file_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            BUNDLED_MODEL_COST_MAP_FILE_NAME,
+        )
+        # cached before the package was installed / upgraded - the bundled map is at least as recent
+        if os.path.getmtime(cache_file_path) < os.path.getmtime(bundled_file_path):
+            return None
+        with open(cache_file_path, "r") as f:
             content = json.load(f)
+    except Exception:
+        return None
+    if not _is_valid_model_cost_map(content):
+        return None
+    return content
+
+
+def _write_cached_model_cost_map(
+    content_bytes: bytes, url: str, etag: Optional[str], last_modified: Optional[str]
+) -> None:
+    """
+    Atomically replaces the on-disk cache of the hosted model cost map.
+    """
+    try:
+        os.makedirs(MODEL_COST_MAP_CACHE_DIR, exist_ok=True)
+        for file_name, file_content in (
+            (MODEL_COST_MAP_CACHE_FILE_NAME, content_bytes),
+            (
+                MODEL_COST_MAP_CACHE_METADATA_FILE_NAME,
+                json.dumps(
+                    {"url": url, "etag": etag, "last_modified": last_modified}
+                ).encode("utf-8"),
+            ),
+        ):
+            file_path = _get_cache_file_path(file_name)
+            tmp_file_path = "{}.{}.tmp".format(file_path, os.getpid())
+            with open(tmp_file_path, "wb") as f:
+                f.write(file_content)
+            os.replace(tmp_file_path, file_path)
+    except Exception as e:
+        verbose_logger.debug(
+            "litellm.get_model_cost_map: unable to cache the model cost map - {}".format(
+                str(e)
+            )
+        )
+
+
+def _get_conditional_request_headers(url: str) -> Dict[str, str]:
+    """
+    ETag / Last-Modified of the cached copy - only if the current model cost map is that copy.
+    """
+    if _model_cost_map_source != "cache":
+        return {}
+    try:
+        with open(
+            _get_cache_file_path(MODEL_COST_MAP_CACHE_METADATA_FILE_NAME), "r"
+        ) as f:
+            metadata = json.load(f)
+    except Exception:
+        return {}
+    if metadata.get("url") != url:
+        return {}
+    headers: Dict[str, str] = {}
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+    return headers
+
+
+def load_local_model_cost_map() -> dict:
+    """
+    Loads the model cost map without a network call - used on import.
+
+    Returns the cached copy of the hosted map if there is one, else the bundled map.
+    """
+    global _model_cost_map_source
+    if not _use_local_model_cost_map():
+        content = _read_cached_model_cost_map()
+        if content is not None:
+            _model_cost_map_source = "cache"
             return content
+    _model_cost_map_source = "bundled"
+    return get_bundled_model_cost_map()
+
+
+def update_model_cost(model_cost_key: str, model_info: dict, fields: dict) -> None:
+    """
+    Used by `register_model` - updates `litellm.model_cost[model_cost_key]` with `model_info`, and records the registered `fields` so they survive a refresh of the model cost map.
+    """
+    import litellm
+
+    with _model_cost_map_lock:
+        _registered_model_cost.setdefault(model_cost_key, {}).update(fields)
+        litellm.model_cost.setdefault(model_cost_key, {}).update(model_info)
+
+
+def get_model_cost_version() -> Tuple[int, int]:
+    """
+    Cheap version key of `litellm.model_cost`, for the lookup caches derived from it (provider, optional params plans, model cost keys).
+
+    Changes when `litellm.model_cost` is replaced or models are added / removed without `register_model`.
+    In-place edits of existing entries (e.g. `litellm.model_cost["gpt-4o"]["litellm_provider"] = ...`) don't change it -
+    use `register_model`, which invalidates the caches.
+    """
+    import litellm
+
+    return (id(litellm.model_cost), len(litellm.model_cost))
+
+
+def _update_model_cost_map(new_model_cost: dict, current_model_cost: dict) -> bool:
+    """
+    Merges `new_model_cost` (+ the models registered with `register_model`) into `litellm.model_cost`, in place.
+
+    - models in `new_model_cost` replace the current entry - fields set by `register_model` are re-applied on top,
+      entries edited directly in `litellm.model_cost` lose those edits
+    - models only in `litellm.model_cost` (e.g. added directly by the user) are kept
+
+    Nothing is updated if `litellm.model_cost` is no longer `current_model_cost` - e.g. it was replaced by the user.
+    """
+    import litellm
+    from litellm.litellm_core_utils.get_llm_provider_logic import (
+        invalidate_llm_provider_cache,
+    )
+    from litellm.litellm_core_utils.llm_cost_calc.price_record import (
+        invalidate_price_records,
+    )
+    from litellm.litellm_core_utils.optional_params_plan import (
+        invalidate_optional_params_plans,
+    )
+    from litellm.utils import invalidate_model_cost_key_index
+
+    with _model_cost_map_lock:
+        if litellm.model_cost is not current_model_cost:
+            return False
+        for model_cost_key, fields in _registered_model_cost.items():
+            new_model_cost.setdefault(model_cost_key, {}).update(fields)
+        new_models = {
+            key: value
+            for key, value in new_model_cost.items()
+            if key not in current_model_cost
+        }
+        current_model_cost.update(new_model_cost)
+
+    # add new model names to provider lists
+    litellm.add_known_models(model_cost_map=new_models)
+    invalidate_llm_provider_cache()
+    invalidate_optional_params_plans()
+    invalidate_model_cost_key_index()
+    invalidate_price_records()
+    return True
+
+
+def refresh_model_cost_map(
+    url: str, timeout: float = MODEL_COST_MAP_REFRESH_TIMEOUT
+) -> bool:
+    """
+    Fetches the hosted model cost map and merges it into `litellm.model_cost` - see `_update_model_cost_map`.
+
+    Sends the ETag / Last-Modified of the cached copy, so an unchanged map isn't downloaded / parsed again.
+    A good copy is cached on disk and used on the next import.
+
+    Returns:
+        bool - True if `litellm.model_cost` was updated
+    """
+    global _model_cost_map_source
+    import litellm
+
+    current_model_cost = litellm.model_cost
+    response = httpx.get(
+        url, timeout=timeout, headers=_get_conditional_request_headers(url=url)
+    )
+    if response.status_code == 304:  # cached copy is up to date
+        return False
+    response.raise_for_status()
+    content = response.json()
+    if not _is_valid_model_cost_map(content):
+        raise ValueError("Invalid model cost map received from {}".format(url))
+
+    _write_cached_model_cost_map(
+        content_bytes=response.content,
+        url=url,
+        etag=response.headers.get("etag"),
+        last_modified=response.headers.get("last-modified"),
+    )
+    updated = _update_model_cost_map(
+        new_model_cost=content, current_model_cost=current_model_cost
+    )
+    if updated:
+        _model_cost_map_source = "cache"
+    return updated
+
+
+def _refresh_model_cost_map_loop(url: Optional[str], interval: int) -> None:
+    import litellm
+
+    while True:
+        try:
+            refresh_model_cost_map(url=url or litellm.model_cost_map_url)
+        except Exception as e:
+            verbose_logger.debug(
+                "litellm.get_model_cost_map: unable to refresh the model cost map, using the local copy - {}".format(
+                    str(e)
+                )
+            )
+        if interval <= 0:
+            return
+        time.sleep(interval)
+
+
+def start_model_cost_map_refresh(
+    url: Optional[str] = None, interval: int = MODEL_COST_MAP_REFRESH_INTERVAL
+) -> Optional[threading.Thread]:
+    """
+    Refreshes the model cost map in a background (daemon) thread - once, or every `interval` seconds if `interval` > 0.
+
+    No-op if LITELLM_LOCAL_MODEL_COST_MAP is set, or a refresh thread is already running.
+    """
+    global _model_cost_map_refresh_thread, _model_cost_map_refresh_args
+    if _use_local_model_cost_map():
+        return None
+    if (
+        _model_cost_map_refresh_thread is not None
+        and _model_cost_map_refresh_thread.is_alive()
+    ):
+        return _model_cost_map_refresh_thread
+
+    _model_cost_map_refresh_thread = threading.Thread(
+        target=_refresh_model_cost_map_loop,
+        args=(url, interval),
+        name="litellm-model-cost-map-refresh",
+        daemon=True,
+    )
+    _model_cost_map_refresh_thread.start()
+    if interval > 0 and _model_cost_map_refresh_args is None:
+        if hasattr(os, "register_at_fork"):
+            # threads don't survive a fork - e.g. gunicorn / uvicorn workers
+            os.register_at_fork(
+                after_in_child=_restart_model_cost_map_refresh_after_fork
+            )
+    _model_cost_map_refresh_args = (url, interval)
+    return _model_cost_map_refresh_thread
+
+
+def _restart_model_cost_map_refresh_after_fork() -> None:
+    global _model_cost_map_refresh_thread
+    _model_cost_map_refresh_thread = None
+    if _model_cost_map_refresh_args is not None:
+        url, interval = _model_cost_map_refresh_args
+        if interval > 0:
+            start_model_cost_map_refresh(url=url, interval=interval)
@@ -0,0 +1,122 @@
+"""
+Placeholders for provider handlers / modules that are only imported on first use.
+
+`litellm.main` holds one module-level handler per provider (e.g. `openai_chat_completions = OpenAIChatCompletion()`).
+Importing all of them on `import litellm` loads every provider's handler module, even if only one provider is ever called.
+
+`lazy_instance` / `lazy_module` / `lazy_attribute` return a `LazyObject` - it imports (and creates) the real object on
+first attribute access, call or `isinstance` check and forwards attribute reads, writes and deletes to it, so
+`unittest.mock.patch.object(litellm.main.openai_chat_completions, ...)` patches the real handler.
+"""
+
+import importlib
+import threading
+from types import ModuleType
+from typing import Any, Callable
+
+_lazy_object_lock = threading.Lock()
+
+_NOT_LOADED = object()
+
+
+class LazyObject:
+    __slots__ = ("_lazy_loader", "_lazy_description", "_lazy_value")
+
+    def __init__(self, loader: Callable[[], Any], description: str) -> None:
+        object.__setattr__(self, "_lazy_loader", loader)
+        object.__setattr__(self, "_lazy_description", description)
+        object.__setattr__(self, "_lazy_value", _NOT_LOADED)
+
+    def _lazy_load(self) -> Any:
+        value = object.__getattribute__(self, "_lazy_value")
+        if value is _NOT_LOADED:
+            # load outside the lock - the import can itself load other lazy objects
+            loaded_value = object.__getattribute__(self, "_lazy_loader")()
+            with _lazy_object_lock:
+                value = object.__getattribute__(self, "_lazy_value")
+                if value is _NOT_LOADED:  # first loader wins if two threads raced
+                    value = loaded_value
+                    object.__setattr__(self, "_lazy_value", value)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._lazy_load(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._lazy_load()(*args, **kwargs)
+
+    @property  # type: ignore[misc]
+    def __class__(self):  # so `isinstance(lazy_object, LoadedClass)` works
+        return type(self._lazy_load())
+
+    def __repr__(self) -> str:
+        value = object.__getattribute__(self, "_lazy_value")
+        if value is _NOT_LOADED:
+            return "<LazyObject {} (not loaded)>".format(
+                object.__getattribute__(self, "_lazy_description")
+            )
+        return repr(value)
+
+
+def lazy_module(module_name: str) -> Any:
+    """
+    `import module_name` on first use
+    """
+    return LazyObject(
+        loader=lambda: importlib.import_module(module_name),
+        description=module_name,
+    )
+
+
+def lazy_attribute(module_name: str, attr_name: str) -> Any:
+    """
+    `from module_name import attr_name` on first use
+    """
+    return LazyObject(
+        loader=lambda: getattr(importlib.import_module(module_name), attr_name),
+        description=f"{module_name}.{attr_name}",
+    )
+
+
+def lazy_instance(module_name: str, class_name: str, **init_kwargs: Any) -> Any:
+    """
+    `from module_name import class_name; class_name(**init_kwargs)` on first use
+    """
+    return LazyObject(
+        loader=lambda: getattr(importlib.import_module(module_name), class_name)(
+            **init_kwargs
+        ),
+        description=f"{module_name}.{class_name}()",
+    )
+
+
+def is_loaded(lazy_object: Any) -> bool:
+    """
+    False if `lazy_object` is a `LazyObject` that hasn't been imported yet
+    """
+    if type(lazy_object) is not LazyObject:
+        return True
+    return object.__getattribute__(lazy_object, "_lazy_value") is not _NOT_LOADED
+
+
+def load_lazy_objects(module: ModuleType) -> int:
+    """
+    Load every `LazyObject` in `module`'s namespace now, returns how many were loaded.
+
+    Objects that fail to load (e.g. a missing optional dependency) are left as placeholders - they raise on first use, as before.
+    """
+    loaded = 0
+    for value in list(vars(module).values()):
+        if type(value) is LazyObject and not is_loaded(value):
+            try:
+                value._lazy_load()
+            except Exception:
+                continue
+            loaded += 1
+    return loaded
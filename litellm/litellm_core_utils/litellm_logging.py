@@ -15,9 +15,11 @@ from datetime import datetime as dt_object
 from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Literal,
     Optional,
@@ -50,19 +52,19 @@ from litellm.constants import (
 from litellm.cost_calculator import (
     RealtimeAPITokenUsageProcessor,
     _select_model_name_for_cost_calc,
+    price_record_response_cost,
 )
-from litellm.integrations.agentops import AgentOps
 from litellm.integrations.anthropic_cache_control_hook import AnthropicCacheControlHook
-from litellm.integrations.arize.arize import ArizeLogger
 from litellm.integrations.custom_guardrail import CustomGuardrail
 from litellm.integrations.custom_logger import CustomLogger
-from litellm.integrations.deepeval.deepeval import DeepEvalLogger
-from litellm.integrations.mlflow import MlflowLogger
-from litellm.integrations.sqs import SQSLogger
 from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
 )
+from litellm.litellm_core_utils.logging_worker import logging_dispatcher
+from litellm.litellm_core_utils.logging_payload_size_policy import (
+    apply_callback_logging_payload_size_policy,
+)
 from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_custom_logger,
@@ -111,39 +113,9 @@ from litellm.types.utils import (
     TranscriptionResponse,
     Usage,
 )
-from litellm.utils import _get_base_model_from_metadata, executor, print_verbose
+from litellm.utils import _get_base_model_from_metadata, print_verbose
 
-from ..integrations.argilla import ArgillaLogger
-from ..integrations.arize.arize_phoenix import ArizePhoenixLogger
-from ..integrations.athina import AthinaLogger
-from ..integrations.azure_storage.azure_storage import AzureBlobStorageLogger
 from ..integrations.custom_prompt_management import CustomPromptManagement
-from ..integrations.datadog.datadog import DataDogLogger
-from ..integrations.datadog.datadog_llm_obs import DataDogLLMObsLogger
-from ..integrations.dotprompt import DotpromptManager
-from ..integrations.dynamodb import DyanmoDBLogger
-from ..integrations.galileo import GalileoObserve
-from ..integrations.gcs_bucket.gcs_bucket import GCSBucketLogger
-from ..integrations.gcs_pubsub.pub_sub import GcsPubSubLogger
-from ..integrations.greenscale import GreenscaleLogger
-from ..integrations.helicone import HeliconeLogger
-from ..integrations.humanloop import HumanloopLogger
-from ..integrations.lago import LagoLogger
-from ..integrations.langfuse.langfuse import LangFuseLogger
-from ..integrations.langfuse.langfuse_handler import LangFuseHandler
-from ..integrations.langfuse.langfuse_otel import LangfuseOtelLogger
-from ..integrations.langfuse.langfuse_prompt_management import LangfusePromptManagement
-from ..integrations.langsmith import LangsmithLogger
-from ..integrations.literal_ai import LiteralAILogger
-from ..integrations.logfire_logger import LogfireLevel, LogfireLogger
-from ..integrations.lunary import LunaryLogger
-from ..integrations.openmeter import OpenMeterLogger
-from ..integrations.opik.opik import OpikLogger
-from ..integrations.prompt_layer import PromptLayerLogger
-from ..integrations.s3 import S3Logger
-from ..integrations.s3_v2 import S3Logger as S3V2Logger
-from ..integrations.supabase import Supabase
-from ..integrations.traceloop import TraceloopLogger
 from .exception_mapping_utils import _get_response_headers
 from .initialize_dynamic_callback_params import (
     initialize_standard_callback_dynamic_params as _initialize_standard_callback_dynamic_params,
@@ -968,6 +940,12 @@ class Logging(LiteLLMLoggingBaseClass):
         litellm.error_logs["POST_CALL"] = locals()
         if isinstance(original_response, dict):
             original_response = json.dumps(original_response)
+        if litellm.logging_payload_size_policy is not None:
+            # don't keep large raw inputs / responses alive until the logging callbacks run
+            input = litellm.logging_payload_size_policy.summarize(input)
+            original_response = litellm.logging_payload_size_policy.summarize(
+                original_response
+            )
         try:
             self.model_call_details["input"] = input
             self.model_call_details["api_key"] = api_key
@@ -1216,6 +1194,30 @@ class Logging(LiteLLMLoggingBaseClass):
             )
             return None
 
+        ## FAST PATH - router deployments priced per token ##
+        try:
+            response_cost = price_record_response_cost(
+                response_object=result,
+                model=response_cost_calculator_kwargs["model"],
+                custom_llm_provider=response_cost_calculator_kwargs[
+                    "custom_llm_provider"
+                ],
+                call_type=self.call_type,
+                optional_params=self.optional_params,
+                cache_hit=cache_hit,
+                base_model=response_cost_calculator_kwargs["base_model"],
+                custom_pricing=custom_pricing,
+                standard_built_in_tools_params=self.standard_built_in_tools_params,
+                router_model_id=router_model_id,
+            )
+            if response_cost is not None:
+                verbose_logger.debug(f"response_cost: {response_cost}")
+                return response_cost
+        except Exception as e:  # use the full cost calculation below
+            verbose_logger.debug(
+                f"price record cost calculation failed, falling back - {str(e)}"
+            )
+
         try:
             response_cost = litellm.response_cost_calculator(
                 **response_cost_calculator_kwargs
@@ -1452,6 +1454,9 @@ class Logging(LiteLLMLoggingBaseClass):
                             end_time=end_time,
                             logging_obj=self,
                             status="success",
+                            payload_fields=self._get_standard_logging_payload_fields(
+                                status="success"
+                            ),
                             standard_built_in_tools_params=self.standard_built_in_tools_params,
                         )
                     )
@@ -1465,6 +1470,9 @@ class Logging(LiteLLMLoggingBaseClass):
                             end_time=end_time,
                             logging_obj=self,
                             status="success",
+                            payload_fields=self._get_standard_logging_payload_fields(
+                                status="success"
+                            ),
                             standard_built_in_tools_params=self.standard_built_in_tools_params,
                         )
                     )
@@ -1638,6 +1646,9 @@ class Logging(LiteLLMLoggingBaseClass):
                         end_time=end_time,
                         logging_obj=self,
                         status="success",
+                        payload_fields=self._get_standard_logging_payload_fields(
+                            status="success"
+                        ),
                         standard_built_in_tools_params=self.standard_built_in_tools_params,
                     )
                 )
@@ -1656,13 +1667,14 @@ class Logging(LiteLLMLoggingBaseClass):
                 result=result,
             )
             ## LOGGING HOOK ##
-            for callback in callbacks:
-                if isinstance(callback, CustomLogger):
-                    self.model_call_details, result = callback.logging_hook(
-                        kwargs=self.model_call_details,
-                        result=result,
-                        call_type=self.call_type,
-                    )
+            for callback in litellm.logging_callback_manager.get_callbacks_for_hook(
+                "logging_hook", callbacks
+            ):
+                self.model_call_details, result = callback.logging_hook(
+                    kwargs=self.model_call_details,
+                    result=result,
+                    call_type=self.call_type,
+                )
 
             self.has_run_logging(event_type="sync_success")
             for callback in callbacks:
@@ -1722,6 +1734,8 @@ class Logging(LiteLLMLoggingBaseClass):
                             print_verbose=print_verbose,
                         )
                     if callback == "logfire" and logfireLogger is not None:
+                        from litellm.integrations.logfire_logger import LogfireLevel
+
                         verbose_logger.debug("reaches logfire for success logging!")
                         kwargs = {}
                         for k, v in self.model_call_details.items():
@@ -1806,6 +1820,10 @@ class Logging(LiteLLMLoggingBaseClass):
                             kwargs=kwargs,
                         )
                     if callback == "langfuse":
+                        from litellm.integrations.langfuse.langfuse_handler import (
+                            LangFuseHandler,
+                        )
+
                         global langFuseLogger
                         print_verbose("reaches langfuse for success logging!")
                         kwargs = {}
@@ -1898,6 +1916,8 @@ class Logging(LiteLLMLoggingBaseClass):
                             print_verbose=print_verbose,
                         )
                     if callback == "s3":
+                        from litellm.integrations.s3 import S3Logger
+
                         global s3Logger
                         if s3Logger is None:
                             s3Logger = S3Logger()
@@ -1949,6 +1969,8 @@ class Logging(LiteLLMLoggingBaseClass):
                     ):
                         global openMeterLogger
                         if openMeterLogger is None:
+                            from litellm.integrations.openmeter import OpenMeterLogger
+
                             print_verbose("Instantiates openmeter client")
                             openMeterLogger = OpenMeterLogger()
                         if self.stream and complete_streaming_response is None:
@@ -1994,12 +2016,18 @@ class Logging(LiteLLMLoggingBaseClass):
                         != CallTypes.pass_through.value  # pass-through endpoints call async_log_success_event
                     ):  # custom logger class
                         if self.stream and complete_streaming_response is None:
-                            callback.log_stream_event(
-                                kwargs=self.model_call_details,
-                                response_obj=result,
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
+                            if _custom_logger_overrides_any_hook(
+                                callback, ("log_stream_event",)
+                            ):
+                                callback.log_stream_event(
+                                    kwargs=apply_callback_logging_payload_size_policy(
+                                        callback=callback,
+                                        model_call_details=self.model_call_details,
+                                    ),
+                                    response_obj=result,
+                                    start_time=start_time,
+                                    end_time=end_time,
+                                )
                         else:
                             if self.stream and complete_streaming_response:
                                 self.model_call_details["complete_response"] = (
@@ -2009,12 +2037,18 @@ class Logging(LiteLLMLoggingBaseClass):
                                 )
                                 result = self.model_call_details["complete_response"]
 
-                            callback.log_success_event(
-                                kwargs=self.model_call_details,
-                                response_obj=result,
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
+                            if _custom_logger_overrides_any_hook(
+                                callback, ("log_success_event",)
+                            ):
+                                callback.log_success_event(
+                                    kwargs=apply_callback_logging_payload_size_policy(
+                                        callback=callback,
+                                        model_call_details=self.model_call_details,
+                                    ),
+                                    response_obj=result,
+                                    start_time=start_time,
+                                    end_time=end_time,
+                                )
                     if (
                         callable(callback) is True
                         and self.model_call_details.get("litellm_params", {}).get(
@@ -2178,6 +2212,9 @@ class Logging(LiteLLMLoggingBaseClass):
                     end_time=end_time,
                     logging_obj=self,
                     status="success",
+                    payload_fields=self._get_standard_logging_payload_fields(
+                        status="success"
+                    ),
                     standard_built_in_tools_params=self.standard_built_in_tools_params,
                 )
             )
@@ -2217,11 +2254,17 @@ class Logging(LiteLLMLoggingBaseClass):
                 result = redact_message_input_output_from_custom_logger(
                     result=result, litellm_logging_obj=self, custom_logger=callback
                 )
-                self.model_call_details, result = await callback.async_logging_hook(
-                    kwargs=self.model_call_details,
-                    result=result,
-                    call_type=self.call_type,
-                )
+                if litellm.logging_callback_manager.callback_overrides_hook(
+                    callback, "async_logging_hook"
+                ):
+                    (
+                        self.model_call_details,
+                        result,
+                    ) = await callback.async_logging_hook(
+                        kwargs=self.model_call_details,
+                        result=result,
+                        call_type=self.call_type,
+                    )
 
         self.has_run_logging(event_type="async_success")
 
@@ -2265,13 +2308,20 @@ class Logging(LiteLLMLoggingBaseClass):
                             end_time=end_time,
                         )
 
-                if isinstance(callback, CustomLogger):  # custom logger class
+                if isinstance(
+                    callback, CustomLogger
+                ) and _custom_logger_overrides_any_hook(
+                    callback, ("async_log_success_event", "async_log_stream_event")
+                ):  # custom logger class
                     model_call_details: Dict = self.model_call_details
                     ##################################
                     # call redaction hook for custom logger
                     model_call_details = callback.redact_standard_logging_payload_from_model_call_details(
                         model_call_details=model_call_details
                     )
+                    model_call_details = apply_callback_logging_payload_size_policy(
+                        callback=callback, model_call_details=model_call_details
+                    )
                     ##################################
                     if self.stream is True:
                         if "async_complete_streaming_response" in model_call_details:
@@ -2326,6 +2376,8 @@ class Logging(LiteLLMLoggingBaseClass):
                             callback_func=callback,
                         )
                 if callback == "dynamodb":
+                    from litellm.integrations.dynamodb import DyanmoDBLogger
+
                     global dynamoLogger
                     if dynamoLogger is None:
                         dynamoLogger = DyanmoDBLogger()
@@ -2400,6 +2452,9 @@ class Logging(LiteLLMLoggingBaseClass):
                 end_time=end_time,
                 logging_obj=self,
                 status="failure",
+                payload_fields=self._get_standard_logging_payload_fields(
+                    status="failure"
+                ),
                 error_str=str(exception),
                 original_exception=exception,
                 standard_built_in_tools_params=self.standard_built_in_tools_params,
@@ -2553,14 +2608,24 @@ class Logging(LiteLLMLoggingBaseClass):
                             "aembedding", False
                         )
                         is not True
+                        and _custom_logger_overrides_any_hook(
+                            callback, ("log_failure_event",)
+                        )
                     ):  # custom logger class
                         callback.log_failure_event(
                             start_time=start_time,
                             end_time=end_time,
                             response_obj=result,
-                            kwargs=self.model_call_details,
+                            kwargs=apply_callback_logging_payload_size_policy(
+                                callback=callback,
+                                model_call_details=self.model_call_details,
+                            ),
                         )
                     if callback == "langfuse":
+                        from litellm.integrations.langfuse.langfuse_handler import (
+                            LangFuseHandler,
+                        )
+
                         global langFuseLogger
                         verbose_logger.debug("reaches langfuse for logging failure")
                         kwargs = {}
@@ -2604,6 +2669,8 @@ class Logging(LiteLLMLoggingBaseClass):
                             kwargs=self.model_call_details,
                         )
                     if callback == "logfire" and logfireLogger is not None:
+                        from litellm.integrations.logfire_logger import LogfireLevel
+
                         verbose_logger.debug("reaches logfire for failure logging!")
                         kwargs = {}
                         for k, v in self.model_call_details.items():
@@ -2674,9 +2741,16 @@ class Logging(LiteLLMLoggingBaseClass):
                 )
                 if not should_run:
                     continue
-                if isinstance(callback, CustomLogger):  # custom logger class
+                if isinstance(
+                    callback, CustomLogger
+                ) and _custom_logger_overrides_any_hook(
+                    callback, ("async_log_failure_event",)
+                ):  # custom logger class
                     await callback.async_log_failure_event(
-                        kwargs=self.model_call_details,
+                        kwargs=apply_callback_logging_payload_size_policy(
+                            callback=callback,
+                            model_call_details=self.model_call_details,
+                        ),
                         response_obj=result,
                         start_time=start_time,
                         end_time=end_time,
@@ -2727,6 +2801,8 @@ class Logging(LiteLLMLoggingBaseClass):
         global langFuseLogger
 
         if service_name == "langfuse":
+            from litellm.integrations.langfuse.langfuse import LangFuseLogger
+
             if langFuseLogger is None or (
                 (
                     self.standard_callback_dynamic_params.get("langfuse_public_key")
@@ -2771,12 +2847,12 @@ class Logging(LiteLLMLoggingBaseClass):
         """
         Handles calling success callbacks for Async calls.
 
-        Why: Some callbacks - `langfuse`, `s3` are sync callbacks. We need to call them in the executor.
+        Why: Some callbacks - `langfuse`, `s3` are sync callbacks. We need to call them on the logging dispatcher's worker threads.
         """
         if self._should_run_sync_callbacks_for_async_calls() is False:
             return
 
-        executor.submit(
+        logging_dispatcher.submit(
             self.success_handler,
             result,
             start_time,
@@ -2800,6 +2876,28 @@ class Logging(LiteLLMLoggingBaseClass):
         )
         return len(_filtered_success_callbacks) > 0
 
+    def _get_standard_logging_payload_fields(
+        self, status: StandardLoggingPayloadStatus
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Get the `StandardLoggingPayload` fields needed by the callbacks of this call - None if all fields are needed.
+        """
+        if status == "failure":
+            return litellm.logging_callback_manager.get_standard_logging_payload_fields(
+                litellm.callbacks,  # type: ignore
+                litellm.failure_callback,  # type: ignore
+                litellm._async_failure_callback,  # type: ignore
+                self.dynamic_failure_callbacks,  # type: ignore
+                self.dynamic_async_failure_callbacks,  # type: ignore
+            )
+        return litellm.logging_callback_manager.get_standard_logging_payload_fields(
+            litellm.callbacks,  # type: ignore
+            litellm.success_callback,  # type: ignore
+            litellm._async_success_callback,  # type: ignore
+            self.dynamic_success_callbacks,  # type: ignore
+            self.dynamic_async_success_callbacks,  # type: ignore
+        )
+
     def get_combined_callback_list(
         self, dynamic_success_callbacks: Optional[List], global_callbacks: List
     ) -> List:
@@ -3100,38 +3198,64 @@ def set_callbacks(callback_list, function_id=None):  # noqa: PLR0915
                 alerts_channel = os.environ["SLACK_API_CHANNEL"]
                 print_verbose(f"Initialized Slack App: {slack_app}")
             elif callback == "traceloop":
+                from litellm.integrations.traceloop import TraceloopLogger
+
                 traceloopLogger = TraceloopLogger()
             elif callback == "athina":
+                from litellm.integrations.athina import AthinaLogger
+
                 athinaLogger = AthinaLogger()
                 print_verbose("Initialized Athina Logger")
             elif callback == "helicone":
+                from litellm.integrations.helicone import HeliconeLogger
+
                 heliconeLogger = HeliconeLogger()
             elif callback == "lunary":
+                from litellm.integrations.lunary import LunaryLogger
+
                 lunaryLogger = LunaryLogger()
             elif callback == "promptlayer":
+                from litellm.integrations.prompt_layer import PromptLayerLogger
+
                 promptLayerLogger = PromptLayerLogger()
             elif callback == "langfuse":
+                from litellm.integrations.langfuse.langfuse import LangFuseLogger
+
                 langFuseLogger = LangFuseLogger(
                     langfuse_public_key=None, langfuse_secret=None, langfuse_host=None
                 )
             elif callback == "openmeter":
+                from litellm.integrations.openmeter import OpenMeterLogger
+
                 openMeterLogger = OpenMeterLogger()
             elif callback == "datadog":
+                from litellm.integrations.datadog.datadog import DataDogLogger
+
                 dataDogLogger = DataDogLogger()
             elif callback == "dynamodb":
+                from litellm.integrations.dynamodb import DyanmoDBLogger
+
                 dynamoLogger = DyanmoDBLogger()
             elif callback == "s3":
+                from litellm.integrations.s3 import S3Logger
+
                 s3Logger = S3Logger()
             elif callback == "wandb":
                 from litellm.integrations.weights_biases import WeightsBiasesLogger
 
                 weightsBiasesLogger = WeightsBiasesLogger()
             elif callback == "logfire":
+                from litellm.integrations.logfire_logger import LogfireLogger
+
                 logfireLogger = LogfireLogger()
             elif callback == "supabase":
+                from litellm.integrations.supabase import Supabase
+
                 print_verbose("instantiating supabase")
                 supabaseClient = Supabase()
             elif callback == "greenscale":
+                from litellm.integrations.greenscale import GreenscaleLogger
+
                 greenscaleLogger = GreenscaleLogger()
                 print_verbose("Initialized Greenscale Logger")
             elif callable(callback):
@@ -3155,6 +3279,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
     try:
         custom_logger_init_args = custom_logger_init_args or {}
         if logging_integration == "agentops":  # Add AgentOps initialization
+            from litellm.integrations.agentops import AgentOps
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, AgentOps):
                     return callback  # type: ignore
@@ -3163,6 +3289,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(agentops_logger)
             return agentops_logger  # type: ignore
         elif logging_integration == "lago":
+            from litellm.integrations.lago import LagoLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LagoLogger):
                     return callback  # type: ignore
@@ -3171,6 +3299,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(lago_logger)
             return lago_logger  # type: ignore
         elif logging_integration == "openmeter":
+            from litellm.integrations.openmeter import OpenMeterLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, OpenMeterLogger):
                     return callback  # type: ignore
@@ -3189,6 +3319,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(braintrust_logger)
             return braintrust_logger  # type: ignore
         elif logging_integration == "langsmith":
+            from litellm.integrations.langsmith import LangsmithLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LangsmithLogger):
                     return callback  # type: ignore
@@ -3197,6 +3329,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_langsmith_logger)
             return _langsmith_logger  # type: ignore
         elif logging_integration == "argilla":
+            from litellm.integrations.argilla import ArgillaLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, ArgillaLogger):
                     return callback  # type: ignore
@@ -3205,6 +3339,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_argilla_logger)
             return _argilla_logger  # type: ignore
         elif logging_integration == "literalai":
+            from litellm.integrations.literal_ai import LiteralAILogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LiteralAILogger):
                     return callback  # type: ignore
@@ -3221,6 +3357,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
                 _in_memory_loggers.append(_prometheus_logger)
                 return _prometheus_logger  # type: ignore
         elif logging_integration == "datadog":
+            from litellm.integrations.datadog.datadog import DataDogLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, DataDogLogger):
                     return callback  # type: ignore
@@ -3229,10 +3367,14 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_datadog_logger)
             return _datadog_logger  # type: ignore
         elif logging_integration == "datadog_llm_observability":
+            from litellm.integrations.datadog.datadog_llm_obs import DataDogLLMObsLogger
+
             _datadog_llm_obs_logger = DataDogLLMObsLogger()
             _in_memory_loggers.append(_datadog_llm_obs_logger)
             return _datadog_llm_obs_logger  # type: ignore
         elif logging_integration == "gcs_bucket":
+            from litellm.integrations.gcs_bucket.gcs_bucket import GCSBucketLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, GCSBucketLogger):
                     return callback  # type: ignore
@@ -3241,6 +3383,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_gcs_bucket_logger)
             return _gcs_bucket_logger  # type: ignore
         elif logging_integration == "s3_v2":
+            from litellm.integrations.s3_v2 import S3Logger as S3V2Logger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, S3V2Logger):
                     return callback  # type: ignore
@@ -3249,6 +3393,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_s3_v2_logger)
             return _s3_v2_logger  # type: ignore
         elif logging_integration == "aws_sqs":
+            from litellm.integrations.sqs import SQSLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, SQSLogger):
                     return callback  # type: ignore
@@ -3257,6 +3403,10 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_aws_sqs_logger)
             return _aws_sqs_logger  # type: ignore
         elif logging_integration == "azure_storage":
+            from litellm.integrations.azure_storage.azure_storage import (
+                AzureBlobStorageLogger,
+            )
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, AzureBlobStorageLogger):
                     return callback  # type: ignore
@@ -3265,6 +3415,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_azure_storage_logger)
             return _azure_storage_logger  # type: ignore
         elif logging_integration == "opik":
+            from litellm.integrations.opik.opik import OpikLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, OpikLogger):
                     return callback  # type: ignore
@@ -3273,6 +3425,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_opik_logger)
             return _opik_logger  # type: ignore
         elif logging_integration == "arize":
+            from litellm.integrations.arize.arize import ArizeLogger
+
             from litellm.integrations.opentelemetry import (
                 OpenTelemetry,
                 OpenTelemetryConfig,
@@ -3301,6 +3455,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_arize_otel_logger)
             return _arize_otel_logger  # type: ignore
         elif logging_integration == "arize_phoenix":
+            from litellm.integrations.arize.arize_phoenix import ArizePhoenixLogger
+
             from litellm.integrations.opentelemetry import (
                 OpenTelemetry,
                 OpenTelemetryConfig,
@@ -3344,6 +3500,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             return otel_logger  # type: ignore
 
         elif logging_integration == "galileo":
+            from litellm.integrations.galileo import GalileoObserve
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, GalileoObserve):
                     return callback  # type: ignore
@@ -3353,6 +3511,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             return galileo_logger  # type: ignore
 
         elif logging_integration == "deepeval":
+            from litellm.integrations.deepeval.deepeval import DeepEvalLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, DeepEvalLogger):
                     return callback  # type: ignore
@@ -3430,6 +3590,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             return _otel_logger  # type: ignore
 
         elif logging_integration == "mlflow":
+            from litellm.integrations.mlflow import MlflowLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, MlflowLogger):
                     return callback  # type: ignore
@@ -3438,6 +3600,10 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_mlflow_logger)
             return _mlflow_logger  # type: ignore
         elif logging_integration == "langfuse":
+            from litellm.integrations.langfuse.langfuse_prompt_management import (
+                LangfusePromptManagement,
+            )
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LangfusePromptManagement):
                     return callback
@@ -3446,6 +3612,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(langfuse_logger)
             return langfuse_logger  # type: ignore
         elif logging_integration == "langfuse_otel":
+            from litellm.integrations.langfuse.langfuse_otel import LangfuseOtelLogger
+
             from litellm.integrations.opentelemetry import (
                 OpenTelemetry,
                 OpenTelemetryConfig,
@@ -3495,6 +3663,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(vector_store_pre_call_hook)
             return vector_store_pre_call_hook  # type: ignore
         elif logging_integration == "gcs_pubsub":
+            from litellm.integrations.gcs_pubsub.pub_sub import GcsPubSubLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, GcsPubSubLogger):
                     return callback
@@ -3523,6 +3693,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(smtp_email_logger)
             return smtp_email_logger  # type: ignore
         elif logging_integration == "humanloop":
+            from litellm.integrations.humanloop import HumanloopLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, HumanloopLogger):
                     return callback
@@ -3531,6 +3703,8 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(humanloop_logger)
             return humanloop_logger  # type: ignore
         elif logging_integration == "dotprompt":
+            from litellm.integrations.dotprompt import DotpromptManager
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, DotpromptManager):
                     return callback
@@ -3547,15 +3721,31 @@ def _init_custom_logger_compatible_class(  # noqa: PLR0915
     return None
 
 
+def _custom_logger_overrides_any_hook(
+    callback: CustomLogger, hook_names: Tuple[str, ...]
+) -> bool:
+    """
+    Returns True if the custom logger implements any of the hooks - the `CustomLogger` defaults are no-ops.
+    """
+    return any(
+        litellm.logging_callback_manager.callback_overrides_hook(callback, hook_name)
+        for hook_name in hook_names
+    )
+
+
 def get_custom_logger_compatible_class(  # noqa: PLR0915
     logging_integration: _custom_logger_compatible_callbacks_literal,
 ) -> Optional[CustomLogger]:
     try:
         if logging_integration == "lago":
+            from litellm.integrations.lago import LagoLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LagoLogger):
                     return callback
         elif logging_integration == "openmeter":
+            from litellm.integrations.openmeter import OpenMeterLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, OpenMeterLogger):
                     return callback
@@ -3566,22 +3756,32 @@ def get_custom_logger_compatible_class(  # noqa: PLR0915
                 if isinstance(callback, BraintrustLogger):
                     return callback
         elif logging_integration == "galileo":
+            from litellm.integrations.galileo import GalileoObserve
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, GalileoObserve):
                     return callback
         elif logging_integration == "deepeval":
+            from litellm.integrations.deepeval.deepeval import DeepEvalLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, DeepEvalLogger):
                     return callback
         elif logging_integration == "langsmith":
+            from litellm.integrations.langsmith import LangsmithLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LangsmithLogger):
                     return callback
         elif logging_integration == "argilla":
+            from litellm.integrations.argilla import ArgillaLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, ArgillaLogger):
                     return callback
         elif logging_integration == "literalai":
+            from litellm.integrations.literal_ai import LiteralAILogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LiteralAILogger):
                     return callback
@@ -3590,22 +3790,32 @@ def get_custom_logger_compatible_class(  # noqa: PLR0915
                 if isinstance(callback, PrometheusLogger):
                     return callback
         elif logging_integration == "datadog":
+            from litellm.integrations.datadog.datadog import DataDogLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, DataDogLogger):
                     return callback
         elif logging_integration == "datadog_llm_observability":
+            from litellm.integrations.datadog.datadog_llm_obs import DataDogLLMObsLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, DataDogLLMObsLogger):
                     return callback
         elif logging_integration == "gcs_bucket":
+            from litellm.integrations.gcs_bucket.gcs_bucket import GCSBucketLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, GCSBucketLogger):
                     return callback
         elif logging_integration == "s3_v2":
+            from litellm.integrations.s3_v2 import S3Logger as S3V2Logger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, S3V2Logger):
                     return callback
         elif logging_integration == "aws_sqs":
+            from litellm.integrations.sqs import SQSLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, SQSLogger):
                     return callback
@@ -3613,14 +3823,24 @@ def get_custom_logger_compatible_class(  # noqa: PLR0915
             _in_memory_loggers.append(_aws_sqs_logger)
             return _aws_sqs_logger  # type: ignore
         elif logging_integration == "azure_storage":
+            from litellm.integrations.azure_storage.azure_storage import (
+                AzureBlobStorageLogger,
+            )
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, AzureBlobStorageLogger):
                     return callback
         elif logging_integration == "opik":
+            from litellm.integrations.opik.opik import OpikLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, OpikLogger):
                     return callback
         elif logging_integration == "langfuse":
+            from litellm.integrations.langfuse.langfuse_prompt_management import (
+                LangfusePromptManagement,
+            )
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, LangfusePromptManagement):
                     return callback
@@ -3631,6 +3851,8 @@ def get_custom_logger_compatible_class(  # noqa: PLR0915
                 if isinstance(callback, OpenTelemetry):
                     return callback
         elif logging_integration == "arize":
+            from litellm.integrations.arize.arize import ArizeLogger
+
             if "ARIZE_SPACE_KEY" not in os.environ:
                 raise ValueError("ARIZE_SPACE_KEY not found in environment variables")
             if "ARIZE_API_KEY" not in os.environ:
@@ -3673,6 +3895,8 @@ def get_custom_logger_compatible_class(  # noqa: PLR0915
                     return callback
 
         elif logging_integration == "mlflow":
+            from litellm.integrations.mlflow import MlflowLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, MlflowLogger):
                     return callback
@@ -3693,6 +3917,8 @@ def get_custom_logger_compatible_class(  # noqa: PLR0915
                 if isinstance(callback, VectorStorePreCallHook):
                     return callback
         elif logging_integration == "gcs_pubsub":
+            from litellm.integrations.gcs_pubsub.pub_sub import GcsPubSubLogger
+
             for callback in _in_memory_loggers:
                 if isinstance(callback, GcsPubSubLogger):
                     return callback
@@ -3977,6 +4203,99 @@ class StandardLoggingPayloadSetup:
                 )
         return model_cost_information
 
+    @staticmethod
+    def get_payload_fields(
+        payload_fields: Optional[AbstractSet[str]],
+    ) -> Optional[AbstractSet[str]]:
+        """
+        Get the payload fields to build - None (all fields) if `LITELLM_PRINT_STANDARD_LOGGING_PAYLOAD` prints the full payload
+        """
+        if payload_fields is not None and os.getenv(
+            "LITELLM_PRINT_STANDARD_LOGGING_PAYLOAD"
+        ):
+            return None
+        return payload_fields
+
+    @staticmethod
+    def get_response_obj_and_hidden_params(
+        init_response_obj: Union[Any, BaseModel, dict],
+        original_exception: Optional[Exception],
+        include_response: bool,
+    ) -> Tuple[dict, Optional[dict]]:
+        """
+        Get the response object as a dict and the hidden params of the response / exception
+
+        If `include_response` is False, a response object is only summarized - skips serializing large responses (e.g. embeddings)
+        """
+        hidden_params: Optional[dict] = None
+        if init_response_obj is None:
+            response_obj: dict = {}
+        elif isinstance(init_response_obj, BaseModel):
+            if include_response:
+                response_obj = init_response_obj.model_dump()
+            else:
+                response_obj = StandardLoggingPayloadSetup.get_response_obj_summary(
+                    init_response_obj
+                )
+            hidden_params = getattr(init_response_obj, "_hidden_params", None)
+        elif isinstance(init_response_obj, dict):
+            response_obj = init_response_obj
+        else:
+            response_obj = {}
+
+        if original_exception is not None and hidden_params is None:
+            response_headers = _get_response_headers(original_exception)
+            if response_headers is not None:
+                hidden_params = dict(
+                    StandardLoggingHiddenParams(
+                        additional_headers=StandardLoggingPayloadSetup.get_additional_headers(
+                            dict(response_headers)
+                        ),
+                        model_id=None,
+                        cache_key=None,
+                        api_base=None,
+                        response_cost=None,
+                        litellm_overhead_time_ms=None,
+                        batch_models=None,
+                        litellm_model_name=None,
+                        usage_object=None,
+                    )
+                )
+        return response_obj, hidden_params
+
+    @staticmethod
+    def get_response_obj_summary(response_obj: BaseModel) -> dict:
+        """
+        Get the `id` and `usage` of a response object, as in `response_obj.model_dump()`
+        """
+        response_obj_summary: dict = {}
+        for field in ("id", "usage"):
+            if not hasattr(response_obj, field):
+                continue
+            value = getattr(response_obj, field)
+            if isinstance(value, BaseModel) and not isinstance(value, Usage):
+                value = value.model_dump()
+            response_obj_summary[field] = value
+        return response_obj_summary
+
+    @staticmethod
+    def get_payload_response(
+        response_obj: dict,
+        init_response_obj: Union[Any, BaseModel, dict],
+        kwargs: dict,
+        include_response: bool,
+    ) -> Optional[Union[dict, str, list]]:
+        """
+        Get the `response` of the payload - None if no callback reads it
+        """
+        if not include_response:
+            return None
+        return StandardLoggingPayloadSetup.get_final_response_obj(
+            response_obj=response_obj,
+            init_response_obj=init_response_obj,
+            kwargs=kwargs,
+        )
+
     @staticmethod
     def get_final_response_obj(
         response_obj: dict, init_response_obj: Union[Any, BaseModel, dict], kwargs: dict
@@ -4215,39 +4534,30 @@ def get_standard_logging_object_payload(
     error_str: Optional[str] = None,
     original_exception: Optional[Exception] = None,
     standard_built_in_tools_params: Optional[StandardBuiltInToolsParams] = None,
+    payload_fields: Optional[AbstractSet[str]] = None,
 ) -> Optional[StandardLoggingPayload]:
+    """
+    Build the `StandardLoggingPayload` for a call.
+
+    `payload_fields` are the fields read by the callbacks (see `CustomLogger.standard_logging_payload_fields`), None means all fields.
+    - if no field is needed, the payload isn't built (returns None)
+    - if `response` isn't needed, the response object isn't serialized (`response` is None)
+    """
+    payload_fields = StandardLoggingPayloadSetup.get_payload_fields(payload_fields)
+    if payload_fields is not None and len(payload_fields) == 0:
+        return None
+    include_response = payload_fields is None or "response" in payload_fields
     try:
         kwargs = kwargs or {}
 
-        hidden_params: Optional[dict] = None
-        if init_response_obj is None:
-            response_obj = {}
-        elif isinstance(init_response_obj, BaseModel):
-            response_obj = init_response_obj.model_dump()
-            hidden_params = getattr(init_response_obj, "_hidden_params", None)
-        elif isinstance(init_response_obj, dict):
-            response_obj = init_response_obj
-        else:
-            response_obj = {}
-
-        if original_exception is not None and hidden_params is None:
-            response_headers = _get_response_headers(original_exception)
-            if response_headers is not None:
-                hidden_params = dict(
-                    StandardLoggingHiddenParams(
-                        additional_headers=StandardLoggingPayloadSetup.get_additional_headers(
-                            dict(response_headers)
-                        ),
-                        model_id=None,
-                        cache_key=None,
-                        api_base=None,
-                        response_cost=None,
-                        litellm_overhead_time_ms=None,
-                        batch_models=None,
-                        litellm_model_name=None,
-                        usage_object=None,
-                    )
-                )
+        (
+            response_obj,
+            hidden_params,
+        ) = StandardLoggingPayloadSetup.get_response_obj_and_hidden_params(
+            init_response_obj=init_response_obj,
+            original_exception=original_exception,
+            include_response=include_response,
+        )
 
         # standardize this function to be used across, s3, dynamoDB, langfuse logging
         litellm_params = kwargs.get("litellm_params", {})
@@ -4345,10 +4655,11 @@ def get_standard_logging_object_payload(
         )
 
         ## get final response object ##
-        final_response_obj = StandardLoggingPayloadSetup.get_final_response_obj(
+        final_response_obj = StandardLoggingPayloadSetup.get_payload_response(
             response_obj=response_obj,
             init_response_obj=init_response_obj,
             kwargs=kwargs,
+            include_response=include_response,
         )
 
         stream: Optional[bool] = None
@@ -4408,6 +4719,13 @@ def get_standard_logging_object_payload(
             standard_built_in_tools_params=standard_built_in_tools_params,
         )
 
+        if litellm.logging_payload_size_policy is not None:
+            payload = (
+                litellm.logging_payload_size_policy.apply_to_standard_logging_payload(
+                    payload
+                )
+            )
+
         emit_standard_logging_payload(payload)
         return payload
     except Exception as e:
@@ -4506,6 +4824,8 @@ def scrub_sensitive_keys_in_metadata(litellm_params: Optional[dict]):
 def modify_integration(integration_name, integration_params):
     global supabaseClient
     if integration_name == "supabase":
+        from litellm.integrations.supabase import Supabase
+
         if "table_name" in integration_params:
             Supabase.supabase_table_name = integration_params["table_name"]
 
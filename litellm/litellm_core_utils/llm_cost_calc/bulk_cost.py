@@ -0,0 +1,361 @@
+"""
+Bulk cost calculation - e.g. to recompute `LiteLLM_SpendLogs.spend` for millions of rows after a pricing change.
+
+`bulk_cost_per_token` takes columnar usage (one sequence per field) and groups the rows by (model, custom_llm_provider),
+so each model's prices are resolved once and applied to all of its rows at once - with NumPy if it's installed, else in pure python.
+
+Rows of providers priced with `generic_cost_per_token` use the model's compiled `PriceRecord`, rows of other providers fall back to `cost_per_token`.
+
+Rows of a router deployment with custom pricing (`model_ids`) are priced with the deployment's `litellm.model_cost` entry - the Router
+registers it under `model_info.id`, like `completion_cost` does with `router_model_id`. Rows of a deployment that isn't registered are None.
+
+Only rows whose cost is fully derivable from these columns are priced - chat / embedding models priced per token, and rows
+without cache creation, audio or reasoning tokens. Everything else (e.g. `whisper-1`, `tts-1`, an anthropic row that wrote
+to the prompt cache) is None, so callers keep the cost that was logged with the full usage.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.cost_calculator import (
+    _get_model_cost_key_for_cost_per_token,
+    cost_per_token,
+)
+from litellm.litellm_core_utils.llm_cost_calc.price_record import (
+    PRICE_RECORD_PROVIDERS,
+    PriceRecord,
+    get_price_record,
+)
+from litellm.types.router import CustomPricingLiteLLMParams
+
+BULK_COST_MODES = ("chat", "embedding")
+
+# model prices not billed per token - rows of these models can't be priced from token counts
+NON_TOKEN_PRICE_KEYWORDS = (
+    "per_second",
+    "per_character",
+    "per_image",
+    "per_pixel",
+    "per_query",
+    "per_request",
+)
+
+
+def bulk_cost_per_token(
+    models: Sequence[str],
+    prompt_tokens: Sequence[int],
+    completion_tokens: Sequence[int],
+    cached_tokens: Optional[Sequence[int]] = None,
+    custom_llm_providers: Optional[Sequence[Optional[str]]] = None,
+    use_numpy: Optional[bool] = None,
+    cache_creation_tokens: Optional[Sequence[int]] = None,
+    audio_tokens: Optional[Sequence[int]] = None,
+    reasoning_tokens: Optional[Sequence[int]] = None,
+    model_ids: Optional[Sequence[Optional[str]]] = None,
+) -> List[Optional[float]]:
+    """
+    Calculates the cost of each row of columnar usage data.
+
+    Parameters:
+        models: the model of each row
+        prompt_tokens: the prompt tokens of each row (including cached tokens)
+        completion_tokens: the completion tokens of each row
+        cached_tokens: Optional - the cached (cache read) prompt tokens of each row
+        custom_llm_providers: Optional - the provider of each row, inferred from the model if not set
+        use_numpy: Optional - use NumPy (True) / pure python (False). Defaults to NumPy if it's installed.
+        cache_creation_tokens: Optional - the cache creation (cache write) prompt tokens of each row
+        audio_tokens: Optional - the audio prompt + completion tokens of each row
+        reasoning_tokens: Optional - the reasoning completion tokens of each row
+        model_ids: Optional - the router deployment (`model_info.id`) of each row, rows of a deployment with custom pricing are priced with its prices
+
+    Returns:
+        List[Optional[float]] - the cost of each row, same as the sum of `cost_per_token(model, prompt_tokens, completion_tokens, custom_llm_provider, cache_read_input_tokens=cached_tokens)`.
+        None for rows whose model isn't mapped, isn't a chat / embedding model priced per token, or that have cache creation, audio or reasoning tokens.
+        None for rows whose deployment isn't registered in `litellm.model_cost`.
+    """
+    num_rows = len(models)
+    if cached_tokens is None:
+        cached_tokens = [0] * num_rows
+    if custom_llm_providers is None:
+        custom_llm_providers = [None] * num_rows
+    if cache_creation_tokens is None:
+        cache_creation_tokens = [0] * num_rows
+    if audio_tokens is None:
+        audio_tokens = [0] * num_rows
+    if reasoning_tokens is None:
+        reasoning_tokens = [0] * num_rows
+    if model_ids is None:
+        model_ids = [None] * num_rows
+    if not (
+        len(prompt_tokens)
+        == len(completion_tokens)
+        == len(cached_tokens)
+        == len(custom_llm_providers)
+        == len(cache_creation_tokens)
+        == len(audio_tokens)
+        == len(reasoning_tokens)
+        == len(model_ids)
+        == num_rows
+    ):
+        raise ValueError(
+            "models, prompt_tokens, completion_tokens, cached_tokens, custom_llm_providers, cache_creation_tokens, audio_tokens, reasoning_tokens and model_ids must have the same length"
+        )
+
+    numpy = _get_numpy() if use_numpy is not False else None
+    if use_numpy is True and numpy is None:
+        raise ImportError(
+            "numpy is required for `use_numpy=True`. Run `pip install numpy`."
+        )
+
+    ## GROUP ROWS BY MODEL ##
+    row_groups: Dict[Tuple[str, Optional[str], Optional[str]], List[int]] = {}
+    for idx in range(num_rows):
+        if cache_creation_tokens[idx] or audio_tokens[idx] or reasoning_tokens[idx]:
+            continue  # not derivable from prompt / completion / cached tokens
+        row_groups.setdefault(
+            (models[idx], custom_llm_providers[idx], model_ids[idx] or None), []
+        ).append(idx)
+
+    costs: List[Optional[float]] = [None] * num_rows
+    for (model, custom_llm_provider, model_id), row_indices in row_groups.items():
+        bulk_pricing_model = _get_bulk_pricing_model(
+            model=model, custom_llm_provider=custom_llm_provider, model_id=model_id
+        )
+        if bulk_pricing_model is None:
+            continue
+        pricing_model, inferred_custom_llm_provider = bulk_pricing_model
+        if pricing_model != model:
+            # a deployment id - the provider can't be inferred from it
+            custom_llm_provider = inferred_custom_llm_provider
+        price_record = _get_bulk_price_record(
+            model=pricing_model,
+            custom_llm_provider=custom_llm_provider,
+            inferred_custom_llm_provider=inferred_custom_llm_provider,
+        )
+        if price_record is None:
+            for idx in row_indices:
+                costs[idx] = _row_cost_per_token(
+                    model=pricing_model,
+                    prompt_tokens=prompt_tokens[idx],
+                    completion_tokens=completion_tokens[idx],
+                    cached_tokens=cached_tokens[idx],
+                    custom_llm_provider=custom_llm_provider,
+                )
+            continue
+
+        group_prompt_tokens = [prompt_tokens[idx] for idx in row_indices]
+        group_completion_tokens = [completion_tokens[idx] for idx in row_indices]
+        group_cached_tokens = [cached_tokens[idx] or 0 for idx in row_indices]
+        if numpy is not None:
+            group_costs = _price_record_costs_numpy(
+                numpy=numpy,
+                price_record=price_record,
+                prompt_tokens=group_prompt_tokens,
+                completion_tokens=group_completion_tokens,
+                cached_tokens=group_cached_tokens,
+            )
+        else:
+            group_costs = _price_record_costs(
+                price_record=price_record,
+                prompt_tokens=group_prompt_tokens,
+                completion_tokens=group_completion_tokens,
+                cached_tokens=group_cached_tokens,
+            )
+        for idx, cost in zip(row_indices, group_costs):
+            costs[idx] = cost
+    return costs
+
+
+def _get_numpy() -> Optional[Any]:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _get_bulk_pricing_model(
+    model: str, custom_llm_provider: Optional[str], model_id: Optional[str]
+) -> Optional[Tuple[str, str]]:
+    """
+    Returns the `litellm.model_cost` key to price the rows with and their provider, None if they can't be priced from token counts.
+
+    Rows of a router deployment with custom pricing use the deployment's entry (registered under its `model_info.id`).
+    """
+    deployment_model_info: Optional[dict] = None
+    if model_id is not None:
+        deployment_model_info = litellm.model_cost.get(model_id)
+        if deployment_model_info is None:  # the deployment's prices are unknown
+            return None
+        if not any(
+            deployment_model_info.get(key) is not None
+            for key in CustomPricingLiteLLMParams.model_fields.keys()
+        ):
+            deployment_model_info = None  # priced like `model`
+
+    if custom_llm_provider is None:
+        try:
+            _, inferred_custom_llm_provider, _, _ = litellm.get_llm_provider(
+                model=model
+            )
+        except Exception:  # `cost_per_token` raises for every row
+            return None
+    else:
+        inferred_custom_llm_provider = custom_llm_provider
+
+    if deployment_model_info is not None and model_id is not None:
+        # the router doesn't register a `mode` for the deployment unless it's set in its `model_info`
+        if not _is_token_priced_model_info(
+            model_info={"mode": "chat", **deployment_model_info}
+        ):
+            return None
+        return model_id, inferred_custom_llm_provider
+    if not _is_token_priced_model(
+        model=model, custom_llm_provider=inferred_custom_llm_provider
+    ):
+        return None
+    return model, inferred_custom_llm_provider
+
+
+def _is_token_priced_model(model: str, custom_llm_provider: str) -> bool:
+    """
+    True if `model` is a chat / embedding model whose cost only depends on its token counts.
+    """
+    try:
+        model_info = litellm.get_model_info(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+    except Exception:
+        return False
+    return _is_token_priced_model_info(model_info=dict(model_info))
+
+
+def _is_token_priced_model_info(model_info: dict) -> bool:
+    if model_info.get("mode") not in BULK_COST_MODES:
+        return False
+    if not (
+        model_info.get("input_cost_per_token")
+        or model_info.get("output_cost_per_token")
+    ):
+        return False
+    for key, value in model_info.items():
+        if value and any(keyword in key for keyword in NON_TOKEN_PRICE_KEYWORDS):
+            return False
+    return True
+
+
+def _get_bulk_price_record(
+    model: str,
+    custom_llm_provider: Optional[str],
+    inferred_custom_llm_provider: str,
+) -> Optional[PriceRecord]:
+    """
+    Returns the price record `cost_per_token` would use for `model`, None if `cost_per_token` has to be used.
+    """
+    if inferred_custom_llm_provider not in PRICE_RECORD_PROVIDERS:
+        return None
+    model_cost_key = _get_model_cost_key_for_cost_per_token(
+        model=model, custom_llm_provider=custom_llm_provider, region_name=None
+    )
+    return get_price_record(
+        model=model_cost_key, custom_llm_provider=inferred_custom_llm_provider
+    )
+
+
+def _row_cost_per_token(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: Optional[int],
+    custom_llm_provider: Optional[str],
+) -> Optional[float]:
+    try:
+        prompt_cost, completion_cost = cost_per_token(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cache_read_input_tokens=cached_tokens or 0,
+            custom_llm_provider=custom_llm_provider,
+        )
+    except Exception as e:
+        verbose_logger.debug(
+            "bulk_cost_per_token - unable to calculate cost for model={} - {}".format(
+                model, str(e)
+            )
+        )
+        return None
+    return prompt_cost + completion_cost
+
+
+def _price_record_costs(
+    price_record: PriceRecord,
+    prompt_tokens: List[int],
+    completion_tokens: List[int],
+    cached_tokens: List[int],
+) -> List[float]:
+    """
+    Pure python version of `_price_record_costs_numpy`. Same arithmetic as `cost_from_usage`.
+    """
+    token_tiers = price_record.token_tiers
+    cache_read_input_token_cost = price_record.cache_read_input_token_cost
+    costs: List[float] = []
+    for row_prompt_tokens, row_completion_tokens, row_cached_tokens in zip(
+        prompt_tokens, completion_tokens, cached_tokens
+    ):
+        prompt_base_cost = price_record.input_cost_per_token
+        completion_base_cost = price_record.output_cost_per_token
+        for threshold, tier_input_cost, tier_output_cost in token_tiers:
+            if row_prompt_tokens > threshold:
+                prompt_base_cost = tier_input_cost
+                completion_base_cost = tier_output_cost
+                break
+        prompt_cost = float(row_prompt_tokens - row_cached_tokens) * prompt_base_cost
+        if row_cached_tokens > 0 and cache_read_input_token_cost:
+            prompt_cost += float(row_cached_tokens) * cache_read_input_token_cost
+        costs.append(prompt_cost + float(row_completion_tokens) * completion_base_cost)
+    return costs
+
+
+def _price_record_costs_numpy(
+    numpy: Any,
+    price_record: PriceRecord,
+    prompt_tokens: List[int],
+    completion_tokens: List[int],
+    cached_tokens: List[int],
+) -> List[float]:
+    """
+    Applies the price record to all rows of a model at once.
+    """
+    prompt_tokens_array = numpy.asarray(prompt_tokens, dtype=numpy.int64)
+    completion_tokens_array = numpy.asarray(completion_tokens, dtype=numpy.int64)
+    cached_tokens_array = numpy.asarray(cached_tokens, dtype=numpy.int64)
+
+    prompt_base_cost = numpy.full(
+        len(prompt_tokens), price_record.input_cost_per_token, dtype=numpy.float64
+    )
+    completion_base_cost = numpy.full(
+        len(prompt_tokens), price_record.output_cost_per_token, dtype=numpy.float64
+    )
+    # the first tier above its threshold wins - apply tiers in reverse
+    for threshold, tier_input_cost, tier_output_cost in reversed(
+        price_record.token_tiers
+    ):
+        above_threshold = prompt_tokens_array > threshold
+        prompt_base_cost[above_threshold] = tier_input_cost
+        completion_base_cost[above_threshold] = tier_output_cost
+
+    prompt_cost = (prompt_tokens_array - cached_tokens_array).astype(
+        numpy.float64
+    ) * prompt_base_cost
+    if price_record.cache_read_input_token_cost:
+        prompt_cost = prompt_cost + numpy.where(
+            cached_tokens_array > 0,
+            cached_tokens_array.astype(numpy.float64)
+            * price_record.cache_read_input_token_cost,
+            0.0,
+        )
+    completion_cost = (
+        completion_tokens_array.astype(numpy.float64) * completion_base_cost
+    )
+    return (prompt_cost + completion_cost).tolist()
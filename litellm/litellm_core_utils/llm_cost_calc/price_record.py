@@ -0,0 +1,320 @@
+"""
+Compiled price records for token based cost calculation.
+
+`generic_cost_per_token` looks up the model info and re-reads every pricing field (base / tiered token cost, cache read / write, audio, reasoning, ...) for each response.
+A `PriceRecord` holds these fields for one (model, custom_llm_provider), converted to floats once, so `cost_from_usage` only does the arithmetic.
+
+`cost_from_usage(price_record, usage)` returns the same (prompt_cost, completion_cost) as `generic_cost_per_token(model, usage, custom_llm_provider)`.
+
+Price records are compiled when the Router adds a deployment (see `compile_deployment_price_records` in `cost_calculator.py`) or on first use, and are invalidated by `register_model` for the `litellm.model_cost` keys it updates.
+"""
+
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import litellm
+from litellm.constants import MAX_PRICE_RECORD_CACHE_SIZE
+from litellm.types.utils import ModelInfo, Usage
+
+# providers whose `cost_per_token` is `generic_cost_per_token`
+PRICE_RECORD_PROVIDERS = frozenset(
+    ["openai", "anthropic", "bedrock", "deepseek", "gemini"]
+)
+
+
+class PriceRecord:
+    __slots__ = (
+        "model",
+        "custom_llm_provider",
+        "input_cost_per_token",
+        "output_cost_per_token",
+        "token_tiers",
+        "cache_read_input_token_cost",
+        "input_cost_per_audio_token",
+        "cache_creation_input_token_cost",
+        "input_cost_per_character",
+        "input_cost_per_image",
+        "input_cost_per_video_per_second",
+        "output_cost_per_audio_token",
+        "output_cost_per_reasoning_token",
+    )
+
+    def __init__(
+        self,
+        model: str,
+        custom_llm_provider: str,
+        input_cost_per_token: float,
+        output_cost_per_token: float,
+        token_tiers: Tuple[Tuple[float, float, float], ...],
+        cache_read_input_token_cost: float,
+        input_cost_per_audio_token: float,
+        cache_creation_input_token_cost: float,
+        input_cost_per_character: float,
+        input_cost_per_image: float,
+        input_cost_per_video_per_second: float,
+        output_cost_per_audio_token: Optional[float],
+        output_cost_per_reasoning_token: Optional[float],
+    ):
+        self.model = model
+        self.custom_llm_provider = custom_llm_provider
+        self.input_cost_per_token = input_cost_per_token
+        self.output_cost_per_token = output_cost_per_token
+        # (threshold, input cost per token, output cost per token), in the order `_get_token_base_cost` checks them
+        self.token_tiers = token_tiers
+        self.cache_read_input_token_cost = cache_read_input_token_cost
+        self.input_cost_per_audio_token = input_cost_per_audio_token
+        self.cache_creation_input_token_cost = cache_creation_input_token_cost
+        self.input_cost_per_character = input_cost_per_character
+        self.input_cost_per_image = input_cost_per_image
+        self.input_cost_per_video_per_second = input_cost_per_video_per_second
+        # None - billed at the (tiered) output cost per token
+        self.output_cost_per_audio_token = output_cost_per_audio_token
+        self.output_cost_per_reasoning_token = output_cost_per_reasoning_token
+
+
+def compile_price_record(
+    model: str, custom_llm_provider: str, model_info: ModelInfo
+) -> PriceRecord:
+    """
+    Compile the pricing fields of `model_info` (as returned by `get_model_info`) into a `PriceRecord`.
+    """
+    from litellm.litellm_core_utils.llm_cost_calc.utils import _get_cost_per_unit
+
+    def _cost(cost_key: str, default_value: Optional[float] = 0.0) -> Optional[float]:
+        return _get_cost_per_unit(model_info, cost_key, default_value)
+
+    input_cost_per_token = _cost("input_cost_per_token") or 0.0
+    output_cost_per_token = _cost("output_cost_per_token") or 0.0
+
+    token_tiers = []
+    for key, value in sorted(model_info.items(), reverse=True):
+        if key.startswith("input_cost_per_token_above_") and value is not None:
+            try:
+                # Handle both formats: _above_128k_tokens and _above_128_tokens
+                threshold_str = key.split("_above_")[1].split("_tokens")[0]
+                threshold = float(threshold_str.replace("k", "")) * (
+                    1000 if "k" in threshold_str else 1
+                )
+            except (IndexError, ValueError):
+                continue
+            token_tiers.append(
+                (
+                    threshold,
+                    _cost(key, input_cost_per_token),
+                    _cost(
+                        f"output_cost_per_token_above_{threshold_str}_tokens",
+                        output_cost_per_token,
+                    ),
+                )
+            )
+
+    return PriceRecord(
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+        input_cost_per_token=input_cost_per_token,
+        output_cost_per_token=output_cost_per_token,
+        token_tiers=tuple(token_tiers),  # type: ignore
+        cache_read_input_token_cost=_cost("cache_read_input_token_cost") or 0.0,
+        input_cost_per_audio_token=_cost("input_cost_per_audio_token") or 0.0,
+        cache_creation_input_token_cost=_cost("cache_creation_input_token_cost") or 0.0,
+        input_cost_per_character=_cost("input_cost_per_character") or 0.0,
+        input_cost_per_image=_cost("input_cost_per_image") or 0.0,
+        input_cost_per_video_per_second=_cost("input_cost_per_video_per_second") or 0.0,
+        output_cost_per_audio_token=_cost("output_cost_per_audio_token", None),
+        output_cost_per_reasoning_token=_cost("output_cost_per_reasoning_token", None),
+    )
+
+
+def cost_from_usage(price_record: PriceRecord, usage: Usage) -> Tuple[float, float]:
+    """
+    Calculates the cost of `usage` with a compiled price record.
+
+    Returns:
+        Tuple[float, float] - prompt_cost_in_usd, completion_cost_in_usd - same as `generic_cost_per_token`
+    """
+    prompt_base_cost, completion_base_cost = _get_token_base_costs(
+        price_record=price_record, prompt_tokens=usage.prompt_tokens
+    )
+    prompt_cost = _prompt_cost_from_usage(
+        price_record=price_record, usage=usage, prompt_base_cost=prompt_base_cost
+    )
+    completion_cost = _completion_cost_from_usage(
+        price_record=price_record,
+        usage=usage,
+        completion_base_cost=completion_base_cost,
+    )
+    return prompt_cost, completion_cost
+
+
+def _get_token_base_costs(
+    price_record: PriceRecord, prompt_tokens: int
+) -> Tuple[float, float]:
+    """
+    Returns the (input, output) cost per token - of the first tier `prompt_tokens` is above, else the base cost.
+    """
+    for threshold, tier_input_cost, tier_output_cost in price_record.token_tiers:
+        if prompt_tokens > threshold:
+            return tier_input_cost, tier_output_cost
+    return price_record.input_cost_per_token, price_record.output_cost_per_token
+
+
+def _prompt_cost_from_usage(
+    price_record: PriceRecord, usage: Usage, prompt_base_cost: float
+) -> float:
+    prompt_tokens = usage.prompt_tokens
+    text_tokens = prompt_tokens
+    cache_hit_tokens = 0
+    audio_tokens = 0
+    character_count = 0
+    image_count = 0
+    video_length_seconds = 0
+    prompt_tokens_details = usage.prompt_tokens_details
+    if prompt_tokens_details:
+        cache_hit_tokens = getattr(prompt_tokens_details, "cached_tokens", 0) or 0
+        text_tokens = getattr(prompt_tokens_details, "text_tokens", None) or 0
+        audio_tokens = getattr(prompt_tokens_details, "audio_tokens", 0) or 0
+        character_count = getattr(prompt_tokens_details, "character_count", 0) or 0
+        image_count = getattr(prompt_tokens_details, "image_count", 0) or 0
+        video_length_seconds = (
+            getattr(prompt_tokens_details, "video_length_seconds", 0) or 0
+        )
+
+    ## EDGE CASE - text tokens not set inside PromptTokensDetails
+    if text_tokens == 0:
+        text_tokens = prompt_tokens - cache_hit_tokens - audio_tokens
+
+    # components without a price add 0.0 in `generic_cost_per_token` - skipping them gives the same result
+    prompt_cost = float(text_tokens) * prompt_base_cost
+    if cache_hit_tokens > 0 and price_record.cache_read_input_token_cost:
+        prompt_cost += (
+            float(cache_hit_tokens) * price_record.cache_read_input_token_cost
+        )
+    if audio_tokens > 0 and price_record.input_cost_per_audio_token:
+        prompt_cost += float(audio_tokens) * price_record.input_cost_per_audio_token
+    cache_creation_input_tokens = usage._cache_creation_input_tokens
+    if (
+        cache_creation_input_tokens is not None
+        and cache_creation_input_tokens > 0
+        and price_record.cache_creation_input_token_cost
+    ):
+        prompt_cost += (
+            float(cache_creation_input_tokens)
+            * price_record.cache_creation_input_token_cost
+        )
+    if character_count > 0 and price_record.input_cost_per_character:
+        prompt_cost += float(character_count) * price_record.input_cost_per_character
+    if image_count > 0 and price_record.input_cost_per_image:
+        prompt_cost += float(image_count) * price_record.input_cost_per_image
+    if video_length_seconds > 0 and price_record.input_cost_per_video_per_second:
+        prompt_cost += (
+            float(video_length_seconds) * price_record.input_cost_per_video_per_second
+        )
+    return prompt_cost
+
+
+def _completion_cost_from_usage(
+    price_record: PriceRecord, usage: Usage, completion_base_cost: float
+) -> float:
+    text_tokens = 0
+    audio_tokens = 0
+    reasoning_tokens = 0
+    completion_tokens_details = usage.completion_tokens_details
+    if completion_tokens_details is not None:
+        audio_tokens = getattr(completion_tokens_details, "audio_tokens", 0) or 0
+        text_tokens = getattr(completion_tokens_details, "text_tokens", None) or 0
+        reasoning_tokens = (
+            getattr(completion_tokens_details, "reasoning_tokens", 0) or 0
+        )
+
+    if text_tokens == 0:
+        text_tokens = usage.completion_tokens
+    is_text_tokens_total = text_tokens == usage.completion_tokens
+
+    completion_cost = float(text_tokens) * completion_base_cost
+    if not is_text_tokens_total and audio_tokens > 0:
+        output_cost_per_audio_token = price_record.output_cost_per_audio_token
+        completion_cost += float(audio_tokens) * (
+            output_cost_per_audio_token
+            if output_cost_per_audio_token is not None
+            else completion_base_cost
+        )
+    if not is_text_tokens_total and reasoning_tokens > 0:
+        output_cost_per_reasoning_token = price_record.output_cost_per_reasoning_token
+        completion_cost += float(reasoning_tokens) * (
+            output_cost_per_reasoning_token
+            if output_cost_per_reasoning_token is not None
+            else completion_base_cost
+        )
+    return completion_cost
+
+
+# (model, custom_llm_provider) -> price record, None if the model can't be priced per token
+_price_records: Dict[Tuple[str, str], Optional[PriceRecord]] = {}
+# `litellm.model_cost` key -> the price records whose model info lookup checks that key
+_price_record_dependencies: Dict[str, Set[Tuple[str, str]]] = {}
+_price_records_model_cost_id: Optional[int] = None
+
+
+def invalidate_price_records(model_cost_keys: Optional[Iterable[str]] = None) -> None:
+    """
+    Drop the price records that depend on `model_cost_keys` - all price records if None.
+    """
+    if model_cost_keys is None:
+        _price_records.clear()
+        _price_record_dependencies.clear()
+        return
+    for model_cost_key in model_cost_keys:
+        for cache_key in _price_record_dependencies.pop(model_cost_key, ()):
+            _price_records.pop(cache_key, None)
+
+
+def get_price_record(model: str, custom_llm_provider: str) -> Optional[PriceRecord]:
+    """
+    Returns the (cached) price record for `model` / `custom_llm_provider`, None if the model isn't mapped.
+
+    `model` is the name `cost_per_token` passes to the provider's cost calculation.
+    """
+    global _price_records_model_cost_id
+    # catches `litellm.model_cost` being replaced
+    if id(litellm.model_cost) != _price_records_model_cost_id:
+        invalidate_price_records()
+        _price_records_model_cost_id = id(litellm.model_cost)
+
+    cache_key = (model, custom_llm_provider)
+    if cache_key in _price_records:
+        return _price_records[cache_key]
+
+    price_record: Optional[PriceRecord] = None
+    try:
+        model_info = litellm.get_model_info(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+        price_record = compile_price_record(
+            model=model, custom_llm_provider=custom_llm_provider, model_info=model_info
+        )
+    except Exception:
+        pass
+
+    if len(_price_records) >= MAX_PRICE_RECORD_CACHE_SIZE:
+        invalidate_price_records()
+    _price_records[cache_key] = price_record
+    for model_cost_key in _get_model_cost_keys_checked(
+        model=model, custom_llm_provider=custom_llm_provider
+    ):
+        _price_record_dependencies.setdefault(model_cost_key, set()).add(cache_key)
+    return price_record
+
+
+def _get_model_cost_keys_checked(model: str, custom_llm_provider: str) -> Set[str]:
+    """
+    The `litellm.model_cost` keys `get_model_info` checks for `model` / `custom_llm_provider`.
+    """
+    potential_model_names = litellm.utils._get_potential_model_names(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    return {
+        model,
+        potential_model_names["split_model"],
+        potential_model_names["combined_model_name"],
+        potential_model_names["stripped_model_name"],
+        potential_model_names["combined_stripped_model_name"],
+    }
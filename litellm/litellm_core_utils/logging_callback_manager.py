@@ -1,4 +1,15 @@
-from typing import Callable, List, Set, Type, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import litellm
 from litellm._logging import verbose_logger
@@ -14,11 +25,26 @@ class LoggingCallbackManager:
     Goals of this class:
     - Prevent adding duplicate callbacks / success_callback / failure_callback
     - Keep a reasonable MAX_CALLBACKS limit (this ensures callbacks don't exponentially grow and consume CPU Resources)
+    - Keep per-hook dispatch lists, so hooks are only called on callbacks that implement them (see `get_callbacks_for_hook`)
     """
 
     # healthy maximum number of callbacks - unlikely someone needs more than 20
     MAX_CALLBACKS = 30
 
+    # bound on cached dispatch lists (one per hook + callback list combination)
+    MAX_HOOK_DISPATCH_TABLES = 256
+
+    def __init__(self):
+        # (hook_name, ids of callbacks) -> dispatch list
+        self._hook_dispatch_tables: Dict[
+            Tuple[str, Tuple[int, ...]], "_HookDispatchList"
+        ] = {}
+        # CustomLogger subclass -> hooks it overrides
+        # cleared with the dispatch tables, so hooks patched on a class are picked up when callbacks change
+        self._overridden_hooks_by_type: Dict[type, FrozenSet[str]] = {}
+        # state of the callback lists after `function_setup` last synced them
+        self._synced_callback_lists_fingerprint: Optional[Tuple] = None
+
     def add_litellm_input_callback(self, callback: Union[CustomLogger, str]):
         """
         Add a input callback to litellm.input_callback
@@ -105,6 +131,7 @@ class LoggingCallbackManager:
 
         for c in remove_list:
             callback_list.remove(c)
+        self._invalidate_hook_dispatch_tables()
 
     def _add_string_callback_to_list(
         self, callback: str, parent_list: List[Union[CustomLogger, Callable, str]]
@@ -147,6 +174,8 @@ class LoggingCallbackManager:
         if not self._check_callback_list_size(parent_list):
             return
 
+        self._invalidate_hook_dispatch_tables()
+
         if isinstance(callback, str):
             self._add_string_callback_to_list(
                 callback=callback, parent_list=parent_list
@@ -226,6 +255,7 @@ class LoggingCallbackManager:
         litellm._async_success_callback = []
         litellm._async_failure_callback = []
         litellm.callbacks = []
+        self._invalidate_hook_dispatch_tables()
 
     def _get_all_callbacks(self) -> List[Union[CustomLogger, Callable, str]]:
         """
@@ -343,3 +373,201 @@ class LoggingCallbackManager:
         elif callable(callback):
             return getattr(callback, "__name__", str(callback))
         return str(callback)
+
+    def get_callbacks_for_hook(
+        self,
+        hook_name: str,
+        callbacks: Optional[List[Union[CustomLogger, Callable, str]]] = None,
+        resolve_string_callbacks: bool = False,
+    ) -> List[CustomLogger]:
+        """
+        Get the CustomLoggers in `callbacks` (default: `litellm.callbacks`) that override `hook_name`.
+
+        Callbacks that only inherit the no-op `CustomLogger` implementation are skipped, so calling a hook
+        doesn't await every configured callback.
+
+        The dispatch list is cached per hook, and rebuilt when callbacks are added / removed - including
+        direct changes to the callback list.
+
+        Args:
+            hook_name: name of the `CustomLogger` method, e.g. "async_pre_call_hook"
+            callbacks: the callback list to filter
+            resolve_string_callbacks: if True, string callbacks (e.g. "langsmith") are resolved to their initialized CustomLogger
+        """
+        if callbacks is None:
+            callbacks = litellm.callbacks  # type: ignore
+        callbacks = cast(List[Union[CustomLogger, Callable, str]], callbacks)
+        cache_key = (hook_name, tuple(map(id, callbacks)))
+        dispatch_list = self._hook_dispatch_tables.get(cache_key)
+        if dispatch_list is None or dispatch_list.has_instance_override(hook_name):
+            dispatch_list = self._build_hook_dispatch_list(
+                hook_name=hook_name, callbacks=callbacks
+            )
+            if len(self._hook_dispatch_tables) >= self.MAX_HOOK_DISPATCH_TABLES:
+                self._hook_dispatch_tables.clear()
+            self._hook_dispatch_tables[cache_key] = dispatch_list
+
+        if not resolve_string_callbacks or not dispatch_list.has_string_callbacks:
+            return dispatch_list.custom_loggers
+
+        from litellm.litellm_core_utils.litellm_logging import (
+            get_custom_logger_compatible_class,
+        )
+
+        resolved_callbacks: List[CustomLogger] = []
+        for callback in dispatch_list.entries:
+            if isinstance(callback, str):
+                _callback = get_custom_logger_compatible_class(callback)  # type: ignore
+                if _callback is None or not self.callback_overrides_hook(
+                    _callback, hook_name
+                ):
+                    continue
+                resolved_callbacks.append(_callback)
+            else:
+                resolved_callbacks.append(callback)
+        return resolved_callbacks
+
+    def callback_overrides_hook(self, callback: CustomLogger, hook_name: str) -> bool:
+        """
+        Returns True if `callback` implements `hook_name`, instead of inheriting it from `CustomLogger`.
+        """
+        if hook_name in getattr(callback, "__dict__", {}):  # e.g. patched on the instance
+            return True
+        callback_type = type(callback)
+        overridden_hooks = self._overridden_hooks_by_type.get(callback_type)
+        if overridden_hooks is None:
+            overridden_hooks = frozenset(
+                name
+                for name, base_attribute in vars(CustomLogger).items()
+                if callable(base_attribute)
+                and getattr(callback_type, name, None) is not base_attribute
+            )
+            self._overridden_hooks_by_type[callback_type] = overridden_hooks
+        return hook_name in overridden_hooks
+
+    def _build_hook_dispatch_list(
+        self,
+        hook_name: str,
+        callbacks: List[Union[CustomLogger, Callable, str]],
+    ) -> "_HookDispatchList":
+        entries: List[Union[CustomLogger, str]] = []
+        skipped: List[CustomLogger] = []
+        for callback in callbacks:
+            if isinstance(callback, str):
+                entries.append(callback)
+            elif isinstance(callback, CustomLogger):
+                if self.callback_overrides_hook(callback, hook_name):
+                    entries.append(callback)
+                else:
+                    skipped.append(callback)
+        return _HookDispatchList(
+            callbacks=tuple(callbacks), entries=entries, skipped=skipped
+        )
+
+    def get_standard_logging_payload_fields(
+        self,
+        *callback_lists: Optional[List[Union[CustomLogger, Callable, str]]],
+    ) -> Optional[FrozenSet[str]]:
+        """
+        Get the `StandardLoggingPayload` fields read by the callbacks in `callback_lists`.
+
+        Returns None if all fields are needed - i.e. a callback is a string / function, or a CustomLogger
+        that doesn't set `standard_logging_payload_fields`.
+        """
+        payload_fields: Set[str] = set()
+        for callbacks in callback_lists:
+            if not callbacks:
+                continue
+            for callback in callbacks:
+                if not isinstance(callback, CustomLogger):
+                    return None
+                callback_fields = callback.standard_logging_payload_fields
+                if callback_fields is None:
+                    return None
+                payload_fields.update(callback_fields)
+        return frozenset(payload_fields)
+
+    def callback_lists_synced(self) -> bool:
+        """
+        Returns True if the callback lists haven't changed since `mark_callback_lists_synced`.
+
+        Used by `function_setup` to skip re-syncing `litellm.callbacks` into the success / failure lists on every call.
+        """
+        return (
+            self._synced_callback_lists_fingerprint is not None
+            and _fingerprints_match(
+                self._synced_callback_lists_fingerprint,
+                self._get_callback_lists_fingerprint(),
+            )
+        )
+
+    def mark_callback_lists_synced(self):
+        self._synced_callback_lists_fingerprint = self._get_callback_lists_fingerprint()
+
+    def _get_callback_lists_fingerprint(self) -> Tuple:
+        callback_lists = (
+            litellm.callbacks,
+            litellm.input_callback,
+            litellm.success_callback,
+            litellm.failure_callback,
+            litellm._async_success_callback,
+            litellm._async_failure_callback,
+        )
+        return tuple(
+            # the list itself is kept in the fingerprint, so its id can't be reused
+            (callback_list, id(callback_list), tuple(map(id, callback_list)))
+            for callback_list in callback_lists
+        )
+
+    def _invalidate_hook_dispatch_tables(self):
+        self._hook_dispatch_tables.clear()
+        self._overridden_hooks_by_type.clear()
+        self._synced_callback_lists_fingerprint = None
+
+
+def _fingerprints_match(fingerprint: Tuple, other_fingerprint: Tuple) -> bool:
+    # compare by identity - callbacks (e.g. CustomLogger) may define a custom __eq__
+    return all(
+        list_id == other_list_id and callback_ids == other_callback_ids
+        for (_, list_id, callback_ids), (_, other_list_id, other_callback_ids) in zip(
+            fingerprint, other_fingerprint
+        )
+    )
+
+
+class _HookDispatchList:
+    """
+    The callbacks to run for one hook - see `LoggingCallbackManager.get_callbacks_for_hook`.
+    """
+
+    __slots__ = (
+        "callbacks",
+        "entries",
+        "custom_loggers",
+        "skipped",
+        "has_string_callbacks",
+    )
+
+    def __init__(
+        self,
+        callbacks: Tuple[Union[CustomLogger, Callable, str], ...],
+        entries: List[Union[CustomLogger, str]],
+        skipped: List[CustomLogger],
+    ):
+        # keeps the callbacks alive, so their ids in the cache key can't be reused
+        self.callbacks = callbacks
+        self.entries = entries
+        self.custom_loggers: List[CustomLogger] = [
+            entry for entry in entries if isinstance(entry, CustomLogger)
+        ]
+        self.skipped = skipped
+        self.has_string_callbacks = len(self.custom_loggers) != len(entries)
+
+    def has_instance_override(self, hook_name: str) -> bool:
+        """
+        True if a skipped callback had the hook set on the instance after the list was built.
+        """
+        for callback in self.skipped:
+            if hook_name in getattr(callback, "__dict__", {}):
+                return True
+        return False
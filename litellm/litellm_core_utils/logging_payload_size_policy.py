@@ -0,0 +1,199 @@
+"""
+Size policy for large values in logging payloads - e.g. embedding vectors, batch inputs, base64 images / audio.
+
+Large values are replaced by a short summary, so a queued logging event doesn't keep megabytes of request / response data alive:
+- strings / bytes: the first `preview_length` characters, the length and a sha256 hash
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAA...[truncated by litellm - length=1398101, sha256=3f2a...]"
+- lists / tuples: the first `preview_length` characters of the first items and the length
+    "[0.0123, -0.0456, ...][truncated by litellm - length=1536]"
+
+Summarizing is copy-on-write: containers are only copied along the path to a large value, everything else stays a
+reference to the original object - the caller's request / response is never modified.
+
+Usage:
+```python
+# all callbacks - bounds the StandardLoggingPayload and `original_response` kept in `model_call_details`
+litellm.logging_payload_size_policy = LoggingPayloadSizePolicy(max_str_length=10_000)
+
+# one callback - the callback receives a size-bounded StandardLoggingPayload
+class MyLogger(CustomLogger):
+    logging_payload_size_policy = LoggingPayloadSizePolicy(max_list_length=100)
+```
+"""
+
+import hashlib
+from copy import copy
+from typing import Any, Dict, Optional, Tuple
+
+from litellm.constants import (
+    LOGGING_PAYLOAD_MAX_LIST_LENGTH,
+    LOGGING_PAYLOAD_MAX_STR_LENGTH,
+    LOGGING_PAYLOAD_PREVIEW_LENGTH,
+)
+from litellm.types.utils import StandardLoggingPayload
+
+# StandardLoggingPayload fields that can hold request / response content
+DEFAULT_SIZE_BOUNDED_PAYLOAD_FIELDS: Tuple[str, ...] = (
+    "messages",
+    "response",
+    "error_str",
+    "model_parameters",
+)
+
+# nested values below this depth are kept as-is
+_MAX_SUMMARIZE_DEPTH = 32
+
+
+class LoggingPayloadSizePolicy:
+    """
+    Replaces values larger than `max_str_length` characters / `max_list_length` items with a summary.
+    """
+
+    __slots__ = ("max_str_length", "max_list_length", "preview_length", "fields")
+
+    def __init__(
+        self,
+        max_str_length: int = LOGGING_PAYLOAD_MAX_STR_LENGTH,
+        max_list_length: int = LOGGING_PAYLOAD_MAX_LIST_LENGTH,
+        preview_length: int = LOGGING_PAYLOAD_PREVIEW_LENGTH,
+        fields: Tuple[str, ...] = DEFAULT_SIZE_BOUNDED_PAYLOAD_FIELDS,
+    ):
+        """
+        Args:
+            max_str_length: strings / bytes longer than this are summarized
+            max_list_length: lists / tuples with more items than this are summarized
+            preview_length: number of characters of a summarized value kept in the summary
+            fields: the StandardLoggingPayload fields the policy is applied to
+        """
+        self.max_str_length = max_str_length
+        self.max_list_length = max_list_length
+        self.preview_length = preview_length
+        self.fields = fields
+
+    def summarize(self, value: Any) -> Any:
+        """
+        Returns `value` with its large values summarized - `value` itself if nothing is summarized.
+        """
+        return self._summarize(value, depth=0)
+
+    def apply_to_standard_logging_payload(
+        self, standard_logging_object: StandardLoggingPayload
+    ) -> StandardLoggingPayload:
+        """
+        Returns a shallow copy of the payload with `self.fields` summarized - the payload itself if nothing is summarized.
+        """
+        summarized_fields: Dict[str, Any] = {}
+        for field in self.fields:
+            value = standard_logging_object.get(field)
+            if value is None:
+                continue
+            summarized_value = self._summarize(value, depth=0)
+            if summarized_value is not value:
+                summarized_fields[field] = summarized_value
+
+        if not summarized_fields:
+            return standard_logging_object
+        standard_logging_object_copy = copy(standard_logging_object)
+        standard_logging_object_copy.update(summarized_fields)  # type: ignore
+        return standard_logging_object_copy
+
+    def apply_to_model_call_details(self, model_call_details: Dict) -> Dict:
+        """
+        Returns a shallow copy of `model_call_details` with a size-bounded `standard_logging_object` - `model_call_details` itself if nothing is summarized.
+        """
+        standard_logging_object: Optional[StandardLoggingPayload] = (
+            model_call_details.get("standard_logging_object")
+        )
+        if standard_logging_object is None:
+            return model_call_details
+        bounded_standard_logging_object = self.apply_to_standard_logging_payload(
+            standard_logging_object
+        )
+        if bounded_standard_logging_object is standard_logging_object:
+            return model_call_details
+        model_call_details_copy = copy(model_call_details)
+        model_call_details_copy["standard_logging_object"] = (
+            bounded_standard_logging_object
+        )
+        return model_call_details_copy
+
+    def _summarize(self, value: Any, depth: int) -> Any:
+        if isinstance(value, str):
+            if len(value) > self.max_str_length:
+                return self._summarize_str(value)
+            return value
+        if isinstance(value, (bytes, bytearray)):
+            if len(value) > self.max_str_length:
+                return self._summarize_bytes(value)
+            return value
+        if depth >= _MAX_SUMMARIZE_DEPTH:
+            return value
+        if isinstance(value, dict):
+            summarized_dict: Optional[dict] = None
+            for key, item in value.items():
+                summarized_item = self._summarize(item, depth + 1)
+                if summarized_item is not item:
+                    if summarized_dict is None:
+                        summarized_dict = dict(value)
+                    summarized_dict[key] = summarized_item
+            return value if summarized_dict is None else summarized_dict
+        if isinstance(value, (list, tuple)):
+            if len(value) > self.max_list_length:
+                return self._summarize_list(value)
+            summarized_list: Optional[list] = None
+            for index, item in enumerate(value):
+                summarized_item = self._summarize(item, depth + 1)
+                if summarized_item is not item:
+                    if summarized_list is None:
+                        summarized_list = list(value)
+                    summarized_list[index] = summarized_item
+            if summarized_list is None:
+                return value
+            return (
+                summarized_list if isinstance(value, list) else tuple(summarized_list)
+            )
+        return value
+
+    def _summarize_str(self, value: str) -> str:
+        sha256 = hashlib.sha256(value.encode("utf-8", errors="replace")).hexdigest()
+        return "{}...[truncated by litellm - length={}, sha256={}]".format(
+            value[: self.preview_length], len(value), sha256
+        )
+
+    def _summarize_bytes(self, value: bytes) -> str:
+        sha256 = hashlib.sha256(value).hexdigest()
+        return "{!r}...[truncated by litellm - length={}, sha256={}]".format(
+            bytes(value[: self.preview_length]), len(value), sha256
+        )
+
+    def _summarize_list(self, value: Any) -> str:
+        preview_items = []
+        preview_length = 0
+        for item in value:
+            if isinstance(item, str):
+                item_str = repr(item[: self.preview_length])
+            elif item is None or isinstance(item, (int, float)):
+                item_str = repr(item)
+            else:  # don't render (large) nested values
+                item_str = "<{}>".format(type(item).__name__)
+            preview_items.append(item_str)
+            preview_length += len(item_str) + 2
+            if preview_length >= self.preview_length:
+                break
+        return "[{}, ...][truncated by litellm - length={}]".format(
+            ", ".join(preview_items)[: self.preview_length], len(value)
+        )
+
+
+def apply_callback_logging_payload_size_policy(
+    callback: Any, model_call_details: Dict
+) -> Dict:
+    """
+    Apply the `logging_payload_size_policy` of a callback (see `CustomLogger`) to the `model_call_details` passed to it.
+
+    Returns `model_call_details` unchanged if the callback has no policy.
+    """
+    policy = getattr(callback, "logging_payload_size_policy", None)
+    if not isinstance(policy, LoggingPayloadSizePolicy):
+        return model_call_details
+    return policy.apply_to_model_call_details(model_call_details)
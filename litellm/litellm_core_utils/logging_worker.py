@@ -0,0 +1,320 @@
+"""
+Bounded dispatcher for success / failure logging work.
+
+Logging must not delay the response (or the final streaming chunk), and logging load
+must not create unbounded threads. `logging_dispatcher` runs sync logging work on a fixed
+number of daemon worker threads fed by a bounded queue, and schedules async logging
+coroutines with a cap on the number of in-flight tasks.
+
+Success / failure handlers are never dropped - they do spend, budget and cache accounting. When the queue is
+full (or too many async logging tasks are in flight) they run on the shared thread pool executor / are scheduled
+anyway (counted in `spilled`).
+
+Only events submitted with `submit_droppable` / `submit_coroutine(..., droppable=True)` - for callbacks that opt in
+and do no accounting - are subject to `queue_full_policy` when the queue is full:
+- "drop" (default): discard it (counted in `dropped`), so a logging backend that can't keep up doesn't grow memory.
+- "spill": run it on the shared thread pool executor / schedule it anyway (counted in `spilled`).
+
+Configure via env vars (`LOGGING_WORKER_COUNT`, `LOGGING_WORKER_MAX_QUEUE_SIZE`,
+`LOGGING_WORKER_QUEUE_FULL_POLICY`) or `logging_dispatcher.configure(...)`.
+"""
+
+import asyncio
+import atexit
+import queue
+import threading
+import time
+from typing import Any, Callable, Coroutine, List, Optional, Set, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    LOGGING_WORKER_COUNT,
+    LOGGING_WORKER_FLUSH_TIMEOUT_SECONDS,
+    LOGGING_WORKER_MAX_QUEUE_SIZE,
+    LOGGING_WORKER_QUEUE_FULL_POLICY,
+)
+from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.types.litellm_core_utils.logging_worker import (
+    LoggingDispatcherMetrics,
+    LoggingQueueFullPolicy,
+)
+
+_WorkItem = Tuple[float, Callable[..., Any], tuple, dict]
+
+# how often idle workers wake up to check if they should exit after `configure()`
+_WORKER_IDLE_POLL_INTERVAL_SECONDS = 1.0
+
+
+class LoggingDispatcher:
+    def __init__(
+        self,
+        num_workers: int = LOGGING_WORKER_COUNT,
+        max_queue_size: int = LOGGING_WORKER_MAX_QUEUE_SIZE,
+        queue_full_policy: LoggingQueueFullPolicy = LOGGING_WORKER_QUEUE_FULL_POLICY,  # type: ignore
+    ):
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[_WorkItem]" = queue.Queue()
+        self._workers: List[Optional[threading.Thread]] = []
+        self._async_tasks: Set["asyncio.Task[Any]"] = set()
+
+        self.num_workers = 1
+        self.max_queue_size = 1
+        self.queue_full_policy: LoggingQueueFullPolicy = "drop"
+        self.configure(
+            num_workers=num_workers,
+            max_queue_size=max_queue_size,
+            queue_full_policy=queue_full_policy,
+        )
+        self.reset_metrics()
+
+    def configure(
+        self,
+        num_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        queue_full_policy: Optional[LoggingQueueFullPolicy] = None,
+    ) -> None:
+        """
+        Update the dispatcher settings. Safe to call while workers are running.
+        """
+        with self._lock:
+            if num_workers is not None:
+                if num_workers < 1:
+                    raise ValueError("num_workers must be >= 1")
+                self.num_workers = num_workers
+            if max_queue_size is not None:
+                if max_queue_size < 1:
+                    raise ValueError("max_queue_size must be >= 1")
+                self.max_queue_size = max_queue_size
+                self._queue.maxsize = max_queue_size
+            if queue_full_policy is not None:
+                if queue_full_policy not in ("drop", "spill"):
+                    raise ValueError(
+                        "queue_full_policy must be one of 'drop', 'spill'. Got={}".format(
+                            queue_full_policy
+                        )
+                    )
+                self.queue_full_policy = queue_full_policy
+
+    def reset_metrics(self) -> None:
+        with self._lock:
+            self._submitted = 0
+            self._completed = 0
+            self._failed = 0
+            self._dropped = 0
+            self._spilled = 0
+            self._started = 0
+            self._max_queue_depth = 0
+            self._total_queue_latency = 0.0
+            self._max_queue_latency = 0.0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> bool:
+        """
+        Queue a sync logging function to run on a worker thread.
+
+        Never blocks and never drops - if the queue is full, it runs on the shared thread pool executor.
+        """
+        return self._submit(fn=fn, args=args, kwargs=kwargs, droppable=False)
+
+    def submit_droppable(
+        self, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> bool:
+        """
+        `submit` for logging that opted in to being dropped - it must not do any spend / budget / cache accounting.
+
+        Returns False if the event was dropped because the queue is full and `queue_full_policy` is "drop".
+        """
+        return self._submit(fn=fn, args=args, kwargs=kwargs, droppable=True)
+
+    def _submit(
+        self, fn: Callable[..., Any], args: tuple, kwargs: dict, droppable: bool
+    ) -> bool:
+        self._ensure_workers()
+        with self._lock:
+            self._submitted += 1
+        try:
+            self._queue.put_nowait((time.perf_counter(), fn, args, kwargs))
+        except queue.Full:
+            return self._handle_queue_full(fn, args, kwargs, droppable=droppable)
+
+        queue_depth = self._queue.qsize()
+        if queue_depth > self._max_queue_depth:
+            with self._lock:
+                self._max_queue_depth = max(self._max_queue_depth, queue_depth)
+        return True
+
+    def submit_coroutine(
+        self, coro: Coroutine[Any, Any, Any], droppable: bool = False
+    ) -> bool:
+        """
+        Schedule an async logging coroutine on the running event loop.
+
+        Only a `droppable` coroutine (see `submit_droppable`) is dropped when too many logging tasks are in flight
+        and `queue_full_policy` is "drop" - returns False if it was.
+        """
+        with self._lock:
+            self._submitted += 1
+            is_full = len(self._async_tasks) >= self.max_queue_size
+            should_drop = is_full and droppable and self.queue_full_policy == "drop"
+            if should_drop:
+                self._dropped += 1
+            elif is_full:
+                self._spilled += 1
+
+        if should_drop:
+            verbose_logger.debug(
+                "LoggingDispatcher: too many async logging tasks in flight, dropping logging event"
+            )
+            coro.close()
+            return False
+
+        task = asyncio.create_task(
+            self._run_coroutine(enqueued_at=time.perf_counter(), coro=coro)
+        )
+        with self._lock:
+            self._async_tasks.add(task)
+            self._max_queue_depth = max(self._max_queue_depth, len(self._async_tasks))
+        task.add_done_callback(self._on_async_task_done)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued sync logging work to finish.
+
+        Returns True if the queue was fully drained within `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if deadline is None:
+                    self._queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def get_metrics(self) -> LoggingDispatcherMetrics:
+        with self._lock:
+            return LoggingDispatcherMetrics(
+                num_workers=self.num_workers,
+                max_queue_size=self.max_queue_size,
+                queue_full_policy=self.queue_full_policy,
+                queue_depth=self._queue.qsize(),
+                max_queue_depth=self._max_queue_depth,
+                async_tasks_in_flight=len(self._async_tasks),
+                submitted=self._submitted,
+                completed=self._completed,
+                failed=self._failed,
+                dropped=self._dropped,
+                spilled=self._spilled,
+                avg_queue_latency_ms=(
+                    (self._total_queue_latency / self._started) * 1000
+                    if self._started
+                    else 0.0
+                ),
+                max_queue_latency_ms=self._max_queue_latency * 1000,
+            )
+
+    def _handle_queue_full(
+        self, fn: Callable[..., Any], args: tuple, kwargs: dict, droppable: bool
+    ) -> bool:
+        if droppable and self.queue_full_policy == "drop":
+            with self._lock:
+                self._dropped += 1
+            verbose_logger.debug(
+                "LoggingDispatcher: logging queue is full (max_queue_size=%s), dropping logging event",
+                self.max_queue_size,
+            )
+            return False
+
+        with self._lock:
+            self._spilled += 1
+        executor.submit(
+            self._run_work_item, (time.perf_counter(), fn, args, kwargs), False
+        )
+        return True
+
+    def _ensure_workers(self) -> None:
+        if len(self._workers) >= self.num_workers and all(
+            worker is not None and worker.is_alive() for worker in self._workers
+        ):
+            return
+        with self._lock:
+            while len(self._workers) < self.num_workers:
+                self._workers.append(None)
+            for index in range(self.num_workers):
+                worker = self._workers[index]
+                if worker is None or not worker.is_alive():
+                    worker = threading.Thread(
+                        target=self._worker_loop,
+                        args=(index,),
+                        name="litellm-logging-worker-{}".format(index),
+                        daemon=True,
+                    )
+                    self._workers[index] = worker
+                    worker.start()
+
+    def _worker_loop(self, index: int) -> None:
+        while index < self.num_workers:
+            try:
+                item = self._queue.get(timeout=_WORKER_IDLE_POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+            self._run_work_item(item, True)
+        with self._lock:
+            if index < len(self._workers) and self._workers[index] is not None:
+                self._workers[index] = None
+            while self._workers and self._workers[-1] is None:
+                self._workers.pop()
+
+    def _run_work_item(self, item: _WorkItem, from_queue: bool) -> None:
+        enqueued_at, fn, args, kwargs = item
+        self._record_start(enqueued_at)
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            verbose_logger.exception(
+                "LoggingDispatcher: error running logging function - {}".format(str(e))
+            )
+        finally:
+            with self._lock:
+                self._completed += 1
+            if from_queue:
+                self._queue.task_done()
+
+    async def _run_coroutine(
+        self, enqueued_at: float, coro: Coroutine[Any, Any, Any]
+    ) -> None:
+        self._record_start(enqueued_at)
+        try:
+            await coro
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            verbose_logger.exception(
+                "LoggingDispatcher: error running async logging coroutine - {}".format(
+                    str(e)
+                )
+            )
+        finally:
+            with self._lock:
+                self._completed += 1
+
+    def _on_async_task_done(self, task: "asyncio.Task[Any]") -> None:
+        with self._lock:
+            self._async_tasks.discard(task)
+
+    def _record_start(self, enqueued_at: float) -> None:
+        latency = time.perf_counter() - enqueued_at
+        with self._lock:
+            self._started += 1
+            self._total_queue_latency += latency
+            if latency > self._max_queue_latency:
+                self._max_queue_latency = latency
+
+
+logging_dispatcher = LoggingDispatcher()
+atexit.register(logging_dispatcher.flush, timeout=LOGGING_WORKER_FLUSH_TIMEOUT_SECONDS)
@@ -0,0 +1,94 @@
+"""
+Per-(model, provider) plan used by `get_optional_params` to map the openai params of a request.
+
+Everything that only depends on the model + provider is resolved once and cached:
+- the provider config
+- the set of supported openai params (`get_supported_openai_params`)
+
+So a request only does a single pass over its non-default params, with set lookups.
+
+The cache is cleared by `register_model`, whenever `litellm.model_cost` is replaced or grows,
+and when it reaches `MAX_OPTIONAL_PARAMS_PLAN_CACHE_SIZE` entries.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Tuple
+
+import litellm
+from litellm.constants import MAX_OPTIONAL_PARAMS_PLAN_CACHE_SIZE
+from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_version
+from litellm.litellm_core_utils.get_supported_openai_params import (
+    get_supported_openai_params,
+)
+from litellm.types.utils import LlmProviders, LlmProvidersSet
+
+if TYPE_CHECKING:
+    from litellm.llms.base_llm.chat.transformation import BaseConfig
+else:
+    BaseConfig = Any
+
+
+class OptionalParamsPlan:
+    __slots__ = ("provider_config", "supported_params")
+
+    def __init__(
+        self,
+        provider_config: Optional[BaseConfig],
+        supported_params: FrozenSet[str],
+    ):
+        self.provider_config = provider_config
+        self.supported_params = supported_params
+
+
+_optional_params_plans: Dict[Tuple[str, Optional[str]], OptionalParamsPlan] = {}
+_optional_params_plans_model_cost_version: Optional[Tuple[int, int]] = None
+
+
+def invalidate_optional_params_plans() -> None:
+    _optional_params_plans.clear()
+
+
+def get_optional_params_plan(
+    model: str, custom_llm_provider: Optional[str]
+) -> OptionalParamsPlan:
+    """
+    Returns the (cached) optional params plan for `model` / `custom_llm_provider`.
+    """
+    global _optional_params_plans_model_cost_version
+    model_cost_version = get_model_cost_version()
+    if model_cost_version != _optional_params_plans_model_cost_version:
+        _optional_params_plans.clear()
+        _optional_params_plans_model_cost_version = model_cost_version
+
+    cache_key = (model, custom_llm_provider)
+    plan = _optional_params_plans.get(cache_key)
+    if plan is None:
+        plan = _build_optional_params_plan(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+        if len(_optional_params_plans) >= MAX_OPTIONAL_PARAMS_PLAN_CACHE_SIZE:
+            _optional_params_plans.clear()
+        _optional_params_plans[cache_key] = plan
+    return plan
+
+
+def _build_optional_params_plan(
+    model: str, custom_llm_provider: Optional[str]
+) -> OptionalParamsPlan:
+    provider_config: Optional[BaseConfig] = None
+    if custom_llm_provider is not None and custom_llm_provider in LlmProvidersSet:
+        provider_config = litellm.ProviderConfigManager.get_provider_chat_config(
+            model=model, provider=LlmProviders(custom_llm_provider)
+        )
+
+    supported_params = get_supported_openai_params(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    if supported_params is None:
+        supported_params = get_supported_openai_params(
+            model=model, custom_llm_provider="openai"
+        )
+
+    return OptionalParamsPlan(
+        provider_config=provider_config,
+        supported_params=frozenset(supported_params or []),
+    )
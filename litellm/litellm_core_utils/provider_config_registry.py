@@ -0,0 +1,304 @@
+"""
+Lookup tables used by `ProviderConfigManager` to resolve the provider config for a request.
+
+Each table maps a provider to a function returning the config class for a model. Most providers
+have a single config class, a few (vertex_ai, bedrock, openai / azure o-series) pick the class
+based on the model name.
+
+Config classes hold no per-request state, so one instance per class is created and reused
+across requests - see `get_provider_config_instance`.
+
+Config classes are read from the `litellm` module at call time, so patched / overridden classes are picked up.
+"""
+
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+import litellm
+from litellm.llms.bedrock.common_utils import BedrockModelInfo
+from litellm.types.utils import LlmProviders
+
+ConfigT = TypeVar("ConfigT")
+
+# provider -> function(model) -> config class
+ProviderConfigTable = Dict[LlmProviders, Callable[[str], Optional[Type[Any]]]]
+
+_provider_config_instances: Dict[type, Any] = {}
+
+
+def get_provider_config_instance(config_class: Type[ConfigT]) -> ConfigT:
+    """
+    Returns the shared instance of `config_class`, creating it on first use.
+    """
+    instance = _provider_config_instances.get(config_class)
+    if instance is None:
+        instance = config_class()
+        _provider_config_instances[config_class] = instance
+    return instance
+
+
+def get_config_from_table(
+    table: ProviderConfigTable, model: str, provider: LlmProviders
+) -> Optional[Any]:
+    """
+    Returns the shared config instance for `provider` / `model`, or None if the provider is not in `table`.
+    """
+    get_config_class = table.get(provider)
+    if get_config_class is None:
+        return None
+    config_class = get_config_class(model)
+    if config_class is None:
+        return None
+    return get_provider_config_instance(config_class)
+
+
+#### CHAT ####
+
+
+def _get_openai_chat_config_class(model: str) -> Type[Any]:
+    if litellm.openaiOSeriesConfig.is_model_o_series_model(model=model):
+        return litellm.OpenAIOSeriesConfig
+    return litellm.OpenAIGPTConfig
+
+
+def _get_azure_chat_config_class(model: str) -> Type[Any]:
+    azure_o_series_config = get_provider_config_instance(litellm.AzureOpenAIO1Config)
+    if azure_o_series_config.is_o_series_model(model=model):
+        return litellm.AzureOpenAIO1Config
+    return litellm.AzureOpenAIConfig
+
+
+def _get_vertex_ai_chat_config_class(model: str) -> Type[Any]:
+    if "gemini" in model:
+        return litellm.VertexGeminiConfig
+    elif "claude" in model:
+        return litellm.VertexAIAnthropicConfig
+    elif model in litellm.vertex_mistral_models:
+        if "codestral" in model:
+            return litellm.CodestralTextCompletionConfig
+        return litellm.MistralConfig
+    elif model in litellm.vertex_ai_ai21_models:
+        return litellm.VertexAIAi21Config
+    # use generic openai-like param mapping
+    return litellm.VertexAILlama3Config
+
+
+def _get_bedrock_chat_config_class(model: str) -> Type[Any]:
+    bedrock_route = BedrockModelInfo.get_bedrock_route(model)
+    if bedrock_route == "converse" or bedrock_route == "converse_like":
+        return litellm.AmazonConverseConfig
+    elif bedrock_route == "agent":
+        from litellm.llms.bedrock.chat.invoke_agent.transformation import (
+            AmazonInvokeAgentConfig,
+        )
+
+        return AmazonInvokeAgentConfig
+
+    bedrock_invoke_provider = litellm.BedrockLLM.get_bedrock_invoke_provider(
+        model=model
+    )
+    if bedrock_invoke_provider == "amazon":  # amazon titan llms
+        return litellm.AmazonTitanConfig
+    elif bedrock_invoke_provider == "anthropic":
+        base_model = BedrockModelInfo.get_base_model(model)
+        if (
+            base_model
+            in litellm.AmazonAnthropicConfig.get_legacy_anthropic_model_names()
+        ):
+            return litellm.AmazonAnthropicConfig
+        return litellm.AmazonAnthropicClaude3Config
+    elif (
+        bedrock_invoke_provider == "meta" or bedrock_invoke_provider == "llama"
+    ):  # amazon / meta llms
+        return litellm.AmazonLlamaConfig
+    elif bedrock_invoke_provider == "ai21":  # ai21 llms
+        return litellm.AmazonAI21Config
+    elif bedrock_invoke_provider == "cohere":  # cohere models on bedrock
+        return litellm.AmazonCohereConfig
+    elif bedrock_invoke_provider == "mistral":  # mistral models on bedrock
+        return litellm.AmazonMistralConfig
+    elif bedrock_invoke_provider == "deepseek_r1":  # deepseek models on bedrock
+        return litellm.AmazonDeepSeekR1Config
+    elif bedrock_invoke_provider == "nova":
+        return litellm.AmazonInvokeNovaConfig
+    return litellm.AmazonInvokeConfig
+
+
+PROVIDER_CHAT_CONFIGS: ProviderConfigTable = {
+    LlmProviders.OPENAI: _get_openai_chat_config_class,
+    LlmProviders.DEEPSEEK: lambda model: litellm.DeepSeekChatConfig,
+    LlmProviders.GROQ: lambda model: litellm.GroqChatConfig,
+    LlmProviders.BYTEZ: lambda model: litellm.BytezChatConfig,
+    LlmProviders.DATABRICKS: lambda model: litellm.DatabricksConfig,
+    LlmProviders.XAI: lambda model: litellm.XAIChatConfig,
+    LlmProviders.LAMBDA_AI: lambda model: litellm.LambdaAIChatConfig,
+    LlmProviders.LLAMA: lambda model: litellm.LlamaAPIConfig,
+    LlmProviders.TEXT_COMPLETION_OPENAI: lambda model: litellm.OpenAITextCompletionConfig,
+    LlmProviders.COHERE_CHAT: lambda model: litellm.CohereChatConfig,
+    LlmProviders.COHERE: lambda model: litellm.CohereConfig,
+    LlmProviders.SNOWFLAKE: lambda model: litellm.SnowflakeConfig,
+    LlmProviders.CLARIFAI: lambda model: litellm.ClarifaiConfig,
+    LlmProviders.ANTHROPIC: lambda model: litellm.AnthropicConfig,
+    LlmProviders.ANTHROPIC_TEXT: lambda model: litellm.AnthropicTextConfig,
+    LlmProviders.VERTEX_AI_BETA: lambda model: litellm.VertexGeminiConfig,
+    LlmProviders.VERTEX_AI: _get_vertex_ai_chat_config_class,
+    LlmProviders.CLOUDFLARE: lambda model: litellm.CloudflareChatConfig,
+    LlmProviders.SAGEMAKER_CHAT: lambda model: litellm.SagemakerChatConfig,
+    LlmProviders.SAGEMAKER: lambda model: litellm.SagemakerConfig,
+    LlmProviders.FIREWORKS_AI: lambda model: litellm.FireworksAIConfig,
+    LlmProviders.FRIENDLIAI: lambda model: litellm.FriendliaiChatConfig,
+    LlmProviders.WATSONX: lambda model: litellm.IBMWatsonXChatConfig,
+    LlmProviders.WATSONX_TEXT: lambda model: litellm.IBMWatsonXAIConfig,
+    LlmProviders.EMPOWER: lambda model: litellm.EmpowerChatConfig,
+    LlmProviders.GITHUB: lambda model: litellm.GithubChatConfig,
+    LlmProviders.GITHUB_COPILOT: lambda model: litellm.GithubCopilotConfig,
+    LlmProviders.CUSTOM: lambda model: litellm.OpenAILikeChatConfig,
+    LlmProviders.CUSTOM_OPENAI: lambda model: litellm.OpenAILikeChatConfig,
+    LlmProviders.OPENAI_LIKE: lambda model: litellm.OpenAILikeChatConfig,
+    LlmProviders.AIOHTTP_OPENAI: lambda model: litellm.AiohttpOpenAIChatConfig,
+    LlmProviders.HOSTED_VLLM: lambda model: litellm.HostedVLLMChatConfig,
+    LlmProviders.LLAMAFILE: lambda model: litellm.LlamafileChatConfig,
+    LlmProviders.LM_STUDIO: lambda model: litellm.LMStudioChatConfig,
+    LlmProviders.GALADRIEL: lambda model: litellm.GaladrielChatConfig,
+    LlmProviders.REPLICATE: lambda model: litellm.ReplicateConfig,
+    LlmProviders.HUGGINGFACE: lambda model: litellm.HuggingFaceChatConfig,
+    LlmProviders.TOGETHER_AI: lambda model: litellm.TogetherAIConfig,
+    LlmProviders.OPENROUTER: lambda model: litellm.OpenrouterConfig,
+    LlmProviders.DATAROBOT: lambda model: litellm.DataRobotConfig,
+    LlmProviders.GEMINI: lambda model: litellm.GoogleAIStudioGeminiConfig,
+    LlmProviders.AI21: lambda model: litellm.AI21ChatConfig,
+    LlmProviders.AI21_CHAT: lambda model: litellm.AI21ChatConfig,
+    LlmProviders.AZURE: _get_azure_chat_config_class,
+    LlmProviders.AZURE_AI: lambda model: litellm.AzureAIStudioConfig,
+    LlmProviders.AZURE_TEXT: lambda model: litellm.AzureOpenAITextConfig,
+    LlmProviders.NLP_CLOUD: lambda model: litellm.NLPCloudConfig,
+    LlmProviders.OOBABOOGA: lambda model: litellm.OobaboogaConfig,
+    LlmProviders.OLLAMA_CHAT: lambda model: litellm.OllamaChatConfig,
+    LlmProviders.DEEPINFRA: lambda model: litellm.DeepInfraConfig,
+    LlmProviders.PERPLEXITY: lambda model: litellm.PerplexityChatConfig,
+    LlmProviders.MISTRAL: lambda model: litellm.MistralConfig,
+    LlmProviders.CODESTRAL: lambda model: litellm.MistralConfig,
+    LlmProviders.NVIDIA_NIM: lambda model: litellm.NvidiaNimConfig,
+    LlmProviders.CEREBRAS: lambda model: litellm.CerebrasConfig,
+    LlmProviders.VOLCENGINE: lambda model: litellm.VolcEngineConfig,
+    LlmProviders.TEXT_COMPLETION_CODESTRAL: lambda model: litellm.CodestralTextCompletionConfig,
+    LlmProviders.SAMBANOVA: lambda model: litellm.SambanovaConfig,
+    LlmProviders.MARITALK: lambda model: litellm.MaritalkConfig,
+    LlmProviders.VLLM: lambda model: litellm.VLLMConfig,
+    LlmProviders.OLLAMA: lambda model: litellm.OllamaConfig,
+    LlmProviders.PREDIBASE: lambda model: litellm.PredibaseConfig,
+    LlmProviders.TRITON: lambda model: litellm.TritonConfig,
+    LlmProviders.PETALS: lambda model: litellm.PetalsConfig,
+    LlmProviders.FEATHERLESS_AI: lambda model: litellm.FeatherlessAIConfig,
+    LlmProviders.NOVITA: lambda model: litellm.NovitaConfig,
+    LlmProviders.NEBIUS: lambda model: litellm.NebiusConfig,
+    LlmProviders.DASHSCOPE: lambda model: litellm.DashScopeChatConfig,
+    LlmProviders.MOONSHOT: lambda model: litellm.MoonshotChatConfig,
+    LlmProviders.V0: lambda model: litellm.V0ChatConfig,
+    LlmProviders.MORPH: lambda model: litellm.MorphChatConfig,
+    LlmProviders.BEDROCK: _get_bedrock_chat_config_class,
+    LlmProviders.LITELLM_PROXY: lambda model: litellm.LiteLLMProxyChatConfig,
+    LlmProviders.NSCALE: lambda model: litellm.NscaleConfig,
+    LlmProviders.HYPERBOLIC: lambda model: litellm.HyperbolicChatConfig,
+}
+
+
+#### EMBEDDING ####
+
+
+def _get_cohere_embedding_config_class(model: str) -> Type[Any]:
+    from litellm.llms.cohere.embed.transformation import CohereEmbeddingConfig
+
+    return CohereEmbeddingConfig
+
+
+def _get_lodash_embedding_config_class(model: str) -> Type[Any]:
+    from litellm.llms.lodash.embedding.transformation import LodashEmbeddingConfig
+
+    return LodashEmbeddingConfig
+
+
+PROVIDER_EMBEDDING_CONFIGS: ProviderConfigTable = {
+    LlmProviders.VOYAGE: lambda model: litellm.VoyageEmbeddingConfig,
+    LlmProviders.TRITON: lambda model: litellm.TritonEmbeddingConfig,
+    LlmProviders.WATSONX: lambda model: litellm.IBMWatsonXEmbeddingConfig,
+    LlmProviders.INFINITY: lambda model: litellm.InfinityEmbeddingConfig,
+    LlmProviders.COHERE: _get_cohere_embedding_config_class,
+    LlmProviders.COHERE_CHAT: _get_cohere_embedding_config_class,
+    LlmProviders.LODASH: _get_lodash_embedding_config_class,
+}
+
+
+#### RERANK ####
+
+# cohere picks v1 / v2 based on the request - handled in `ProviderConfigManager.get_provider_rerank_config`
+PROVIDER_RERANK_CONFIGS: ProviderConfigTable = {
+    LlmProviders.AZURE_AI: lambda model: litellm.AzureAIRerankConfig,
+    LlmProviders.INFINITY: lambda model: litellm.InfinityRerankConfig,
+    LlmProviders.JINA_AI: lambda model: litellm.JinaAIRerankConfig,
+    LlmProviders.HUGGINGFACE: lambda model: litellm.HuggingFaceRerankConfig,
+}
+
+
+#### ANTHROPIC /v1/messages ####
+
+
+def _get_vertex_ai_anthropic_messages_config_class(
+    model: str,
+) -> Optional[Type[Any]]:
+    if "claude" in model:
+        from litellm.llms.vertex_ai.vertex_ai_partner_models.anthropic.experimental_pass_through.transformation import (
+            VertexAIPartnerModelsAnthropicMessagesConfig,
+        )
+
+        return VertexAIPartnerModelsAnthropicMessagesConfig
+    return None
+
+
+PROVIDER_ANTHROPIC_MESSAGES_CONFIGS: ProviderConfigTable = {
+    LlmProviders.ANTHROPIC: lambda model: litellm.AnthropicMessagesConfig,
+    # The 'BEDROCK' provider corresponds to Amazon's implementation of Anthropic Claude v3.
+    LlmProviders.BEDROCK: lambda model: litellm.AmazonAnthropicClaude3MessagesConfig,
+    LlmProviders.VERTEX_AI: _get_vertex_ai_anthropic_messages_config_class,
+}
+
+
+#### AUDIO TRANSCRIPTION ####
+
+
+def _get_elevenlabs_audio_transcription_config_class(model: str) -> Type[Any]:
+    from litellm.llms.elevenlabs.audio_transcription.transformation import (
+        ElevenLabsAudioTranscriptionConfig,
+    )
+
+    return ElevenLabsAudioTranscriptionConfig
+
+
+def _get_openai_audio_transcription_config_class(model: str) -> Type[Any]:
+    if "gpt-4o" in model:
+        return litellm.OpenAIGPTAudioTranscriptionConfig
+    return litellm.OpenAIWhisperAudioTranscriptionConfig
+
+
+PROVIDER_AUDIO_TRANSCRIPTION_CONFIGS: ProviderConfigTable = {
+    LlmProviders.FIREWORKS_AI: lambda model: litellm.FireworksAIAudioTranscriptionConfig,
+    LlmProviders.DEEPGRAM: lambda model: litellm.DeepgramAudioTranscriptionConfig,
+    LlmProviders.ELEVENLABS: _get_elevenlabs_audio_transcription_config_class,
+    LlmProviders.OPENAI: _get_openai_audio_transcription_config_class,
+}
+
+
+#### RESPONSES API ####
+
+PROVIDER_RESPONSES_API_CONFIGS: ProviderConfigTable = {
+    LlmProviders.OPENAI: lambda model: litellm.OpenAIResponsesAPIConfig,
+    LlmProviders.AZURE: lambda model: litellm.AzureOpenAIResponsesAPIConfig,
+}
+
+
+#### TEXT COMPLETION ####
+
+# providers not in the table use `litellm.OpenAITextCompletionConfig`
+PROVIDER_TEXT_COMPLETION_CONFIGS: ProviderConfigTable = {
+    LlmProviders.FIREWORKS_AI: lambda model: litellm.FireworksAITextCompletionConfig,
+    LlmProviders.TOGETHER_AI: lambda model: litellm.TogetherAITextCompletionConfig,
+}
@@ -1,7 +1,19 @@
 import base64
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, cast
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+    cast,
+)
 
+from litellm.types.caching import CachedStreamChunkBoundaries
 from litellm.types.llms.openai import (
     ChatCompletionAssistantContentValue,
     ChatCompletionAudioDelta,
@@ -17,6 +29,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     PromptTokensDetailsWrapper,
+    TextChoices,
     Usage,
 )
 from litellm.utils import print_verbose, token_counter
@@ -29,6 +42,7 @@ if TYPE_CHECKING:
         ChatCompletionRedactedThinkingBlock,
         ChatCompletionThinkingBlock,
     )
+    from litellm.types.utils import TextCompletionResponse
 
 
 class ChunkProcessor:
@@ -377,89 +391,97 @@ class ChunkProcessor:
 
         return reasoning_tokens
 
-    def _calculate_usage_per_chunk(
-        self,
-        chunks: List[Union[Dict[str, Any], ModelResponse]],
-    ) -> "UsagePerChunk":
+    @staticmethod
+    def _get_usage_from_chunk(
+        chunk: Union[Dict[str, Any], ModelResponse, ModelResponseStream],
+    ) -> Optional[Usage]:
+        if "usage" in chunk:
+            return chunk["usage"]
+        elif (
+            isinstance(chunk, ModelResponse) or isinstance(chunk, ModelResponseStream)
+        ) and hasattr(chunk, "_hidden_params"):
+            return chunk._hidden_params.get("usage", None)
+        return None
+
+    @staticmethod
+    def _get_empty_usage_per_chunk() -> "UsagePerChunk":
         from litellm.types.litellm_core_utils.streaming_chunk_builder_utils import (
             UsagePerChunk,
         )
 
-        # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-
-        web_search_requests: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetailsWrapper] = None
-        for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif (
-                isinstance(chunk, ModelResponse)
-                or isinstance(chunk, ModelResponseStream)
-            ) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
+        return UsagePerChunk(
+            prompt_tokens=0,
+            completion_tokens=0,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+            web_search_requests=None,
+            completion_tokens_details=None,
+            prompt_tokens_details=None,
+        )
 
-            if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_creation_input_tokens"] > 0
-                    or cache_creation_input_tokens is None
-                ):
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_read_input_tokens"] > 0
-                    or cache_read_input_tokens is None
-                ):
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                if (
-                    usage_chunk_dict["prompt_tokens_details"] is not None
-                    and getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                        None,
-                    )
-                    is not None
-                ):
-                    web_search_requests = getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                    )
+    def _update_usage_per_chunk(
+        self, usage_per_chunk: "UsagePerChunk", usage_chunk: Usage
+    ) -> None:
+        """
+        Fold a single usage chunk into the running `usage_per_chunk` values.
+        """
+        usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            usage_per_chunk["prompt_tokens"] = usage_chunk_dict["prompt_tokens"]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            usage_per_chunk["completion_tokens"] = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
+            usage_chunk_dict["cache_creation_input_tokens"] > 0
+            or usage_per_chunk["cache_creation_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_creation_input_tokens"] = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None and (
+            usage_chunk_dict["cache_read_input_tokens"] > 0
+            or usage_per_chunk["cache_read_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_read_input_tokens"] = usage_chunk_dict[
+                "cache_read_input_tokens"
+            ]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            usage_per_chunk["completion_tokens_details"] = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        if (
+            usage_chunk_dict["prompt_tokens_details"] is not None
+            and getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+                None,
+            )
+            is not None
+        ):
+            usage_per_chunk["web_search_requests"] = getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+            )
 
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
+        usage_per_chunk["prompt_tokens_details"] = usage_chunk_dict[
+            "prompt_tokens_details"
+        ]
 
-        return UsagePerChunk(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_creation_input_tokens=cache_creation_input_tokens,
-            cache_read_input_tokens=cache_read_input_tokens,
-            web_search_requests=web_search_requests,
-            completion_tokens_details=completion_tokens_details,
-            prompt_tokens_details=prompt_tokens_details,
-        )
+    def _calculate_usage_per_chunk(
+        self,
+        chunks: List[Union[Dict[str, Any], ModelResponse]],
+    ) -> "UsagePerChunk":
+        usage_per_chunk = self._get_empty_usage_per_chunk()
+        for chunk in chunks:
+            usage_chunk = self._get_usage_from_chunk(chunk)
+            if usage_chunk is not None:
+                self._update_usage_per_chunk(usage_per_chunk, usage_chunk)
+        return usage_per_chunk
 
     def calculate_usage(
         self,
@@ -472,10 +494,26 @@ class ChunkProcessor:
         """
         Calculate usage for the given chunks.
         """
-        returned_usage = Usage()
-        # # Update usage information if needed
+        return self.calculate_usage_from_usage_per_chunk(
+            calculated_usage_per_chunk=self._calculate_usage_per_chunk(chunks=chunks),
+            model=model,
+            completion_output=completion_output,
+            messages=messages,
+            reasoning_tokens=reasoning_tokens,
+        )
 
-        calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
+    def calculate_usage_from_usage_per_chunk(
+        self,
+        calculated_usage_per_chunk: "UsagePerChunk",
+        model: str,
+        completion_output: str,
+        messages: Optional[List] = None,
+        reasoning_tokens: Optional[int] = None,
+    ) -> Usage:
+        """
+        Calculate usage from already-combined per-chunk usage values.
+        """
+        returned_usage = Usage()
         prompt_tokens = calculated_usage_per_chunk["prompt_tokens"]
         completion_tokens = calculated_usage_per_chunk["completion_tokens"]
         ## anthropic prompt caching information ##
@@ -561,6 +599,394 @@ class ChunkProcessor:
         return returned_usage
 
 
+class StreamingChunkAccumulator:
+    """
+    Incrementally folds streaming chunks into running content / tool call / usage state.
+
+    Used by `CustomStreamWrapper` so the complete response can be built at the end of
+    the stream without holding on to every chunk object - memory per stream is
+    proportional to the response text, not the number of chunks.
+
+    `build_complete_streaming_response()` returns the same result as
+    `litellm.stream_chunk_builder(chunks=...)` over the chunks added so far.
+
+    Chunks are folded in the order they are added. `stream_chunk_builder` orders chunks by
+    `_hidden_params["created_at"]` - `CustomStreamWrapper` adds every chunk right after creating it
+    and never stamps a chunk earlier than the previous one, so both orders are the same.
+    """
+
+    def __init__(self, recent_chunks_limit: Optional[int] = None):
+        self.recent_chunks: Deque[Any] = deque(maxlen=recent_chunks_limit)
+        self.num_chunks: int = 0
+        self._chunk_processor: Optional[ChunkProcessor] = None
+
+        ## base response
+        self.first_chunk: Optional[Any] = None
+        self.chunk_id: str = ""
+        self.finish_reason: Optional[str] = "stop"
+        self.last_hidden_params: Dict[str, Any] = {}
+
+        ## text completion chunks - routed to `stream_chunk_builder_text_completion`
+        self.text_completion_chunks: Optional[List[Any]] = None
+
+        ## message content
+        self.content_list: List[str] = []
+        self.has_content: bool = False
+        self.reasoning_content_list: List[str] = []
+        self.has_reasoning_content: bool = False
+        self.tool_call_map: Dict[int, Dict[str, Any]] = {}
+        self.has_tool_calls: bool = False
+        self.function_call_name: Optional[str] = None
+        self.function_call_arguments: List[str] = []
+        self.has_function_call: bool = False
+        self.has_multiple_choices: bool = False
+
+        ## thinking blocks
+        self.has_thinking_blocks: bool = False
+        self.combined_thinking_text: Optional[str] = None
+        self.thinking_data: Optional[str] = None
+        self.thinking_signature: Optional[str] = None
+        self.thinking_type: Literal["thinking", "redacted_thinking"] = "thinking"
+
+        ## audio
+        self.has_audio: bool = False
+        self.audio_base64_data_list: List[str] = []
+        self.audio_transcript_list: List[str] = []
+        self.audio_expires_at: Optional[int] = None
+        self.audio_id: Optional[str] = None
+
+        ## usage
+        self.usage_per_chunk: "UsagePerChunk" = (
+            ChunkProcessor._get_empty_usage_per_chunk()
+        )
+        self.total_prompt_tokens: int = 0
+        self.total_completion_tokens: int = 0
+
+    def __len__(self) -> int:
+        return self.num_chunks
+
+    def add_chunk(self, chunk: Any) -> None:
+        """
+        Fold a streaming chunk into the running response state.
+        """
+        self.num_chunks += 1
+        self.recent_chunks.append(chunk)
+        choices = chunk.get("choices", None) or []
+        if self._chunk_processor is None:
+            self._chunk_processor = ChunkProcessor(chunks=[chunk])
+            self.first_chunk = chunk
+            if len(choices) > 0 and isinstance(choices[0], TextChoices):
+                self.text_completion_chunks = []
+
+        if self.text_completion_chunks is not None:
+            self.text_completion_chunks.append(chunk)
+            return
+
+        if not self.chunk_id and chunk.get("id"):
+            self.chunk_id = chunk["id"]
+        self.last_hidden_params = chunk.get("_hidden_params", {})
+
+        self._add_usage(chunk)
+
+        if len(choices) > 0:
+            if hasattr(choices[0], "finish_reason"):
+                self.finish_reason = choices[0].finish_reason
+            elif "finish_reason" in choices[0]:
+                self.finish_reason = choices[0]["finish_reason"]
+        if len(choices) == 0:
+            return
+        if len(choices) > 1:
+            self.has_multiple_choices = True
+
+        delta = choices[0]["delta"]
+        if "tool_calls" in delta and delta["tool_calls"] is not None:
+            self.has_tool_calls = True
+            self._add_tool_calls(choices)
+        if "function_call" in delta and delta["function_call"] is not None:
+            self._add_function_call(choices)
+        if "content" in delta and delta["content"] is not None:
+            self.has_content = True
+            self._add_content(choices, self.content_list, delta_key="content")
+        if "thinking_blocks" in delta and delta["thinking_blocks"] is not None:
+            self.has_thinking_blocks = True
+            self._add_thinking_blocks(choices)
+        if "reasoning_content" in delta and delta["reasoning_content"] is not None:
+            self.has_reasoning_content = True
+            self._add_content(
+                choices, self.reasoning_content_list, delta_key="reasoning_content"
+            )
+        if "audio" in delta and delta["audio"] is not None:
+            self.has_audio = True
+            self._add_audio(choices)
+
+    def get_stream_chunk_boundaries(self) -> Optional[CachedStreamChunkBoundaries]:
+        """
+        Returns the length of each streamed content / reasoning delta - stored with cached
+        streaming responses, so cache hits replay with the same chunk boundaries.
+
+        Returns None for text completion and multi-choice (n > 1) streams.
+        """
+        if self.text_completion_chunks is not None or self.has_multiple_choices:
+            return None
+        boundaries = CachedStreamChunkBoundaries()
+        if self.content_list:
+            boundaries["content"] = [len(content) for content in self.content_list]
+        if self.reasoning_content_list:
+            boundaries["reasoning_content"] = [
+                len(content) for content in self.reasoning_content_list
+            ]
+        return boundaries
+
+    def _add_usage(self, chunk: Any) -> None:
+        if "usage" in chunk:
+            if "prompt_tokens" in chunk["usage"]:
+                self.total_prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
+            if "completion_tokens" in chunk["usage"]:
+                self.total_completion_tokens = (
+                    chunk["usage"].get("completion_tokens", 0) or 0
+                )
+
+        usage_chunk = ChunkProcessor._get_usage_from_chunk(chunk)
+        if usage_chunk is not None and self._chunk_processor is not None:
+            self._chunk_processor._update_usage_per_chunk(
+                self.usage_per_chunk, usage_chunk
+            )
+
+    def _add_content(
+        self, choices: List[Any], content_list: List[str], delta_key: str
+    ) -> None:
+        for choice in choices:
+            content = choice.get("delta", {}).get(delta_key, "")
+            if content is None:
+                continue  # openai v1.0.0 sets content = None for chunks
+            content_list.append(content)
+
+    def _add_tool_calls(self, choices: List[Any]) -> None:
+        for choice in choices:
+            tool_calls = choice.get("delta", {}).get("tool_calls", [])
+            for tool_call in tool_calls or []:
+                if not tool_call or not hasattr(tool_call, "function"):
+                    continue
+
+                index = getattr(tool_call, "index", 0)
+                if index not in self.tool_call_map:
+                    self.tool_call_map[index] = {
+                        "id": None,
+                        "name": None,
+                        "type": None,
+                        "arguments": [],
+                    }
+                tool_call_data = self.tool_call_map[index]
+                if hasattr(tool_call, "id") and tool_call.id:
+                    tool_call_data["id"] = tool_call.id
+                if hasattr(tool_call, "type") and tool_call.type:
+                    tool_call_data["type"] = tool_call.type
+                if hasattr(tool_call.function, "name") and tool_call.function.name:
+                    tool_call_data["name"] = tool_call.function.name
+                if (
+                    hasattr(tool_call.function, "arguments")
+                    and tool_call.function.arguments
+                ):
+                    tool_call_data["arguments"].append(tool_call.function.arguments)
+
+    def _add_function_call(self, choices: List[Any]) -> None:
+        if self.has_function_call is False:
+            self.has_function_call = True
+            self.function_call_name = choices[0]["delta"]["function_call"].name
+        for choice in choices:
+            function_call = choice.get("delta", {}).get("function_call", "")
+            if function_call:
+                self.function_call_arguments.append(function_call.arguments)
+
+    def _add_thinking_blocks(self, choices: List[Any]) -> None:
+        for choice in choices:
+            thinking = choice.get("delta", {}).get("thinking_blocks", None)
+            if not thinking or not isinstance(thinking, list):
+                continue
+            for thinking_block in thinking:
+                thinking_type = thinking_block.get("type", None)
+                if thinking_type and thinking_type == "redacted_thinking":
+                    self.thinking_type = "redacted_thinking"
+                    self.thinking_data = thinking_block.get("data", None)
+                else:
+                    self.thinking_type = "thinking"
+                    thinking_text = thinking_block.get("thinking", None)
+                    if thinking_text:
+                        if self.combined_thinking_text is None:
+                            self.combined_thinking_text = ""
+                        self.combined_thinking_text += thinking_text
+                    self.thinking_signature = thinking_block.get("signature", None)
+
+    def _add_audio(self, choices: List[Any]) -> None:
+        for choice in choices:
+            delta = choice.get("delta") or {}
+            audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
+            if audio is None:
+                continue
+            for k, v in audio.items():
+                if k == "data" and v is not None and isinstance(v, str):
+                    self.audio_base64_data_list.append(v)
+                elif k == "transcript" and v is not None and isinstance(v, str):
+                    self.audio_transcript_list.append(v)
+                elif k == "expires_at" and v is not None and isinstance(v, int):
+                    self.audio_expires_at = v
+                elif k == "id" and v is not None and isinstance(v, str):
+                    self.audio_id = v
+
+    def calculate_total_usage(self) -> Usage:
+        """
+        Usage reported by the most recent chunks - equivalent to `streaming_handler.calculate_total_usage`.
+        """
+        return Usage(
+            prompt_tokens=self.total_prompt_tokens,
+            completion_tokens=self.total_completion_tokens,
+            total_tokens=self.total_prompt_tokens + self.total_completion_tokens,
+        )
+
+    def _get_tool_calls(self) -> List[ChatCompletionMessageToolCall]:
+        tool_calls_list: List[ChatCompletionMessageToolCall] = []
+        for index in sorted(self.tool_call_map.keys()):
+            tool_call_data = self.tool_call_map[index]
+            if tool_call_data["id"] and tool_call_data["name"]:
+                tool_calls_list.append(
+                    ChatCompletionMessageToolCall(
+                        id=tool_call_data["id"],
+                        function=Function(
+                            arguments="".join(tool_call_data["arguments"]) or "{}",
+                            name=tool_call_data["name"],
+                        ),
+                        type=tool_call_data["type"] or "function",
+                    )
+                )
+        return tool_calls_list
+
+    def _get_thinking_blocks(
+        self,
+    ) -> Optional[
+        List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ]
+    ]:
+        from litellm.types.llms.openai import (
+            ChatCompletionRedactedThinkingBlock,
+            ChatCompletionThinkingBlock,
+        )
+
+        if (
+            self.combined_thinking_text
+            and self.thinking_type == "thinking"
+            and self.thinking_signature
+        ):
+            return [
+                ChatCompletionThinkingBlock(
+                    type="thinking",
+                    thinking=self.combined_thinking_text,
+                    signature=self.thinking_signature,
+                )
+            ]
+        elif self.thinking_data and self.thinking_type == "redacted_thinking":
+            return [
+                ChatCompletionRedactedThinkingBlock(
+                    type="redacted_thinking",
+                    data=self.thinking_data,
+                )
+            ]
+        return None
+
+    def _get_audio(self) -> ChatCompletionAudioResponse:
+        return ChatCompletionAudioResponse(
+            data=concatenate_base64_list(self.audio_base64_data_list),
+            expires_at=self.audio_expires_at or int(time.time() + 3600),
+            transcript="".join(self.audio_transcript_list),
+            id=self.audio_id,
+        )
+
+    def build_complete_streaming_response(
+        self, messages: Optional[list] = None
+    ) -> Optional[Union[ModelResponse, "TextCompletionResponse"]]:
+        """
+        Build the complete response from the accumulated state.
+
+        Returns None if no chunks were added.
+        """
+        from litellm.litellm_core_utils.prompt_templates.common_utils import (
+            get_content_from_model_response,
+        )
+
+        if self.first_chunk is None or self._chunk_processor is None:
+            return None
+
+        if self.text_completion_chunks is not None:
+            from litellm.main import stream_chunk_builder_text_completion
+
+            return stream_chunk_builder_text_completion(
+                chunks=self.text_completion_chunks, messages=messages
+            )
+
+        first_chunk = self.first_chunk
+        model = first_chunk["model"]
+        response = ModelResponse(
+            **{
+                "id": self.chunk_id,
+                "object": first_chunk["object"],
+                "created": first_chunk["created"],
+                "model": model,
+                "system_fingerprint": first_chunk.get("system_fingerprint", None),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": first_chunk["choices"][0]["delta"]["role"],
+                            "content": "",
+                        },
+                        "finish_reason": self.finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        )
+        response._hidden_params = self.last_hidden_params
+
+        _choice = cast(Choices, response.choices[0])
+        if self.has_tool_calls:
+            _choice.message.content = None
+            _choice.message.tool_calls = self._get_tool_calls()
+        if self.has_function_call:
+            _choice.message.content = None
+            _choice.message.function_call = FunctionCall(
+                name=self.function_call_name,
+                arguments="".join(self.function_call_arguments),
+            )
+        if self.has_content:
+            response["choices"][0]["message"]["content"] = "".join(self.content_list)
+        if self.has_thinking_blocks:
+            response["choices"][0]["message"][
+                "thinking_blocks"
+            ] = self._get_thinking_blocks()
+        if self.has_reasoning_content:
+            response["choices"][0]["message"]["reasoning_content"] = "".join(
+                self.reasoning_content_list
+            )
+        if self.has_audio:
+            _choice.message.audio = self._get_audio()
+
+        completion_output = get_content_from_model_response(response)
+        reasoning_tokens = self._chunk_processor.count_reasoning_tokens(response)
+        usage = self._chunk_processor.calculate_usage_from_usage_per_chunk(
+            calculated_usage_per_chunk=self.usage_per_chunk,
+            model=model,
+            completion_output=completion_output,
+            messages=messages,
+            reasoning_tokens=reasoning_tokens,
+        )
+        setattr(response, "usage", usage)
+        return response
+
+
 def concatenate_base64_list(base64_strings: List[str]) -> str:
     """
     Concatenates a list of base64-encoded strings.
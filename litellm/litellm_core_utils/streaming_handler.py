@@ -1,8 +1,8 @@
 import asyncio
 import collections.abc
 import datetime
+import inspect
 import json
-import threading
 import time
 import traceback
 import uuid
@@ -13,8 +13,9 @@ from pydantic import BaseModel
 
 import litellm
 from litellm import verbose_logger
+from litellm.caching.cached_stream_replay import CachedStreamReplay
 from litellm.litellm_core_utils.redact_messages import LiteLLMLoggingObject
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.logging_worker import logging_dispatcher
 from litellm.types.llms.openai import ChatCompletionChunk
 from litellm.types.router import GenericLiteLLMParams
 from litellm.types.utils import Delta
@@ -23,6 +24,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     StreamingChoices,
+    TextCompletionResponse,
     Usage,
 )
 
@@ -54,6 +56,25 @@ def print_verbose(print_statement):
         pass
 
 
+async def _aclose_upstream_stream(stream: Any) -> None:
+    """
+    Close a provider stream / iterator / http response, if it can be closed.
+    """
+    if stream is None or isinstance(stream, (str, bytes)):
+        return
+    close_fn = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close_fn is None or not callable(close_fn):
+        return
+    try:
+        result = close_fn()
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        verbose_logger.debug(
+            "CustomStreamWrapper: error closing upstream stream - {}".format(str(e))
+        )
+
+
 class CustomStreamWrapper:
     def __init__(
         self,
@@ -64,14 +85,18 @@ class CustomStreamWrapper:
         stream_options=None,
         make_call: Optional[Callable] = None,
         _response_headers: Optional[dict] = None,
+        upstream_response: Optional[Any] = None,
     ):
         self.model = model
         self.make_call = make_call
         self.custom_llm_provider = custom_llm_provider
         self.logging_obj: LiteLLMLoggingObject = logging_obj
         self.completion_stream = completion_stream
+        self.upstream_response = upstream_response  # e.g. the httpx response, closed by `aclose()`
         self.sent_first_chunk = False
         self.sent_last_chunk = False
+        self.closed = False
+        self.stream_end_logged = False
 
         litellm_params: GenericLiteLLMParams = GenericLiteLLMParams(
             **self.logging_obj.model_call_details.get("litellm_params", {})
@@ -131,11 +156,46 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
-            []
-        )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        from .streaming_chunk_builder_utils import StreamingChunkAccumulator
+
+        self.chunk_accumulator = StreamingChunkAccumulator(
+            recent_chunks_limit=litellm.REPEATED_STREAMING_CHUNK_LIMIT
+        )  # folds the returned chunks into the complete response - used for calculating the input/output tokens for stream options
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
+        self._last_chunk_created_at: float = 0.0
+
+    @property
+    def chunks(self) -> List:
+        """
+        Most recent chunks returned by the stream (bounded by `REPEATED_STREAMING_CHUNK_LIMIT`).
+
+        Use `get_complete_streaming_response()` for the complete response.
+        """
+        return list(self.chunk_accumulator.recent_chunks)
+
+    def get_complete_streaming_response(
+        self,
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        Returns the complete response built from the chunks streamed so far.
+        """
+        try:
+            return self.chunk_accumulator.build_complete_streaming_response(
+                messages=self.messages
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "CustomStreamWrapper.get_complete_streaming_response() - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+            raise litellm.APIError(
+                status_code=500,
+                message="Error building chunks for logging/streaming usage calculation",
+                llm_provider="",
+                model="",
+            )
 
     def __iter__(self):
         return self
@@ -187,9 +247,12 @@ class CustomStreamWrapper:
 
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
-        if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
+        recent_chunks = self.chunk_accumulator.recent_chunks
+        if len(recent_chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
             # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
+            last_chunks = list(recent_chunks)[
+                -litellm.REPEATED_STREAMING_CHUNK_LIMIT :
+            ]
 
             # Extract the relevant content from the chunks
             last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
@@ -638,7 +701,11 @@ class CustomStreamWrapper:
         if hidden_params is not None:
             model_response._hidden_params = hidden_params
         model_response._hidden_params["custom_llm_provider"] = _logging_obj_llm_provider
-        model_response._hidden_params["created_at"] = time.time()
+        # never earlier than the previous chunk, even if the wall clock steps back - `stream_chunk_builder` orders
+        # chunks by `created_at`, `chunk_accumulator` folds them in the order they are streamed
+        created_at = max(time.time(), self._last_chunk_created_at)
+        self._last_chunk_created_at = created_at
+        model_response._hidden_params["created_at"] = created_at
         model_response._hidden_params = {
             **model_response._hidden_params,
             **self._hidden_params,
@@ -859,7 +926,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self.chunk_accumulator.add_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -901,7 +968,7 @@ class CustomStreamWrapper:
             return model_response
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self.chunk_accumulator.add_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -1451,7 +1518,8 @@ class CustomStreamWrapper:
         """
         if not cache_hit and self.logging_obj._llm_caching_handler is not None:
             self.logging_obj._llm_caching_handler._sync_add_streaming_response_to_cache(
-                processed_chunk
+                processed_chunk,
+                stream_chunk_boundaries=self.chunk_accumulator.get_stream_chunk_boundaries(),
             )
 
     async def async_cache_streaming_response(self, processed_chunk, cache_hit: bool):
@@ -1460,7 +1528,8 @@ class CustomStreamWrapper:
         """
         if not cache_hit and self.logging_obj._llm_caching_handler is not None:
             await self.logging_obj._llm_caching_handler._add_streaming_response_to_cache(
-                processed_chunk
+                processed_chunk,
+                stream_chunk_boundaries=self.chunk_accumulator.get_stream_chunk_boundaries(),
             )
 
     def run_success_logging_and_cache_storage(self, processed_chunk, cache_hit: bool):
@@ -1494,6 +1563,122 @@ class CustomStreamWrapper:
         ## SYNC LOGGING
         self.logging_obj.success_handler(processed_chunk, None, None, cache_hit)
 
+    def _handle_cached_stream_replay_chunk(
+        self, chunk: ModelResponseStream
+    ) -> ModelResponseStream:
+        """
+        Cache hit fast path - replayed chunks are already in the OpenAI format, so `chunk_creator` is skipped.
+
+        The final replayed chunk carries the finish reason, and the cached usage (removed before returning it).
+        """
+        if self.logging_obj.completion_start_time is None:
+            self.logging_obj._update_completion_start_time(
+                completion_start_time=datetime.datetime.now()
+            )
+        self.sent_first_chunk = True
+        chunk._hidden_params = {
+            **chunk._hidden_params,
+            **self._hidden_params,
+            "custom_llm_provider": self.custom_llm_provider,
+            "cache_hit": True,
+            "response_cost": None,
+        }
+        choice = chunk.choices[0]
+        self.response_uptil_now += choice.delta.get("content", "") or ""
+        self.rules.post_call_rules(input=self.response_uptil_now, model=self.model)
+        self.chunk_accumulator.add_chunk(chunk)
+        if choice.finish_reason is not None:
+            self.received_finish_reason = choice.finish_reason
+            self.sent_last_chunk = True
+        if getattr(chunk, "usage", None) is not None:
+            del chunk.usage  # only sent on the final usage chunk
+            if self.stream_options is None:
+                chunk._hidden_params[
+                    "usage"
+                ] = self.chunk_accumulator.calculate_total_usage()
+        return chunk
+
+    async def aclose(self) -> None:
+        """
+        Stop streaming early - e.g. the client disconnected mid-stream.
+
+        Closes the upstream provider stream (releasing its connection) instead of reading it to the end,
+        and logs the partial response streamed so far. Logging the end of the request right away also
+        updates spend and releases rate limit slots (e.g. `parallel_request_limiter_v3` max parallel requests).
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        for upstream in (
+            self.completion_stream,
+            getattr(self.completion_stream, "streaming_response", None),
+            self.upstream_response,
+        ):
+            await _aclose_upstream_stream(upstream)
+
+        if self.stream_end_logged is True:
+            return
+        self.stream_end_logged = True
+        self.logging_obj.model_call_details["stream_client_disconnected"] = True
+        cache_hit = self.custom_llm_provider == "cached_response"
+
+        try:
+            if len(self.chunk_accumulator) == 0:
+                exception = Exception(
+                    "Client disconnected before the first chunk was streamed"
+                )
+                logging_dispatcher.submit(
+                    self.logging_obj.failure_handler, exception, ""
+                )
+                logging_dispatcher.submit_coroutine(
+                    self.logging_obj.async_failure_handler(exception, "")
+                )
+                return
+
+            partial_streaming_response = self.get_complete_streaming_response()
+            logging_dispatcher.submit_coroutine(
+                self.logging_obj.async_success_handler(
+                    partial_streaming_response,
+                    cache_hit=cache_hit,
+                    start_time=None,
+                    end_time=None,
+                )
+            )
+            logging_dispatcher.submit(
+                self.logging_obj.success_handler,
+                partial_streaming_response,
+                cache_hit=cache_hit,
+                start_time=None,
+                end_time=None,
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "CustomStreamWrapper: error logging partial streaming response - {}".format(
+                    str(e)
+                )
+            )
+
+    async def aiter_cached_sse_frames(self):
+        """
+        Yields the pre-serialized SSE frames of a cached stream replay, ending with `data: [DONE]`.
+
+        Runs the same logging as iterating the wrapper - used by the proxy to skip per-chunk serialization on cache hits.
+        """
+        if not isinstance(self.completion_stream, CachedStreamReplay):
+            raise ValueError("aiter_cached_sse_frames() requires a cached stream replay")
+        sse_frames = self.completion_stream.sse_frames
+        index = 0
+        async for chunk in self:
+            if index < len(sse_frames):
+                yield sse_frames[index]
+            else:  # e.g. the usage chunk for `stream_options={"include_usage": True}`
+                yield "data: {}\n\n".format(
+                    chunk.model_dump_json(exclude_none=True, exclude_unset=True)
+                )
+            index += 1
+        yield "data: [DONE]\n\n"
+
     def finish_reason_handler(self):
         model_response = self.model_response_creator()
         _finish_reason = self.received_finish_reason or self.intermittent_finish_reason
@@ -1520,6 +1705,11 @@ class CustomStreamWrapper:
             if self.completion_stream is None:
                 self.fetch_sync_stream()
 
+            if isinstance(self.completion_stream, CachedStreamReplay):
+                return self._handle_cached_stream_replay_chunk(
+                    next(self.completion_stream)
+                )
+
             while True:
                 if (
                     isinstance(self.completion_stream, str)
@@ -1545,7 +1735,7 @@ class CustomStreamWrapper:
                             completion_start_time=datetime.datetime.now()
                         )
                     ## LOGGING
-                    executor.submit(
+                    logging_dispatcher.submit(
                         self.run_success_logging_and_cache_storage,
                         response,
                         cache_hit,
@@ -1559,7 +1749,7 @@ class CustomStreamWrapper:
                         input=self.response_uptil_now, model=self.model
                     )
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self.chunk_accumulator.add_chunk(response)
                     if hasattr(
                         response, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1576,16 +1766,15 @@ class CustomStreamWrapper:
                         )
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self.chunk_accumulator.calculate_total_usage()
                         response._hidden_params["usage"] = usage
                     # RETURN RESULT
                     return response
 
         except StopIteration:
             if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks, messages=self.messages
-                )
+                self.stream_end_logged = True
+                complete_streaming_response = self.get_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1600,7 +1789,7 @@ class CustomStreamWrapper:
                         ),
                         cache_hit=cache_hit,
                     )
-                    executor.submit(
+                    logging_dispatcher.submit(
                         self.logging_obj.success_handler,
                         complete_streaming_response.model_copy(deep=True),
                         None,
@@ -1608,7 +1797,7 @@ class CustomStreamWrapper:
                         cache_hit,
                     )
                 else:
-                    executor.submit(
+                    logging_dispatcher.submit(
                         self.logging_obj.success_handler,
                         response,
                         None,
@@ -1623,10 +1812,10 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self.chunk_accumulator.calculate_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
-                executor.submit(
+                logging_dispatcher.submit(
                     self.run_success_logging_and_cache_storage,
                     processed_chunk,
                     cache_hit,
@@ -1635,9 +1824,9 @@ class CustomStreamWrapper:
         except Exception as e:
             traceback_exception = traceback.format_exc()
             # LOG FAILURE - handle streaming failure logging in the _next_ object, remove `handle_failure` once it's deprecated
-            threading.Thread(
-                target=self.logging_obj.failure_handler, args=(e, traceback_exception)
-            ).start()
+            logging_dispatcher.submit(
+                self.logging_obj.failure_handler, e, traceback_exception
+            )
             if isinstance(e, OpenAIError):
                 raise e
             else:
@@ -1666,6 +1855,8 @@ class CustomStreamWrapper:
         return self.completion_stream
 
     async def __anext__(self):  # noqa: PLR0915
+        if self.closed is True:
+            raise StopAsyncIteration
         cache_hit = False
         if (
             self.custom_llm_provider is not None
@@ -1676,6 +1867,11 @@ class CustomStreamWrapper:
             if self.completion_stream is None:
                 await self.fetch_stream()
 
+            if isinstance(self.completion_stream, CachedStreamReplay):
+                return self._handle_cached_stream_replay_chunk(
+                    await self.completion_stream.__anext__()
+                )
+
             if is_async_iterable(self.completion_stream):
                 async for chunk in self.completion_stream:
                     if chunk == "None" or chunk is None:
@@ -1715,7 +1911,7 @@ class CustomStreamWrapper:
                     self.rules.post_call_rules(
                         input=self.response_uptil_now, model=self.model
                     )
-                    self.chunks.append(processed_chunk)
+                    self.chunk_accumulator.add_chunk(processed_chunk)
                     if hasattr(
                         processed_chunk, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1762,14 +1958,12 @@ class CustomStreamWrapper:
                             input=self.response_uptil_now, model=self.model
                         )
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self.chunk_accumulator.add_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks, messages=self.messages
-                )
+                complete_streaming_response = self.get_complete_streaming_response()
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
                     setattr(
@@ -1777,7 +1971,7 @@ class CustomStreamWrapper:
                         "usage",
                         getattr(complete_streaming_response, "usage"),
                     )
-                    asyncio.create_task(
+                    logging_dispatcher.submit_coroutine(
                         self.async_cache_streaming_response(
                             processed_chunk=complete_streaming_response.model_copy(
                                 deep=True
@@ -1789,7 +1983,8 @@ class CustomStreamWrapper:
                     self.sent_stream_usage = True
                     return response
 
-                asyncio.create_task(
+                self.stream_end_logged = True
+                logging_dispatcher.submit_coroutine(
                     self.logging_obj.async_success_handler(
                         complete_streaming_response,
                         cache_hit=cache_hit,
@@ -1798,7 +1993,7 @@ class CustomStreamWrapper:
                     )
                 )
 
-                executor.submit(
+                logging_dispatcher.submit(
                     self.logging_obj.success_handler,
                     complete_streaming_response,
                     cache_hit=cache_hit,
@@ -1819,12 +2014,11 @@ class CustomStreamWrapper:
             )
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                logging_dispatcher.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
-                asyncio.create_task(
+                logging_dispatcher.submit_coroutine(
                     self.logging_obj.async_failure_handler(e, traceback_exception)
                 )
             raise e
@@ -1832,12 +2026,11 @@ class CustomStreamWrapper:
             traceback_exception = traceback.format_exc()
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                logging_dispatcher.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
-                asyncio.create_task(
+                logging_dispatcher.submit_coroutine(
                     self.logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
                 )
             ## Map to OpenAI Exception
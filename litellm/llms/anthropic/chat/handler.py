@@ -30,6 +30,10 @@ from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
 )
+from litellm.llms.custom_httpx.sse_decoder import (
+    aiter_sse_json_chunks,
+    iter_sse_json_chunks,
+)
 from litellm.types.llms.anthropic import (
     ContentBlockDelta,
     ContentBlockStart,
@@ -97,7 +101,7 @@ async def make_call(
         raise AnthropicError(status_code=500, message=str(e))
 
     completion_stream = ModelResponseIterator(
-        streaming_response=response.aiter_lines(),
+        streaming_response=aiter_sse_json_chunks(response.aiter_bytes()),
         sync_stream=False,
         json_mode=json_mode,
     )
@@ -156,7 +160,9 @@ def make_sync_call(
         )
 
     completion_stream = ModelResponseIterator(
-        streaming_response=response.iter_lines(), sync_stream=True, json_mode=json_mode
+        streaming_response=iter_sse_json_chunks(response.iter_bytes()),
+        sync_stream=True,
+        json_mode=json_mode,
     )
 
     # LOGGING
@@ -854,6 +860,8 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
+            if isinstance(chunk, dict):  # already parsed by the shared SSE decoder
+                return self.chunk_parser(chunk=chunk)
             str_line = chunk
             if isinstance(chunk, bytes):  # Handle binary data
                 str_line = chunk.decode("utf-8")  # Convert bytes to string
@@ -892,6 +900,8 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
+            if isinstance(chunk, dict):  # already parsed by the shared SSE decoder
+                return self.chunk_parser(chunk=chunk)
             str_line = chunk
             if isinstance(chunk, bytes):  # Handle binary data
                 str_line = chunk.decode("utf-8")  # Convert bytes to string
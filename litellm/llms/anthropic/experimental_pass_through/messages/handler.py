@@ -11,12 +11,12 @@ from functools import partial
 from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, Union
 
 import litellm
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.llms.base_llm.anthropic_messages.transformation import (
     BaseAnthropicMessagesConfig,
 )
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from litellm.types.llms.anthropic_messages.anthropic_request import AnthropicMetadata
 from litellm.types.llms.anthropic_messages.anthropic_response import (
     AnthropicMessagesResponse,
@@ -29,7 +29,9 @@ from .utils import AnthropicMessagesRequestUtils, mock_response
 
 ####### ENVIRONMENT VARIABLES ###################
 # Initialize any necessary instances or variables here
-base_llm_http_handler = BaseLLMHTTPHandler()
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 #################################################
 
 
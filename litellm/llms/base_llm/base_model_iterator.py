@@ -89,6 +89,8 @@ class BaseModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
+            if isinstance(chunk, dict):  # already parsed by the shared SSE decoder
+                return self.chunk_parser(chunk=chunk)
             str_line = chunk
             if isinstance(chunk, bytes):  # Handle binary data
                 str_line = chunk.decode("utf-8")  # Convert bytes to string
@@ -117,6 +119,8 @@ class BaseModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
+            if isinstance(chunk, dict):  # already parsed by the shared SSE decoder
+                return self.chunk_parser(chunk=chunk)
             str_line = chunk
             if isinstance(chunk, bytes):  # Handle binary data
                 str_line = chunk.decode("utf-8")  # Convert bytes to string
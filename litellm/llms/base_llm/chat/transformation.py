@@ -428,6 +428,16 @@ class BaseConfig(ABC):
     def has_custom_stream_wrapper(self) -> bool:
         return False
 
+    @property
+    def streams_server_sent_events(self) -> bool:
+        """
+        Returns True if the provider streams `text/event-stream` responses with JSON `data:` payloads.
+
+        If True, `BaseLLMHTTPHandler` decodes the raw response bytes with the shared SSE decoder (`llms/custom_httpx/sse_decoder.py`),
+        and `get_model_response_iterator` receives parsed dicts (or the raw string for non-JSON payloads, e.g. `[DONE]`) instead of lines.
+        """
+        return False
+
     @property
     def supports_stream_param_in_request_body(self) -> bool:
         """
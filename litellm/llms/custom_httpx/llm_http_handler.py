@@ -48,6 +48,10 @@ from litellm.llms.custom_httpx.http_handler import (
     _get_httpx_client,
     get_async_httpx_client,
 )
+from litellm.llms.custom_httpx.sse_decoder import (
+    aiter_sse_json_chunks,
+    iter_sse_json_chunks,
+)
 from litellm.responses.streaming_iterator import (
     BaseResponsesAPIStreamingIterator,
     MockResponsesAPIStreamingIterator,
@@ -554,7 +558,11 @@ class BaseLLMHTTPHandler:
             )
         else:
             completion_stream = provider_config.get_model_response_iterator(
-                streaming_response=response.iter_lines(),
+                streaming_response=(
+                    iter_sse_json_chunks(response.iter_bytes())
+                    if provider_config.streams_server_sent_events
+                    else response.iter_lines()
+                ),
                 sync_stream=True,
                 json_mode=json_mode,
             )
@@ -601,7 +609,7 @@ class BaseLLMHTTPHandler:
                 signed_json_body=signed_json_body,
             )
 
-        completion_stream, _response_headers = await self.make_async_call_stream_helper(
+        completion_stream, response = await self.make_async_call_stream_helper(
             model=model,
             custom_llm_provider=custom_llm_provider,
             provider_config=provider_config,
@@ -623,6 +631,7 @@ class BaseLLMHTTPHandler:
             model=model,
             custom_llm_provider=custom_llm_provider,
             logging_obj=logging_obj,
+            upstream_response=response,
         )
         return streamwrapper
 
@@ -643,11 +652,13 @@ class BaseLLMHTTPHandler:
         client: Optional[AsyncHTTPHandler] = None,
         json_mode: Optional[bool] = None,
         signed_json_body: Optional[bytes] = None,
-    ) -> Tuple[Any, httpx.Headers]:
+    ) -> Tuple[Any, httpx.Response]:
         """
         Helper function for making an async call with stream.
 
         Handles fake stream as well.
+
+        Returns the completion stream and the (still open) httpx response.
         """
         if client is None:
             async_httpx_client = get_async_httpx_client(
@@ -692,7 +703,12 @@ class BaseLLMHTTPHandler:
             )
         else:
             completion_stream = provider_config.get_model_response_iterator(
-                streaming_response=response.aiter_lines(), sync_stream=False
+                streaming_response=(
+                    aiter_sse_json_chunks(response.aiter_bytes())
+                    if provider_config.streams_server_sent_events
+                    else response.aiter_lines()
+                ),
+                sync_stream=False,
             )
         # LOGGING
         logging_obj.post_call(
@@ -702,7 +718,7 @@ class BaseLLMHTTPHandler:
             additional_args={"complete_input_dict": data},
         )
 
-        return completion_stream, response.headers
+        return completion_stream, response
 
     def _add_stream_param_to_request_body(
         self,
@@ -0,0 +1,285 @@
+"""
+Incremental, byte-level Server-Sent Events (SSE) decoder shared by the provider streaming iterators.
+
+Operates on the raw byte buffers from `response.iter_bytes()` / `response.aiter_bytes()` instead of
+`iter_lines()`, handles multi-line `event:` / `data:` frames, and parses `data:` payloads as JSON
+(with `orjson` when installed).
+
+Usage:
+```python
+completion_stream = provider_config.get_model_response_iterator(
+    streaming_response=aiter_sse_json_chunks(response.aiter_bytes()),
+    sync_stream=False,
+)
+```
+
+Iterators receiving these chunks get a `dict` for JSON payloads, and the raw `str` payload otherwise (e.g. `[DONE]`).
+"""
+
+import inspect
+import json
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+try:
+    import orjson
+
+    _json_loads: Any = orjson.loads
+    _JSON_DECODE_ERRORS: tuple = (orjson.JSONDecodeError, ValueError)
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, ValueError)
+
+
+class ServerSentEvent:
+    __slots__ = ("event", "data", "id", "retry")
+
+    def __init__(
+        self,
+        data: str = "",
+        event: Optional[str] = None,
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ):
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def json(self) -> Any:
+        return _json_loads(self.data)
+
+    def __repr__(self) -> str:
+        return "ServerSentEvent(event={!r}, data={!r}, id={!r}, retry={!r})".format(
+            self.event, self.data, self.id, self.retry
+        )
+
+
+class SSEDecoder:
+    """
+    Incremental SSE decoder - feed it arbitrary byte buffers, get back complete events.
+
+    Follows the WHATWG event-stream parsing rules:
+    - lines end with `\\r\\n`, `\\n` or `\\r`; a blank line dispatches the event
+    - `data:` lines of one event are joined with `\\n`
+    - a single space after the `:` is stripped; lines starting with `:` are comments
+
+    For compatibility with providers streaming newline-delimited JSON, a line starting with `{`
+    (no field name) is treated as a complete `data` event.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._seen_carriage_return = False
+        self._data_lines: List[str] = []
+        self._event: Optional[str] = None
+        self._id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def decode(self, chunk: bytes) -> List[ServerSentEvent]:
+        """
+        Add `chunk` to the buffer and return all events completed by it.
+
+        Only the new bytes are searched for line endings and only completed lines are copied out of
+        the buffer - a long event split across many chunks is decoded in linear time.
+        """
+        events: List[ServerSentEvent] = []
+        buffer = self._buffer
+        # the buffer has no line ending left, except a trailing `\r` that might be followed by `\n`
+        search_start = len(buffer)
+        if search_start and buffer[-1] == 0x0D:  # \r
+            search_start -= 1
+        buffer.extend(chunk)
+        if not self._seen_carriage_return and b"\r" in chunk:
+            self._seen_carriage_return = True
+
+        if not self._seen_carriage_return:
+            # fast path - `\n` line endings only, split all completed lines at once
+            last_newline_index = buffer.rfind(b"\n", search_start)
+            if last_newline_index == -1:
+                return events
+            lines = buffer[:last_newline_index].split(b"\n")
+            del buffer[: last_newline_index + 1]
+            for line in lines:
+                event = self._process_line(line)
+                if event is not None:
+                    events.append(event)
+            return events
+
+        start = 0
+        buffer_length = len(buffer)
+        while True:
+            newline_index = _find_line_end(buffer, search_start)
+            if newline_index == -1:
+                break
+            line_end = newline_index
+            if buffer[newline_index] == 0x0D:  # \r
+                if newline_index + 1 == buffer_length:
+                    # wait for the next chunk - this might be a `\r\n` split across buffers
+                    break
+                if buffer[newline_index + 1] == 0x0A:  # \n
+                    newline_index += 1
+            event = self._process_line(bytes(buffer[start:line_end]))
+            if event is not None:
+                events.append(event)
+            start = search_start = newline_index + 1
+
+        if start:
+            del buffer[:start]
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        """
+        Return any event left in the buffer at the end of the stream.
+        """
+        events: List[ServerSentEvent] = []
+        if self._buffer:
+            remaining = bytes(self._buffer).rstrip(b"\r\n")
+            self._buffer = bytearray()
+            for line in remaining.splitlines():
+                event = self._process_line(line)
+                if event is not None:
+                    events.append(event)
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, raw_line: bytes) -> Optional[ServerSentEvent]:
+        if not raw_line:
+            return self._dispatch()
+
+        line = raw_line.decode("utf-8")
+        if line.startswith(":"):
+            return None
+
+        if line.startswith("{") and not self._data_lines and self._event is None:
+            # newline-delimited JSON - not SSE, but emitted by some openai-compatible providers
+            self._data_lines.append(line)
+            return self._dispatch()
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data_lines.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id":
+            if "\0" not in value:
+                self._id = value
+        elif field == "retry":
+            try:
+                self._retry = int(value)
+            except ValueError:
+                pass
+        return None
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        if not self._data_lines and self._event is None:
+            return None
+        event = ServerSentEvent(
+            data="\n".join(self._data_lines),
+            event=self._event,
+            id=self._id,
+            retry=self._retry,
+        )
+        self._data_lines = []
+        self._event = None
+        self._retry = None
+        return event
+
+
+def _find_line_end(buffer: bytearray, start: int) -> int:
+    newline_index = buffer.find(b"\n", start)
+    if newline_index == -1:
+        return buffer.find(b"\r", start)
+    # only search for `\r` up to the `\n` - keeps the scan linear in the buffer size
+    carriage_return_index = buffer.find(b"\r", start, newline_index)
+    if carriage_return_index == -1:
+        return newline_index
+    return carriage_return_index
+
+
+def parse_sse_event_data(event: ServerSentEvent) -> Optional[Union[dict, str]]:
+    """
+    Returns the JSON-decoded `data` of an event, or the raw string if it is not JSON (e.g. `[DONE]`).
+
+    Returns None for events without data.
+    """
+    data = event.data
+    if not data:
+        return None
+    if data[0] == "{":
+        try:
+            return _json_loads(data)
+        except _JSON_DECODE_ERRORS:
+            pass
+    return data
+
+
+def iter_sse_events(byte_iterator: Iterable[bytes]) -> Iterator[ServerSentEvent]:
+    decoder = SSEDecoder()
+    for chunk in byte_iterator:
+        yield from decoder.decode(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_sse_events(
+    byte_iterator: AsyncIterable[bytes],
+) -> AsyncIterator[ServerSentEvent]:
+    decoder = SSEDecoder()
+    try:
+        async for chunk in byte_iterator:
+            for event in decoder.decode(chunk):
+                yield event
+        for event in decoder.flush():
+            yield event
+    finally:
+        # if the consumer stops early (e.g. client disconnected), close the upstream byte stream too
+        await _aclose_iterator(byte_iterator)
+
+
+def iter_sse_json_chunks(
+    byte_iterator: Iterable[bytes],
+) -> Iterator[Union[dict, str]]:
+    """
+    Yields the parsed `data` payload of each SSE event - see `parse_sse_event_data`.
+    """
+    for event in iter_sse_events(byte_iterator):
+        parsed_data = parse_sse_event_data(event)
+        if parsed_data is not None:
+            yield parsed_data
+
+
+async def aiter_sse_json_chunks(
+    byte_iterator: AsyncIterable[bytes],
+) -> AsyncIterator[Union[dict, str]]:
+    """
+    Yields the parsed `data` payload of each SSE event - see `parse_sse_event_data`.
+    """
+    events = aiter_sse_events(byte_iterator)
+    try:
+        async for event in events:
+            parsed_data = parse_sse_event_data(event)
+            if parsed_data is not None:
+                yield parsed_data
+    finally:
+        await _aclose_iterator(events)
+
+
+async def _aclose_iterator(iterator: Any) -> None:
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        result = aclose()
+        if inspect.isawaitable(result):
+            await result
@@ -88,6 +88,8 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
+            if isinstance(chunk, dict):  # already parsed by the shared SSE decoder
+                return self.chunk_parser(chunk=chunk)
             chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(chunk) or ""
             chunk = chunk.strip()
             if len(chunk) > 0:
@@ -133,6 +135,8 @@ class ModelResponseIterator:
             raise RuntimeError(f"Error receiving chunk from stream: {e}")
 
         try:
+            if isinstance(chunk, dict):  # already parsed by the shared SSE decoder
+                return self.chunk_parser(chunk=chunk)
             chunk = litellm.CustomStreamWrapper._strip_sse_data_from_chunk(chunk) or ""
             chunk = chunk.strip()
             if chunk == "[DONE]":
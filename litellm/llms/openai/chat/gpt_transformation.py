@@ -745,6 +745,10 @@ class OpenAIGPTConfig(BaseLLMModelInfo, BaseConfig):
     def get_base_model(model: Optional[str] = None) -> Optional[str]:
         return model
 
+    @property
+    def streams_server_sent_events(self) -> bool:
+        return True
+
     def get_model_response_iterator(
         self,
         streaming_response: Union[Iterator[str], AsyncIterator[str], ModelResponse],
@@ -13,6 +13,10 @@ import litellm
 from litellm import LlmProviders
 from litellm.llms.bedrock.chat.invoke_handler import MockResponseIterator
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+from litellm.llms.custom_httpx.sse_decoder import (
+    aiter_sse_json_chunks,
+    iter_sse_json_chunks,
+)
 from litellm.llms.databricks.streaming_utils import ModelResponseIterator
 from litellm.llms.openai.chat.gpt_transformation import OpenAIGPTConfig
 from litellm.llms.openai.openai import OpenAIConfig
@@ -50,7 +54,8 @@ async def make_call(
         completion_stream = MockResponseIterator(model_response=model_response)
     else:
         completion_stream = ModelResponseIterator(
-            streaming_response=response.aiter_lines(), sync_stream=False
+            streaming_response=aiter_sse_json_chunks(response.aiter_bytes()),
+            sync_stream=False,
         )
     # LOGGING
     logging_obj.post_call(
@@ -94,7 +99,8 @@ def make_sync_call(
         completion_stream = MockResponseIterator(model_response=model_response)
     else:
         completion_stream = ModelResponseIterator(
-            streaming_response=response.iter_lines(), sync_stream=True
+            streaming_response=iter_sse_json_chunks(response.iter_bytes()),
+            sync_stream=True,
         )
 
     # LOGGING
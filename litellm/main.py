@@ -8,7 +8,6 @@
 #  Thank you ! We ❤️ you! - Krrish & Ishaan
 
 import asyncio
-import contextvars
 import datetime
 import inspect
 import json
@@ -59,6 +58,7 @@ from litellm.constants import (
 )
 from litellm.exceptions import LiteLLMUnknownProvider
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.async_request_setup import run_request_setup
 from litellm.litellm_core_utils.audio_utils.utils import get_audio_file_for_health_check
 from litellm.litellm_core_utils.dd_tracing import tracer
 from litellm.litellm_core_utils.health_check_utils import (
@@ -116,6 +116,11 @@ from .litellm_core_utils.fallback_utils import (
     async_completion_with_fallbacks,
     completion_with_fallbacks,
 )
+from .litellm_core_utils.lazy_loading import (
+    lazy_attribute,
+    lazy_instance,
+    lazy_module,
+)
 from .litellm_core_utils.prompt_templates.common_utils import (
     get_completion_messages,
     update_messages_with_model_file_ids,
@@ -129,60 +134,8 @@ from .litellm_core_utils.prompt_templates.factory import (
     stringify_json_tool_call_content,
 )
 from .litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
-from .llms import baseten
-from .llms.anthropic.chat import AnthropicChatCompletion
-from .llms.azure.audio_transcriptions import AzureAudioTranscription
-from .llms.azure.azure import AzureChatCompletion, _check_dynamic_azure_params
-from .llms.azure.chat.o_series_handler import AzureOpenAIO1ChatCompletion
-from .llms.azure.completion.handler import AzureTextCompletion
-from .llms.azure_ai.embed import AzureAIEmbedding
-from .llms.bedrock.chat import BedrockConverseLLM, BedrockLLM
-from .llms.bedrock.embed.embedding import BedrockEmbedding
-from .llms.bedrock.image.image_handler import BedrockImageGeneration
-from .llms.bytez.chat.transformation import BytezChatConfig
-from .llms.codestral.completion.handler import CodestralTextCompletion
-from .llms.cohere.embed import handler as cohere_embed
-from .llms.custom_httpx.aiohttp_handler import BaseLLMAIOHTTPHandler
-from .llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from .llms.custom_llm import CustomLLM, custom_chat_llm_router
-from .llms.databricks.embed.handler import DatabricksEmbeddingHandler
-from .llms.deprecated_providers import aleph_alpha, palm
 from .llms.gemini.common_utils import get_api_key_from_env
-from .llms.groq.chat.handler import GroqChatCompletion
-from .llms.huggingface.embedding.handler import HuggingFaceEmbedding
-from .llms.lodash.embedding.transformation import LodashEmbeddingConfig
-from .llms.nlp_cloud.chat.handler import completion as nlp_cloud_chat_completion
-from .llms.ollama.completion import handler as ollama
-from .llms.oobabooga.chat import oobabooga
-from .llms.openai.completion.handler import OpenAITextCompletion
-from .llms.openai.image_variations.handler import OpenAIImageVariationsHandler
-from .llms.openai.openai import OpenAIChatCompletion
-from .llms.openai.transcriptions.handler import OpenAIAudioTranscription
-from .llms.openai_like.chat.handler import OpenAILikeChatHandler
-from .llms.openai_like.embedding.handler import OpenAILikeEmbeddingHandler
-from .llms.petals.completion import handler as petals_handler
-from .llms.predibase.chat.handler import PredibaseChatCompletion
-from .llms.replicate.chat.handler import completion as replicate_chat_completion
-from .llms.sagemaker.chat.handler import SagemakerChatHandler
-from .llms.sagemaker.completion.handler import SagemakerLLM
-from .llms.vertex_ai import vertex_ai_non_gemini
-from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import VertexLLM
-from .llms.vertex_ai.gemini_embeddings.batch_embed_content_handler import (
-    GoogleBatchEmbeddings,
-)
-from .llms.vertex_ai.image_generation.image_generation_handler import (
-    VertexImageGeneration,
-)
-from .llms.vertex_ai.multimodal_embeddings.embedding_handler import (
-    VertexMultimodalEmbedding,
-)
-from .llms.vertex_ai.text_to_speech.text_to_speech_handler import VertexTextToSpeechAPI
-from .llms.vertex_ai.vertex_ai_partner_models.main import VertexAIPartnerModels
-from .llms.vertex_ai.vertex_embeddings.embedding_handler import VertexEmbedding
-from .llms.vertex_ai.vertex_model_garden.main import VertexAIModelGardenModels
-from .llms.vllm.completion import handler as vllm_handler
-from .llms.watsonx.chat.handler import WatsonXChatHandler
-from .llms.watsonx.common_utils import IBMWatsonXMixin
 from .types.llms.anthropic import AnthropicThinkingParam
 from .types.llms.openai import (
     ChatCompletionAssistantMessage,
@@ -219,40 +172,130 @@ from litellm.utils import (
 )
 
 ####### ENVIRONMENT VARIABLES ###################
-openai_chat_completions = OpenAIChatCompletion()
-openai_text_completions = OpenAITextCompletion()
-openai_audio_transcriptions = OpenAIAudioTranscription()
-openai_image_variations = OpenAIImageVariationsHandler()
-groq_chat_completions = GroqChatCompletion()
-azure_ai_embedding = AzureAIEmbedding()
-anthropic_chat_completions = AnthropicChatCompletion()
-azure_chat_completions = AzureChatCompletion()
-azure_o1_chat_completions = AzureOpenAIO1ChatCompletion()
-azure_text_completions = AzureTextCompletion()
-azure_audio_transcriptions = AzureAudioTranscription()
-huggingface_embed = HuggingFaceEmbedding()
-predibase_chat_completions = PredibaseChatCompletion()
-codestral_text_completions = CodestralTextCompletion()
-bedrock_converse_chat_completion = BedrockConverseLLM()
-bedrock_embedding = BedrockEmbedding()
-bedrock_image_generation = BedrockImageGeneration()
-vertex_chat_completion = VertexLLM()
-vertex_embedding = VertexEmbedding()
-vertex_multimodal_embedding = VertexMultimodalEmbedding()
-vertex_image_generation = VertexImageGeneration()
-google_batch_embeddings = GoogleBatchEmbeddings()
-vertex_partner_models_chat_completion = VertexAIPartnerModels()
-vertex_model_garden_chat_completion = VertexAIModelGardenModels()
-vertex_text_to_speech = VertexTextToSpeechAPI()
-sagemaker_llm = SagemakerLLM()
-watsonx_chat_completion = WatsonXChatHandler()
-openai_like_embedding = OpenAILikeEmbeddingHandler()
-openai_like_chat_completion = OpenAILikeChatHandler()
-databricks_embedding = DatabricksEmbeddingHandler()
-base_llm_http_handler = BaseLLMHTTPHandler()
-base_llm_aiohttp_handler = BaseLLMAIOHTTPHandler()
-sagemaker_chat_completion = SagemakerChatHandler()
-bytez_transformation = BytezChatConfig()
+openai_chat_completions = lazy_instance(
+    "litellm.llms.openai.openai", "OpenAIChatCompletion"
+)
+openai_text_completions = lazy_instance(
+    "litellm.llms.openai.completion.handler", "OpenAITextCompletion"
+)
+openai_audio_transcriptions = lazy_instance(
+    "litellm.llms.openai.transcriptions.handler", "OpenAIAudioTranscription"
+)
+openai_image_variations = lazy_instance(
+    "litellm.llms.openai.image_variations.handler", "OpenAIImageVariationsHandler"
+)
+groq_chat_completions = lazy_instance(
+    "litellm.llms.groq.chat.handler", "GroqChatCompletion"
+)
+azure_ai_embedding = lazy_instance("litellm.llms.azure_ai.embed", "AzureAIEmbedding")
+anthropic_chat_completions = lazy_instance(
+    "litellm.llms.anthropic.chat", "AnthropicChatCompletion"
+)
+azure_chat_completions = lazy_instance(
+    "litellm.llms.azure.azure", "AzureChatCompletion"
+)
+azure_o1_chat_completions = lazy_instance(
+    "litellm.llms.azure.chat.o_series_handler", "AzureOpenAIO1ChatCompletion"
+)
+azure_text_completions = lazy_instance(
+    "litellm.llms.azure.completion.handler", "AzureTextCompletion"
+)
+azure_audio_transcriptions = lazy_instance(
+    "litellm.llms.azure.audio_transcriptions", "AzureAudioTranscription"
+)
+huggingface_embed = lazy_instance(
+    "litellm.llms.huggingface.embedding.handler", "HuggingFaceEmbedding"
+)
+predibase_chat_completions = lazy_instance(
+    "litellm.llms.predibase.chat.handler", "PredibaseChatCompletion"
+)
+codestral_text_completions = lazy_instance(
+    "litellm.llms.codestral.completion.handler", "CodestralTextCompletion"
+)
+bedrock_converse_chat_completion = lazy_instance(
+    "litellm.llms.bedrock.chat", "BedrockConverseLLM"
+)
+bedrock_embedding = lazy_instance(
+    "litellm.llms.bedrock.embed.embedding", "BedrockEmbedding"
+)
+bedrock_image_generation = lazy_instance(
+    "litellm.llms.bedrock.image.image_handler", "BedrockImageGeneration"
+)
+vertex_chat_completion = lazy_instance(
+    "litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini", "VertexLLM"
+)
+vertex_embedding = lazy_instance(
+    "litellm.llms.vertex_ai.vertex_embeddings.embedding_handler", "VertexEmbedding"
+)
+vertex_multimodal_embedding = lazy_instance(
+    "litellm.llms.vertex_ai.multimodal_embeddings.embedding_handler",
+    "VertexMultimodalEmbedding",
+)
+vertex_image_generation = lazy_instance(
+    "litellm.llms.vertex_ai.image_generation.image_generation_handler",
+    "VertexImageGeneration",
+)
+google_batch_embeddings = lazy_instance(
+    "litellm.llms.vertex_ai.gemini_embeddings.batch_embed_content_handler",
+    "GoogleBatchEmbeddings",
+)
+vertex_partner_models_chat_completion = lazy_instance(
+    "litellm.llms.vertex_ai.vertex_ai_partner_models.main", "VertexAIPartnerModels"
+)
+vertex_model_garden_chat_completion = lazy_instance(
+    "litellm.llms.vertex_ai.vertex_model_garden.main", "VertexAIModelGardenModels"
+)
+vertex_text_to_speech = lazy_instance(
+    "litellm.llms.vertex_ai.text_to_speech.text_to_speech_handler",
+    "VertexTextToSpeechAPI",
+)
+sagemaker_llm = lazy_instance(
+    "litellm.llms.sagemaker.completion.handler", "SagemakerLLM"
+)
+watsonx_chat_completion = lazy_instance(
+    "litellm.llms.watsonx.chat.handler", "WatsonXChatHandler"
+)
+openai_like_embedding = lazy_instance(
+    "litellm.llms.openai_like.embedding.handler", "OpenAILikeEmbeddingHandler"
+)
+openai_like_chat_completion = lazy_instance(
+    "litellm.llms.openai_like.chat.handler", "OpenAILikeChatHandler"
+)
+databricks_embedding = lazy_instance(
+    "litellm.llms.databricks.embed.handler", "DatabricksEmbeddingHandler"
+)
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
+base_llm_aiohttp_handler = lazy_instance(
+    "litellm.llms.custom_httpx.aiohttp_handler", "BaseLLMAIOHTTPHandler"
+)
+sagemaker_chat_completion = lazy_instance(
+    "litellm.llms.sagemaker.chat.handler", "SagemakerChatHandler"
+)
+bytez_transformation = lazy_instance(
+    "litellm.llms.bytez.chat.transformation", "BytezChatConfig"
+)
+
+# provider modules / helpers only used by a single provider branch
+baseten = lazy_module("litellm.llms.baseten")
+aleph_alpha = lazy_module("litellm.llms.deprecated_providers.aleph_alpha")
+palm = lazy_module("litellm.llms.deprecated_providers.palm")
+ollama = lazy_module("litellm.llms.ollama.completion.handler")
+oobabooga = lazy_module("litellm.llms.oobabooga.chat.oobabooga")
+petals_handler = lazy_module("litellm.llms.petals.completion.handler")
+vertex_ai_non_gemini = lazy_module("litellm.llms.vertex_ai.vertex_ai_non_gemini")
+vllm_handler = lazy_module("litellm.llms.vllm.completion.handler")
+nlp_cloud_chat_completion = lazy_attribute(
+    "litellm.llms.nlp_cloud.chat.handler", "completion"
+)
+replicate_chat_completion = lazy_attribute(
+    "litellm.llms.replicate.chat.handler", "completion"
+)
+_check_dynamic_azure_params = lazy_attribute(
+    "litellm.llms.azure.azure", "_check_dynamic_azure_params"
+)
+IBMWatsonXMixin = lazy_attribute("litellm.llms.watsonx.common_utils", "IBMWatsonXMixin")
 ####### COMPLETION ENDPOINTS ################
 
 
@@ -404,7 +447,7 @@ async def acompletion(
 
     Notes:
         - This function is an asynchronous version of the `completion` function.
-        - The `completion` function is called using `run_in_executor` to execute synchronously in the event loop.
+        - The sync `completion` function builds the request - on the event loop when it does no blocking I/O, else via `run_in_executor` (see `run_request_setup`).
         - If `stream` is True, the function returns an async generator that yields completion lines.
     """
     fallbacks = kwargs.get("fallbacks", None)
@@ -527,11 +570,11 @@ async def acompletion(
         # Use a partial function to pass your keyword arguments
         func = partial(completion, **completion_kwargs, **kwargs)
 
-        # Add the context to the function
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
         if isinstance(init_response, dict) or isinstance(
             init_response, ModelResponse
         ):  ## CACHING SCENARIO
@@ -3512,7 +3555,6 @@ async def aembedding(*args, **kwargs) -> EmbeddingResponse:
     Returns:
     - `response` (Any): The response returned by the `embedding` function.
     """
-    loop = asyncio.get_event_loop()
     model = args[0] if len(args) > 0 else kwargs["model"]
     ### PASS ARGS TO Embedding ###
     kwargs["aembedding"] = True
@@ -3521,16 +3563,16 @@ async def aembedding(*args, **kwargs) -> EmbeddingResponse:
         # Use a partial function to pass your keyword arguments
         func = partial(embedding, *args, **kwargs)
 
-        # Add the context to the function
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-
         _, custom_llm_provider, _, _ = get_llm_provider(
             model=model, api_base=kwargs.get("api_base", None)
         )
 
         # Await normally
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
 
         response: Optional[EmbeddingResponse] = None
         if isinstance(init_response, dict):
@@ -4389,7 +4431,6 @@ async def atext_completion(
     """
     Implemented to handle async streaming for the text completion endpoint
     """
-    loop = asyncio.get_event_loop()
     model = args[0] if len(args) > 0 else kwargs["model"]
     ### PASS ARGS TO COMPLETION ###
     kwargs["acompletion"] = True
@@ -4398,11 +4439,11 @@ async def atext_completion(
         # Use a partial function to pass your keyword arguments
         func = partial(text_completion, *args, **kwargs)
 
-        # Add the context to the function
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=kwargs.get("custom_llm_provider", None),
+            request_kwargs=kwargs,
+        )
         if isinstance(init_response, dict) or isinstance(
             init_response, TextCompletionResponse
         ):  ## CACHING SCENARIO
@@ -4914,7 +4955,6 @@ async def atranscription(*args, **kwargs) -> TranscriptionResponse:
 
     Allows router to load balance between them
     """
-    loop = asyncio.get_event_loop()
     model = args[0] if len(args) > 0 else kwargs["model"]
     ### PASS ARGS TO Image Generation ###
     kwargs["atranscription"] = True
@@ -4923,16 +4963,16 @@ async def atranscription(*args, **kwargs) -> TranscriptionResponse:
         # Use a partial function to pass your keyword arguments
         func = partial(transcription, *args, **kwargs)
 
-        # Add the context to the function
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-
         _, custom_llm_provider, _, _ = get_llm_provider(
             model=model, api_base=kwargs.get("api_base", None)
         )
 
         # Await normally
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
         if isinstance(init_response, dict):
             response = TranscriptionResponse(**init_response)
         elif isinstance(init_response, TranscriptionResponse):  ## CACHING SCENARIO
@@ -4940,8 +4980,12 @@ async def atranscription(*args, **kwargs) -> TranscriptionResponse:
         elif asyncio.iscoroutine(init_response):
             response = await init_response  # type: ignore
         else:
-            # Call the synchronous function using run_in_executor
-            response = await loop.run_in_executor(None, func_with_context)
+            # Call the synchronous function again
+            response = await run_request_setup(
+                func=func,
+                custom_llm_provider=custom_llm_provider,
+                request_kwargs=kwargs,
+            )
         if not isinstance(response, TranscriptionResponse):
             raise ValueError(
                 f"Invalid response from transcription provider, expected TranscriptionResponse, but got {type(response)}"
@@ -5166,7 +5210,6 @@ async def aspeech(*args, **kwargs) -> HttpxBinaryResponseContent:
     """
     Calls openai tts endpoints.
     """
-    loop = asyncio.get_event_loop()
     model = args[0] if len(args) > 0 else kwargs["model"]
     ### PASS ARGS TO Image Generation ###
     kwargs["aspeech"] = True
@@ -5175,21 +5218,25 @@ async def aspeech(*args, **kwargs) -> HttpxBinaryResponseContent:
         # Use a partial function to pass your keyword arguments
         func = partial(speech, *args, **kwargs)
 
-        # Add the context to the function
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-
         _, custom_llm_provider, _, _ = get_llm_provider(
             model=model, api_base=kwargs.get("api_base", None)
         )
 
         # Await normally
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
         if asyncio.iscoroutine(init_response):
             response = await init_response
         else:
-            # Call the synchronous function using run_in_executor
-            response = await loop.run_in_executor(None, func_with_context)
+            # Call the synchronous function again
+            response = await run_request_setup(
+                func=func,
+                custom_llm_provider=custom_llm_provider,
+                request_kwargs=kwargs,
+            )
         return response  # type: ignore
     except Exception as e:
         custom_llm_provider = custom_llm_provider or "openai"
@@ -22,11 +22,13 @@ from httpx._types import CookieTypes, QueryParamTypes, RequestFiles
 
 import litellm
 from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from litellm.utils import client
 
-base_llm_http_handler = BaseLLMHTTPHandler()
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 from .utils import BasePassthroughUtils
 
 if TYPE_CHECKING:
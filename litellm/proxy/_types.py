@@ -15,6 +15,7 @@ from pydantic import (
 )
 from typing_extensions import Required, TypedDict
 
+from litellm.constants import SPEND_LOG_RECALCULATE_BATCH_SIZE
 from litellm.types.integrations.slack_alerting import AlertType
 from litellm.types.llms.openai import (
     AllMessageValues,
@@ -2417,6 +2418,14 @@ class SpendCalculateRequest(LiteLLMPydanticObjectBase):
     completion_response: Optional[dict] = None
 
 
+class SpendLogsRecalculateRequest(LiteLLMPydanticObjectBase):
+    start_date: Optional[str] = None  # YYYY-MM-DD or ISO timestamp, inclusive
+    end_date: Optional[str] = None  # YYYY-MM-DD or ISO timestamp, inclusive
+    model: Optional[str] = None  # only recalculate spend logs of this model
+    batch_size: int = SPEND_LOG_RECALCULATE_BATCH_SIZE
+    dry_run: bool = False  # calculate the new spend, without updating the spend logs
+
+
 class ProxyErrorTypes(str, enum.Enum):
     budget_exceeded = "budget_exceeded"
     """
@@ -0,0 +1,76 @@
+import json
+from typing import Optional
+
+import click
+import rich
+import requests
+
+from ...spend import SpendManagementClient
+
+
+@click.group()
+def spend():
+    """Manage spend tracking for the LiteLLM proxy server"""
+    pass
+
+
+@spend.command()
+@click.option(
+    "--start-date",
+    type=str,
+    help="Only spend logs starting at / after this date (YYYY-MM-DD)",
+)
+@click.option(
+    "--end-date",
+    type=str,
+    help="Only spend logs starting at / before this date (YYYY-MM-DD)",
+)
+@click.option("--model", type=str, help="Only spend logs of this model")
+@click.option(
+    "--batch-size", type=int, help="Number of spend logs recalculated per batch"
+)
+@click.option(
+    "--dry-run", is_flag=True, help="Calculate the new spend without saving it"
+)
+@click.pass_context
+def recalculate(
+    ctx: click.Context,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    model: Optional[str],
+    batch_size: Optional[int],
+    dry_run: bool,
+):
+    """Recalculate the spend of spend logs with the current model prices"""
+    client = SpendManagementClient(ctx.obj["base_url"], ctx.obj["api_key"])
+    total_rows = 0
+    total_updated_rows = 0
+    total_spend_delta = 0.0
+    try:
+        for batch in client.recalculate_spend_logs(
+            start_date=start_date,
+            end_date=end_date,
+            model=model,
+            batch_size=batch_size,
+            dry_run=dry_run,
+        ):
+            total_rows += batch["rows"]
+            total_updated_rows += batch["updated_rows"]
+            total_spend_delta += batch["spend_delta"]
+            click.echo(
+                f"Batch {batch['batch']}: {batch['rows']} rows, {batch['updated_rows']} updated, "
+                f"spend delta {batch['spend_delta']:.6f}"
+            )
+    except requests.exceptions.HTTPError as e:
+        click.echo(f"Error: HTTP {e.response.status_code}", err=True)
+        try:
+            error_body = e.response.json()
+            rich.print_json(data=error_body)
+        except json.JSONDecodeError:
+            click.echo(e.response.text, err=True)
+        raise click.Abort()
+
+    rich.print(
+        f"{'Dry run - ' if dry_run else ''}Recalculated {total_rows} spend logs: "
+        f"{total_updated_rows} updated, spend delta {total_spend_delta:.6f}"
+    )
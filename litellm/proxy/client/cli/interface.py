@@ -88,6 +88,7 @@ def show_commands():
         ("http", "Make HTTP requests to the proxy"),
         ("keys", "Manage API keys"),
         ("users", "Manage users"),
+        ("spend", "Recalculate spend logs"),
         ("version", "Show version information"),
         ("help", "Show this help message"),
         ("quit", "Exit the interactive session"),
@@ -15,6 +15,7 @@ from .commands.keys import keys
 
 # local imports
 from .commands.models import models
+from .commands.spend import spend
 from .commands.users import users
 from .interface import interactive_shell
 
@@ -100,6 +101,8 @@ cli.add_command(http)
 cli.add_command(keys)
 # Add the users command group
 cli.add_command(users)
+# Add the spend command group
+cli.add_command(spend)
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ from .model_groups import ModelGroupsManagementClient
 from .chat import ChatClient
 from .keys import KeysManagementClient
 from .credentials import CredentialsManagementClient
+from .spend import SpendManagementClient
 
 
 class Client:
@@ -36,3 +37,4 @@ class Client:
         self.chat = ChatClient(base_url=self._base_url, api_key=self._api_key)
         self.keys = KeysManagementClient(base_url=self._base_url, api_key=self._api_key)
         self.credentials = CredentialsManagementClient(base_url=self._base_url, api_key=self._api_key)
+        self.spend = SpendManagementClient(base_url=self._base_url, api_key=self._api_key)
@@ -0,0 +1,89 @@
+import json
+import requests
+from typing import Dict, Any, Iterator, Optional, Union
+from .exceptions import UnauthorizedError
+
+
+class SpendManagementClient:
+    def __init__(self, base_url: str, api_key: Optional[str] = None):
+        """
+        Initialize the SpendManagementClient.
+
+        Args:
+            base_url (str): The base URL of the LiteLLM proxy server (e.g., "http://localhost:8000")
+            api_key (Optional[str]): API key for authentication. If provided, it will be sent as a Bearer token.
+        """
+        self._base_url = base_url.rstrip("/")  # Remove trailing slash if present
+        self._api_key = api_key
+
+    def _get_headers(self) -> Dict[str, str]:
+        """
+        Get the headers for API requests, including authorization if api_key is set.
+
+        Returns:
+            Dict[str, str]: Headers to use for API requests
+        """
+        headers = {"Content-Type": "application/json"}
+        if self._api_key:
+            headers["Authorization"] = f"Bearer {self._api_key}"
+        return headers
+
+    def recalculate_spend_logs(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        model: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        dry_run: bool = False,
+        return_request: bool = False,
+    ) -> Union[Iterator[Dict[str, Any]], requests.Request]:
+        """
+        Recalculate the spend of spend logs with the current model prices (admin only).
+
+        Args:
+            start_date (Optional[str]): Only spend logs starting at / after this date (YYYY-MM-DD)
+            end_date (Optional[str]): Only spend logs starting at / before this date (YYYY-MM-DD)
+            model (Optional[str]): Only spend logs of this model
+            batch_size (Optional[int]): Number of spend logs recalculated per batch
+            dry_run (bool): If True, the new spend is calculated but not saved
+            return_request (bool): If True, returns the prepared request object instead of executing it
+
+        Returns:
+            Union[Iterator[Dict[str, Any]], requests.Request]: An iterator over the per-batch summaries streamed by the server,
+            or a prepared request object if return_request is True
+
+        Raises:
+            UnauthorizedError: If the request fails with a 401 status code
+            requests.exceptions.RequestException: If the request fails with any other error
+        """
+        url = f"{self._base_url}/spend/logs/recalculate"
+        data: Dict[str, Any] = {"dry_run": dry_run}
+        if start_date is not None:
+            data["start_date"] = start_date
+        if end_date is not None:
+            data["end_date"] = end_date
+        if model is not None:
+            data["model"] = model
+        if batch_size is not None:
+            data["batch_size"] = batch_size
+
+        request = requests.Request("POST", url, headers=self._get_headers(), json=data)
+
+        if return_request:
+            return request
+
+        return self._stream_batches(request)
+
+    def _stream_batches(self, request: requests.Request) -> Iterator[Dict[str, Any]]:
+        session = requests.Session()
+        try:
+            response = session.send(request.prepare(), stream=True)
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 401:
+                raise UnauthorizedError(e)
+            raise
+        with response:
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
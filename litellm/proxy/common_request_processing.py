@@ -166,10 +166,16 @@ async def create_streaming_response(
         if first_chunk_value is not None:
             with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
                 yield first_chunk_value
-        async for chunk in generator:
-
-            with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
-                yield chunk
+        try:
+            async for chunk in generator:
+
+                with tracer.trace(DD_TRACER_STREAMING_CHUNK_YIELD_RESOURCE):
+                    yield chunk
+        finally:
+            # propagate a client disconnect to the wrapped generator, so it can close the upstream stream
+            aclose = getattr(generator, "aclose", None)
+            if aclose is not None:
+                await aclose()
 
     return StreamingResponse(
         combined_generator(),
@@ -49,6 +49,16 @@ async def get_active_tasks_stats():
     }
 
 
+@router.get("/debug/logging-dispatcher")
+async def get_logging_dispatcher_stats():
+    """
+    Returns queue depth, queue latency and dropped / spilled counts for the success / failure logging dispatcher.
+    """
+    from litellm.litellm_core_utils.logging_worker import logging_dispatcher
+
+    return logging_dispatcher.get_metrics()
+
+
 if os.environ.get("LITELLM_PROFILE", "false").lower() == "true":
     try:
         import objgraph  # type: ignore
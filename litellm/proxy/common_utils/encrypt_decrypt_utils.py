@@ -1,8 +1,22 @@
 import base64
+import hashlib
 import os
-from typing import Literal, Optional
+import time
+from typing import Dict, Literal, Optional, Tuple
 
 from litellm._logging import verbose_proxy_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import DECRYPTED_VALUE_CACHE_TTL, MAX_DECRYPTED_VALUE_CACHE_SIZE
+
+# sha256(signing key + ciphertext) -> (plaintext, expiry time). Held in process memory only.
+_decrypted_value_cache: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+    max_size=MAX_DECRYPTED_VALUE_CACHE_SIZE
+)
+
+# decrypt_value_helper calls / cache hits in the current and last full minute
+_decrypt_stats: Dict[str, int] = {"calls": 0, "cache_hits": 0}
+_decrypt_stats_last_minute: Dict[str, int] = {"calls": 0, "cache_hits": 0}
+_decrypt_stats_window_start: float = time.time()
 
 
 def _get_salt_key():
@@ -35,6 +49,60 @@ def encrypt_value_helper(value: str, new_encryption_key: Optional[str] = None):
         raise e
 
 
+def invalidate_decrypted_value_cache() -> None:
+    _decrypted_value_cache.clear()
+
+
+def get_decrypt_stats() -> Dict[str, int]:
+    """
+    decrypt_value_helper calls in the last full minute, and how many of them were served from the cache
+    """
+    _roll_decrypt_stats_window()
+    return {
+        "decrypt_calls_per_minute": _decrypt_stats_last_minute["calls"],
+        "decrypt_cache_hits_per_minute": _decrypt_stats_last_minute["cache_hits"],
+        "decryptions_per_minute": _decrypt_stats_last_minute["calls"]
+        - _decrypt_stats_last_minute["cache_hits"],
+        "decrypted_value_cache_size": len(_decrypted_value_cache),
+    }
+
+
+def _roll_decrypt_stats_window() -> None:
+    global _decrypt_stats_window_start
+
+    now = time.time()
+    if now - _decrypt_stats_window_start < 60:
+        return
+    if now - _decrypt_stats_window_start >= 120:  # no calls in the last full minute
+        _decrypt_stats_last_minute.update(calls=0, cache_hits=0)
+    else:
+        _decrypt_stats_last_minute.update(_decrypt_stats)
+        verbose_proxy_logger.debug(
+            "decrypt_value_helper - %s calls, %s served from cache in the last minute",
+            _decrypt_stats["calls"],
+            _decrypt_stats["cache_hits"],
+        )
+    _decrypt_stats.update(calls=0, cache_hits=0)
+    _decrypt_stats_window_start = now
+
+
+def _get_decrypted_value_cache_key(value: str, signing_key: str) -> str:
+    return hashlib.sha256(
+        "{}:{}".format(signing_key, value).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_cached_decrypted_value(cache_key: str) -> Tuple[bool, Optional[str]]:
+    cached_value = _decrypted_value_cache.get(cache_key)
+    if cached_value is None:
+        return False, None
+    plaintext, expires_at = cached_value
+    if time.time() >= expires_at:
+        _decrypted_value_cache.pop(cache_key, None)
+        return False, None
+    return True, plaintext
+
+
 def decrypt_value_helper(
     value: str,
     key: str,  # this is just for debug purposes, showing the k,v pair that's invalid. not a signing key.
@@ -42,10 +110,28 @@ def decrypt_value_helper(
 ):
     signing_key = _get_salt_key()
 
+    _roll_decrypt_stats_window()
+    _decrypt_stats["calls"] += 1
+
     try:
         if isinstance(value, str):
+            cache_key: Optional[str] = None
+            if DECRYPTED_VALUE_CACHE_TTL > 0:
+                cache_key = _get_decrypted_value_cache_key(
+                    value=value, signing_key=signing_key
+                )
+                is_cached, plaintext = _get_cached_decrypted_value(cache_key)
+                if is_cached:
+                    _decrypt_stats["cache_hits"] += 1
+                    return plaintext
+
             decoded_b64 = base64.b64decode(value)
             value = decrypt_value(value=decoded_b64, signing_key=signing_key)  # type: ignore
+            if cache_key is not None:
+                _decrypted_value_cache[cache_key] = (
+                    value,
+                    time.time() + DECRYPTED_VALUE_CACHE_TTL,
+                )
             return value
 
         # if it's not str - do not decrypt it, return the value
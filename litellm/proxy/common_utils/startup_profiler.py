@@ -0,0 +1,171 @@
+"""
+Startup profiling for `litellm --profile_startup <report.json>`
+
+Records a timestamp after each phase of proxy startup (importing the proxy, config loading, DB migrations, prisma
+connect, callbacks, background jobs, ...) and writes the phase durations to a JSON report once the proxy has started,
+so cold-start time can be tracked, e.g. in CI. Each process writes its own report - the pid is added to the file name,
+e.g. `startup_profile.1234.json`, so the reports of multiple workers don't overwrite each other.
+
+With `--profile_startup_imports`, startup also runs under cProfile - the report then lists the slowest module imports
+(cumulative time of each module's body, like `python -X importtime`) and the full profile is written next to it.
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from litellm._logging import verbose_proxy_logger
+
+# number of modules listed under "imports" in the report
+_MAX_REPORTED_IMPORTS = 50
+
+
+class StartupProfiler:
+    """
+    Enabled by the `LITELLM_PROFILE_STARTUP` env var (the report path) - the cli sets it, so uvicorn / gunicorn workers
+    started in new processes profile their startup too.
+    """
+
+    def __init__(self) -> None:
+        self.report_path: Optional[str] = None
+        self.profile_imports: bool = False
+        self.phases: List[Dict[str, Any]] = []
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self._start_time = time.perf_counter()
+        self._last_mark_time = self._start_time
+        self._profiler: Optional[cProfile.Profile] = None
+        self._report_written = False
+        report_path = os.getenv("LITELLM_PROFILE_STARTUP")
+        if report_path:
+            self.enable(
+                report_path=report_path,
+                profile_imports=os.getenv(
+                    "LITELLM_PROFILE_STARTUP_IMPORTS", "False"
+                ).lower()
+                == "true",
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self.report_path is not None
+
+    def enable(self, report_path: str, profile_imports: bool = False) -> None:
+        self.report_path = report_path
+        self.profile_imports = profile_imports
+        self.phases = []
+        self.timings = {}
+        self._start_time = self._last_mark_time = time.perf_counter()
+        self._report_written = False
+        if profile_imports and self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def mark(self, phase: str) -> None:
+        """
+        Record that `phase` finished now - it took the time since the previous mark
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append(
+            {
+                "name": phase,
+                "start_seconds": self._last_mark_time - self._start_time,
+                "duration_seconds": now - self._last_mark_time,
+            }
+        )
+        self._last_mark_time = now
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """
+        Mark `phase` as finished once the wrapped block has run
+        """
+        yield
+        self.mark(phase)
+
+    def record_timings(self, name: str, timings: Dict[str, Any]) -> None:
+        """
+        Add a component's own breakdown (e.g. `ProxyConfig.load_config_timings`) to the report
+        """
+        if self.enabled and timings:
+            self.timings[name] = dict(timings)
+
+    def write_report(self) -> Optional[Dict[str, Any]]:
+        """
+        Write the JSON report (once) - returns it, or None if profiling isn't enabled / the report was already written
+        """
+        if not self.enabled or self._report_written or self.report_path is None:
+            return None
+        self._report_written = True
+        report_path = self.get_report_path(self.report_path)
+        report: Dict[str, Any] = {
+            "pid": os.getpid(),
+            "python_version": sys.version.split()[0],
+            "total_seconds": time.perf_counter() - self._start_time,
+            "phases": self.phases,
+            "timings": self.timings,
+        }
+        if self._profiler is not None:
+            self._profiler.disable()
+            profile_path = os.path.splitext(report_path)[0] + ".prof"
+            report["imports"] = self._get_slowest_imports(self._profiler)
+            report["profile_path"] = profile_path
+            try:
+                self._profiler.dump_stats(profile_path)
+            except Exception as e:
+                verbose_proxy_logger.warning(
+                    f"Unable to write startup profile to {profile_path} - {e}"
+                )
+            self._profiler = None
+        try:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=2)
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                f"Unable to write startup profile report to {report_path} - {e}"
+            )
+        else:
+            verbose_proxy_logger.info(
+                f"Proxy started in {report['total_seconds']:.2f}s - startup profile written to {report_path}"
+            )
+        return report
+
+    @staticmethod
+    def get_report_path(report_path: str) -> str:
+        """
+        Add the pid to the report file name - `startup_profile.json` -> `startup_profile.<pid>.json`
+        """
+        root, ext = os.path.splitext(report_path)
+        return f"{root}.{os.getpid()}{ext or '.json'}"
+
+    @staticmethod
+    def _get_slowest_imports(profiler: cProfile.Profile) -> List[Dict[str, Any]]:
+        """
+        Cumulative time spent executing each module's body - i.e. importing it, including the modules it imports
+        """
+        module_names = {
+            getattr(module, "__file__", None): module_name
+            for module_name, module in list(sys.modules.items())
+            if module is not None
+        }
+        function_stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+        imports = [
+            {
+                # stats are (call count, primitive call count, own time, cumulative time, callers)
+                "module": module_names.get(filename, filename),
+                "cumulative_seconds": stats[3],
+            }
+            for (filename, _, function_name), stats in function_stats.items()
+            if function_name == "<module>"
+        ]
+        imports.sort(key=lambda entry: entry["cumulative_seconds"], reverse=True)
+        return imports[:_MAX_REPORTED_IMPORTS]
+
+
+startup_profiler = StartupProfiler()
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime
 from typing import List, Optional
 
@@ -6,7 +5,7 @@ import httpx
 
 from litellm._logging import verbose_proxy_logger
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.logging_worker import logging_dispatcher
 from litellm.proxy._types import PassThroughEndpointLoggingResultValues
 from litellm.types.passthrough_endpoints.pass_through_endpoints import EndpointType
 from litellm.types.utils import StandardPassThroughResponseObject
@@ -44,7 +43,7 @@ class PassThroughStreamingHandler:
             # After all chunks are processed, handle post-processing
             end_time = datetime.now()
 
-            asyncio.create_task(
+            logging_dispatcher.submit_coroutine(
                 PassThroughStreamingHandler._route_streaming_logging_to_handler(
                     litellm_logging_obj=litellm_logging_obj,
                     passthrough_success_handler_obj=passthrough_success_handler_obj,
@@ -134,7 +133,7 @@ class PassThroughStreamingHandler:
         if litellm_logging_obj._should_run_sync_callbacks_for_async_calls() is False:
             return
 
-        executor.submit(
+        logging_dispatcher.submit(
             litellm_logging_obj.success_handler,
             result=standard_logging_response_object,
             end_time=end_time,
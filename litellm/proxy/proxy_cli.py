@@ -1,4 +1,5 @@
 # ruff: noqa: T201
+import gc
 import importlib
 import json
 import os
@@ -270,8 +271,62 @@ class ProxyInitializationHelpers:
             gunicorn_options["certfile"] = ssl_certfile_path
             gunicorn_options["keyfile"] = ssl_keyfile_path
 
+        if num_workers > 1:
+            # workers are forked from this (preloaded) process - load shared state once, here
+            ProxyInitializationHelpers._preload_shared_state()
+            gunicorn_options["pre_fork"] = ProxyInitializationHelpers._gunicorn_pre_fork
+
         StandaloneApplication(app=app, options=gunicorn_options).run()  # Run gunicorn
 
+    @staticmethod
+    def _preload_shared_state() -> None:
+        """
+        Load the provider configs / handlers litellm otherwise imports on first use.
+
+        Done in the gunicorn master, so forked workers share them copy-on-write instead of each importing them.
+        The model cost map and the proxy config are already loaded in the master by this point.
+        """
+        import litellm
+        from litellm._logging import verbose_proxy_logger
+        from litellm.litellm_core_utils.lazy_loading import load_lazy_objects
+
+        for name in list(litellm._lazy_imports) + list(litellm._lazy_instances):
+            try:
+                getattr(litellm, name)
+            except Exception as e:
+                # e.g. missing optional dependency - raises on first use, as before
+                verbose_proxy_logger.debug(f"Unable to preload litellm.{name} - {e}")
+
+        for module_name, module in list(sys.modules.items()):
+            if module is not None and (
+                module_name == "litellm" or module_name.startswith("litellm.")
+            ):
+                load_lazy_objects(module)
+
+    @staticmethod
+    def _gunicorn_pre_fork(server, worker) -> None:
+        """
+        gunicorn `pre_fork` hook - runs in the master before each worker is forked.
+
+        Moves everything the master allocated into the gc's permanent generation. Workers' garbage collections
+        then don't write to those objects, so their memory pages stay shared with the master.
+        """
+        gc.freeze()
+
+    @staticmethod
+    def _enable_startup_profiling(report_path: str, profile_imports: bool) -> None:
+        """
+        Profile the startup of this process - and of workers started in new processes, which read the env vars
+        """
+        from litellm.proxy.common_utils.startup_profiler import startup_profiler
+
+        os.environ["LITELLM_PROFILE_STARTUP"] = report_path
+        if profile_imports:
+            os.environ["LITELLM_PROFILE_STARTUP_IMPORTS"] = "True"
+        startup_profiler.enable(
+            report_path=report_path, profile_imports=profile_imports
+        )
+
     @staticmethod
     def _run_ollama_serve():
         try:
@@ -484,6 +539,20 @@ class ProxyInitializationHelpers:
     help="Set the uvicorn keepalive timeout in seconds (uvicorn timeout_keep_alive parameter)",
     envvar="KEEPALIVE_TIMEOUT",
 )
+@click.option(
+    "--profile_startup",
+    "--profile-startup",
+    default=None,
+    type=str,
+    help="Write a JSON report of how long each phase of proxy startup took to this path",
+    envvar="LITELLM_PROFILE_STARTUP",
+)
+@click.option(
+    "--profile_startup_imports",
+    is_flag=True,
+    default=False,
+    help="With --profile_startup, run startup under cProfile and add the slowest module imports to the report",
+)
 def run_server(  # noqa: PLR0915
     host,
     port,
@@ -522,8 +591,16 @@ def run_server(  # noqa: PLR0915
     use_prisma_migrate,
     skip_server_startup,
     keepalive_timeout,
+    profile_startup,
+    profile_startup_imports,
 ):
     args = locals()
+    from litellm.proxy.common_utils.startup_profiler import startup_profiler
+
+    if profile_startup is not None:
+        ProxyInitializationHelpers._enable_startup_profiling(
+            report_path=profile_startup, profile_imports=profile_startup_imports
+        )
     if local:
         from proxy_server import (
             KeyManagementSettings,
@@ -555,6 +632,7 @@ def run_server(  # noqa: PLR0915
                     app,
                     save_worker_config,
                 )
+    startup_profiler.mark("import_proxy_server")
     if version is True:
         ProxyInitializationHelpers._echo_litellm_version()
         return
@@ -711,6 +789,7 @@ def run_server(  # noqa: PLR0915
                 os.chdir(original_dir)
             if database_url is not None and isinstance(database_url, str):
                 os.environ["DATABASE_URL"] = database_url
+            startup_profiler.mark("read_config")
 
         # Handle database URL construction when no config file is used
         if config is None and os.getenv("DATABASE_URL") is None:
@@ -776,6 +855,7 @@ def run_server(  # noqa: PLR0915
                 print(  # noqa
                     f"Unable to connect to DB. DATABASE_URL found in environment, but prisma package not found."  # noqa
                 )
+            startup_profiler.mark("database_migrations")
         if port == 4000 and ProxyInitializationHelpers._is_port_in_use(port):
             port = random.randint(1024, 49152)
 
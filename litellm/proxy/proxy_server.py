@@ -11,6 +11,7 @@ import time
 import traceback
 import uuid
 import warnings
+import weakref
 from datetime import datetime, timedelta
 from typing import (
     TYPE_CHECKING,
@@ -125,6 +126,7 @@ from contextlib import asynccontextmanager
 import litellm
 from litellm import Router
 from litellm._logging import verbose_proxy_logger, verbose_router_logger
+from litellm.caching.cached_stream_replay import CachedStreamReplay
 from litellm.caching.caching import DualCache, RedisCache
 from litellm.constants import (
     DAYS_IN_A_MONTH,
@@ -208,6 +210,7 @@ from litellm.proxy.common_utils.openai_endpoint_utils import (
 )
 from litellm.proxy.common_utils.proxy_state import ProxyState
 from litellm.proxy.common_utils.reset_budget_job import ResetBudgetJob
+from litellm.proxy.common_utils.startup_profiler import startup_profiler
 from litellm.proxy.common_utils.swagger_utils import ERROR_RESPONSES
 from litellm.proxy.credential_endpoints.endpoints import router as credential_router
 from litellm.proxy.db.db_transaction_queue.spend_log_cleanup import SpendLogCleanup
@@ -352,6 +355,7 @@ from litellm.secret_managers.main import (
     get_secret,
     get_secret_bool,
     get_secret_str,
+    get_secrets,
     str_to_bool,
 )
 from litellm.types.integrations.slack_alerting import SlackAlertingArgs
@@ -548,6 +552,7 @@ async def proxy_startup_event(app: FastAPI):
     global prisma_client, master_key, use_background_health_checks, llm_router, llm_model_list, general_settings, proxy_budget_rescheduler_min_time, proxy_budget_rescheduler_max_time, litellm_proxy_admin_name, db_writer_client, store_model_in_db, premium_user, _license_check, proxy_batch_polling_interval
     import json
 
+    startup_profiler.mark("server_init")
     init_verbose_loggers()
     ## CHECK PREMIUM USER
     verbose_proxy_logger.debug(
@@ -560,74 +565,78 @@ async def proxy_startup_event(app: FastAPI):
 
     ## CHECK MASTER KEY IN ENVIRONMENT ##
     master_key = get_secret_str("LITELLM_MASTER_KEY")
-    ### LOAD CONFIG ###
-    worker_config: Optional[Union[str, dict]] = get_secret("WORKER_CONFIG")  # type: ignore
-    env_config_yaml: Optional[str] = get_secret_str("CONFIG_FILE_PATH")
-    verbose_proxy_logger.debug("worker_config: %s", worker_config)
-    # check if it's a valid file path
-    if env_config_yaml is not None:
-        if os.path.isfile(env_config_yaml) and proxy_config.is_yaml(
-            config_file_path=env_config_yaml
-        ):
-            (
-                llm_router,
-                llm_model_list,
-                general_settings,
-            ) = await proxy_config.load_config(
-                router=llm_router, config_file_path=env_config_yaml
-            )
-    elif worker_config is not None:
-        if (
-            isinstance(worker_config, str)
-            and os.path.isfile(worker_config)
-            and proxy_config.is_yaml(config_file_path=worker_config)
-        ):
-            (
-                llm_router,
-                llm_model_list,
-                general_settings,
-            ) = await proxy_config.load_config(
-                router=llm_router, config_file_path=worker_config
-            )
-        elif os.environ.get("LITELLM_CONFIG_BUCKET_NAME") is not None and isinstance(
-            worker_config, str
-        ):
-            (
-                llm_router,
-                llm_model_list,
-                general_settings,
-            ) = await proxy_config.load_config(
-                router=llm_router, config_file_path=worker_config
-            )
-        elif isinstance(worker_config, dict):
-            await initialize(**worker_config)
-        else:
-            # if not, assume it's a json string
-            worker_config = json.loads(worker_config)
-            if isinstance(worker_config, dict):
+    with startup_profiler.phase("load_config"):
+        ### LOAD CONFIG ###
+        worker_config: Optional[Union[str, dict]] = get_secret("WORKER_CONFIG")  # type: ignore
+        env_config_yaml: Optional[str] = get_secret_str("CONFIG_FILE_PATH")
+        verbose_proxy_logger.debug("worker_config: %s", worker_config)
+        # check if it's a valid file path
+        if env_config_yaml is not None:
+            if os.path.isfile(env_config_yaml) and proxy_config.is_yaml(
+                config_file_path=env_config_yaml
+            ):
+                (
+                    llm_router,
+                    llm_model_list,
+                    general_settings,
+                ) = await proxy_config.load_config(
+                    router=llm_router, config_file_path=env_config_yaml
+                )
+        elif worker_config is not None:
+            if (
+                isinstance(worker_config, str)
+                and os.path.isfile(worker_config)
+                and proxy_config.is_yaml(config_file_path=worker_config)
+            ):
+                (
+                    llm_router,
+                    llm_model_list,
+                    general_settings,
+                ) = await proxy_config.load_config(
+                    router=llm_router, config_file_path=worker_config
+                )
+            elif os.environ.get(
+                "LITELLM_CONFIG_BUCKET_NAME"
+            ) is not None and isinstance(worker_config, str):
+                (
+                    llm_router,
+                    llm_model_list,
+                    general_settings,
+                ) = await proxy_config.load_config(
+                    router=llm_router, config_file_path=worker_config
+                )
+            elif isinstance(worker_config, dict):
                 await initialize(**worker_config)
+            else:
+                # if not, assume it's a json string
+                worker_config = json.loads(worker_config)
+                if isinstance(worker_config, dict):
+                    await initialize(**worker_config)
 
     # check if DATABASE_URL in environment - load from there
-    if prisma_client is None:
-        _db_url: Optional[str] = get_secret("DATABASE_URL", None)  # type: ignore
-        prisma_client = await ProxyStartupEvent._setup_prisma_client(
-            database_url=_db_url,
+    with startup_profiler.phase("prisma_connect"):
+        if prisma_client is None:
+            _db_url: Optional[str] = get_secret("DATABASE_URL", None)  # type: ignore
+            prisma_client = await ProxyStartupEvent._setup_prisma_client(
+                database_url=_db_url,
+                proxy_logging_obj=proxy_logging_obj,
+                user_api_key_cache=user_api_key_cache,
+            )
+
+    with startup_profiler.phase("callbacks"):
+        ProxyStartupEvent._initialize_startup_logging(
+            llm_router=llm_router,
             proxy_logging_obj=proxy_logging_obj,
-            user_api_key_cache=user_api_key_cache,
+            redis_usage_cache=redis_usage_cache,
         )
 
-    ProxyStartupEvent._initialize_startup_logging(
-        llm_router=llm_router,
-        proxy_logging_obj=proxy_logging_obj,
-        redis_usage_cache=redis_usage_cache,
-    )
-
     ## JWT AUTH ##
-    ProxyStartupEvent._initialize_jwt_auth(
-        general_settings=general_settings,
-        prisma_client=prisma_client,
-        user_api_key_cache=user_api_key_cache,
-    )
+    with startup_profiler.phase("jwt_auth"):
+        ProxyStartupEvent._initialize_jwt_auth(
+            general_settings=general_settings,
+            prisma_client=prisma_client,
+            user_api_key_cache=user_api_key_cache,
+        )
 
     if use_background_health_checks:
         asyncio.create_task(
@@ -644,20 +653,23 @@ async def proxy_startup_event(app: FastAPI):
         )
 
     ### START BATCH WRITING DB + CHECKING NEW MODELS###
-    if prisma_client is not None:
-        await ProxyStartupEvent.initialize_scheduled_background_jobs(
-            general_settings=general_settings,
-            prisma_client=prisma_client,
-            proxy_budget_rescheduler_min_time=proxy_budget_rescheduler_min_time,
-            proxy_budget_rescheduler_max_time=proxy_budget_rescheduler_max_time,
-            proxy_batch_write_at=proxy_batch_write_at,
-            proxy_logging_obj=proxy_logging_obj,
-        )
+    with startup_profiler.phase("background_jobs"):
+        if prisma_client is not None:
+            await ProxyStartupEvent.initialize_scheduled_background_jobs(
+                general_settings=general_settings,
+                prisma_client=prisma_client,
+                proxy_budget_rescheduler_min_time=proxy_budget_rescheduler_min_time,
+                proxy_budget_rescheduler_max_time=proxy_budget_rescheduler_max_time,
+                proxy_batch_write_at=proxy_batch_write_at,
+                proxy_logging_obj=proxy_logging_obj,
+            )
 
-        await ProxyStartupEvent._update_default_team_member_budget()
+            await ProxyStartupEvent._update_default_team_member_budget()
 
     ## [Optional] Initialize dd tracer
-    ProxyStartupEvent._init_dd_tracer()
+    with startup_profiler.phase("dd_tracer"):
+        ProxyStartupEvent._init_dd_tracer()
+    startup_profiler.write_report()
 
     # End of startup event
     yield
@@ -1377,6 +1389,10 @@ class StreamingCallbackError(Exception):
     pass
 
 
+# config file path -> ((mtime, size), parsed yaml). With gunicorn workers it is filled in the master and shared by the forked workers.
+_parsed_config_files: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
 class ProxyConfig:
     """
     Abstraction class on top of config loading/updating logic. Gives us one place to control all config updating logic.
@@ -1384,6 +1400,11 @@ class ProxyConfig:
 
     def __init__(self) -> None:
         self.config: Dict[str, Any] = {}
+        # model_id -> `updated_at` of the DB row last applied to `_db_model_versions_router`
+        self._db_model_versions: Dict[str, Any] = {}
+        self._db_model_versions_router: Optional[weakref.ref] = None
+        # stage -> seconds spent in it, for the last `load_config` call
+        self.load_config_timings: Dict[str, float] = {}
 
     def is_yaml(self, config_file_path: str) -> bool:
         if not os.path.isfile(config_file_path):
@@ -1420,8 +1441,7 @@ class ProxyConfig:
         # Load existing config
         ## Yaml
         if os.path.exists(f"{file_path}"):
-            with open(f"{file_path}", "r") as config_file:
-                config = yaml.safe_load(config_file)
+            config = self._read_config_file(file_path=f"{file_path}")
         elif file_path is not None:
             raise Exception(f"Config file not found: {file_path}")
         else:
@@ -1442,6 +1462,19 @@ class ProxyConfig:
         # verbose_proxy_logger.debug(f"loaded config={json.dumps(config, indent=4)}")
         return config
 
+    def _read_config_file(self, file_path: str) -> Any:
+        """
+        Parsed yaml of the config file - only re-parsed when the file changed. Returns a copy the caller can modify.
+        """
+        file_stat = os.stat(file_path)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached_config = _parsed_config_files.get(file_path)
+        if cached_config is None or cached_config[0] != file_version:
+            with open(file_path, "r") as config_file:
+                cached_config = (file_version, yaml.safe_load(config_file))
+            _parsed_config_files[file_path] = cached_config
+        return copy.deepcopy(cached_config[1])
+
     def _process_includes(self, config: dict, base_dir: str) -> dict:
         """
         Process includes by appending their contents to the main config
@@ -1503,6 +1536,7 @@ class ProxyConfig:
             ## YAML
             with open(f"{user_config_file_path}", "w") as config_file:
                 yaml.dump(new_config, config_file, default_flow_style=False)
+            _parsed_config_files.pop(f"{user_config_file_path}", None)
 
     def _check_for_os_environ_vars(
         self, config: dict, depth: int = 0, max_depth: int = DEFAULT_MAX_RECURSE_DEPTH
@@ -1511,6 +1545,9 @@ class ProxyConfig:
         Check for os.environ/ variables in the config and replace them with the actual values.
         Includes a depth limit to prevent infinite recursion.
 
+        All references are collected first and resolved as one batch - each distinct reference is looked up once,
+        secret manager lookups run concurrently.
+
         Args:
             config (dict): The configuration dictionary to process.
             depth (int): Current recursion depth.
@@ -1519,27 +1556,54 @@ class ProxyConfig:
         Returns:
             dict: Processed configuration dictionary.
         """
+        os_environ_vars: List[Tuple[dict, Any, str]] = []
+        self._collect_os_environ_vars(
+            config=config,
+            os_environ_vars=os_environ_vars,
+            depth=depth,
+            max_depth=max_depth,
+        )
+        resolved_values = get_secrets(value for _, _, value in os_environ_vars)
+        for container, key, value in os_environ_vars:
+            container[key] = resolved_values[value]
+        return config
+
+    def _collect_os_environ_vars(
+        self,
+        config: dict,
+        os_environ_vars: List[Tuple[dict, Any, str]],
+        depth: int = 0,
+        max_depth: int = DEFAULT_MAX_RECURSE_DEPTH,
+    ) -> None:
+        """
+        Append (container, key, value) for every os.environ/ value in the config to `os_environ_vars`
+        """
         if depth > max_depth:
             verbose_proxy_logger.warning(
                 f"Maximum recursion depth ({max_depth}) reached while processing config."
             )
-            return config
+            return
 
         for key, value in config.items():
             if isinstance(value, dict):
-                config[key] = self._check_for_os_environ_vars(
-                    config=value, depth=depth + 1, max_depth=max_depth
+                self._collect_os_environ_vars(
+                    config=value,
+                    os_environ_vars=os_environ_vars,
+                    depth=depth + 1,
+                    max_depth=max_depth,
                 )
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, dict):
-                        item = self._check_for_os_environ_vars(
-                            config=item, depth=depth + 1, max_depth=max_depth
+                        self._collect_os_environ_vars(
+                            config=item,
+                            os_environ_vars=os_environ_vars,
+                            depth=depth + 1,
+                            max_depth=max_depth,
                         )
             # if the value is a string and starts with "os.environ/" - then it's an environment variable
             elif isinstance(value, str) and value.startswith("os.environ/"):
-                config[key] = get_secret(value)
-        return config
+                os_environ_vars.append((config, key, value))
 
     def _get_team_config(self, team_id: str, all_teams_config: List[Dict]) -> Dict:
         team_config: dict = {}
@@ -1722,9 +1786,13 @@ class ProxyConfig:
         """
         global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, user_custom_ui_sso_sign_in_handler, use_background_health_checks, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, callback_settings, proxy_batch_polling_interval
 
+        self.load_config_timings = {}
+        load_config_start = stage_start = time.perf_counter()
+
         config: dict = await self.get_config(config_file_path=config_file_path)
 
         self._load_environment_variables(config=config)
+        stage_start = self._record_load_config_stage("get_config", stage_start)
 
         ## Callback settings
         callback_settings = config.get("callback_settings", None)
@@ -1965,6 +2033,7 @@ class ProxyConfig:
                         f"{blue_color_code} setting litellm.{key}={value}{reset_color_code}"
                     )
                     setattr(litellm, key, value)
+        stage_start = self._record_load_config_stage("litellm_settings", stage_start)
 
         ## GENERAL SERVER SETTINGS (e.g. master key,..) # do this after initializing litellm, to ensure sentry logging works for proxylogging
         general_settings = config.get("general_settings", {})
@@ -2116,6 +2185,7 @@ class ProxyConfig:
             if "litellm_license" in general_settings:
                 _license_check.license_str = general_settings["litellm_license"]
                 premium_user = _license_check.is_premium()
+        stage_start = self._record_load_config_stage("general_settings", stage_start)
 
         router_params: dict = {
             "cache_responses": litellm.cache
@@ -2138,6 +2208,7 @@ class ProxyConfig:
                 litellm_model_api_base = model["litellm_params"].get("api_base", None)
                 if "ollama" in litellm_model_name and litellm_model_api_base is None:
                     run_ollama_serve()
+        stage_start = self._record_load_config_stage("model_list", stage_start)
 
         ## ASSISTANT SETTINGS
         assistants_config: Optional[AssistantsTypedDict] = None
@@ -2164,6 +2235,8 @@ class ProxyConfig:
             config=default_vertex_config
         )
 
+        stage_start = self._record_load_config_stage("endpoint_settings", stage_start)
+
         ## ROUTER SETTINGS (e.g. routing_strategy, ...)
         router_settings = config.get("router_settings", None)
         if router_settings and isinstance(router_settings, dict):
@@ -2190,6 +2263,7 @@ class ProxyConfig:
 
         if redis_usage_cache is not None and router.cache.redis_cache is None:
             router._update_redis_cache(cache=redis_usage_cache)
+        stage_start = self._record_load_config_stage("router", stage_start)
 
         # Guardrail settings
         guardrails_v2: Optional[List[Dict]] = None
@@ -2200,16 +2274,34 @@ class ProxyConfig:
             init_guardrails_v2(
                 all_guardrails=guardrails_v2, config_file_path=config_file_path
             )
+        stage_start = self._record_load_config_stage("guardrails", stage_start)
 
         ## CREDENTIALS
         credential_list_dict = self.load_credential_list(config=config)
         litellm.credential_list = credential_list_dict
+        stage_start = self._record_load_config_stage("credentials", stage_start)
 
         ## NON-LLM CONFIGS eg. MCP tools, vector stores, etc.
         self._init_non_llm_configs(config=config)
+        self._record_load_config_stage("non_llm_configs", stage_start)
+
+        self.load_config_timings["total"] = time.perf_counter() - load_config_start
+        verbose_proxy_logger.debug(
+            "load_config stage timings (seconds): %s", self.load_config_timings
+        )
+        startup_profiler.record_timings("load_config", self.load_config_timings)
+        startup_profiler.record_timings("router_init", router.deployment_init_timings)
 
         return router, router.get_model_list(), general_settings
 
+    def _record_load_config_stage(self, stage: str, stage_start: float) -> float:
+        """
+        Record the seconds since `stage_start` as `stage` in `load_config_timings`, returns the start of the next stage
+        """
+        now = time.perf_counter()
+        self.load_config_timings[stage] = now - stage_start
+        return now
+
     def _init_non_llm_configs(self, config: dict):
         """
         Initialize non-LLM configs eg. MCP tools, vector stores, etc.
@@ -2358,7 +2450,9 @@ class ProxyConfig:
             _model_info = RouterModelInfo(id=model.model_id, db_model=db_model)
         return _model_info
 
-    async def _delete_deployment(self, db_models: list) -> int:
+    async def _delete_deployment(
+        self, db_models: list, db_model_ids: Optional[List[str]] = None
+    ) -> int:
         """
         (Helper function of add deployment) -> combined to reduce prisma db calls
 
@@ -2366,23 +2460,28 @@ class ProxyConfig:
         - Compare all up list to router model id's
         - Remove any that are missing
 
+        `db_model_ids` - id's of all db models, when `db_models` only holds the changed ones
+
         Return:
         - int - returns number of deleted deployments
         """
         global user_config_file_path, llm_router
         combined_id_list = []
 
+        ## DB MODELS ##
+        if db_model_ids is not None:
+            combined_id_list.extend(db_model_ids)
+        else:
+            for m in db_models:
+                model_info = self.get_model_info_with_id(model=m)
+                if model_info.id is not None:
+                    combined_id_list.append(model_info.id)
+
         ## BASE CASES ##
-        # if llm_router is None or db_models is empty, return 0
-        if llm_router is None or len(db_models) == 0:
+        # if llm_router is None or there are no db models, return 0
+        if llm_router is None or len(combined_id_list) == 0:
             return 0
 
-        ## DB MODELS ##
-        for m in db_models:
-            model_info = self.get_model_info_with_id(model=m)
-            if model_info.id is not None:
-                combined_id_list.append(model_info.id)
-
         ## CONFIG MODELS ##
         config = await self.get_config(config_file_path=user_config_file_path)
         model_list = config.get("model_list", None)
@@ -2434,7 +2533,7 @@ class ProxyConfig:
         if llm_router is None:
             return 0
 
-        added_models = 0
+        deployments: List[Deployment] = []
         ## ADD MODEL LOGIC
         for m in db_models:
             _litellm_params = m.litellm_params
@@ -2460,17 +2559,17 @@ class ProxyConfig:
                 model=m, db_model=True
             )  ## 👈 FLAG = True for db_models
 
-            added = llm_router.upsert_deployment(
-                deployment=Deployment(
+            deployments.append(
+                Deployment(
                     model_name=m.model_name,
                     litellm_params=_litellm_params,
                     model_info=_model_info,
                 )
             )
 
-            if added is not None:
-                added_models += 1
-        return added_models
+        # unchanged deployments are skipped, changed ones are applied to the router in one step
+        added_deployments = llm_router.bulk_upsert_deployments(deployments=deployments)
+        return len(added_deployments)
 
     def decrypt_model_list_from_db(self, new_models: list) -> list:
         _model_list: list = []
@@ -2503,7 +2602,11 @@ class ProxyConfig:
         self,
         new_models: list,
         proxy_logging_obj: ProxyLogging,
+        db_model_versions: Optional[Dict[str, Any]] = None,
     ):
+        """
+        `db_model_versions` - model_id -> updated_at of every db model, when `new_models` only holds the changed ones
+        """
         global llm_router, llm_model_list, master_key, general_settings
 
         try:
@@ -2526,11 +2629,21 @@ class ProxyConfig:
             else:
                 verbose_proxy_logger.debug(f"len new_models: {len(new_models)}")
                 ## DELETE MODEL LOGIC
-                await self._delete_deployment(db_models=new_models)
+                await self._delete_deployment(
+                    db_models=new_models,
+                    db_model_ids=(
+                        list(db_model_versions.keys())
+                        if db_model_versions is not None
+                        else None
+                    ),
+                )
 
                 ## ADD MODEL LOGIC
                 self._add_deployment(db_models=new_models)
 
+            if db_model_versions is not None:
+                self._record_db_model_versions(db_model_versions=db_model_versions)
+
         except Exception as e:
             verbose_proxy_logger.exception(
                 f"Error adding/deleting model to llm_router: {str(e)}"
@@ -2858,15 +2971,88 @@ class ProxyConfig:
 
         return new_models
 
+    async def _get_db_model_versions(
+        self, prisma_client: PrismaClient
+    ) -> Optional[Dict[str, Any]]:
+        """
+        model_id -> updated_at of every row in `LiteLLM_ProxyModelTable`
+
+        Returns None if the query fails.
+        """
+        try:
+            rows = await prisma_client.db.query_raw(
+                'SELECT model_id, updated_at FROM "LiteLLM_ProxyModelTable"'
+            )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "litellm.proxy_server.py::add_deployment() - Error getting model versions from DB - {}".format(
+                    str(e)
+                )
+            )
+            return None
+
+        return {row["model_id"]: row["updated_at"] for row in rows}
+
+    async def _get_changed_models_from_db(
+        self, prisma_client: PrismaClient, db_model_versions: Dict[str, Any]
+    ) -> list:
+        """
+        Get the db models whose `updated_at` changed since they were last applied to `llm_router`
+        """
+        if (
+            self._db_model_versions_router is None
+            or self._db_model_versions_router() is not llm_router
+        ):  # new router (or first sync) - nothing applied to it yet
+            self._db_model_versions = {}
+
+        changed_model_ids = [
+            model_id
+            for model_id, updated_at in db_model_versions.items()
+            if self._db_model_versions.get(model_id) != updated_at
+        ]
+        if len(changed_model_ids) == 0:
+            return []
+
+        try:
+            new_models = await prisma_client.db.litellm_proxymodeltable.find_many(
+                where={"model_id": {"in": changed_model_ids}}
+            )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "litellm.proxy_server.py::add_deployment() - Error getting changed models from DB - {}".format(
+                    str(e)
+                )
+            )
+            new_models = []
+
+        return new_models
+
+    def _record_db_model_versions(self, db_model_versions: Dict[str, Any]) -> None:
+        """
+        Remember which db model versions `llm_router` now holds.
+
+        Only id's on the router are kept - a model that failed to load is fetched again on the next sync.
+        """
+        if llm_router is None:
+            return
+
+        router_model_ids = set(llm_router.get_model_ids())
+        self._db_model_versions = {
+            model_id: updated_at
+            for model_id, updated_at in db_model_versions.items()
+            if model_id in router_model_ids
+        }
+        self._db_model_versions_router = weakref.ref(llm_router)
+
     async def add_deployment(
         self,
         prisma_client: PrismaClient,
         proxy_logging_obj: ProxyLogging,
     ):
         """
-        - Check db for new models
-        - Check if model id's in router already
-        - If not, add to router
+        - Check db for models changed since the last sync (by `updated_at`)
+        - Fetch only those, add / update them on the router
+        - Remove router models no longer in the db (by id)
         """
         global llm_router, llm_model_list, master_key, general_settings
 
@@ -2876,11 +3062,22 @@ class ProxyConfig:
                     f"Master key is not initialized or formatted. master_key={master_key}"
                 )
 
-            new_models = await self._get_models_from_db(prisma_client=prisma_client)
+            db_model_versions = await self._get_db_model_versions(
+                prisma_client=prisma_client
+            )
+            if db_model_versions is not None:
+                new_models = await self._get_changed_models_from_db(
+                    prisma_client=prisma_client, db_model_versions=db_model_versions
+                )
+            else:  # fall back to a full sync
+                self._db_model_versions = {}
+                new_models = await self._get_models_from_db(prisma_client=prisma_client)
 
             # update llm router
             await self._update_llm_router(
-                new_models=new_models, proxy_logging_obj=proxy_logging_obj
+                new_models=new_models,
+                proxy_logging_obj=proxy_logging_obj,
+                db_model_versions=db_model_versions,
             )
 
             db_general_settings = await prisma_client.db.litellm_config.find_first(
@@ -3248,11 +3445,25 @@ async def async_assistants_data_generator(
         yield f"data: {error_returned}\n\n"
 
 
+# the `aclose` tasks of streams whose client disconnected - the event loop only keeps weak references to tasks
+_stream_close_tasks: Set[asyncio.Task] = set()
+
+
 async def async_data_generator(
     response, user_api_key_dict: UserAPIKeyAuth, request_data: dict
 ):
     verbose_proxy_logger.debug("inside generator")
     try:
+        if (
+            isinstance(response, litellm.CustomStreamWrapper)
+            and isinstance(response.completion_stream, CachedStreamReplay)
+            and not proxy_logging_obj.has_streaming_response_hooks()
+        ):
+            # cache hit - send the pre-serialized chunks as-is
+            async for sse_frame in response.aiter_cached_sse_frames():
+                yield sse_frame
+            return
+
         str_so_far = ""
         error_message: Optional[str] = None
         async for chunk in proxy_logging_obj.async_post_call_streaming_iterator_hook(
@@ -3292,6 +3503,16 @@ async def async_data_generator(
             yield error_message
         done_message = "[DONE]"
         yield f"data: {done_message}\n\n"
+    except (asyncio.CancelledError, GeneratorExit):
+        # client disconnected - stop the upstream request and log what was streamed so far
+        verbose_proxy_logger.debug(
+            "async_data_generator: client disconnected, closing the upstream stream"
+        )
+        if isinstance(response, litellm.CustomStreamWrapper):
+            close_task = asyncio.create_task(response.aclose())
+            _stream_close_tasks.add(close_task)
+            close_task.add_done_callback(_stream_close_tasks.discard)
+        raise
     except Exception as e:
         verbose_proxy_logger.exception(
             "litellm.proxy.proxy_server.async_data_generator(): Exception occured - {}".format(
@@ -1,5 +1,6 @@
 #### SPEND MANAGEMENT #####
 import collections
+import json
 import os
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
@@ -7,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 import fastapi
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 import litellm
 from litellm._logging import verbose_proxy_logger
@@ -1611,6 +1613,157 @@ async def calculate_spend(request: SpendCalculateRequest):
         )
 
 
+@router.post(
+    "/spend/logs/recalculate",
+    tags=["Budget & Spend Tracking"],
+    dependencies=[Depends(user_api_key_auth)],
+)
+async def recalculate_spend_logs(
+    data: SpendLogsRecalculateRequest,
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    ADMIN ONLY Endpoint
+
+    Recalculate the `spend` of `LiteLLM_SpendLogs` rows with the current model prices - e.g. after a pricing change.
+
+    Spend logs are read in batches of `batch_size` rows and priced with `litellm.bulk_cost_per_token` (model, custom_llm_provider, prompt / completion / cached tokens).
+    Rows of a deployment with custom pricing are priced with the deployment's current prices (by `model_id`), rows of a deployment that no longer exists keep their spend.
+    Only rows whose cost is fully derivable from these columns are rewritten - chat / embedding models priced per token, without cache creation, audio or reasoning tokens.
+    All other rows (e.g. transcription / speech models, unmapped models) keep their spend. Key / team / user spend totals are not changed.
+
+    Streams one JSON line per batch:
+    ```
+    {"batch": 1, "rows": 1000, "updated_rows": 12, "spend_delta": 0.42, "last_request_id": "..."}
+    ```
+
+    ```
+    curl -X POST 'http://localhost:4000/spend/logs/recalculate' \
+    -H 'Authorization: Bearer sk-1234' \
+    -H 'Content-Type: application/json' \
+    -d '{"start_date": "2025-01-01", "end_date": "2025-01-31", "dry_run": true}'
+    ```
+    """
+    from litellm.proxy.proxy_server import prisma_client
+
+    if user_api_key_dict.user_role != LitellmUserRoles.PROXY_ADMIN:
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "Only proxy admins can recalculate spend logs. Your role={}".format(
+                    user_api_key_dict.user_role
+                )
+            },
+        )
+    if prisma_client is None:
+        raise HTTPException(
+            status_code=500,
+            detail={"error": CommonProxyErrors.db_not_connected_error.value},
+        )
+    if data.batch_size <= 0:
+        raise HTTPException(
+            status_code=400, detail={"error": "batch_size must be greater than 0"}
+        )
+
+    async def _stream_batches():
+        async for batch_result in _recalculate_spend_logs_in_batches(
+            prisma_client=prisma_client, request=data
+        ):
+            yield json.dumps(batch_result) + "\n"
+
+    return StreamingResponse(_stream_batches(), media_type="application/x-ndjson")
+
+
+async def _recalculate_spend_logs_in_batches(
+    prisma_client: PrismaClient, request: SpendLogsRecalculateRequest
+):
+    """
+    Yields a summary per batch of recalculated spend logs. Batches are paginated on `request_id`.
+    """
+    from litellm.litellm_core_utils.llm_cost_calc.bulk_cost import (
+        bulk_cost_per_token,
+    )
+
+    sql_query = """
+    SELECT
+        request_id,
+        model,
+        model_id,
+        custom_llm_provider,
+        prompt_tokens,
+        completion_tokens,
+        spend,
+        COALESCE((metadata->'usage_object'->'prompt_tokens_details'->>'cached_tokens')::int, 0) AS cached_tokens,
+        COALESCE((metadata->'usage_object'->>'cache_creation_input_tokens')::int, 0) AS cache_creation_tokens,
+        COALESCE((metadata->'usage_object'->'prompt_tokens_details'->>'audio_tokens')::int, 0)
+            + COALESCE((metadata->'usage_object'->'completion_tokens_details'->>'audio_tokens')::int, 0) AS audio_tokens,
+        COALESCE((metadata->'usage_object'->'completion_tokens_details'->>'reasoning_tokens')::int, 0) AS reasoning_tokens
+    FROM "LiteLLM_SpendLogs"
+    WHERE request_id > $1
+        AND "startTime" >= $2::timestamp
+        AND "startTime" <= $3::timestamp
+        AND ($4::text IS NULL OR model = $4)
+    ORDER BY request_id
+    LIMIT $5
+    """
+    start_date = request.start_date or "1970-01-01"
+    end_date = request.end_date or datetime.now(timezone.utc).isoformat()
+    if len(end_date) == 10:  # YYYY-MM-DD -> include the whole day
+        end_date = end_date + "T23:59:59.999999"
+
+    last_request_id = ""
+    batch = 0
+    while True:
+        rows = await prisma_client.db.query_raw(
+            sql_query,
+            last_request_id,
+            start_date,
+            end_date,
+            request.model,
+            request.batch_size,
+        )
+        if not rows:
+            break
+        batch += 1
+        last_request_id = rows[-1]["request_id"]
+
+        costs = bulk_cost_per_token(
+            models=[row["model"] or "" for row in rows],
+            prompt_tokens=[row["prompt_tokens"] or 0 for row in rows],
+            completion_tokens=[row["completion_tokens"] or 0 for row in rows],
+            cached_tokens=[row["cached_tokens"] or 0 for row in rows],
+            custom_llm_providers=[row["custom_llm_provider"] or None for row in rows],
+            cache_creation_tokens=[
+                row.get("cache_creation_tokens") or 0 for row in rows
+            ],
+            audio_tokens=[row.get("audio_tokens") or 0 for row in rows],
+            reasoning_tokens=[row.get("reasoning_tokens") or 0 for row in rows],
+            model_ids=[row.get("model_id") or None for row in rows],
+        )
+        updates = [
+            (row["request_id"], cost, cost - (row["spend"] or 0.0))
+            for row, cost in zip(rows, costs)
+            if cost is not None and cost != row["spend"]
+        ]
+        if updates and not request.dry_run:
+            async with prisma_client.db.batch_() as batcher:
+                for request_id, cost, _ in updates:
+                    batcher.litellm_spendlogs.update(
+                        where={"request_id": request_id}, data={"spend": cost}
+                    )
+
+        yield {
+            "batch": batch,
+            "rows": len(rows),
+            "updated_rows": len(updates),
+            "spend_delta": sum(spend_delta for _, _, spend_delta in updates),
+            "last_request_id": last_request_id,
+            "dry_run": request.dry_run,
+        }
+        if len(rows) < request.batch_size:
+            break
+
+
 @router.get(
     "/spend/logs/ui",
     tags=["Budget & Spend Tracking"],
@@ -693,15 +693,12 @@ class ProxyLogging:
             return None
 
         try:
-            for callback in litellm.callbacks:
-                _callback = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
-                    )
-                else:
-                    _callback = callback  # type: ignore
-                if _callback is not None and isinstance(_callback, CustomGuardrail):
+            for (
+                _callback
+            ) in litellm.logging_callback_manager.get_callbacks_for_hook(
+                "async_pre_call_hook", resolve_string_callbacks=True
+            ):
+                if isinstance(_callback, CustomGuardrail):
                     from litellm.types.guardrails import GuardrailEventHooks
 
                     if (
@@ -723,13 +720,7 @@ class ProxyLogging:
                             response=response, data=data, call_type=call_type
                         )
 
-                elif (
-                    _callback is not None
-                    and isinstance(_callback, CustomLogger)
-                    and "async_pre_call_hook" in vars(_callback.__class__)
-                    and _callback.__class__.async_pre_call_hook
-                    != CustomLogger.async_pre_call_hook
-                ):
+                elif "async_pre_call_hook" in vars(_callback.__class__):
                     response = await _callback.async_pre_call_hook(
                         user_api_key_dict=user_api_key_dict,
                         cache=self.call_details["user_api_key_cache"],
@@ -761,7 +752,9 @@ class ProxyLogging:
         """
         Runs the CustomGuardrail's async_moderation_hook()
         """
-        for callback in litellm.callbacks:
+        for callback in litellm.logging_callback_manager.get_callbacks_for_hook(
+            "async_moderation_hook"
+        ):
             try:
                 if isinstance(callback, CustomGuardrail):
                     ################################################################
@@ -1000,24 +993,18 @@ class ProxyLogging:
                 original_exception=original_exception,
             )
 
-        for callback in litellm.callbacks:
+        for _callback in litellm.logging_callback_manager.get_callbacks_for_hook(
+            "async_post_call_failure_hook", resolve_string_callbacks=True
+        ):
             try:
-                _callback: Optional[CustomLogger] = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
-                    )
-                else:
-                    _callback = callback  # type: ignore
-                if _callback is not None and isinstance(_callback, CustomLogger):
-                    asyncio.create_task(
-                        _callback.async_post_call_failure_hook(
-                            request_data=request_data,
-                            user_api_key_dict=user_api_key_dict,
-                            original_exception=original_exception,
-                            traceback_str=traceback_str,
-                        )
+                asyncio.create_task(
+                    _callback.async_post_call_failure_hook(
+                        request_data=request_data,
+                        user_api_key_dict=user_api_key_dict,
+                        original_exception=original_exception,
+                        traceback_str=traceback_str,
                     )
+                )
             except Exception as e:
                 verbose_proxy_logger.exception(
                     f"[Non-Blocking] Error in post_call_failure_hook: {e}"
@@ -1160,45 +1147,31 @@ class ProxyLogging:
         4. /files
         """
 
-        for callback in litellm.callbacks:
+        for _callback in litellm.logging_callback_manager.get_callbacks_for_hook(
+            "async_post_call_success_hook", resolve_string_callbacks=True
+        ):
             try:
-                _callback: Optional[CustomLogger] = None
-                if isinstance(callback, str):
-                    _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                        callback
-                    )
-                else:
-                    _callback = callback  # type: ignore
-
-                if _callback is not None:
-                    ############## Handle Guardrails ########################################
-                    #############################################################################
-                    if isinstance(callback, CustomGuardrail):
-                        # Main - V2 Guardrails implementation
-                        from litellm.types.guardrails import GuardrailEventHooks
-
-                        if (
-                            callback.should_run_guardrail(
-                                data=data, event_type=GuardrailEventHooks.post_call
-                            )
-                            is not True
-                        ):
-                            continue
+                ############## Handle Guardrails ########################################
+                #############################################################################
+                if isinstance(_callback, CustomGuardrail):
+                    # Main - V2 Guardrails implementation
+                    from litellm.types.guardrails import GuardrailEventHooks
 
-                        await callback.async_post_call_success_hook(
-                            user_api_key_dict=user_api_key_dict,
-                            data=data,
-                            response=response,
+                    if (
+                        _callback.should_run_guardrail(
+                            data=data, event_type=GuardrailEventHooks.post_call
                         )
+                        is not True
+                    ):
+                        continue
 
-                    ############ Handle CustomLogger ###############################
-                    #################################################################
-                    elif isinstance(_callback, CustomLogger):
-                        await _callback.async_post_call_success_hook(
-                            user_api_key_dict=user_api_key_dict,
-                            data=data,
-                            response=response,
-                        )
+                ############ Handle CustomLogger ###############################
+                #################################################################
+                await _callback.async_post_call_success_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    data=data,
+                    response=response,
+                )
             except Exception as e:
                 raise e
         return response
@@ -1224,10 +1197,13 @@ class ProxyLogging:
         if isinstance(response, (ModelResponse, ModelResponseStream)):
             response_str = litellm.get_response_string(response_obj=response)
         if response_str is not None:
-            for callback in litellm.callbacks:
+            for (
+                _callback
+            ) in litellm.logging_callback_manager.get_callbacks_for_hook(
+                "async_post_call_streaming_hook", resolve_string_callbacks=True
+            ):
                 try:
-                    _callback: Optional[CustomLogger] = None
-                    if isinstance(callback, CustomGuardrail):
+                    if isinstance(_callback, CustomGuardrail):
                         # Main - V2 Guardrails implementation
                         from litellm.types.guardrails import GuardrailEventHooks
 
@@ -1237,38 +1213,50 @@ class ProxyLogging:
                         )
 
                         if (
-                            callback.should_run_guardrail(
+                            _callback.should_run_guardrail(
                                 data=modified_data,
                                 event_type=GuardrailEventHooks.post_call,
                             )
                             is not True
                         ):
                             continue
-                    if isinstance(callback, str):
-                        _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                            callback
-                        )
+                    if str_so_far is not None:
+                        complete_response = str_so_far + response_str
                     else:
-                        _callback = callback  # type: ignore
-                    if _callback is not None and isinstance(_callback, CustomLogger):
-                        if str_so_far is not None:
-                            complete_response = str_so_far + response_str
-                        else:
-                            complete_response = response_str
-                        potential_error_response = (
-                            await _callback.async_post_call_streaming_hook(
-                                user_api_key_dict=user_api_key_dict,
-                                response=complete_response,
-                            )
+                        complete_response = response_str
+                    potential_error_response = (
+                        await _callback.async_post_call_streaming_hook(
+                            user_api_key_dict=user_api_key_dict,
+                            response=complete_response,
                         )
-                        if isinstance(
-                            potential_error_response, str
-                        ) and potential_error_response.startswith("data: "):
-                            return potential_error_response
+                    )
+                    if isinstance(
+                        potential_error_response, str
+                    ) and potential_error_response.startswith("data: "):
+                        return potential_error_response
                 except Exception as e:
                     raise e
         return response
 
+    def has_streaming_response_hooks(self) -> bool:
+        """
+        Returns True if any callback can modify outgoing streaming chunks.
+
+        If none can, cached streaming responses are sent as pre-serialized SSE frames.
+        """
+        return any(
+            len(
+                litellm.logging_callback_manager.get_callbacks_for_hook(
+                    hook_name, resolve_string_callbacks=True
+                )
+            )
+            > 0
+            for hook_name in (
+                "async_post_call_streaming_hook",
+                "async_post_call_streaming_iterator_hook",
+            )
+        )
+
     def async_post_call_streaming_iterator_hook(
         self,
         response,
@@ -1282,25 +1270,19 @@ class ProxyLogging:
         Covers:
         1. /chat/completions
         """
-        for callback in litellm.callbacks:
-            _callback: Optional[CustomLogger] = None
-            if isinstance(callback, str):
-                _callback = litellm.litellm_core_utils.litellm_logging.get_custom_logger_compatible_class(
-                    callback
+        for _callback in litellm.logging_callback_manager.get_callbacks_for_hook(
+            "async_post_call_streaming_iterator_hook", resolve_string_callbacks=True
+        ):
+            if not isinstance(
+                _callback, CustomGuardrail
+            ) or _callback.should_run_guardrail(
+                data=request_data, event_type=GuardrailEventHooks.post_call
+            ):
+                response = _callback.async_post_call_streaming_iterator_hook(
+                    user_api_key_dict=user_api_key_dict,
+                    response=response,
+                    request_data=request_data,
                 )
-            else:
-                _callback = callback  # type: ignore
-            if _callback is not None and isinstance(_callback, CustomLogger):
-                if not isinstance(
-                    _callback, CustomGuardrail
-                ) or _callback.should_run_guardrail(
-                    data=request_data, event_type=GuardrailEventHooks.post_call
-                ):
-                    response = _callback.async_post_call_streaming_iterator_hook(
-                        user_api_key_dict=user_api_key_dict,
-                        response=response,
-                        request_data=request_data,
-                    )
         return response
 
     def _init_response_taking_too_long_task(self, data: Optional[dict] = None):
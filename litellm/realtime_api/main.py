@@ -5,7 +5,6 @@ from typing import Any, Optional, cast
 import litellm
 from litellm import get_llm_provider
 from litellm.llms.base_llm.realtime.transformation import BaseRealtimeConfig
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from litellm.secret_managers.main import get_secret_str
 from litellm.types.router import GenericLiteLLMParams
 from litellm.types.utils import LlmProviders
@@ -13,14 +12,17 @@ from litellm.utils import ProviderConfigManager
 
 from ..litellm_core_utils.get_litellm_params import get_litellm_params
 from ..litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
-from ..llms.azure.realtime.handler import AzureOpenAIRealtime
-from ..llms.openai.realtime.handler import OpenAIRealtime
+from ..litellm_core_utils.lazy_loading import lazy_instance
 from litellm.types.realtime import RealtimeQueryParams
 from ..utils import client as wrapper_client
 
-azure_realtime = AzureOpenAIRealtime()
-openai_realtime = OpenAIRealtime()
-base_llm_http_handler = BaseLLMHTTPHandler()
+azure_realtime = lazy_instance("litellm.llms.azure.realtime.handler", "AzureOpenAIRealtime")
+openai_realtime = lazy_instance(
+    "litellm.llms.openai.realtime.handler", "OpenAIRealtime"
+)
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 
 
 @wrapper_client
@@ -5,11 +5,9 @@ from typing import Any, Coroutine, Dict, List, Literal, Optional, Union
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.llms.base_llm.rerank.transformation import BaseRerankConfig
-from litellm.llms.bedrock.rerank.handler import BedrockRerankHandler
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
-from litellm.llms.together_ai.rerank.handler import TogetherAIRerank
 from litellm.rerank_api.rerank_utils import get_optional_rerank_params
 from litellm.secret_managers.main import get_secret, get_secret_str
 from litellm.types.rerank import OptionalRerankParams, RerankResponse
@@ -18,9 +16,15 @@ from litellm.utils import ProviderConfigManager, client, exception_type
 
 ####### ENVIRONMENT VARIABLES ###################
 # Initialize any necessary instances or variables here
-together_rerank = TogetherAIRerank()
-bedrock_rerank = BedrockRerankHandler()
-base_llm_http_handler = BaseLLMHTTPHandler()
+together_rerank = lazy_instance(
+    "litellm.llms.together_ai.rerank.handler", "TogetherAIRerank"
+)
+bedrock_rerank = lazy_instance(
+    "litellm.llms.bedrock.rerank.handler", "BedrockRerankHandler"
+)
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 #################################################
 
 
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -8,7 +7,7 @@ import httpx
 from litellm.constants import STREAM_SSE_DONE_STRING
 from litellm.litellm_core_utils.asyncify import run_async_function
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.logging_worker import logging_dispatcher
 from litellm.llms.base_llm.responses.transformation import BaseResponsesAPIConfig
 from litellm.responses.utils import ResponsesAPIRequestUtils
 from litellm.types.llms.openai import (
@@ -161,7 +160,7 @@ class ResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
 
     def _handle_logging_completed_response(self):
         """Handle logging for completed responses in async context"""
-        asyncio.create_task(
+        logging_dispatcher.submit_coroutine(
             self.logging_obj.async_success_handler(
                 result=self.completed_response,
                 start_time=self.start_time,
@@ -170,7 +169,7 @@ class ResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
             )
         )
 
-        executor.submit(
+        logging_dispatcher.submit(
             self.logging_obj.success_handler,
             result=self.completed_response,
             cache_hit=None,
@@ -239,7 +238,7 @@ class SyncResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
             cache_hit=None,
         )
 
-        executor.submit(
+        logging_dispatcher.submit(
             self.logging_obj.success_handler,
             result=self.completed_response,
             cache_hit=None,
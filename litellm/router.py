@@ -52,6 +52,7 @@ from litellm.caching.caching import (
     RedisClusterCache,
 )
 from litellm.constants import DEFAULT_MAX_LRU_CACHE_SIZE
+from litellm.cost_calculator import compile_deployment_price_records
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.asyncify import run_async_function
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
@@ -114,6 +115,7 @@ from litellm.router_utils.router_callbacks.track_deployment_metrics import (
     increment_deployment_successes_for_current_minute,
 )
 from litellm.scheduler import FlowItem, Scheduler
+from litellm.secret_managers.main import get_secrets
 from litellm.types.llms.openai import (
     AllMessageValues,
     FileTypes,
@@ -156,7 +158,6 @@ from litellm.utils import (
     function_setup,
     get_llm_provider,
     get_non_default_completion_params,
-    get_secret,
     get_utc_datetime,
     is_region_allowed,
 )
@@ -408,9 +409,13 @@ class Router:
         self.pattern_router = PatternMatchRouter()
         self.auto_routers: Dict[str, "AutoRouter"] = {}
 
+        self.deployment_init_timings: Dict[str, Any] = {}
+        # model_id -> content hash of the litellm_params the deployment was added with
+        self._deployment_content_hashes: Dict[str, str] = {}
+        # (id, len) of `model_list` the hashes were recorded for - a list changed outside the router drops them
+        self._deployment_content_hashes_version: Tuple[int, int] = (0, 0)
         if model_list is not None:
-            model_list = copy.deepcopy(model_list)
-            self.set_model_list(model_list)
+            self.set_model_list(model_list)  # works on its own copy of model_list
             self.healthy_deployments: List = self.model_list  # type: ignore
             for m in model_list:
                 if "model" in m["litellm_params"]:
@@ -419,6 +424,8 @@ class Router:
             self.model_list: List = (
                 []
             )  # initialize an empty list - to allow _add_deployment and delete_deployment to work
+            self._deployment_content_hashes = {}
+            self._deployment_content_hashes_version = (id(self.model_list), 0)
 
         if allowed_fails is not None:
             self.allowed_fails = allowed_fails
@@ -1114,10 +1121,8 @@ class Router:
                 async for item in model_response:
                     yield item
             except MidStreamFallbackError as e:
-                from litellm.main import stream_chunk_builder
-
-                complete_response_object = stream_chunk_builder(
-                    chunks=model_response.chunks
+                complete_response_object = (
+                    model_response.chunk_accumulator.build_complete_streaming_response()
                 )
                 complete_response_object_usage = cast(
                     Optional[Usage],
@@ -4896,11 +4901,15 @@ class Router:
                 )
                 return None
 
+            content_hash = self._get_deployment_content_hash(deployment=deployment)
             deployment = self._add_deployment(deployment=deployment)
 
             model = deployment.to_json(exclude_none=True)
 
             self.model_list.append(model)
+            self._set_deployment_content_hash(
+                model_id=deployment.model_info.id, content_hash=content_hash
+            )
             return deployment
         except Exception as e:
             if self.ignore_invalid_deployments:
@@ -5008,11 +5017,30 @@ class Router:
             return True
         return False
 
+    def _resolve_model_list_secrets(self, model_list: list) -> Dict[str, Any]:
+        """
+        Resolve every distinct `os.environ/` value in the model list's litellm_params once, as one batch.
+        """
+        secret_names: List[str] = []
+        for model in model_list:
+            _litellm_params = model.get("litellm_params")
+            if isinstance(_litellm_params, dict):
+                for v in _litellm_params.values():
+                    if isinstance(v, str) and v.startswith("os.environ/"):
+                        secret_names.append(v)
+        return get_secrets(secret_names)
+
     def set_model_list(self, model_list: list):
+        start_time = time.perf_counter()
         original_model_list = copy.deepcopy(model_list)
         self.model_list = []
+        self._deployment_content_hashes = {}
+        self._deployment_content_hashes_version = (id(self.model_list), 0)
         # we add api_base/api_key each model so load balancing between azure/gpt on api_base1 and api_base2 works
 
+        secrets = self._resolve_model_list_secrets(model_list=original_model_list)
+        secrets_resolved_time = time.perf_counter()
+
         for model in original_model_list:
             _model_name = model.pop("model_name")
             _litellm_params = model.pop("litellm_params")
@@ -5020,7 +5048,7 @@ class Router:
             if isinstance(_litellm_params, dict):
                 for k, v in _litellm_params.items():
                     if isinstance(v, str) and v.startswith("os.environ/"):
-                        _litellm_params[k] = get_secret(v)
+                        _litellm_params[k] = secrets[v]
 
             _model_info: dict = model.pop("model_info", {})
 
@@ -5053,6 +5081,18 @@ class Router:
         )
         self.model_names = [m["model_name"] for m in model_list]
 
+        end_time = time.perf_counter()
+        self.deployment_init_timings = {
+            "num_deployments": len(self.model_list),
+            "num_secrets": len(secrets),
+            "secret_resolution_seconds": secrets_resolved_time - start_time,
+            "deployment_creation_seconds": end_time - secrets_resolved_time,
+            "total_seconds": end_time - start_time,
+        }
+        verbose_router_logger.debug(
+            f"Router deployment init timings: {self.deployment_init_timings}"
+        )
+
     def _add_deployment(self, deployment: Deployment) -> Deployment:
         import os
 
@@ -5137,8 +5177,34 @@ class Router:
         if self._is_auto_router_deployment(litellm_params=deployment.litellm_params):
             self.init_auto_router_deployment(deployment=deployment)
 
+        self._compile_deployment_price_records(
+            deployment=deployment, custom_llm_provider=custom_llm_provider
+        )
+
         return deployment
 
+    def _compile_deployment_price_records(
+        self, deployment: Deployment, custom_llm_provider: str
+    ) -> None:
+        """
+        Compile the price records used to calculate the cost of this deployment's responses, so it's not resolved per response.
+        """
+        try:
+            custom_pricing = any(
+                deployment.litellm_params.get(field) is not None
+                for field in CustomPricingLiteLLMParams.model_fields.keys()
+            )
+            compile_deployment_price_records(
+                model=deployment.litellm_params.model,
+                custom_llm_provider=custom_llm_provider,
+                model_id=deployment.model_info.id,
+                custom_pricing=custom_pricing,
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                f"Error compiling price records for deployment {deployment.model_name} - {str(e)}"
+            )
+
     def _initialize_deployment_for_pass_through(
         self, deployment: Deployment, custom_llm_provider: str, model: str
     ):
@@ -5213,6 +5279,9 @@ class Router:
         if deployment.model_info.id in self.get_model_ids():
             return None
 
+        self._get_deployment_content_hashes()  # drop hashes if model_list was changed outside the router
+        content_hash = self._get_deployment_content_hash(deployment=deployment)
+
         # add to model list
         _deployment = deployment.to_json(exclude_none=True)
         # initialize client
@@ -5221,8 +5290,48 @@ class Router:
         # add to model names
         self.model_list.append(_deployment)
         self.model_names.append(deployment.model_name)
+        self._set_deployment_content_hash(
+            model_id=deployment.model_info.id, content_hash=content_hash
+        )
         return deployment
 
+    @staticmethod
+    def _get_deployment_content_hash(deployment: Deployment) -> str:
+        """
+        Stable hash of the deployment's litellm_params - equal hashes mean `upsert_deployment` has nothing to update
+        """
+        return hashlib.sha256(
+            json.dumps(
+                deployment.litellm_params.model_dump(exclude_none=True),
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_deployment_content_hashes(self) -> Dict[str, str]:
+        # catches `model_list` being replaced / modified without the router's add / delete methods
+        model_list_version = (id(self.model_list), len(self.model_list))
+        if model_list_version != self._deployment_content_hashes_version:
+            self._deployment_content_hashes = {}
+            self._deployment_content_hashes_version = model_list_version
+        return self._deployment_content_hashes
+
+    def _set_deployment_content_hash(
+        self, model_id: Optional[str], content_hash: Optional[str]
+    ) -> None:
+        """
+        Record (or with `content_hash=None` forget) a deployment's hash after `model_list` was updated for it
+        """
+        if model_id is not None:
+            if content_hash is None:
+                self._deployment_content_hashes.pop(model_id, None)
+            else:
+                self._deployment_content_hashes[model_id] = content_hash
+        self._deployment_content_hashes_version = (
+            id(self.model_list),
+            len(self.model_list),
+        )
+
     def upsert_deployment(self, deployment: Deployment) -> Optional[Deployment]:
         """
         Add or update deployment
@@ -5236,6 +5345,13 @@ class Router:
             # check if deployment already exists
             _deployment_model_id = deployment.model_info.id or ""
 
+            content_hashes = self._get_deployment_content_hashes()
+            if content_hashes.get(
+                _deployment_model_id
+            ) == self._get_deployment_content_hash(deployment=deployment):
+                # same litellm params as the deployment on the router - no need to update
+                return None
+
             _deployment_on_router: Optional[Deployment] = self.get_deployment(
                 model_id=_deployment_model_id
             )
@@ -5254,6 +5370,9 @@ class Router:
 
                 if removal_idx is not None:
                     self.model_list.pop(removal_idx)
+                    self._set_deployment_content_hash(
+                        model_id=deployment.model_info.id, content_hash=None
+                    )
 
             # if the model_id is not in router
             self.add_deployment(deployment=deployment)
@@ -5267,6 +5386,66 @@ class Router:
             else:
                 raise e
 
+    def bulk_upsert_deployments(
+        self, deployments: List[Deployment]
+    ) -> List[Deployment]:
+        """
+        Add or update many deployments at once.
+
+        Deployments with the same litellm params as on the router are skipped (content hash check).
+        The changed ones are built first and swapped into `model_list` in one step - requests never
+        route against a partially applied set.
+
+        Returns:
+        - The added/updated deployments
+        """
+        content_hashes = self._get_deployment_content_hashes()
+        changed_deployments: List[Tuple[Deployment, str]] = []
+        for deployment in deployments:
+            content_hash = self._get_deployment_content_hash(deployment=deployment)
+            if content_hashes.get(deployment.model_info.id or "") != content_hash:
+                changed_deployments.append((deployment, content_hash))
+
+        if len(changed_deployments) == 0:
+            return []
+
+        changed_model_ids = {
+            deployment.model_info.id for deployment, _ in changed_deployments
+        }
+        new_model_list = [
+            model
+            for model in self.model_list
+            if model["model_info"]["id"] not in changed_model_ids
+        ]
+        model_names = set(self.model_names)
+        upserted_deployments: List[Deployment] = []
+        new_content_hashes: Dict[str, str] = {}
+        for deployment, content_hash in changed_deployments:
+            try:
+                self._add_deployment(deployment=deployment)
+            except Exception as e:
+                if self.ignore_invalid_deployments:
+                    verbose_router_logger.debug(
+                        f"Error upserting deployment: {e}, ignoring and continuing with other deployments."
+                    )
+                    continue
+                raise e
+            new_model_list.append(deployment.to_json(exclude_none=True))
+            if deployment.model_name not in model_names:
+                model_names.add(deployment.model_name)
+                self.model_names.append(deployment.model_name)
+            if deployment.model_info.id is not None:
+                new_content_hashes[deployment.model_info.id] = content_hash
+            upserted_deployments.append(deployment)
+
+        # in place - routing strategies hold a reference to model_list
+        self.model_list[:] = new_model_list
+        for model_id in changed_model_ids:
+            self._set_deployment_content_hash(
+                model_id=model_id, content_hash=new_content_hashes.get(model_id)
+            )
+        return upserted_deployments
+
     def delete_deployment(self, id: str) -> Optional[Deployment]:
         """
         Parameters:
@@ -5283,7 +5462,9 @@ class Router:
 
         try:
             if deployment_idx is not None:
+                self._get_deployment_content_hashes()  # drop hashes if model_list was changed outside the router
                 item = self.model_list.pop(deployment_idx)
+                self._set_deployment_content_hash(model_id=id, content_hash=None)
                 return item
             else:
                 return None
@@ -3,13 +3,15 @@ import base64
 import binascii
 import os
 import traceback
-from typing import Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Union
 
 import httpx
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.caching.caching import DualCache
+from litellm.constants import SECRET_RESOLUTION_MAX_WORKERS
 from litellm.llms.custom_httpx.http_handler import HTTPHandler
 from litellm.secret_managers.get_azure_ad_token_provider import (
     get_azure_ad_token_provider,
@@ -330,6 +332,32 @@ def get_secret(  # noqa: PLR0915
             raise e
 
 
+def get_secrets(secret_names: Iterable[str]) -> Dict[str, Any]:
+    """
+    `get_secret` for many secret names at once - each distinct name is resolved once.
+
+    With a secret manager (or oidc) configured the lookups are network calls - they run on a thread pool.
+    """
+    unique_secret_names = list(dict.fromkeys(secret_names))
+    if len(unique_secret_names) <= 1 or (
+        litellm._key_management_system is None
+        and not any(
+            secret_name.replace("os.environ/", "", 1).startswith("oidc/")
+            for secret_name in unique_secret_names
+        )
+    ):
+        return {
+            secret_name: get_secret(secret_name) for secret_name in unique_secret_names
+        }
+
+    with ThreadPoolExecutor(
+        max_workers=min(SECRET_RESOLUTION_MAX_WORKERS, len(unique_secret_names))
+    ) as executor:
+        return dict(
+            zip(unique_secret_names, executor.map(get_secret, unique_secret_names))
+        )
+
+
 def _should_read_secret_from_secret_manager() -> bool:
     """
     Returns True if the secret manager should be used to read the secret, False otherwise
@@ -62,10 +62,27 @@ DynamicCacheControl = TypedDict(
         "no-cache": Optional[bool],
         # Will not store the response in the cache.
         "no-store": Optional[bool],
+        # Delay (in seconds) between chunks when replaying a cached streaming response
+        "stream-chunk-delay": Optional[float],
     },
 )
 
 
+class CachedStreamChunkBoundaries(TypedDict, total=False):
+    """
+    Length of each streamed delta, stored next to a cached streaming response.
+
+    Used to replay cache hits with the chunk boundaries of the original stream.
+    """
+
+    content: List[int]
+    reasoning_content: List[int]
+
+
+# key the chunk boundaries are returned under, in the cached response dict
+CACHED_STREAM_CHUNK_BOUNDARIES_KEY = "litellm_stream_chunk_boundaries"
+
+
 class CachePingResponse(BaseModel):
     status: str
     cache_type: str
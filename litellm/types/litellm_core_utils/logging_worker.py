@@ -0,0 +1,19 @@
+from typing import Literal, TypedDict
+
+LoggingQueueFullPolicy = Literal["drop", "spill"]
+
+
+class LoggingDispatcherMetrics(TypedDict):
+    num_workers: int
+    max_queue_size: int
+    queue_full_policy: LoggingQueueFullPolicy
+    queue_depth: int
+    max_queue_depth: int
+    async_tasks_in_flight: int
+    submitted: int
+    completed: int
+    failed: int
+    dropped: int
+    spilled: int
+    avg_queue_latency_ms: float
+    max_queue_latency_ms: float
@@ -70,6 +70,7 @@ from litellm.constants import (
     FUNCTION_DEFINITION_TOKEN_COUNT,
     INITIAL_RETRY_DELAY,
     JITTER,
+    MAX_MODEL_COST_KEY_INDEX_SIZE,
     MAX_RETRY_DELAY,
     MAX_TOKEN_TRIMMING_ATTEMPTS,
     MINIMUM_PROMPT_CACHE_TOKEN_COUNT,
@@ -99,10 +100,18 @@ from litellm.litellm_core_utils.get_litellm_params import (
 from litellm.litellm_core_utils.get_llm_provider_logic import (
     _is_non_openai_azure_model,
     get_llm_provider,
+    invalidate_llm_provider_cache,
+)
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_model_cost_version,
+    update_model_cost,
 )
 from litellm.litellm_core_utils.get_supported_openai_params import (
     get_supported_openai_params,
 )
+from litellm.litellm_core_utils.llm_cost_calc.price_record import (
+    invalidate_price_records,
+)
 from litellm.litellm_core_utils.llm_request_utils import _ensure_extra_body_is_safe
 from litellm.litellm_core_utils.llm_response_utils.convert_dict_to_response import (
     LiteLLMResponseObjectHandler,
@@ -122,6 +131,21 @@ from litellm.litellm_core_utils.llm_response_utils.get_headers import (
 from litellm.litellm_core_utils.llm_response_utils.response_metadata import (
     ResponseMetadata,
 )
+from litellm.litellm_core_utils.optional_params_plan import (
+    get_optional_params_plan,
+    invalidate_optional_params_plans,
+)
+from litellm.litellm_core_utils.provider_config_registry import (
+    PROVIDER_ANTHROPIC_MESSAGES_CONFIGS,
+    PROVIDER_AUDIO_TRANSCRIPTION_CONFIGS,
+    PROVIDER_CHAT_CONFIGS,
+    PROVIDER_EMBEDDING_CONFIGS,
+    PROVIDER_RERANK_CONFIGS,
+    PROVIDER_RESPONSES_API_CONFIGS,
+    PROVIDER_TEXT_COMPLETION_CONFIGS,
+    get_config_from_table,
+    get_provider_config_instance,
+)
 from litellm.litellm_core_utils.redact_messages import (
     LiteLLMLoggingObject,
     redact_message_input_output_from_logging,
@@ -206,8 +230,10 @@ claude_json_str = json.dumps(json_data)
 import importlib.metadata
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
+    Container,
     Dict,
     Iterable,
     List,
@@ -222,6 +248,7 @@ from typing import (
 
 from openai import OpenAIError as OriginalError
 
+from litellm.litellm_core_utils.logging_worker import logging_dispatcher
 from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.litellm_core_utils.token_counter import token_counter as token_counter_new
 from litellm.llms.base_llm.anthropic_messages.transformation import (
@@ -545,8 +572,13 @@ def function_setup(  # noqa: PLR0915
             kwargs.pop("callbacks", None)
         )
         all_callbacks = get_dynamic_callbacks(dynamic_callbacks=dynamic_callbacks)
+        # skip re-syncing the callback lists if nothing changed since the last call
+        callback_lists_synced = (
+            dynamic_callbacks is None
+            and litellm.logging_callback_manager.callback_lists_synced()
+        )
 
-        if len(all_callbacks) > 0:
+        if len(all_callbacks) > 0 and not callback_lists_synced:
             for callback in all_callbacks:
                 # check if callback is a string - e.g. "lago", "openmeter"
                 if isinstance(callback, str):
@@ -588,7 +620,7 @@ def function_setup(  # noqa: PLR0915
             )
             set_callbacks(callback_list=callback_list, function_id=function_id)
         ## ASYNC CALLBACKS
-        if len(litellm.input_callback) > 0:
+        if len(litellm.input_callback) > 0 and not callback_lists_synced:
             removed_async_items = []
             for index, callback in enumerate(litellm.input_callback):  # type: ignore
                 if inspect.iscoroutinefunction(callback):
@@ -598,7 +630,7 @@ def function_setup(  # noqa: PLR0915
             # Pop the async items from input_callback in reverse order to avoid index issues
             for index in reversed(removed_async_items):
                 litellm.input_callback.pop(index)
-        if len(litellm.success_callback) > 0:
+        if len(litellm.success_callback) > 0 and not callback_lists_synced:
             removed_async_items = []
             for index, callback in enumerate(litellm.success_callback):  # type: ignore
                 if inspect.iscoroutinefunction(callback):
@@ -623,7 +655,7 @@ def function_setup(  # noqa: PLR0915
             for index in reversed(removed_async_items):
                 litellm.success_callback.pop(index)
 
-        if len(litellm.failure_callback) > 0:
+        if len(litellm.failure_callback) > 0 and not callback_lists_synced:
             removed_async_items = []
             for index, callback in enumerate(litellm.failure_callback):  # type: ignore
                 if inspect.iscoroutinefunction(callback):
@@ -640,6 +672,8 @@ def function_setup(  # noqa: PLR0915
             # Pop the async items from failure_callback in reverse order to avoid index issues
             for index in reversed(removed_async_items):
                 litellm.failure_callback.pop(index)
+        if not callback_lists_synced:
+            litellm.logging_callback_manager.mark_callback_lists_synced()
         ### DYNAMIC CALLBACKS ###
         dynamic_success_callbacks: Optional[
             List[Union[str, Callable, CustomLogger]]
@@ -834,7 +868,7 @@ async def _client_async_logging_helper(
             f"Async Wrapper: Completed Call, calling async_success_handler: {logging_obj.async_success_handler}"
         )
         # check if user does not want this to be logged
-        asyncio.create_task(
+        logging_dispatcher.submit_coroutine(
             logging_obj.async_success_handler(result, start_time, end_time)
         )
         logging_obj.handle_sync_success_callbacks_for_async_calls(
@@ -899,6 +933,12 @@ def client(original_function):  # noqa: PLR0915
 
         Use this instead of 'async_pre_call_hook' when you need to modify the request AFTER a deployment is selected, but BEFORE the request is sent.
         """
+        callbacks = litellm.logging_callback_manager.get_callbacks_for_hook(
+            "async_pre_call_deployment_hook"
+        )
+        if len(callbacks) == 0:
+            return kwargs
+
         try:
             typed_call_type = CallTypes(call_type)
         except ValueError:
@@ -906,13 +946,12 @@ def client(original_function):  # noqa: PLR0915
 
         modified_kwargs = kwargs.copy()
 
-        for callback in litellm.callbacks:
-            if isinstance(callback, CustomLogger):
-                result = await callback.async_pre_call_deployment_hook(
-                    modified_kwargs, typed_call_type
-                )
-                if result is not None:
-                    modified_kwargs = result
+        for callback in callbacks:
+            result = await callback.async_pre_call_deployment_hook(
+                modified_kwargs, typed_call_type
+            )
+            if result is not None:
+                modified_kwargs = result
 
         return modified_kwargs
 
@@ -922,18 +961,23 @@ def client(original_function):  # noqa: PLR0915
         """
         Allow modifying / reviewing the response just after it's received from the deployment.
         """
+        callbacks = litellm.logging_callback_manager.get_callbacks_for_hook(
+            "async_post_call_success_deployment_hook"
+        )
+        if len(callbacks) == 0:
+            return response
+
         try:
             typed_call_type = CallTypes(call_type)
         except ValueError:
             typed_call_type = None  # unknown call type
 
-        for callback in litellm.callbacks:
-            if isinstance(callback, CustomLogger):
-                result = await callback.async_post_call_success_deployment_hook(
-                    request_data, cast(LLMResponseTypes, response), typed_call_type
-                )
-                if result is not None:
-                    return result
+        for callback in callbacks:
+            result = await callback.async_post_call_success_deployment_hook(
+                request_data, cast(LLMResponseTypes, response), typed_call_type
+            )
+            if result is not None:
+                return result
 
         return response
 
@@ -1260,7 +1304,7 @@ def client(original_function):  # noqa: PLR0915
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object, remove `handle_success` once it's deprecated
             verbose_logger.info("Wrapper: Completed Call, calling success_handler")
-            executor.submit(
+            logging_dispatcher.submit(
                 logging_obj.success_handler,
                 result,
                 start_time,
@@ -1483,7 +1527,7 @@ def client(original_function):  # noqa: PLR0915
             )
 
             # LOG SUCCESS - handle streaming success logging in the _next_ object
-            asyncio.create_task(
+            logging_dispatcher.submit_coroutine(
                 _client_async_logging_helper(
                     logging_obj=logging_obj,
                     result=result,
@@ -2309,7 +2353,14 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
             model_cost_key = key
         ## override / add new keys to the existing model cost dictionary
         updated_dictionary = _update_dictionary(existing_model, value)
-        litellm.model_cost.setdefault(model_cost_key, {}).update(updated_dictionary)
+        update_model_cost(
+            model_cost_key=model_cost_key,
+            model_info=updated_dictionary,
+            fields={
+                k: updated_dictionary[k] for k, v in value.items() if v is not None
+            },
+        )
+        invalidate_price_records(model_cost_keys=(key, model_cost_key))
         verbose_logger.debug(
             f"added/updated model={model_cost_key} in litellm.model_cost: {model_cost_key}"
         )
@@ -2357,6 +2408,9 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         elif value.get("litellm_provider") == "novita":
             if key not in litellm.novita_models:
                 litellm.novita_models.append(key)
+    invalidate_llm_provider_cache()
+    invalidate_optional_params_plans()
+    invalidate_model_cost_key_index()
     return model_cost
 
 
@@ -2926,6 +2980,19 @@ def _remove_unsupported_params(
     return non_default_params
 
 
+# request args that are never sent to the provider as optional params
+_NON_OPTIONAL_PARAM_NAMES = frozenset(
+    [
+        "model",
+        "custom_llm_provider",
+        "api_version",
+        "drop_params",
+        "allowed_openai_params",
+        "additional_drop_params",
+    ]
+)
+
+
 class PreProcessNonDefaultParams:
     @staticmethod
     def base_pre_process_non_default_params(
@@ -2957,14 +3024,9 @@ class PreProcessNonDefaultParams:
             k: v
             for k, v in passed_params.items()
             if (
-                k != "model"
-                and k != "custom_llm_provider"
-                and k != "api_version"
-                and k != "drop_params"
-                and k != "allowed_openai_params"
-                and k != "additional_drop_params"
+                k in default_param_values
+                and k not in _NON_OPTIONAL_PARAM_NAMES
                 and k not in additional_endpoint_specific_params
-                and k in default_param_values
                 and v != default_param_values[k]
                 and _should_drop_param(
                     k=k, additional_drop_params=additional_drop_params
@@ -3022,13 +3084,9 @@ def pre_process_non_default_params(
         additional_endpoint_specific_params=["messages"],
     )
 
-    provider_config: Optional[BaseConfig] = None
-    if custom_llm_provider is not None and custom_llm_provider in [
-        provider.value for provider in LlmProviders
-    ]:
-        provider_config = ProviderConfigManager.get_provider_chat_config(
-            model=model, provider=LlmProviders(custom_llm_provider)
-        )
+    provider_config = get_optional_params_plan(
+        model=model, custom_llm_provider=custom_llm_provider
+    ).provider_config
 
     if "response_format" in non_default_params:
         if provider_config is not None:
@@ -3067,7 +3125,7 @@ def pre_process_non_default_params(
             optional_params=non_default_params,
             passed_params=passed_params,
             custom_llm_provider=custom_llm_provider,
-            openai_params=list(DEFAULT_CHAT_COMPLETION_PARAM_VALUES.keys()),
+            openai_params=DEFAULT_CHAT_COMPLETION_PARAM_VALUES,
             additional_drop_params=additional_drop_params,
         )
 
@@ -3242,29 +3300,29 @@ def get_optional_params(  # noqa: PLR0915
         non_default_params=non_default_params,
         custom_llm_provider=custom_llm_provider,
     )
-    provider_config: Optional[BaseConfig] = None
-    if custom_llm_provider is not None and custom_llm_provider in [
-        provider.value for provider in LlmProviders
-    ]:
-        provider_config = ProviderConfigManager.get_provider_chat_config(
-            model=model, provider=LlmProviders(custom_llm_provider)
-        )
+    optional_params_plan = get_optional_params_plan(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    provider_config: Optional[BaseConfig] = optional_params_plan.provider_config
 
-    def _check_valid_arg(supported_params: List[str]):
+    def _check_valid_arg(supported_params: AbstractSet[str]):
         """
         Check if the params passed to completion() are supported by the provider
 
         Args:
-            supported_params: List[str] - supported params from the litellm config
+            supported_params: AbstractSet[str] - supported params from the litellm config
         """
         verbose_logger.info(
-            f"\nLiteLLM completion() model= {model}; provider = {custom_llm_provider}"
+            "\nLiteLLM completion() model= %s; provider = %s",
+            model,
+            custom_llm_provider,
         )
         verbose_logger.debug(
-            f"\nLiteLLM: Params passed to completion() {passed_params}"
+            "\nLiteLLM: Params passed to completion() %s", passed_params
         )
         verbose_logger.debug(
-            f"\nLiteLLM: Non-Default params passed to completion() {non_default_params}"
+            "\nLiteLLM: Non-Default params passed to completion() %s",
+            non_default_params,
         )
         unsupported_params = {}
         for k in non_default_params.keys():
@@ -3293,25 +3351,20 @@ def get_optional_params(  # noqa: PLR0915
                     message=f"{custom_llm_provider} does not support parameters: {list(unsupported_params.keys())}, for model={model}. To drop these, set `litellm.drop_params=True` or for proxy:\n\n`litellm_settings:\n drop_params: true`\n. \n If you want to use these params dynamically send allowed_openai_params={list(unsupported_params.keys())} in your request.",
                 )
 
-    supported_params = get_supported_openai_params(
-        model=model, custom_llm_provider=custom_llm_provider
-    )
-    if supported_params is None:
-        supported_params = get_supported_openai_params(
-            model=model, custom_llm_provider="openai"
-        )
-
-    supported_params = supported_params or []
+    supported_params = optional_params_plan.supported_params
     allowed_openai_params = allowed_openai_params or []
-    supported_params.extend(allowed_openai_params)
+    if allowed_openai_params:
+        supported_params = supported_params.union(allowed_openai_params)
 
     _check_valid_arg(
-        supported_params=supported_params or [],
+        supported_params=supported_params,
     )
     ## raise exception if provider doesn't support passed in param
     if custom_llm_provider == "anthropic":
         ## check if unsupported param passed in
-        optional_params = litellm.AnthropicConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.AnthropicConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3322,7 +3375,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "anthropic_text":
-        optional_params = litellm.AnthropicTextConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.AnthropicTextConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3332,7 +3387,9 @@ def get_optional_params(  # noqa: PLR0915
                 else False
             ),
         )
-        optional_params = litellm.AnthropicTextConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.AnthropicTextConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3346,7 +3403,9 @@ def get_optional_params(  # noqa: PLR0915
     elif custom_llm_provider == "cohere":
         ## check if unsupported param passed in
         # handle cohere params
-        optional_params = litellm.CohereConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.CohereConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3358,7 +3417,9 @@ def get_optional_params(  # noqa: PLR0915
         )
     elif custom_llm_provider == "cohere_chat":
         # handle cohere params
-        optional_params = litellm.CohereChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.CohereChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3369,7 +3430,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "triton":
-        optional_params = litellm.TritonConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.TritonConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3377,7 +3440,9 @@ def get_optional_params(  # noqa: PLR0915
         )
 
     elif custom_llm_provider == "maritalk":
-        optional_params = litellm.MaritalkConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.MaritalkConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3388,7 +3453,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "replicate":
-        optional_params = litellm.ReplicateConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.ReplicateConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3399,7 +3466,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "predibase":
-        optional_params = litellm.PredibaseConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.PredibaseConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3410,7 +3479,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "huggingface":
-        optional_params = litellm.HuggingFaceChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.HuggingFaceChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3421,7 +3492,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "together_ai":
-        optional_params = litellm.TogetherAIConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.TogetherAIConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3439,7 +3512,9 @@ def get_optional_params(  # noqa: PLR0915
         or model in litellm.vertex_language_models
         or model in litellm.vertex_vision_models
     ):
-        optional_params = litellm.VertexGeminiConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.VertexGeminiConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3451,7 +3526,9 @@ def get_optional_params(  # noqa: PLR0915
         )
 
     elif custom_llm_provider == "gemini":
-        optional_params = litellm.GoogleAIStudioGeminiConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.GoogleAIStudioGeminiConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3464,7 +3541,9 @@ def get_optional_params(  # noqa: PLR0915
     elif custom_llm_provider == "vertex_ai_beta" or (
         custom_llm_provider == "vertex_ai" and "gemini" in model
     ):
-        optional_params = litellm.VertexGeminiConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.VertexGeminiConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3477,7 +3556,9 @@ def get_optional_params(  # noqa: PLR0915
     elif litellm.VertexAIAnthropicConfig.is_supported_model(
         model=model, custom_llm_provider=custom_llm_provider
     ):
-        optional_params = litellm.VertexAIAnthropicConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.VertexAIAnthropicConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3490,20 +3571,22 @@ def get_optional_params(  # noqa: PLR0915
     elif custom_llm_provider == "vertex_ai":
         if model in litellm.vertex_mistral_models:
             if "codestral" in model:
-                optional_params = (
-                    litellm.CodestralTextCompletionConfig().map_openai_params(
-                        model=model,
-                        non_default_params=non_default_params,
-                        optional_params=optional_params,
-                        drop_params=(
-                            drop_params
-                            if drop_params is not None and isinstance(drop_params, bool)
-                            else False
-                        ),
-                    )
+                optional_params = get_provider_config_instance(
+                    litellm.CodestralTextCompletionConfig
+                ).map_openai_params(
+                    model=model,
+                    non_default_params=non_default_params,
+                    optional_params=optional_params,
+                    drop_params=(
+                        drop_params
+                        if drop_params is not None and isinstance(drop_params, bool)
+                        else False
+                    ),
                 )
             else:
-                optional_params = litellm.MistralConfig().map_openai_params(
+                optional_params = get_provider_config_instance(
+                    litellm.MistralConfig
+                ).map_openai_params(
                     model=model,
                     non_default_params=non_default_params,
                     optional_params=optional_params,
@@ -3514,7 +3597,9 @@ def get_optional_params(  # noqa: PLR0915
                     ),
                 )
         elif model in litellm.vertex_ai_ai21_models:
-            optional_params = litellm.VertexAIAi21Config().map_openai_params(
+            optional_params = get_provider_config_instance(
+                litellm.VertexAIAi21Config
+            ).map_openai_params(
                 non_default_params=non_default_params,
                 optional_params=optional_params,
                 model=model,
@@ -3525,7 +3610,9 @@ def get_optional_params(  # noqa: PLR0915
                 ),
             )
         else:  # use generic openai-like param mapping
-            optional_params = litellm.VertexAILlama3Config().map_openai_params(
+            optional_params = get_provider_config_instance(
+                litellm.VertexAILlama3Config
+            ).map_openai_params(
                 non_default_params=non_default_params,
                 optional_params=optional_params,
                 model=model,
@@ -3538,7 +3625,9 @@ def get_optional_params(  # noqa: PLR0915
 
     elif custom_llm_provider == "sagemaker":
         # temperature, top_p, n, stream, stop, max_tokens, n, presence_penalty default to None
-        optional_params = litellm.SagemakerConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.SagemakerConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3552,7 +3641,9 @@ def get_optional_params(  # noqa: PLR0915
         bedrock_route = BedrockModelInfo.get_bedrock_route(model)
         bedrock_base_model = BedrockModelInfo.get_base_model(model)
         if bedrock_route == "converse" or bedrock_route == "converse_like":
-            optional_params = litellm.AmazonConverseConfig().map_openai_params(
+            optional_params = get_provider_config_instance(
+                litellm.AmazonConverseConfig
+            ).map_openai_params(
                 model=model,
                 non_default_params=non_default_params,
                 optional_params=optional_params,
@@ -3565,21 +3656,23 @@ def get_optional_params(  # noqa: PLR0915
 
         elif "anthropic" in bedrock_base_model and bedrock_route == "invoke":
             if bedrock_base_model.startswith("anthropic.claude-3"):
-                optional_params = (
-                    litellm.AmazonAnthropicClaude3Config().map_openai_params(
-                        non_default_params=non_default_params,
-                        optional_params=optional_params,
-                        model=model,
-                        drop_params=(
-                            drop_params
-                            if drop_params is not None and isinstance(drop_params, bool)
-                            else False
-                        ),
-                    )
+                optional_params = get_provider_config_instance(
+                    litellm.AmazonAnthropicClaude3Config
+                ).map_openai_params(
+                    non_default_params=non_default_params,
+                    optional_params=optional_params,
+                    model=model,
+                    drop_params=(
+                        drop_params
+                        if drop_params is not None and isinstance(drop_params, bool)
+                        else False
+                    ),
                 )
 
             else:
-                optional_params = litellm.AmazonAnthropicConfig().map_openai_params(
+                optional_params = get_provider_config_instance(
+                    litellm.AmazonAnthropicConfig
+                ).map_openai_params(
                     non_default_params=non_default_params,
                     optional_params=optional_params,
                     model=model,
@@ -3601,7 +3694,9 @@ def get_optional_params(  # noqa: PLR0915
                 ),
             )
     elif custom_llm_provider == "cloudflare":
-        optional_params = litellm.CloudflareChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.CloudflareChatConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3612,7 +3707,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "ollama":
-        optional_params = litellm.OllamaConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.OllamaConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3623,7 +3720,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "ollama_chat":
-        optional_params = litellm.OllamaChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.OllamaChatConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3634,7 +3733,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "nlp_cloud":
-        optional_params = litellm.NLPCloudConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.NLPCloudConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3646,7 +3747,9 @@ def get_optional_params(  # noqa: PLR0915
         )
 
     elif custom_llm_provider == "petals":
-        optional_params = litellm.PetalsConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.PetalsConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3657,7 +3760,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "deepinfra":
-        optional_params = litellm.DeepInfraConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.DeepInfraConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3679,7 +3784,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "mistral" or custom_llm_provider == "codestral":
-        optional_params = litellm.MistralConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.MistralConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3690,7 +3797,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "text-completion-codestral":
-        optional_params = litellm.CodestralTextCompletionConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.CodestralTextCompletionConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3702,7 +3811,9 @@ def get_optional_params(  # noqa: PLR0915
         )
 
     elif custom_llm_provider == "databricks":
-        optional_params = litellm.DatabricksConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.DatabricksConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3713,7 +3824,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "nvidia_nim":
-        optional_params = litellm.NvidiaNimConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.NvidiaNimConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
@@ -3724,7 +3837,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "cerebras":
-        optional_params = litellm.CerebrasConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.CerebrasConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3735,13 +3850,17 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "xai":
-        optional_params = litellm.XAIChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.XAIChatConfig
+        ).map_openai_params(
             model=model,
             non_default_params=non_default_params,
             optional_params=optional_params,
         )
     elif custom_llm_provider == "ai21_chat" or custom_llm_provider == "ai21":
-        optional_params = litellm.AI21ChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.AI21ChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3752,7 +3871,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "fireworks_ai":
-        optional_params = litellm.FireworksAIConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.FireworksAIConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3763,7 +3884,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "volcengine":
-        optional_params = litellm.VolcEngineConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.VolcEngineConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3774,7 +3897,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "hosted_vllm":
-        optional_params = litellm.HostedVLLMChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.HostedVLLMChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3785,7 +3910,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "vllm":
-        optional_params = litellm.VLLMConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.VLLMConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3796,7 +3923,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "groq":
-        optional_params = litellm.GroqChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.GroqChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3807,7 +3936,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "deepseek":
-        optional_params = litellm.OpenAIConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.OpenAIConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3818,7 +3949,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "openrouter":
-        optional_params = litellm.OpenrouterConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.OpenrouterConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3830,7 +3963,9 @@ def get_optional_params(  # noqa: PLR0915
         )
 
     elif custom_llm_provider == "watsonx":
-        optional_params = litellm.IBMWatsonXChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.IBMWatsonXChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3842,12 +3977,16 @@ def get_optional_params(  # noqa: PLR0915
         )
         # WatsonX-text param check
         for param in passed_params.keys():
-            if litellm.IBMWatsonXAIConfig().is_watsonx_text_param(param):
+            if get_provider_config_instance(
+                litellm.IBMWatsonXAIConfig
+            ).is_watsonx_text_param(param):
                 raise ValueError(
                     f"LiteLLM now defaults to Watsonx's `/text/chat` endpoint. Please use the `watsonx_text` provider instead, to call the `/text/generation` endpoint. Param: {param}"
                 )
     elif custom_llm_provider == "watsonx_text":
-        optional_params = litellm.IBMWatsonXAIConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.IBMWatsonXAIConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3858,7 +3997,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "openai":
-        optional_params = litellm.OpenAIConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.OpenAIConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3869,7 +4010,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "nebius":
-        optional_params = litellm.NebiusConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.NebiusConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3880,8 +4023,12 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     elif custom_llm_provider == "azure":
-        if litellm.AzureOpenAIO1Config().is_o_series_model(model=model):
-            optional_params = litellm.AzureOpenAIO1Config().map_openai_params(
+        if get_provider_config_instance(litellm.AzureOpenAIO1Config).is_o_series_model(
+            model=model
+        ):
+            optional_params = get_provider_config_instance(
+                litellm.AzureOpenAIO1Config
+            ).map_openai_params(
                 non_default_params=non_default_params,
                 optional_params=optional_params,
                 model=model,
@@ -3903,7 +4050,9 @@ def get_optional_params(  # noqa: PLR0915
                 or get_secret("AZURE_API_VERSION")
                 or litellm.AZURE_DEFAULT_API_VERSION
             )
-            optional_params = litellm.AzureOpenAIConfig().map_openai_params(
+            optional_params = get_provider_config_instance(
+                litellm.AzureOpenAIConfig
+            ).map_openai_params(
                 non_default_params=non_default_params,
                 optional_params=optional_params,
                 model=model,
@@ -3926,7 +4075,9 @@ def get_optional_params(  # noqa: PLR0915
             ),
         )
     else:  # assume passing in params for openai-like api
-        optional_params = litellm.OpenAILikeChatConfig().map_openai_params(
+        optional_params = get_provider_config_instance(
+            litellm.OpenAILikeChatConfig
+        ).map_openai_params(
             non_default_params=non_default_params,
             optional_params=optional_params,
             model=model,
@@ -3941,7 +4092,7 @@ def get_optional_params(  # noqa: PLR0915
         optional_params=optional_params,
         passed_params=passed_params,
         custom_llm_provider=custom_llm_provider,
-        openai_params=list(DEFAULT_CHAT_COMPLETION_PARAM_VALUES.keys()),
+        openai_params=DEFAULT_CHAT_COMPLETION_PARAM_VALUES,
         additional_drop_params=additional_drop_params,
     )
     print_verbose(f"Final returned optional params: {optional_params}")
@@ -3957,7 +4108,7 @@ def add_provider_specific_params_to_optional_params(
     optional_params: dict,
     passed_params: dict,
     custom_llm_provider: str,
-    openai_params: List[str],
+    openai_params: Container[str],
     additional_drop_params: Optional[list] = None,
 ) -> dict:
     """
@@ -4595,13 +4746,92 @@ def _is_potential_model_name_in_model_cost(
     )
 
 
+# (model, custom_llm_provider) -> (key in litellm.model_cost or None if not mapped, resolved custom_llm_provider)
+_model_cost_key_index: Dict[Tuple[str, Optional[str]], Tuple[Optional[str], str]] = {}
+_model_cost_key_index_version: Optional[Tuple[int, int]] = None
+
+
+def invalidate_model_cost_key_index() -> None:
+    _model_cost_key_index.clear()
+
+
+def _get_indexed_model_cost_key(
+    cache_key: Tuple[str, Optional[str]],
+) -> Optional[Tuple[Optional[str], str]]:
+    """
+    Returns the indexed model cost key for `cache_key`, None if it isn't indexed yet.
+
+    The index is cleared by `register_model`, and whenever `litellm.model_cost` is replaced or grows.
+    """
+    global _model_cost_key_index_version
+    model_cost_version = get_model_cost_version()
+    if model_cost_version != _model_cost_key_index_version:
+        _model_cost_key_index.clear()
+        _model_cost_key_index_version = model_cost_version
+        return None
+    return _model_cost_key_index.get(cache_key)
+
+
+def _set_indexed_model_cost_key(
+    cache_key: Tuple[str, Optional[str]],
+    key: Optional[str],
+    custom_llm_provider: str,
+) -> None:
+    if len(_model_cost_key_index) >= MAX_MODEL_COST_KEY_INDEX_SIZE:
+        _model_cost_key_index.clear()
+    _model_cost_key_index[cache_key] = (key, custom_llm_provider)
+
+
+def _get_model_cost_key(
+    model: str,
+    potential_model_names: PotentialModelNamesAndCustomLLMProvider,
+) -> Optional[str]:
+    """
+    Check if: (in order of specificity)
+    1. 'custom_llm_provider/model' in litellm.model_cost. Checks "groq/llama3-8b-8192" if model="llama3-8b-8192" and custom_llm_provider="groq"
+    2. 'model' in litellm.model_cost. Checks "gemini-1.5-pro-002" in  litellm.model_cost if model="gemini-1.5-pro-002" and custom_llm_provider=None
+    3. 'combined_stripped_model_name' in litellm.model_cost. Checks if 'gemini/gemini-1.5-flash' in model map, if 'gemini/gemini-1.5-flash-001' given.
+    4. 'stripped_model_name' in litellm.model_cost. Checks if 'ft:gpt-3.5-turbo' in model map, if 'ft:gpt-3.5-turbo:my-org:custom_suffix:id' given.
+    5. 'split_model' in litellm.model_cost. Checks "llama3-8b-8192" in litellm.model_cost if model="groq/llama3-8b-8192"
+
+    Returns None if the model isn't mapped.
+    """
+    custom_llm_provider = potential_model_names["custom_llm_provider"]
+    for potential_key in (
+        potential_model_names["combined_model_name"],
+        model,
+        potential_model_names["combined_stripped_model_name"],
+        potential_model_names["stripped_model_name"],
+        potential_model_names["split_model"],
+    ):
+        _model_info = litellm.model_cost.get(potential_key)
+        if _model_info is not None and _check_provider_match(
+            model_info=_model_info, custom_llm_provider=custom_llm_provider
+        ):
+            return potential_key
+    return None
+
+
 def _get_model_info_helper(  # noqa: PLR0915
     model: str, custom_llm_provider: Optional[str] = None
 ) -> ModelInfoBase:
     """
     Helper for 'get_model_info'. Separated out to avoid infinite loop caused by returning 'supported_openai_param's
+
+    The `litellm.model_cost` key a model resolves to (or that it isn't mapped) is indexed, so repeated lookups are a single dict probe.
     """
     try:
+        cache_key = (model, custom_llm_provider)
+        indexed_model_cost_key = _get_indexed_model_cost_key(cache_key)
+        if indexed_model_cost_key is not None:
+            key, custom_llm_provider = indexed_model_cost_key
+            if key is None:
+                raise ValueError(
+                    "This model isn't mapped yet. Add it here - https://github.com/BerriAI/litellm/blob/main/model_prices_and_context_window.json"
+                )
+            return _build_model_info_from_model_cost(
+                model=model, key=key, custom_llm_provider=custom_llm_provider
+            )
         azure_llms = {**litellm.azure_llms, **litellm.azure_embedding_models}
         if model in azure_llms:
             model = azure_llms[model]
@@ -4623,12 +4853,6 @@ def _get_model_info_helper(  # noqa: PLR0915
             f"checking potential_model_names in litellm.model_cost: {potential_model_names}"
         )
 
-        combined_model_name = potential_model_names["combined_model_name"]
-        stripped_model_name = potential_model_names["stripped_model_name"]
-        combined_stripped_model_name = potential_model_names[
-            "combined_stripped_model_name"
-        ]
-        split_model = potential_model_names["split_model"]
         custom_llm_provider = potential_model_names["custom_llm_provider"]
         #########################
         if custom_llm_provider == "huggingface":
@@ -4656,182 +4880,20 @@ def _get_model_info_helper(  # noqa: PLR0915
         ) and not _is_potential_model_name_in_model_cost(potential_model_names):
             return litellm.OllamaConfig().get_model_info(model)
         else:
-            """
-            Check if: (in order of specificity)
-            1. 'custom_llm_provider/model' in litellm.model_cost. Checks "groq/llama3-8b-8192" if model="llama3-8b-8192" and custom_llm_provider="groq"
-            2. 'model' in litellm.model_cost. Checks "gemini-1.5-pro-002" in  litellm.model_cost if model="gemini-1.5-pro-002" and custom_llm_provider=None
-            3. 'combined_stripped_model_name' in litellm.model_cost. Checks if 'gemini/gemini-1.5-flash' in model map, if 'gemini/gemini-1.5-flash-001' given.
-            4. 'stripped_model_name' in litellm.model_cost. Checks if 'ft:gpt-3.5-turbo' in model map, if 'ft:gpt-3.5-turbo:my-org:custom_suffix:id' given.
-            5. 'split_model' in litellm.model_cost. Checks "llama3-8b-8192" in litellm.model_cost if model="groq/llama3-8b-8192"
-            """
-
-            _model_info: Optional[Dict[str, Any]] = None
-            key: Optional[str] = None
-
-            if combined_model_name in litellm.model_cost:
-                key = combined_model_name
-                _model_info = _get_model_info_from_model_cost(key=cast(str, key))
-                if not _check_provider_match(
-                    model_info=_model_info, custom_llm_provider=custom_llm_provider
-                ):
-                    _model_info = None
-            if _model_info is None and model in litellm.model_cost:
-                key = model
-                _model_info = _get_model_info_from_model_cost(key=cast(str, key))
-                if not _check_provider_match(
-                    model_info=_model_info, custom_llm_provider=custom_llm_provider
-                ):
-                    _model_info = None
-            if (
-                _model_info is None
-                and combined_stripped_model_name in litellm.model_cost
-            ):
-                key = combined_stripped_model_name
-                _model_info = _get_model_info_from_model_cost(key=cast(str, key))
-                if not _check_provider_match(
-                    model_info=_model_info, custom_llm_provider=custom_llm_provider
-                ):
-                    _model_info = None
-            if _model_info is None and stripped_model_name in litellm.model_cost:
-                key = stripped_model_name
-                _model_info = _get_model_info_from_model_cost(key=cast(str, key))
-                if not _check_provider_match(
-                    model_info=_model_info, custom_llm_provider=custom_llm_provider
-                ):
-                    _model_info = None
-            if _model_info is None and split_model in litellm.model_cost:
-                key = split_model
-                _model_info = _get_model_info_from_model_cost(key=cast(str, key))
-                if not _check_provider_match(
-                    model_info=_model_info, custom_llm_provider=custom_llm_provider
-                ):
-                    _model_info = None
-
-            if _model_info is None or key is None:
-                raise ValueError(
-                    "This model isn't mapped yet. Add it here - https://github.com/BerriAI/litellm/blob/main/model_prices_and_context_window.json"
-                )
-
-            _input_cost_per_token: Optional[float] = _model_info.get(
-                "input_cost_per_token"
+            key = _get_model_cost_key(
+                model=model, potential_model_names=potential_model_names
             )
-            if _input_cost_per_token is None:
-                # default value to 0, be noisy about this
-                verbose_logger.debug(
-                    "model={}, custom_llm_provider={} has no input_cost_per_token in model_cost_map. Defaulting to 0.".format(
-                        model, custom_llm_provider
-                    )
-                )
-                _input_cost_per_token = 0
-
-            _output_cost_per_token: Optional[float] = _model_info.get(
-                "output_cost_per_token"
+            _set_indexed_model_cost_key(
+                cache_key=cache_key,
+                key=key,
+                custom_llm_provider=custom_llm_provider,
             )
-            if _output_cost_per_token is None:
-                # default value to 0, be noisy about this
-                verbose_logger.debug(
-                    "model={}, custom_llm_provider={} has no output_cost_per_token in model_cost_map. Defaulting to 0.".format(
-                        model, custom_llm_provider
-                    )
+            if key is None:
+                raise ValueError(
+                    "This model isn't mapped yet. Add it here - https://github.com/BerriAI/litellm/blob/main/model_prices_and_context_window.json"
                 )
-                _output_cost_per_token = 0
-
-            return ModelInfoBase(
-                key=key,
-                max_tokens=_model_info.get("max_tokens", None),
-                max_input_tokens=_model_info.get("max_input_tokens", None),
-                max_output_tokens=_model_info.get("max_output_tokens", None),
-                input_cost_per_token=_input_cost_per_token,
-                cache_creation_input_token_cost=_model_info.get(
-                    "cache_creation_input_token_cost", None
-                ),
-                cache_read_input_token_cost=_model_info.get(
-                    "cache_read_input_token_cost", None
-                ),
-                input_cost_per_character=_model_info.get(
-                    "input_cost_per_character", None
-                ),
-                input_cost_per_token_above_128k_tokens=_model_info.get(
-                    "input_cost_per_token_above_128k_tokens", None
-                ),
-                input_cost_per_token_above_200k_tokens=_model_info.get(
-                    "input_cost_per_token_above_200k_tokens", None
-                ),
-                input_cost_per_query=_model_info.get("input_cost_per_query", None),
-                input_cost_per_second=_model_info.get("input_cost_per_second", None),
-                input_cost_per_audio_token=_model_info.get(
-                    "input_cost_per_audio_token", None
-                ),
-                input_cost_per_token_batches=_model_info.get(
-                    "input_cost_per_token_batches"
-                ),
-                output_cost_per_token_batches=_model_info.get(
-                    "output_cost_per_token_batches"
-                ),
-                output_cost_per_token=_output_cost_per_token,
-                output_cost_per_audio_token=_model_info.get(
-                    "output_cost_per_audio_token", None
-                ),
-                output_cost_per_character=_model_info.get(
-                    "output_cost_per_character", None
-                ),
-                output_cost_per_reasoning_token=_model_info.get(
-                    "output_cost_per_reasoning_token", None
-                ),
-                output_cost_per_token_above_128k_tokens=_model_info.get(
-                    "output_cost_per_token_above_128k_tokens", None
-                ),
-                output_cost_per_character_above_128k_tokens=_model_info.get(
-                    "output_cost_per_character_above_128k_tokens", None
-                ),
-                output_cost_per_token_above_200k_tokens=_model_info.get(
-                    "output_cost_per_token_above_200k_tokens", None
-                ),
-                output_cost_per_second=_model_info.get("output_cost_per_second", None),
-                output_cost_per_image=_model_info.get("output_cost_per_image", None),
-                output_vector_size=_model_info.get("output_vector_size", None),
-                citation_cost_per_token=_model_info.get(
-                    "citation_cost_per_token", None
-                ),
-                litellm_provider=_model_info.get(
-                    "litellm_provider", custom_llm_provider
-                ),
-                mode=_model_info.get("mode"),  # type: ignore
-                supports_system_messages=_model_info.get(
-                    "supports_system_messages", None
-                ),
-                supports_response_schema=_model_info.get(
-                    "supports_response_schema", None
-                ),
-                supports_vision=_model_info.get("supports_vision", None),
-                supports_function_calling=_model_info.get(
-                    "supports_function_calling", None
-                ),
-                supports_tool_choice=_model_info.get("supports_tool_choice", None),
-                supports_assistant_prefill=_model_info.get(
-                    "supports_assistant_prefill", None
-                ),
-                supports_prompt_caching=_model_info.get(
-                    "supports_prompt_caching", None
-                ),
-                supports_audio_input=_model_info.get("supports_audio_input", None),
-                supports_audio_output=_model_info.get("supports_audio_output", None),
-                supports_pdf_input=_model_info.get("supports_pdf_input", None),
-                supports_embedding_image_input=_model_info.get(
-                    "supports_embedding_image_input", None
-                ),
-                supports_native_streaming=_model_info.get(
-                    "supports_native_streaming", None
-                ),
-                supports_web_search=_model_info.get("supports_web_search", None),
-                supports_url_context=_model_info.get("supports_url_context", None),
-                supports_reasoning=_model_info.get("supports_reasoning", None),
-                supports_computer_use=_model_info.get("supports_computer_use", None),
-                search_context_cost_per_query=_model_info.get(
-                    "search_context_cost_per_query", None
-                ),
-                tpm=_model_info.get("tpm", None),
-                rpm=_model_info.get("rpm", None),
+            return _build_model_info_from_model_cost(
+                model=model, key=key, custom_llm_provider=custom_llm_provider
             )
     except Exception as e:
         verbose_logger.debug(f"Error getting model info: {e}")
@@ -4844,6 +4906,103 @@ def _get_model_info_helper(  # noqa: PLR0915
         )
 
 
+def _build_model_info_from_model_cost(
+    model: str, key: str, custom_llm_provider: str
+) -> ModelInfoBase:
+    _model_info = _get_model_info_from_model_cost(key=key)
+    _input_cost_per_token: Optional[float] = _model_info.get("input_cost_per_token")
+    if _input_cost_per_token is None:
+        # default value to 0, be noisy about this
+        verbose_logger.debug(
+            "model={}, custom_llm_provider={} has no input_cost_per_token in model_cost_map. Defaulting to 0.".format(
+                model, custom_llm_provider
+            )
+        )
+        _input_cost_per_token = 0
+
+    _output_cost_per_token: Optional[float] = _model_info.get("output_cost_per_token")
+    if _output_cost_per_token is None:
+        # default value to 0, be noisy about this
+        verbose_logger.debug(
+            "model={}, custom_llm_provider={} has no output_cost_per_token in model_cost_map. Defaulting to 0.".format(
+                model, custom_llm_provider
+            )
+        )
+        _output_cost_per_token = 0
+
+    return ModelInfoBase(
+        key=key,
+        max_tokens=_model_info.get("max_tokens", None),
+        max_input_tokens=_model_info.get("max_input_tokens", None),
+        max_output_tokens=_model_info.get("max_output_tokens", None),
+        input_cost_per_token=_input_cost_per_token,
+        cache_creation_input_token_cost=_model_info.get(
+            "cache_creation_input_token_cost", None
+        ),
+        cache_read_input_token_cost=_model_info.get(
+            "cache_read_input_token_cost", None
+        ),
+        input_cost_per_character=_model_info.get("input_cost_per_character", None),
+        input_cost_per_token_above_128k_tokens=_model_info.get(
+            "input_cost_per_token_above_128k_tokens", None
+        ),
+        input_cost_per_token_above_200k_tokens=_model_info.get(
+            "input_cost_per_token_above_200k_tokens", None
+        ),
+        input_cost_per_query=_model_info.get("input_cost_per_query", None),
+        input_cost_per_second=_model_info.get("input_cost_per_second", None),
+        input_cost_per_audio_token=_model_info.get("input_cost_per_audio_token", None),
+        input_cost_per_token_batches=_model_info.get("input_cost_per_token_batches"),
+        output_cost_per_token_batches=_model_info.get("output_cost_per_token_batches"),
+        output_cost_per_token=_output_cost_per_token,
+        output_cost_per_audio_token=_model_info.get(
+            "output_cost_per_audio_token", None
+        ),
+        output_cost_per_character=_model_info.get("output_cost_per_character", None),
+        output_cost_per_reasoning_token=_model_info.get(
+            "output_cost_per_reasoning_token", None
+        ),
+        output_cost_per_token_above_128k_tokens=_model_info.get(
+            "output_cost_per_token_above_128k_tokens", None
+        ),
+        output_cost_per_character_above_128k_tokens=_model_info.get(
+            "output_cost_per_character_above_128k_tokens", None
+        ),
+        output_cost_per_token_above_200k_tokens=_model_info.get(
+            "output_cost_per_token_above_200k_tokens", None
+        ),
+        output_cost_per_second=_model_info.get("output_cost_per_second", None),
+        output_cost_per_image=_model_info.get("output_cost_per_image", None),
+        output_vector_size=_model_info.get("output_vector_size", None),
+        citation_cost_per_token=_model_info.get("citation_cost_per_token", None),
+        litellm_provider=_model_info.get("litellm_provider", custom_llm_provider),
+        mode=_model_info.get("mode"),  # type: ignore
+        supports_system_messages=_model_info.get("supports_system_messages", None),
+        supports_response_schema=_model_info.get("supports_response_schema", None),
+        supports_vision=_model_info.get("supports_vision", None),
+        supports_function_calling=_model_info.get("supports_function_calling", None),
+        supports_tool_choice=_model_info.get("supports_tool_choice", None),
+        supports_assistant_prefill=_model_info.get("supports_assistant_prefill", None),
+        supports_prompt_caching=_model_info.get("supports_prompt_caching", None),
+        supports_audio_input=_model_info.get("supports_audio_input", None),
+        supports_audio_output=_model_info.get("supports_audio_output", None),
+        supports_pdf_input=_model_info.get("supports_pdf_input", None),
+        supports_embedding_image_input=_model_info.get(
+            "supports_embedding_image_input", None
+        ),
+        supports_native_streaming=_model_info.get("supports_native_streaming", None),
+        supports_web_search=_model_info.get("supports_web_search", None),
+        supports_url_context=_model_info.get("supports_url_context", None),
+        supports_reasoning=_model_info.get("supports_reasoning", None),
+        supports_computer_use=_model_info.get("supports_computer_use", None),
+        search_context_cost_per_query=_model_info.get(
+            "search_context_cost_per_query", None
+        ),
+        tpm=_model_info.get("tpm", None),
+        rpm=_model_info.get("rpm", None),
+    )
+
+
 def get_model_info(model: str, custom_llm_provider: Optional[str] = None) -> ModelInfo:
     """
     Get a dict for the maximum tokens (context window), input_cost_per_token, output_cost_per_token  for a given model.
@@ -6694,257 +6853,24 @@ def validate_chat_completion_tool_choice(
 
 class ProviderConfigManager:
     @staticmethod
-    def get_provider_chat_config(  # noqa: PLR0915
+    def get_provider_chat_config(
         model: str, provider: LlmProviders
     ) -> Optional[BaseConfig]:
         """
         Returns the provider config for a given provider.
         """
-
-        if (
-            provider == LlmProviders.OPENAI
-            and litellm.openaiOSeriesConfig.is_model_o_series_model(model=model)
-        ):
-            return litellm.openaiOSeriesConfig
-        elif litellm.LlmProviders.DEEPSEEK == provider:
-            return litellm.DeepSeekChatConfig()
-        elif litellm.LlmProviders.GROQ == provider:
-            return litellm.GroqChatConfig()
-        elif litellm.LlmProviders.BYTEZ == provider:
-            return litellm.BytezChatConfig()
-        elif litellm.LlmProviders.DATABRICKS == provider:
-            return litellm.DatabricksConfig()
-        elif litellm.LlmProviders.XAI == provider:
-            return litellm.XAIChatConfig()
-        elif litellm.LlmProviders.LAMBDA_AI == provider:
-            return litellm.LambdaAIChatConfig()
-        elif litellm.LlmProviders.LLAMA == provider:
-            return litellm.LlamaAPIConfig()
-        elif litellm.LlmProviders.TEXT_COMPLETION_OPENAI == provider:
-            return litellm.OpenAITextCompletionConfig()
-        elif litellm.LlmProviders.COHERE_CHAT == provider:
-            return litellm.CohereChatConfig()
-        elif litellm.LlmProviders.COHERE == provider:
-            return litellm.CohereConfig()
-        elif litellm.LlmProviders.SNOWFLAKE == provider:
-            return litellm.SnowflakeConfig()
-        elif litellm.LlmProviders.CLARIFAI == provider:
-            return litellm.ClarifaiConfig()
-        elif litellm.LlmProviders.ANTHROPIC == provider:
-            return litellm.AnthropicConfig()
-        elif litellm.LlmProviders.ANTHROPIC_TEXT == provider:
-            return litellm.AnthropicTextConfig()
-        elif litellm.LlmProviders.VERTEX_AI_BETA == provider:
-            return litellm.VertexGeminiConfig()
-        elif litellm.LlmProviders.VERTEX_AI == provider:
-            if "gemini" in model:
-                return litellm.VertexGeminiConfig()
-            elif "claude" in model:
-                return litellm.VertexAIAnthropicConfig()
-            elif model in litellm.vertex_mistral_models:
-                if "codestral" in model:
-                    return litellm.CodestralTextCompletionConfig()
-                else:
-                    return litellm.MistralConfig()
-            elif model in litellm.vertex_ai_ai21_models:
-                return litellm.VertexAIAi21Config()
-            else:  # use generic openai-like param mapping
-                return litellm.VertexAILlama3Config()
-        elif litellm.LlmProviders.CLOUDFLARE == provider:
-            return litellm.CloudflareChatConfig()
-        elif litellm.LlmProviders.SAGEMAKER_CHAT == provider:
-            return litellm.SagemakerChatConfig()
-        elif litellm.LlmProviders.SAGEMAKER == provider:
-            return litellm.SagemakerConfig()
-        elif litellm.LlmProviders.FIREWORKS_AI == provider:
-            return litellm.FireworksAIConfig()
-        elif litellm.LlmProviders.FRIENDLIAI == provider:
-            return litellm.FriendliaiChatConfig()
-        elif litellm.LlmProviders.WATSONX == provider:
-            return litellm.IBMWatsonXChatConfig()
-        elif litellm.LlmProviders.WATSONX_TEXT == provider:
-            return litellm.IBMWatsonXAIConfig()
-        elif litellm.LlmProviders.EMPOWER == provider:
-            return litellm.EmpowerChatConfig()
-        elif litellm.LlmProviders.GITHUB == provider:
-            return litellm.GithubChatConfig()
-        elif litellm.LlmProviders.GITHUB_COPILOT == provider:
-            return litellm.GithubCopilotConfig()
-        elif (
-            litellm.LlmProviders.CUSTOM == provider
-            or litellm.LlmProviders.CUSTOM_OPENAI == provider
-            or litellm.LlmProviders.OPENAI_LIKE == provider
-        ):
-            return litellm.OpenAILikeChatConfig()
-        elif litellm.LlmProviders.AIOHTTP_OPENAI == provider:
-            return litellm.AiohttpOpenAIChatConfig()
-        elif litellm.LlmProviders.HOSTED_VLLM == provider:
-            return litellm.HostedVLLMChatConfig()
-        elif litellm.LlmProviders.LLAMAFILE == provider:
-            return litellm.LlamafileChatConfig()
-        elif litellm.LlmProviders.LM_STUDIO == provider:
-            return litellm.LMStudioChatConfig()
-        elif litellm.LlmProviders.GALADRIEL == provider:
-            return litellm.GaladrielChatConfig()
-        elif litellm.LlmProviders.REPLICATE == provider:
-            return litellm.ReplicateConfig()
-        elif litellm.LlmProviders.HUGGINGFACE == provider:
-            return litellm.HuggingFaceChatConfig()
-        elif litellm.LlmProviders.TOGETHER_AI == provider:
-            return litellm.TogetherAIConfig()
-        elif litellm.LlmProviders.OPENROUTER == provider:
-            return litellm.OpenrouterConfig()
-        elif litellm.LlmProviders.DATAROBOT == provider:
-            return litellm.DataRobotConfig()
-        elif litellm.LlmProviders.GEMINI == provider:
-            return litellm.GoogleAIStudioGeminiConfig()
-        elif (
-            litellm.LlmProviders.AI21 == provider
-            or litellm.LlmProviders.AI21_CHAT == provider
-        ):
-            return litellm.AI21ChatConfig()
-        elif litellm.LlmProviders.AZURE == provider:
-            if litellm.AzureOpenAIO1Config().is_o_series_model(model=model):
-                return litellm.AzureOpenAIO1Config()
-            return litellm.AzureOpenAIConfig()
-        elif litellm.LlmProviders.AZURE_AI == provider:
-            return litellm.AzureAIStudioConfig()
-        elif litellm.LlmProviders.AZURE_TEXT == provider:
-            return litellm.AzureOpenAITextConfig()
-        elif litellm.LlmProviders.HOSTED_VLLM == provider:
-            return litellm.HostedVLLMChatConfig()
-        elif litellm.LlmProviders.NLP_CLOUD == provider:
-            return litellm.NLPCloudConfig()
-        elif litellm.LlmProviders.OOBABOOGA == provider:
-            return litellm.OobaboogaConfig()
-        elif litellm.LlmProviders.OLLAMA_CHAT == provider:
-            return litellm.OllamaChatConfig()
-        elif litellm.LlmProviders.DEEPINFRA == provider:
-            return litellm.DeepInfraConfig()
-        elif litellm.LlmProviders.PERPLEXITY == provider:
-            return litellm.PerplexityChatConfig()
-        elif (
-            litellm.LlmProviders.MISTRAL == provider
-            or litellm.LlmProviders.CODESTRAL == provider
-        ):
-            return litellm.MistralConfig()
-        elif litellm.LlmProviders.NVIDIA_NIM == provider:
-            return litellm.NvidiaNimConfig()
-        elif litellm.LlmProviders.CEREBRAS == provider:
-            return litellm.CerebrasConfig()
-        elif litellm.LlmProviders.VOLCENGINE == provider:
-            return litellm.VolcEngineConfig()
-        elif litellm.LlmProviders.TEXT_COMPLETION_CODESTRAL == provider:
-            return litellm.CodestralTextCompletionConfig()
-        elif litellm.LlmProviders.SAMBANOVA == provider:
-            return litellm.SambanovaConfig()
-        elif litellm.LlmProviders.MARITALK == provider:
-            return litellm.MaritalkConfig()
-        elif litellm.LlmProviders.CLOUDFLARE == provider:
-            return litellm.CloudflareChatConfig()
-        elif litellm.LlmProviders.ANTHROPIC_TEXT == provider:
-            return litellm.AnthropicTextConfig()
-        elif litellm.LlmProviders.VLLM == provider:
-            return litellm.VLLMConfig()
-        elif litellm.LlmProviders.OLLAMA == provider:
-            return litellm.OllamaConfig()
-        elif litellm.LlmProviders.PREDIBASE == provider:
-            return litellm.PredibaseConfig()
-        elif litellm.LlmProviders.TRITON == provider:
-            return litellm.TritonConfig()
-        elif litellm.LlmProviders.PETALS == provider:
-            return litellm.PetalsConfig()
-        elif litellm.LlmProviders.FEATHERLESS_AI == provider:
-            return litellm.FeatherlessAIConfig()
-        elif litellm.LlmProviders.NOVITA == provider:
-            return litellm.NovitaConfig()
-        elif litellm.LlmProviders.NEBIUS == provider:
-            return litellm.NebiusConfig()
-        elif litellm.LlmProviders.DASHSCOPE == provider:
-            return litellm.DashScopeChatConfig()
-        elif litellm.LlmProviders.MOONSHOT == provider:
-            return litellm.MoonshotChatConfig()
-        elif litellm.LlmProviders.V0 == provider:
-            return litellm.V0ChatConfig()
-        elif litellm.LlmProviders.MORPH == provider:
-            return litellm.MorphChatConfig()
-        elif litellm.LlmProviders.BEDROCK == provider:
-            bedrock_route = BedrockModelInfo.get_bedrock_route(model)
-            bedrock_invoke_provider = litellm.BedrockLLM.get_bedrock_invoke_provider(
-                model=model
-            )
-
-            base_model = BedrockModelInfo.get_base_model(model)
-
-            if bedrock_route == "converse" or bedrock_route == "converse_like":
-                return litellm.AmazonConverseConfig()
-            elif bedrock_route == "agent":
-                from litellm.llms.bedrock.chat.invoke_agent.transformation import (
-                    AmazonInvokeAgentConfig,
-                )
-
-                return AmazonInvokeAgentConfig()
-            elif bedrock_invoke_provider == "amazon":  # amazon titan llms
-                return litellm.AmazonTitanConfig()
-            elif bedrock_invoke_provider == "anthropic":
-                if (
-                    base_model
-                    in litellm.AmazonAnthropicConfig.get_legacy_anthropic_model_names()
-                ):
-                    return litellm.AmazonAnthropicConfig()
-                else:
-                    return litellm.AmazonAnthropicClaude3Config()
-            elif (
-                bedrock_invoke_provider == "meta" or bedrock_invoke_provider == "llama"
-            ):  # amazon / meta llms
-                return litellm.AmazonLlamaConfig()
-            elif bedrock_invoke_provider == "ai21":  # ai21 llms
-                return litellm.AmazonAI21Config()
-            elif bedrock_invoke_provider == "cohere":  # cohere models on bedrock
-                return litellm.AmazonCohereConfig()
-            elif bedrock_invoke_provider == "mistral":  # mistral models on bedrock
-                return litellm.AmazonMistralConfig()
-            elif bedrock_invoke_provider == "deepseek_r1":  # deepseek models on bedrock
-                return litellm.AmazonDeepSeekR1Config()
-            elif bedrock_invoke_provider == "nova":
-                return litellm.AmazonInvokeNovaConfig()
-            else:
-                return litellm.AmazonInvokeConfig()
-        elif litellm.LlmProviders.LITELLM_PROXY == provider:
-            return litellm.LiteLLMProxyChatConfig()
-        elif litellm.LlmProviders.OPENAI == provider:
-            return litellm.OpenAIGPTConfig()
-        elif litellm.LlmProviders.NSCALE == provider:
-            return litellm.NscaleConfig()
-        elif litellm.LlmProviders.HYPERBOLIC == provider:
-            return litellm.HyperbolicChatConfig()
-        return None
+        return get_config_from_table(
+            PROVIDER_CHAT_CONFIGS, model=model, provider=provider
+        )
 
     @staticmethod
     def get_provider_embedding_config(
         model: str,
         provider: LlmProviders,
     ) -> Optional[BaseEmbeddingConfig]:
-        if litellm.LlmProviders.VOYAGE == provider:
-            return litellm.VoyageEmbeddingConfig()
-        elif litellm.LlmProviders.TRITON == provider:
-            return litellm.TritonEmbeddingConfig()
-        elif litellm.LlmProviders.WATSONX == provider:
-            return litellm.IBMWatsonXEmbeddingConfig()
-        elif litellm.LlmProviders.INFINITY == provider:
-            return litellm.InfinityEmbeddingConfig()
-        elif (
-            litellm.LlmProviders.COHERE == provider
-            or litellm.LlmProviders.COHERE_CHAT == provider
-        ):
-            from litellm.llms.cohere.embed.transformation import CohereEmbeddingConfig
-
-            return CohereEmbeddingConfig()
-        elif litellm.LlmProviders.LODASH == provider:
-            from litellm.llms.lodash.embedding.transformation import LodashEmbeddingConfig
-
-            return LodashEmbeddingConfig()
-        return None
+        return get_config_from_table(
+            PROVIDER_EMBEDDING_CONFIGS, model=model, provider=provider
+        )
 
     @staticmethod
     def get_provider_rerank_config(
@@ -6958,82 +6884,48 @@ class ProviderConfigManager:
             or litellm.LlmProviders.COHERE_CHAT == provider
         ):
             if should_use_cohere_v1_client(api_base, present_version_params):
-                return litellm.CohereRerankConfig()
+                return get_provider_config_instance(litellm.CohereRerankConfig)
             else:
-                return litellm.CohereRerankV2Config()
-        elif litellm.LlmProviders.AZURE_AI == provider:
-            return litellm.AzureAIRerankConfig()
-        elif litellm.LlmProviders.INFINITY == provider:
-            return litellm.InfinityRerankConfig()
-        elif litellm.LlmProviders.JINA_AI == provider:
-            return litellm.JinaAIRerankConfig()
-        elif litellm.LlmProviders.HUGGINGFACE == provider:
-            return litellm.HuggingFaceRerankConfig()
-        return litellm.CohereRerankConfig()
+                return get_provider_config_instance(litellm.CohereRerankV2Config)
+        return get_config_from_table(
+            PROVIDER_RERANK_CONFIGS, model=model, provider=provider
+        ) or get_provider_config_instance(litellm.CohereRerankConfig)
 
     @staticmethod
     def get_provider_anthropic_messages_config(
         model: str,
         provider: LlmProviders,
     ) -> Optional[BaseAnthropicMessagesConfig]:
-        if litellm.LlmProviders.ANTHROPIC == provider:
-            return litellm.AnthropicMessagesConfig()
-        # The 'BEDROCK' provider corresponds to Amazon's implementation of Anthropic Claude v3.
-        # This mapping ensures that the correct configuration is returned for BEDROCK.
-        elif litellm.LlmProviders.BEDROCK == provider:
-            return litellm.AmazonAnthropicClaude3MessagesConfig()
-        elif litellm.LlmProviders.VERTEX_AI == provider:
-            if "claude" in model:
-                from litellm.llms.vertex_ai.vertex_ai_partner_models.anthropic.experimental_pass_through.transformation import (
-                    VertexAIPartnerModelsAnthropicMessagesConfig,
-                )
-
-                return VertexAIPartnerModelsAnthropicMessagesConfig()
-        return None
+        return get_config_from_table(
+            PROVIDER_ANTHROPIC_MESSAGES_CONFIGS, model=model, provider=provider
+        )
 
     @staticmethod
     def get_provider_audio_transcription_config(
         model: str,
         provider: LlmProviders,
     ) -> Optional[BaseAudioTranscriptionConfig]:
-        if litellm.LlmProviders.FIREWORKS_AI == provider:
-            return litellm.FireworksAIAudioTranscriptionConfig()
-        elif litellm.LlmProviders.DEEPGRAM == provider:
-            return litellm.DeepgramAudioTranscriptionConfig()
-        elif litellm.LlmProviders.ELEVENLABS == provider:
-            from litellm.llms.elevenlabs.audio_transcription.transformation import (
-                ElevenLabsAudioTranscriptionConfig,
-            )
-
-            return ElevenLabsAudioTranscriptionConfig()
-        elif litellm.LlmProviders.OPENAI == provider:
-            if "gpt-4o" in model:
-                return litellm.OpenAIGPTAudioTranscriptionConfig()
-            else:
-                return litellm.OpenAIWhisperAudioTranscriptionConfig()
-        return None
+        return get_config_from_table(
+            PROVIDER_AUDIO_TRANSCRIPTION_CONFIGS, model=model, provider=provider
+        )
 
     @staticmethod
     def get_provider_responses_api_config(
         provider: LlmProviders,
         model: Optional[str] = None,
     ) -> Optional[BaseResponsesAPIConfig]:
-        if litellm.LlmProviders.OPENAI == provider:
-            return litellm.OpenAIResponsesAPIConfig()
-        elif litellm.LlmProviders.AZURE == provider:
-            return litellm.AzureOpenAIResponsesAPIConfig()
-        return None
+        return get_config_from_table(
+            PROVIDER_RESPONSES_API_CONFIGS, model=model or "", provider=provider
+        )
 
     @staticmethod
     def get_provider_text_completion_config(
         model: str,
         provider: LlmProviders,
     ) -> BaseTextCompletionConfig:
-        if LlmProviders.FIREWORKS_AI == provider:
-            return litellm.FireworksAITextCompletionConfig()
-        elif LlmProviders.TOGETHER_AI == provider:
-            return litellm.TogetherAITextCompletionConfig()
-        return litellm.OpenAITextCompletionConfig()
+        return get_config_from_table(
+            PROVIDER_TEXT_COMPLETION_CONFIGS, model=model, provider=provider
+        ) or get_provider_config_instance(litellm.OpenAITextCompletionConfig)
 
     @staticmethod
     def get_provider_model_info(
@@ -2,7 +2,6 @@
 LiteLLM SDK Functions for Creating and Searching Vector Stores
 """
 import asyncio
-import contextvars
 from functools import partial
 from typing import Any, Coroutine, Dict, List, Optional, Union
 
@@ -10,8 +9,9 @@ import httpx
 
 import litellm
 from litellm.constants import request_timeout
+from litellm.litellm_core_utils.async_request_setup import run_request_setup
+from litellm.litellm_core_utils.lazy_loading import lazy_instance
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.llms.custom_httpx.llm_http_handler import BaseLLMHTTPHandler
 from litellm.types.router import GenericLiteLLMParams
 from litellm.types.vector_stores import (
     VectorStoreCreateOptionalRequestParams,
@@ -27,7 +27,9 @@ from litellm.vector_stores.utils import VectorStoreRequestUtils
 
 ####### ENVIRONMENT VARIABLES ###################
 # Initialize any necessary instances or variables here
-base_llm_http_handler = BaseLLMHTTPHandler()
+base_llm_http_handler = lazy_instance(
+    "litellm.llms.custom_httpx.llm_http_handler", "BaseLLMHTTPHandler"
+)
 #################################################
 
 
@@ -105,7 +107,6 @@ async def acreate(
     """
     local_vars = locals()
     try:
-        loop = asyncio.get_event_loop()
         kwargs["acreate"] = True
 
         # get custom llm provider so we can use this for mapping exceptions
@@ -127,9 +128,11 @@ async def acreate(
             **kwargs,
         )
 
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
 
         if asyncio.iscoroutine(init_response):
             response = await init_response
@@ -277,7 +280,6 @@ async def asearch(
     """
     local_vars = locals()
     try:
-        loop = asyncio.get_event_loop()
         kwargs["asearch"] = True
 
         # get custom llm provider so we can use this for mapping exceptions
@@ -300,9 +302,11 @@ async def asearch(
             **kwargs,
         )
 
-        ctx = contextvars.copy_context()
-        func_with_context = partial(ctx.run, func)
-        init_response = await loop.run_in_executor(None, func_with_context)
+        init_response = await run_request_setup(
+            func=func,
+            custom_llm_provider=custom_llm_provider,
+            request_kwargs=kwargs,
+        )
 
         if asyncio.iscoroutine(init_response):
             response = await init_response
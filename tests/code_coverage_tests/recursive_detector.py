@@ -7,7 +7,7 @@ IGNORE_FUNCTIONS = [
     "_remove_strict_from_schema",
     "filter_schema_fields",
     "text_completion",
-    "_check_for_os_environ_vars",
+    "_collect_os_environ_vars",  # max depth set.
     "clean_message",
     "unpack_defs",
     "convert_anyof_null_to_nullable",  # has a set max depth
@@ -25,6 +25,7 @@ IGNORE_FUNCTIONS = [
     "filter_value_from_dict",  # max depth set.
     "normalize_json_schema_types",  # max depth set.
     "_extract_fields_recursive",  # max depth set.
+    "_summarize",  # max depth set.
 ]
 
 
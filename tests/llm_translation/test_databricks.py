@@ -133,13 +133,12 @@ def mock_chat_streaming_response_chunks_bytes() -> List[bytes]:
 def mock_http_handler_chat_streaming_response() -> MagicMock:
     mock_stream_chunks = mock_chat_streaming_response_chunks()
 
-    def mock_iter_lines():
+    def mock_iter_bytes():
         for chunk in mock_stream_chunks:
-            for line in chunk.splitlines():
-                yield line
+            yield chunk.encode("utf-8") + b"\n"
 
     mock_response = MagicMock()
-    mock_response.iter_lines.side_effect = mock_iter_lines
+    mock_response.iter_bytes.side_effect = mock_iter_bytes
     mock_response.status_code = 200
 
     return mock_response
@@ -148,13 +147,12 @@ def mock_http_handler_chat_streaming_response() -> MagicMock:
 def mock_http_handler_chat_async_streaming_response() -> MagicMock:
     mock_stream_chunks = mock_chat_streaming_response_chunks()
 
-    async def mock_iter_lines():
+    async def mock_aiter_bytes():
         for chunk in mock_stream_chunks:
-            for line in chunk.splitlines():
-                yield line
+            yield chunk.encode("utf-8") + b"\n"
 
     mock_response = MagicMock()
-    mock_response.aiter_lines.return_value = mock_iter_lines()
+    mock_response.aiter_bytes.return_value = mock_aiter_bytes()
     mock_response.status_code = 200
 
     return mock_response
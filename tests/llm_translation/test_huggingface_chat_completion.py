@@ -181,12 +181,12 @@ def mock_http_handler():
 
         def mock_side_effect(*args, **kwargs):
             if kwargs.get("stream", True):
-                mock_response.iter_lines.return_value = iter(
+                mock_response.iter_bytes.return_value = iter(
                     [
-                        f"data: {json.dumps(chunk)}".encode("utf-8")
+                        f"data: {json.dumps(chunk)}\n\n".encode("utf-8")
                         for chunk in MOCK_STREAMING_CHUNKS
                     ]
-                    + [b"data: [DONE]"]
+                    + [b"data: [DONE]\n\n"]
                 )
             else:
                 mock_response.json.return_value = MOCK_COMPLETION_RESPONSE
@@ -218,10 +218,10 @@ def mock_http_async_handler():
 
                 async def mock_aiter():
                     for chunk in MOCK_STREAMING_CHUNKS:
-                        yield f"data: {json.dumps(chunk)}".encode("utf-8")
-                    yield b"data: [DONE]"
+                        yield f"data: {json.dumps(chunk)}\n\n".encode("utf-8")
+                    yield b"data: [DONE]\n\n"
 
-                mock_response.aiter_lines = mock_aiter
+                mock_response.aiter_bytes = mock_aiter
             return mock_response
 
         mock.side_effect = mock_side_effect
@@ -0,0 +1,102 @@
+"""
+Measures the per-call overhead of `litellm.acompletion` with `mock_response`, at 1k concurrent requests.
+
+Compares running the sync request setup on the event loop (default for mock responses) against
+the default executor (`litellm.disable_inline_async_request_setup = True`) - both with an idle
+default executor, and with its threads busy on other blocking work.
+
+Run with `pytest tests/load_tests/test_acompletion_overhead_benchmark.py -s` to print the timings - only
+which path ran (executor or inline) is asserted, wall-clock timings are too noisy for CI.
+"""
+
+import asyncio
+import contextvars
+import os
+import sys
+import time
+from functools import partial
+from typing import Tuple
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+
+NUM_CONCURRENT_REQUESTS = 1000
+BLOCKING_WORK_SECONDS = 0.5
+
+
+def _is_request_setup(func) -> bool:
+    # `run_request_setup` hands `partial(ctx.run, func)` to the executor
+    return (
+        isinstance(func, partial)
+        and getattr(func.func, "__self__", None).__class__ is contextvars.Context
+    )
+
+
+async def _run_concurrent_requests(busy_executor: bool = False) -> Tuple[float, int]:
+    """
+    Returns the elapsed time and the number of request setups that ran in the default executor.
+    """
+    loop = asyncio.get_running_loop()
+    blocking_work = []
+    if busy_executor:
+        # occupy every default executor thread, e.g. with sync callbacks / file reads
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+        blocking_work = [
+            loop.run_in_executor(None, time.sleep, BLOCKING_WORK_SECONDS)
+            for _ in range(max_workers)
+        ]
+    with patch.object(
+        loop, "run_in_executor", wraps=loop.run_in_executor
+    ) as run_in_executor_spy:
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(
+            *[
+                litellm.acompletion(
+                    model="gpt-4o",
+                    messages=[{"role": "user", "content": "hi"}],
+                    mock_response="hello",
+                )
+                for _ in range(NUM_CONCURRENT_REQUESTS)
+            ]
+        )
+        elapsed = time.perf_counter() - start_time
+    assert len(responses) == NUM_CONCURRENT_REQUESTS
+    await asyncio.gather(*blocking_work)
+    executor_request_setups = sum(
+        1
+        for call in run_in_executor_spy.call_args_list
+        if _is_request_setup(call.args[1])
+    )
+    return elapsed, executor_request_setups
+
+
+@pytest.mark.asyncio
+async def test_acompletion_overhead_benchmark():
+    await _run_concurrent_requests()  # warm up
+
+    for busy_executor in (False, True):
+        with patch.object(litellm, "disable_inline_async_request_setup", True):
+            executor_time, executor_request_setups = await _run_concurrent_requests(
+                busy_executor
+            )
+        inline_time, inline_request_setups = await _run_concurrent_requests(
+            busy_executor
+        )
+        print(
+            "\n{} concurrent acompletion calls (busy executor: {}) - executor: {:.3f}s ({:.3f}ms/call), inline: {:.3f}s ({:.3f}ms/call)".format(
+                NUM_CONCURRENT_REQUESTS,
+                busy_executor,
+                executor_time,
+                executor_time * 1000 / NUM_CONCURRENT_REQUESTS,
+                inline_time,
+                inline_time * 1000 / NUM_CONCURRENT_REQUESTS,
+            )
+        )
+
+        # inline setup never waits for a (possibly busy) executor thread
+        assert executor_request_setups == NUM_CONCURRENT_REQUESTS
+        assert inline_request_setups == 0
@@ -0,0 +1,83 @@
+"""
+Measures the private (unshared) memory of gunicorn-style workers forked from a preloaded proxy process.
+
+The master imports the proxy and preloads litellm's lazily imported provider modules
+(`ProxyInitializationHelpers._preload_shared_state`). Each forked worker then runs a full garbage collection,
+as it would soon after starting. Without `gc.freeze()` before the fork, that collection writes to every object
+it traverses and copies the master's pages into the worker. With it, the pages stay shared.
+
+Run with `pytest tests/load_tests/test_gunicorn_preload_memory.py -s` to print the per-worker numbers.
+"""
+
+import gc
+import os
+import sys
+from typing import List
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+NUM_WORKERS = 4
+
+
+def _get_private_memory_mb() -> float:
+    """Private (not shared with any other process) memory of this process in MB"""
+    private_kb = 0
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                private_kb += int(line.split()[1])
+    return private_kb / 1024
+
+
+def _fork_workers(freeze: bool) -> List[float]:
+    """Fork `NUM_WORKERS` workers, returns each one's private memory after a gc run"""
+    if freeze:
+        gc.freeze()
+    worker_private_memory: List[float] = []
+    try:
+        for _ in range(NUM_WORKERS):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:  # worker
+                os.close(read_fd)
+                gc.collect()
+                os.write(write_fd, str(_get_private_memory_mb()).encode())
+                os._exit(0)
+            os.close(write_fd)
+            worker_private_memory.append(float(os.read(read_fd, 64).decode()))
+            os.close(read_fd)
+            os.waitpid(pid, 0)
+    finally:
+        if freeze:
+            gc.unfreeze()
+    return worker_private_memory
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup") or not hasattr(os, "fork"),
+    reason="needs fork and /proc/<pid>/smaps_rollup (linux)",
+)
+def test_preloaded_workers_share_memory_with_gc_freeze():
+    from litellm.proxy.proxy_cli import ProxyInitializationHelpers
+
+    # the gunicorn master imports the app before forking
+    from litellm.proxy.proxy_server import app  # noqa: F401
+
+    ProxyInitializationHelpers._preload_shared_state()
+    gc.collect()
+    print(f"\nmaster private memory: {_get_private_memory_mb():.1f}MB")
+
+    without_freeze = _fork_workers(freeze=False)
+    with_freeze = _fork_workers(freeze=True)
+    print(
+        "worker private memory without gc.freeze: "
+        + ", ".join(f"{mb:.1f}MB" for mb in without_freeze)
+    )
+    print(
+        "worker private memory with gc.freeze: "
+        + ", ".join(f"{mb:.1f}MB" for mb in with_freeze)
+    )
+
+    assert sum(with_freeze) < sum(without_freeze)
@@ -0,0 +1,75 @@
+"""
+Micro-benchmark for `get_optional_params` over the top providers.
+
+Compares a cold optional params plan (supported params / provider config resolved on every call,
+as before plans were cached) against the cached per-(model, provider) plan.
+
+Run with `pytest tests/load_tests/test_optional_params_benchmark.py -s` to print the timings.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.litellm_core_utils.optional_params_plan import (
+    invalidate_optional_params_plans,
+)
+from litellm.utils import get_optional_params
+
+NUM_CALLS = 2000
+
+TOP_PROVIDER_MODELS = [
+    ("openai", "gpt-4o"),
+    ("azure", "gpt-4o"),
+    ("anthropic", "claude-3-5-sonnet-20240620"),
+    ("bedrock", "anthropic.claude-3-5-sonnet-20240620-v1:0"),
+    ("vertex_ai", "gemini-1.5-pro"),
+    ("gemini", "gemini-1.5-flash"),
+    ("groq", "llama3-70b-8192"),
+    ("mistral", "mistral-large-latest"),
+    ("cohere_chat", "command-r-plus"),
+    ("fireworks_ai", "accounts/fireworks/models/llama-v3p1-70b-instruct"),
+]
+
+
+def _time_get_optional_params(
+    custom_llm_provider: str, model: str, cold_plan: bool
+) -> float:
+    start_time = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        if cold_plan:
+            invalidate_optional_params_plans()
+        get_optional_params(
+            model=model,
+            custom_llm_provider=custom_llm_provider,
+            temperature=0.2,
+            max_tokens=256,
+            top_p=0.9,
+            stop=["\n\n"],
+            messages=[{"role": "user", "content": "hi"}],
+        )
+    return time.perf_counter() - start_time
+
+
+@pytest.mark.parametrize("custom_llm_provider, model", TOP_PROVIDER_MODELS)
+def test_get_optional_params_benchmark(custom_llm_provider, model):
+    _time_get_optional_params(custom_llm_provider, model, cold_plan=False)  # warm up
+
+    cold_time = _time_get_optional_params(custom_llm_provider, model, cold_plan=True)
+    cached_time = _time_get_optional_params(
+        custom_llm_provider, model, cold_plan=False
+    )
+    print(
+        "\n{}/{} - {} get_optional_params calls - cold plan: {:.2f}us/call, cached plan: {:.2f}us/call".format(
+            custom_llm_provider,
+            model,
+            NUM_CALLS,
+            cold_time * 1e6 / NUM_CALLS,
+            cached_time * 1e6 / NUM_CALLS,
+        )
+    )
+    assert cached_time < cold_time
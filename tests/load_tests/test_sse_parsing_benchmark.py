@@ -0,0 +1,79 @@
+"""
+Compares the shared byte-level SSE decoder against the previous `iter_lines()` + `json.loads` parsing.
+
+Run with `pytest tests/load_tests/test_sse_parsing_benchmark.py -s` to print the timings.
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.llms.custom_httpx.sse_decoder import iter_sse_json_chunks
+
+NUM_CHUNKS = 5000
+BUFFER_SIZE = 4096
+
+
+def _build_stream() -> bytes:
+    chunk = {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "created": 1234567890,
+        "model": "gpt-4o",
+        "choices": [
+            {"index": 0, "delta": {"content": "token "}, "finish_reason": None}
+        ],
+    }
+    events = [
+        "data: {}\n\n".format(json.dumps(chunk)).encode("utf-8")
+        for _ in range(NUM_CHUNKS)
+    ]
+    events.append(b"data: [DONE]\n\n")
+    return b"".join(events)
+
+
+def _byte_buffers(stream: bytes):
+    for i in range(0, len(stream), BUFFER_SIZE):
+        yield stream[i : i + BUFFER_SIZE]
+
+
+def _line_based_parse(stream: bytes) -> int:
+    parsed = 0
+    pending = ""
+    for buffer in _byte_buffers(stream):
+        pending += buffer.decode("utf-8")
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            if line.startswith("data:"):
+                data = line[len("data:") :].strip()
+                if data != "[DONE]":
+                    json.loads(data)
+                    parsed += 1
+    return parsed
+
+
+def _sse_decoder_parse(stream: bytes) -> int:
+    return sum(
+        1 for chunk in iter_sse_json_chunks(_byte_buffers(stream)) if isinstance(chunk, dict)
+    )
+
+
+def test_sse_parsing_benchmark():
+    stream = _build_stream()
+
+    start = time.perf_counter()
+    assert _line_based_parse(stream) == NUM_CHUNKS
+    line_based_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert _sse_decoder_parse(stream) == NUM_CHUNKS
+    sse_decoder_time = time.perf_counter() - start
+
+    print(  # noqa: T201
+        "\nline based: {:.4f}s, sse decoder: {:.4f}s ({} chunks)".format(
+            line_based_time, sse_decoder_time, NUM_CHUNKS
+        )
+    )
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.cached_stream_replay import CachedStreamReplay
+from litellm.caching.caching import Cache
+
+CACHED_RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "Hello world!"},
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8},
+}
+
+
+def test_cached_stream_replay_uses_chunk_boundaries():
+    replay = CachedStreamReplay(
+        response_object=CACHED_RESPONSE,
+        stream_chunk_boundaries={"content": [5, 0, 6]},
+    )
+    chunks = list(replay)
+
+    assert [chunk.choices[0].delta.content for chunk in chunks] == [
+        "Hello",
+        " world",
+        "!",  # content left over after the recorded boundaries
+        None,
+    ]
+    assert chunks[0].choices[0].delta.role == "assistant"
+    assert chunks[-1].choices[0].finish_reason == "stop"
+    assert chunks[-1].usage.total_tokens == 8
+    assert all(chunk.id == "chatcmpl-123" for chunk in chunks)
+
+
+def test_cached_stream_replay_without_boundaries():
+    chunks = list(CachedStreamReplay(response_object=CACHED_RESPONSE))
+    assert [chunk.choices[0].delta.content for chunk in chunks] == [
+        "Hello world!",
+        None,
+    ]
+
+
+def test_cached_stream_replay_tool_calls():
+    response = {
+        **CACHED_RESPONSE,
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "get_weather", "arguments": "{}"},
+                        }
+                    ],
+                },
+            }
+        ],
+    }
+    chunks = list(CachedStreamReplay(response_object=response))
+    assert len(chunks) == 2
+    tool_call = chunks[0].choices[0].delta.tool_calls[0]
+    assert tool_call.function.name == "get_weather"
+    assert tool_call.index == 0
+    assert chunks[1].choices[0].finish_reason == "tool_calls"
+
+
+def test_cached_stream_replay_sse_frames():
+    replay = CachedStreamReplay(
+        response_object=CACHED_RESPONSE,
+        stream_chunk_boundaries={"content": [5, 7]},
+    )
+    frames = replay.sse_frames
+    assert len(frames) == 3
+    assert all(frame.startswith("data: ") and frame.endswith("\n\n") for frame in frames)
+    payloads = [json.loads(frame[len("data: ") :]) for frame in frames]
+    assert payloads[0]["object"] == "chat.completion.chunk"
+    assert payloads[0]["choices"][0]["delta"] == {
+        "role": "assistant",
+        "content": "Hello",
+    }
+    assert payloads[-1]["choices"][0]["finish_reason"] == "stop"
+    assert "usage" not in payloads[-1]
+
+
+def test_cached_stream_replay_can_replay():
+    assert CachedStreamReplay.can_replay(CACHED_RESPONSE) is True
+    multi_choice_response = {
+        **CACHED_RESPONSE,
+        "choices": CACHED_RESPONSE["choices"] * 2,
+    }
+    assert CachedStreamReplay.can_replay(multi_choice_response) is False
+    assert CachedStreamReplay.can_replay("not a dict") is False
+
+
+@pytest.mark.asyncio
+async def test_cached_stream_replay_pacing():
+    replay = CachedStreamReplay(
+        response_object=CACHED_RESPONSE,
+        stream_chunk_boundaries={"content": [1] * 12},
+        chunk_delay=0.01,
+    )
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    chunks = [chunk async for chunk in replay]
+    assert len(chunks) == 13
+    assert loop.time() - start >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_streaming_cache_hit_replays_original_chunks():
+    litellm.cache = Cache()
+    try:
+        messages = [{"role": "user", "content": "test cached stream replay"}]
+        response = await litellm.acompletion(
+            model="gpt-4o",
+            messages=messages,
+            stream=True,
+            mock_response="This response is streamed in chunks",
+            caching=True,
+        )
+        original_chunks = [
+            chunk.choices[0].delta.content async for chunk in response
+        ]
+        await asyncio.sleep(0.5)  # cache write runs in the background
+
+        cached_response = await litellm.acompletion(
+            model="gpt-4o",
+            messages=messages,
+            stream=True,
+            mock_response="This response is streamed in chunks",
+            caching=True,
+        )
+        assert isinstance(cached_response.completion_stream, CachedStreamReplay)
+        cached_chunks = []
+        async for chunk in cached_response:
+            assert chunk._hidden_params["cache_hit"] is True
+            cached_chunks.append(chunk.choices[0].delta.content)
+
+        assert cached_chunks == original_chunks
+    finally:
+        litellm.cache = None
@@ -0,0 +1,124 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.llm_cost_calc.bulk_cost import bulk_cost_per_token
+
+ROWS = [
+    # (model, custom_llm_provider, prompt_tokens, completion_tokens, cached_tokens)
+    ("gpt-4o", None, 1000, 500, 0),
+    ("gpt-4o", None, 2000, 10, 1024),
+    ("openai/gpt-4o-mini", None, 10, 20, 0),
+    ("claude-3-5-sonnet-20240620", "anthropic", 300_000, 1000, 50_000),
+    ("gemini/gemini-1.5-pro", None, 200_000, 100, 0),
+    ("gemini/gemini-1.5-pro", None, 1000, 100, 0),
+    ("azure/gpt-4o", None, 1000, 100, 0),
+    ("my-unmapped-model", None, 1000, 100, 0),
+]
+
+
+def _expected_costs():
+    expected_costs = []
+    for model, custom_llm_provider, prompt_tokens, completion_tokens, cached in ROWS:
+        try:
+            prompt_cost, completion_cost = litellm.cost_per_token(
+                model=model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cache_read_input_tokens=cached,
+                custom_llm_provider=custom_llm_provider,
+            )
+            expected_costs.append(prompt_cost + completion_cost)
+        except Exception:
+            expected_costs.append(None)
+    return expected_costs
+
+
+def _bulk_costs(use_numpy):
+    return bulk_cost_per_token(
+        models=[row[0] for row in ROWS],
+        custom_llm_providers=[row[1] for row in ROWS],
+        prompt_tokens=[row[2] for row in ROWS],
+        completion_tokens=[row[3] for row in ROWS],
+        cached_tokens=[row[4] for row in ROWS],
+        use_numpy=use_numpy,
+    )
+
+
+def test_bulk_cost_per_token_matches_cost_per_token():
+    expected_costs = _expected_costs()
+    assert expected_costs[-1] is None
+
+    assert _bulk_costs(use_numpy=False) == expected_costs
+
+
+def test_bulk_cost_per_token_numpy_matches_cost_per_token():
+    pytest.importorskip("numpy")
+
+    assert _bulk_costs(use_numpy=True) == pytest.approx(_expected_costs(), rel=1e-12)
+
+
+def test_bulk_cost_per_token_length_mismatch():
+    with pytest.raises(ValueError):
+        bulk_cost_per_token(
+            models=["gpt-4o", "gpt-4o"],
+            prompt_tokens=[10],
+            completion_tokens=[10, 20],
+        )
+
+
+def test_bulk_cost_per_token_skips_models_not_priced_per_token():
+    assert bulk_cost_per_token(
+        models=["whisper-1", "tts-1", "vertex_ai/gemini-1.5-pro"],
+        prompt_tokens=[100, 100, 100],
+        completion_tokens=[10, 10, 10],
+    ) == [None, None, None]
+
+
+@pytest.mark.parametrize(
+    "token_column", ["cache_creation_tokens", "audio_tokens", "reasoning_tokens"]
+)
+def test_bulk_cost_per_token_skips_rows_not_derivable_from_tokens(token_column):
+    costs = bulk_cost_per_token(
+        models=["claude-3-5-sonnet-20240620", "claude-3-5-sonnet-20240620"],
+        prompt_tokens=[1000, 1000],
+        completion_tokens=[100, 100],
+        **{token_column: [0, 500]},
+    )
+    assert costs[0] is not None
+    assert costs[1] is None
+
+
+def test_bulk_cost_per_token_uses_deployment_custom_pricing(monkeypatch):
+    monkeypatch.setattr(litellm, "model_cost", dict(litellm.model_cost))
+    litellm.register_model(
+        model_cost={
+            "bulk-cost-custom-deployment": {
+                "input_cost_per_token": 1.0,
+                "output_cost_per_token": 2.0,
+            },
+            "bulk-cost-default-deployment": {"id": "bulk-cost-default-deployment"},
+        }
+    )
+    prompt_cost, completion_cost = litellm.cost_per_token(
+        model="gpt-4o", prompt_tokens=10, completion_tokens=10
+    )
+
+    costs = bulk_cost_per_token(
+        models=["gpt-4o"] * 4,
+        prompt_tokens=[10] * 4,
+        completion_tokens=[10] * 4,
+        model_ids=[
+            "bulk-cost-custom-deployment",
+            "bulk-cost-default-deployment",
+            "bulk-cost-deleted-deployment",
+            None,
+        ],
+    )
+    assert costs == [30.0, prompt_cost + completion_cost, None, costs[1]]
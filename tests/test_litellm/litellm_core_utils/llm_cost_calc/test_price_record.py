@@ -0,0 +1,170 @@
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.llm_cost_calc.price_record import (
+    cost_from_usage,
+    get_price_record,
+)
+from litellm.litellm_core_utils.llm_cost_calc.utils import generic_cost_per_token
+from litellm.types.utils import (
+    CompletionTokensDetailsWrapper,
+    PromptTokensDetailsWrapper,
+    Usage,
+)
+
+MODEL_PRICES_PATH = os.path.join(
+    os.path.dirname(__file__), "../../../../model_prices_and_context_window.json"
+)
+
+USAGES = [
+    Usage(prompt_tokens=1000, completion_tokens=500, total_tokens=1500),
+    Usage(
+        prompt_tokens=250_000,
+        completion_tokens=1000,
+        total_tokens=251_000,
+        prompt_tokens_details=PromptTokensDetailsWrapper(cached_tokens=100_000),
+    ),
+    Usage(
+        prompt_tokens=150_000,
+        completion_tokens=2000,
+        total_tokens=152_000,
+        cache_creation_input_tokens=3000,
+        cache_read_input_tokens=40_000,
+    ),
+    Usage(
+        prompt_tokens=1200,
+        completion_tokens=600,
+        total_tokens=1800,
+        prompt_tokens_details=PromptTokensDetailsWrapper(
+            text_tokens=1000,
+            audio_tokens=150,
+            cached_tokens=50,
+            character_count=4000,
+            image_count=2,
+            video_length_seconds=3.5,
+        ),
+        completion_tokens_details=CompletionTokensDetailsWrapper(
+            text_tokens=300, audio_tokens=100, reasoning_tokens=200
+        ),
+    ),
+    Usage(
+        prompt_tokens=10,
+        completion_tokens=400,
+        total_tokens=410,
+        completion_tokens_details=CompletionTokensDetailsWrapper(reasoning_tokens=350),
+    ),
+]
+
+
+def test_cost_from_usage_matches_generic_cost_per_token(monkeypatch):
+    """
+    `cost_from_usage` gives the same cost as `generic_cost_per_token` for every model in model_prices_and_context_window.json
+    """
+    with open(MODEL_PRICES_PATH) as f:
+        model_cost = json.load(f)
+    monkeypatch.setattr(litellm, "model_cost", model_cost)
+
+    compared_models = 0
+    for model, model_info in model_cost.items():
+        custom_llm_provider = model_info.get("litellm_provider")
+        if not isinstance(custom_llm_provider, str):
+            continue
+        price_record = get_price_record(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+        for usage in USAGES:
+            try:
+                expected_cost = generic_cost_per_token(
+                    model=model, usage=usage, custom_llm_provider=custom_llm_provider
+                )
+            except Exception:
+                assert price_record is None, model
+                continue
+            assert price_record is not None, model
+            assert (
+                cost_from_usage(price_record=price_record, usage=usage) == expected_cost
+            ), model
+        if price_record is not None:
+            compared_models += 1
+
+    assert compared_models > 1000
+
+
+def test_price_record_invalidated_by_register_model():
+    litellm.register_model(
+        {
+            "my-custom-price-record-model": {
+                "input_cost_per_token": 1,
+                "output_cost_per_token": 2,
+                "litellm_provider": "openai",
+                "mode": "chat",
+            }
+        }
+    )
+    usage = Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+
+    price_record = get_price_record(
+        model="my-custom-price-record-model", custom_llm_provider="openai"
+    )
+    assert price_record is not None
+    assert cost_from_usage(price_record=price_record, usage=usage) == (10.0, 40.0)
+    # cached
+    assert (
+        get_price_record(
+            model="my-custom-price-record-model", custom_llm_provider="openai"
+        )
+        is price_record
+    )
+
+    litellm.register_model(
+        {"my-custom-price-record-model": {"input_cost_per_token": 3}}
+    )
+
+    price_record = get_price_record(
+        model="my-custom-price-record-model", custom_llm_provider="openai"
+    )
+    assert cost_from_usage(price_record=price_record, usage=usage) == (30.0, 40.0)
+
+
+@pytest.mark.parametrize(
+    "model", ["openai/gpt-4o", "anthropic/claude-3-5-sonnet-20240620"]
+)
+def test_router_response_cost_uses_price_record(model):
+    """
+    Router deployments are priced with their compiled price record, with the same cost as `response_cost_calculator`.
+    """
+    from litellm import Router
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-model",
+                "litellm_params": {"model": model, "api_key": "my-api-key"},
+            }
+        ]
+    )
+    messages = [{"role": "user", "content": "Hey, how's it going?"}]
+
+    expected_cost = litellm.completion(
+        model=model, messages=messages, mock_response="Hello, world!"
+    )._hidden_params["response_cost"]
+
+    with patch.object(
+        litellm, "response_cost_calculator", side_effect=Exception("not called")
+    ) as mock_response_cost_calculator:
+        response = router.completion(
+            model="my-model", messages=messages, mock_response="Hello, world!"
+        )
+
+    mock_response_cost_calculator.assert_not_called()
+    assert response._hidden_params["response_cost"] == expected_cost
+    assert expected_cost > 0
@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.async_request_setup import (
+    run_request_setup,
+    should_run_request_setup_inline,
+)
+
+test_context_var: contextvars.ContextVar = contextvars.ContextVar(
+    "test_context_var", default=None
+)
+
+
+@pytest.fixture(autouse=True)
+def no_callbacks(monkeypatch):
+    monkeypatch.setattr(litellm, "input_callback", [])
+    monkeypatch.setattr(litellm, "callbacks", [])
+    monkeypatch.setattr(litellm, "_key_management_system", None)
+
+
+class PreCallLogger(CustomLogger):
+    def log_pre_api_call(self, model, messages, kwargs):
+        pass
+
+
+def test_should_run_request_setup_inline():
+    assert should_run_request_setup_inline("openai", {}) is True
+    assert should_run_request_setup_inline("bedrock", {}) is False
+    assert should_run_request_setup_inline("bedrock", {"mock_response": "hi"}) is True
+    with patch.object(litellm, "disable_inline_async_request_setup", True):
+        assert should_run_request_setup_inline("openai", {}) is False
+
+
+@pytest.mark.parametrize(
+    "setting, value",
+    [
+        ("_key_management_system", "azure_key_vault"),
+        ("input_callback", [lambda *args, **kwargs: None]),
+        ("input_callback", ["sentry"]),
+        ("callbacks", [PreCallLogger()]),
+    ],
+)
+def test_should_run_request_setup_inline_not_pure(monkeypatch, setting, value):
+    """
+    Setup that may block - secrets from a key management system, sync pre-call callbacks - uses the executor
+    """
+    monkeypatch.setattr(litellm, setting, value)
+    assert should_run_request_setup_inline("openai", {}) is False
+    assert should_run_request_setup_inline("openai", {"mock_response": "hi"}) is False
+
+
+def test_should_run_request_setup_inline_ignores_callbacks_without_pre_call():
+    litellm.callbacks = [CustomLogger()]
+    assert should_run_request_setup_inline("openai", {}) is True
+    assert (
+        should_run_request_setup_inline("openai", {"callbacks": [PreCallLogger()]})
+        is False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "custom_llm_provider, expect_inline", [("openai", True), ("bedrock", False)]
+)
+async def test_run_request_setup(custom_llm_provider, expect_inline):
+    test_context_var.set("request-context")
+
+    def setup():
+        test_context_var.set("modified-in-setup")
+        return threading.get_ident()
+
+    thread_id = await run_request_setup(
+        func=setup, custom_llm_provider=custom_llm_provider, request_kwargs={}
+    )
+    assert (thread_id == threading.get_ident()) is expect_inline
+    # setup runs in a copy of the context
+    assert test_context_var.get() == "request-context"
+
+
+@pytest.mark.asyncio
+async def test_acompletion_mock_response_skips_executor():
+    loop = asyncio.get_running_loop()
+    with patch.object(
+        loop, "run_in_executor", side_effect=AssertionError("executor used")
+    ):
+        response = await litellm.acompletion(
+            model="bedrock/anthropic.claude-3-sonnet-20240229-v1:0",
+            messages=[{"role": "user", "content": "hi"}],
+            mock_response="hello",
+        )
+    assert response.choices[0].message.content == "hello"
@@ -0,0 +1,149 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils import get_llm_provider_logic
+from litellm.litellm_core_utils.get_llm_provider_logic import (
+    get_llm_provider,
+    invalidate_llm_provider_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_provider_cache():
+    invalidate_llm_provider_cache()
+    yield
+    invalidate_llm_provider_cache()
+
+
+def test_get_llm_provider_is_memoized():
+    assert get_llm_provider(model="claude-3-5-sonnet-20240620") == (
+        "claude-3-5-sonnet-20240620",
+        "anthropic",
+        None,
+        None,
+    )
+    assert get_llm_provider(model="anthropic/claude-3-5-sonnet-20240620")[1] == (
+        "anthropic"
+    )
+    with patch.object(
+        get_llm_provider_logic, "_resolve_openai_compatible_provider_info"
+    ) as mock_provider_info:
+        assert get_llm_provider(model="claude-3-5-sonnet-20240620")[1] == "anthropic"
+        assert get_llm_provider(model="anthropic/claude-3-5-sonnet-20240620")[1] == (
+            "anthropic"
+        )
+        assert get_llm_provider(model="anthropic/claude-3-5-sonnet-20240620")[1] == (
+            "anthropic"
+        )
+    mock_provider_info.assert_not_called()
+    assert ("claude-3-5-sonnet-20240620", None, None) in (
+        get_llm_provider_logic._llm_provider_cache
+    )
+
+
+def test_get_llm_provider_cache_never_keyed_on_api_key(monkeypatch):
+    monkeypatch.setenv("TEST_PROVIDER_CACHE_KEY_1", "sk-1")
+    monkeypatch.setenv("TEST_PROVIDER_CACHE_KEY_2", "sk-2")
+    for env_var, expected_key in [
+        ("TEST_PROVIDER_CACHE_KEY_1", "sk-1"),
+        ("TEST_PROVIDER_CACHE_KEY_2", "sk-2"),
+    ]:
+        _, provider, dynamic_api_key, _ = get_llm_provider(
+            model="anthropic/claude-3-5-sonnet-20240620",
+            api_key=f"os.environ/{env_var}",
+        )
+        assert provider == "anthropic"
+        assert dynamic_api_key == expected_key
+
+    for cache_key in get_llm_provider_logic._llm_provider_cache:
+        assert "sk-1" not in cache_key and "sk-2" not in cache_key
+    assert len(get_llm_provider_logic._llm_provider_cache) == 1
+
+
+def test_get_llm_provider_does_not_cache_env_dependent_providers(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "groq-key-1")
+    assert get_llm_provider(model="groq/llama3")[2] == "groq-key-1"
+    monkeypatch.setenv("GROQ_API_KEY", "groq-key-2")
+    assert get_llm_provider(model="groq/llama3")[2] == "groq-key-2"
+
+
+@pytest.mark.parametrize(
+    "model, api_base",
+    [
+        ("anthropic/claude-3-5-sonnet-20240620", None),
+        ("openai/gpt-4o", "https://my-openai-proxy.example.com/v1"),
+        ("claude-3-5-sonnet-20240620", None),
+        ("gpt-4o", "https://my-openai-proxy.example.com/v1"),
+        ("azure/command-r-plus", None),
+    ],
+)
+def test_cached_get_llm_provider_matches_uncached_api_key(monkeypatch, model, api_base):
+    monkeypatch.setenv("TEST_PROVIDER_CACHE_API_KEY", "sk-from-env")
+    for api_key in ["sk-abc", "os.environ/TEST_PROVIDER_CACHE_API_KEY", None]:
+        invalidate_llm_provider_cache()
+        uncached = get_llm_provider(model=model, api_base=api_base, api_key=api_key)
+        assert len(get_llm_provider_logic._llm_provider_cache) == 1
+        cached = get_llm_provider(model=model, api_base=api_base, api_key=api_key)
+        assert cached == uncached
+
+    # entry built from one api key, hit with another
+    invalidate_llm_provider_cache()
+    get_llm_provider(model=model, api_base=api_base, api_key="sk-abc")
+    invalidate_llm_provider_cache()
+    uncached = get_llm_provider(
+        model=model, api_base=api_base, api_key="os.environ/TEST_PROVIDER_CACHE_API_KEY"
+    )
+    invalidate_llm_provider_cache()
+    get_llm_provider(model=model, api_base=api_base, api_key="sk-abc")
+    cached = get_llm_provider(
+        model=model, api_base=api_base, api_key="os.environ/TEST_PROVIDER_CACHE_API_KEY"
+    )
+    assert cached == uncached
+
+
+def test_openai_compatible_provider_with_own_branch_is_not_cached(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "groq-key")
+    get_llm_provider(model="groq/llama3", api_base="https://api.groq.com/openai/v1")
+    get_llm_provider(model="groq/llama3", api_key="sk-abc")
+    assert get_llm_provider_logic._llm_provider_cache == {}
+
+
+def test_get_llm_provider_cache_keyed_on_api_base():
+    assert get_llm_provider(model="gpt-4o")[1] == "openai"
+    _, provider, _, api_base = get_llm_provider(
+        model="gpt-4o", api_base="https://api.groq.com/openai/v1"
+    )
+    assert provider == "groq"
+    assert api_base == "https://api.groq.com/openai/v1"
+
+
+def test_register_model_invalidates_llm_provider_cache():
+    with pytest.raises(litellm.BadRequestError):
+        get_llm_provider(model="my-test-provider-cache-model")
+
+    assert get_llm_provider(model="gpt-4o")[1] == "openai"
+    assert len(get_llm_provider_logic._llm_provider_cache) == 1
+    litellm.register_model(
+        {
+            "my-test-provider-cache-model": {
+                "litellm_provider": "anthropic",
+                "mode": "chat",
+            }
+        }
+    )
+    assert len(get_llm_provider_logic._llm_provider_cache) == 0
+    try:
+        assert get_llm_provider(model="my-test-provider-cache-model")[1] == (
+            "anthropic"
+        )
+    finally:
+        litellm.anthropic_models.remove("my-test-provider-cache-model")
+        litellm.model_cost.pop("my-test-provider-cache-model", None)
@@ -0,0 +1,349 @@
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import sys
+import threading
+
+import httpx
+import pytest
+import respx
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils import get_model_cost_map as model_cost_map_module
+from litellm.litellm_core_utils.get_model_cost_map import (
+    _load_model_cost_map_snapshot,
+    build_model_cost_map_snapshot,
+    build_model_cost_provider_index,
+    get_bundled_model_cost_map,
+    get_model_cost_version,
+    load_local_model_cost_map,
+    refresh_model_cost_map,
+)
+
+MODEL_COST_MAP_URL = "https://example.com/model_prices_and_context_window.json"
+
+
+@pytest.fixture
+def model_cost_map_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+    monkeypatch.setattr(
+        model_cost_map_module, "MODEL_COST_MAP_CACHE_DIR", str(tmp_path)
+    )
+    monkeypatch.setattr(model_cost_map_module, "_model_cost_map_source", None)
+    monkeypatch.setattr(model_cost_map_module, "_registered_model_cost", {})
+    monkeypatch.setattr(litellm, "model_cost", dict(litellm.model_cost))
+    monkeypatch.setattr(
+        litellm,
+        "open_ai_chat_completion_models",
+        list(litellm.open_ai_chat_completion_models),
+    )
+    return tmp_path
+
+
+def _hosted_model_cost_map():
+    return {
+        "gpt-4o": {
+            "input_cost_per_token": 1.0,
+            "output_cost_per_token": 2.0,
+            "litellm_provider": "openai",
+            "mode": "chat",
+        },
+        "my-new-hosted-model": {
+            "input_cost_per_token": 3.0,
+            "output_cost_per_token": 4.0,
+            "litellm_provider": "openai",
+            "mode": "chat",
+        },
+    }
+
+
+def test_load_local_model_cost_map_without_cache(model_cost_map_cache_dir):
+    assert load_local_model_cost_map() == get_bundled_model_cost_map()
+    assert model_cost_map_module._model_cost_map_source == "bundled"
+
+
+def test_load_local_model_cost_map_from_cache(model_cost_map_cache_dir):
+    with open(
+        os.path.join(model_cost_map_cache_dir, "model_prices_and_context_window.json"),
+        "w",
+    ) as f:
+        json.dump(_hosted_model_cost_map(), f)
+
+    assert load_local_model_cost_map() == _hosted_model_cost_map()
+    assert model_cost_map_module._model_cost_map_source == "cache"
+
+
+def test_load_local_model_cost_map_ignores_cache_if_local_map_requested(
+    model_cost_map_cache_dir, monkeypatch
+):
+    with open(
+        os.path.join(model_cost_map_cache_dir, "model_prices_and_context_window.json"),
+        "w",
+    ) as f:
+        json.dump(_hosted_model_cost_map(), f)
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+    assert load_local_model_cost_map() == get_bundled_model_cost_map()
+
+
+@respx.mock
+def test_refresh_model_cost_map(model_cost_map_cache_dir):
+    litellm.register_model(
+        {
+            "my-registered-model": {
+                "input_cost_per_token": 5.0,
+                "output_cost_per_token": 6.0,
+                "litellm_provider": "openai",
+                "mode": "chat",
+            }
+        }
+    )
+    route = respx.get(MODEL_COST_MAP_URL).mock(
+        return_value=httpx.Response(
+            200, json=_hosted_model_cost_map(), headers={"ETag": '"v1"'}
+        )
+    )
+
+    assert refresh_model_cost_map(url=MODEL_COST_MAP_URL) is True
+
+    assert litellm.model_cost["my-new-hosted-model"]["input_cost_per_token"] == 3.0
+    assert "my-new-hosted-model" in litellm.open_ai_chat_completion_models
+    assert litellm.get_model_info("gpt-4o")["input_cost_per_token"] == 1.0
+    # models registered with `register_model` survive the refresh
+    assert litellm.model_cost["my-registered-model"]["input_cost_per_token"] == 5.0
+    # last good copy is cached on disk
+    with open(
+        os.path.join(model_cost_map_cache_dir, "model_prices_and_context_window.json")
+    ) as f:
+        assert json.load(f) == _hosted_model_cost_map()
+
+    # unchanged map isn't downloaded again
+    route.mock(return_value=httpx.Response(304))
+    assert refresh_model_cost_map(url=MODEL_COST_MAP_URL) is False
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+
+@respx.mock
+def test_refresh_model_cost_map_keeps_replaced_model_cost(
+    model_cost_map_cache_dir, monkeypatch
+):
+    """
+    A refresh that started before `litellm.model_cost` was replaced doesn't overwrite it.
+    """
+    user_model_cost = {"my-model": {"input_cost_per_token": 1.0}}
+
+    def _replace_model_cost(request):
+        monkeypatch.setattr(litellm, "model_cost", user_model_cost)
+        return httpx.Response(200, json=_hosted_model_cost_map())
+
+    respx.get(MODEL_COST_MAP_URL).mock(side_effect=_replace_model_cost)
+
+    assert refresh_model_cost_map(url=MODEL_COST_MAP_URL) is False
+    assert litellm.model_cost is user_model_cost
+
+
+def test_refresh_model_cost_map_updates_model_cost_in_place(model_cost_map_cache_dir):
+    """
+    `from litellm import model_cost` keeps seeing the refreshed map, and `register_model` calls made while a refresh
+    is in flight survive it.
+    """
+    from litellm import model_cost as imported_model_cost
+
+    request_started = threading.Event()
+    release_response = threading.Event()
+
+    def _slow_response(request):
+        request_started.set()
+        assert release_response.wait(timeout=10)
+        return httpx.Response(200, json=_hosted_model_cost_map())
+
+    imported_model_cost["my-direct-model"] = {"input_cost_per_token": 7.0}
+    refresh_results = []
+    with respx.mock:
+        respx.get(MODEL_COST_MAP_URL).mock(side_effect=_slow_response)
+        refresh_thread = threading.Thread(
+            target=lambda: refresh_results.append(
+                refresh_model_cost_map(url=MODEL_COST_MAP_URL)
+            )
+        )
+        refresh_thread.start()
+        assert request_started.wait(timeout=10)
+        litellm.register_model(
+            {
+                "gpt-4o": {"input_cost_per_token": 9.0},
+                "my-registered-model": {
+                    "input_cost_per_token": 5.0,
+                    "output_cost_per_token": 6.0,
+                    "litellm_provider": "openai",
+                    "mode": "chat",
+                },
+            }
+        )
+        release_response.set()
+        refresh_thread.join(timeout=10)
+
+    assert refresh_results == [True]
+    assert litellm.model_cost is imported_model_cost
+    assert imported_model_cost["my-new-hosted-model"]["input_cost_per_token"] == 3.0
+    assert imported_model_cost["gpt-4o"]["input_cost_per_token"] == 9.0
+    assert imported_model_cost["gpt-4o"]["output_cost_per_token"] == 2.0
+    assert imported_model_cost["my-registered-model"]["input_cost_per_token"] == 5.0
+    assert imported_model_cost["my-direct-model"]["input_cost_per_token"] == 7.0
+
+
+def test_get_model_cost_version(monkeypatch):
+    """
+    The version changes when `litellm.model_cost` is replaced or grows - not on in-place edits of an entry.
+    """
+    model_cost = {"my-model": {"input_cost_per_token": 1.0}}
+    monkeypatch.setattr(litellm, "model_cost", model_cost)
+    version = get_model_cost_version()
+
+    model_cost["my-model"]["input_cost_per_token"] = 2.0
+    assert get_model_cost_version() == version
+
+    model_cost["my-other-model"] = {"input_cost_per_token": 1.0}
+    assert get_model_cost_version() != version
+
+    version = get_model_cost_version()
+    monkeypatch.setattr(litellm, "model_cost", dict(model_cost))
+    assert get_model_cost_version() != version
+
+
+@respx.mock
+def test_refresh_model_cost_map_invalid_response(model_cost_map_cache_dir):
+    model_cost = litellm.model_cost
+    respx.get(MODEL_COST_MAP_URL).mock(return_value=httpx.Response(200, json={}))
+
+    with pytest.raises(ValueError):
+        refresh_model_cost_map(url=MODEL_COST_MAP_URL)
+    assert litellm.model_cost is model_cost
+
+
+def test_bundled_model_cost_map_snapshot(model_cost_map_cache_dir, monkeypatch):
+    """
+    The first load parses the bundled json and writes the snapshot to the cache dir, the next load uses it.
+    """
+    bundled_model_cost_map_path = os.path.join(
+        os.path.dirname(litellm.__file__),
+        "model_prices_and_context_window_backup.json",
+    )
+    with open(bundled_model_cost_map_path, "rb") as f:
+        content_bytes = f.read()
+    source_sha256 = hashlib.sha256(content_bytes).hexdigest()
+    assert _load_model_cost_map_snapshot(source_sha256=source_sha256) is None
+
+    assert get_bundled_model_cost_map() == json.loads(content_bytes)
+
+    snapshot = _load_model_cost_map_snapshot(source_sha256=source_sha256)
+    assert snapshot is not None
+    assert snapshot["model_cost"] == json.loads(content_bytes)
+    assert snapshot["provider_index"] == build_model_cost_provider_index(
+        json.loads(content_bytes)
+    )
+
+    def _fail_json_loads(*args, **kwargs):
+        raise AssertionError("json parsed instead of loading the snapshot")
+
+    monkeypatch.setattr(model_cost_map_module.json, "loads", _fail_json_loads)
+    assert get_bundled_model_cost_map() == snapshot["model_cost"]
+
+
+def test_bundled_model_cost_map_read_only_cache_dir(tmp_path, monkeypatch):
+    cache_file = tmp_path / "not-a-dir"
+    cache_file.write_text("")
+    monkeypatch.setattr(
+        model_cost_map_module, "MODEL_COST_MAP_CACHE_DIR", str(cache_file)
+    )
+
+    assert "gpt-4o" in get_bundled_model_cost_map()
+
+
+def test_benchmark_model_cost_map_snapshot_does_not_write(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location(
+        "build_model_cost_map_snapshot",
+        os.path.join(
+            os.path.dirname(os.path.dirname(litellm.__file__)),
+            "ci_cd",
+            "build_model_cost_map_snapshot.py",
+        ),
+    )
+    build_script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(build_script)
+
+    model_cost_map_path = os.path.join(tmp_path, "model_cost.json")
+    with open(model_cost_map_path, "w") as f:
+        json.dump(_hosted_model_cost_map(), f)
+    monkeypatch.setattr(build_script, "MODEL_COST_MAP_PATH", model_cost_map_path)
+    monkeypatch.setattr(build_script, "_measure", lambda fn: (fn() and 0.0, 0.0))
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(
+        model_cost_map_module, "MODEL_COST_MAP_CACHE_DIR", str(cache_dir)
+    )
+
+    assert build_script.main(["--benchmark"]) == 0
+    assert not cache_dir.exists()
+    assert sorted(os.listdir(tmp_path)) == ["model_cost.json"]
+
+    assert build_script.main([]) == 0
+    with open(build_script.get_snapshot_path(), "rb") as f:
+        assert pickle.load(f)["model_cost"] == _hosted_model_cost_map()
+
+
+def test_stale_model_cost_map_snapshot_is_ignored(model_cost_map_cache_dir):
+    get_bundled_model_cost_map()
+    assert _load_model_cost_map_snapshot(source_sha256="stale") is None
+
+
+def test_build_model_cost_map_snapshot(tmp_path):
+    model_cost_map_path = os.path.join(tmp_path, "model_cost.json")
+    snapshot_path = os.path.join(tmp_path, "model_cost.pickle")
+    with open(model_cost_map_path, "w") as f:
+        json.dump(_hosted_model_cost_map(), f)
+
+    build_model_cost_map_snapshot(
+        model_cost_map_path=model_cost_map_path, snapshot_path=snapshot_path
+    )
+
+    with open(snapshot_path, "rb") as f:
+        snapshot = pickle.load(f)
+    assert snapshot["model_cost"] == _hosted_model_cost_map()
+    assert snapshot["provider_index"] == {"openai": ["gpt-4o", "my-new-hosted-model"]}
+
+
+def test_add_known_models(monkeypatch):
+    for model_list_name in (
+        "open_ai_chat_completion_models",
+        "vertex_anthropic_models",
+        "ai21_models",
+        "ai21_chat_models",
+        "fireworks_ai_models",
+    ):
+        monkeypatch.setattr(litellm, model_list_name, [])
+
+    litellm.add_known_models(
+        model_cost_map={
+            "gpt-4o": {"litellm_provider": "openai"},
+            "ft:gpt-4o": {"litellm_provider": "openai"},
+            "vertex_ai/claude-3-5-sonnet": {
+                "litellm_provider": "vertex_ai-anthropic_models"
+            },
+            "j2-ultra": {"litellm_provider": "ai21", "mode": "completion"},
+            "jamba-1.5": {"litellm_provider": "ai21", "mode": "chat"},
+            "fireworks-ai-up-to-4b": {"litellm_provider": "fireworks_ai"},
+            "accounts/fireworks/models/llama": {"litellm_provider": "fireworks_ai"},
+            "my-unknown-provider-model": {"litellm_provider": "my-unknown-provider"},
+        }
+    )
+
+    assert litellm.open_ai_chat_completion_models == ["gpt-4o"]
+    assert litellm.vertex_anthropic_models == ["claude-3-5-sonnet"]
+    assert litellm.ai21_models == ["j2-ultra"]
+    assert litellm.ai21_chat_models == ["jamba-1.5"]
+    assert litellm.fireworks_ai_models == ["accounts/fireworks/models/llama"]
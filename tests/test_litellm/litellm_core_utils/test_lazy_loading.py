@@ -0,0 +1,88 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.lazy_loading import (
+    LazyObject,
+    is_loaded,
+    lazy_attribute,
+    lazy_instance,
+    lazy_module,
+)
+
+
+class _Handler:
+    def completion(self):
+        return self._make_request()
+
+    def _make_request(self):
+        return "real"
+
+
+def test_lazy_instance_is_created_once():
+    handler = lazy_instance(__name__, "_Handler")
+
+    assert is_loaded(handler) is False
+    assert handler.completion() == "real"
+    assert is_loaded(handler) is True
+    assert isinstance(handler, _Handler)
+    assert handler.completion.__self__ is handler.completion.__self__
+
+
+def test_lazy_instance_init_kwargs():
+    lazy_dict = lazy_instance("collections", "OrderedDict", a=1)
+
+    assert lazy_dict.get("a") == 1
+
+
+def test_patch_object_patches_the_loaded_instance():
+    """
+    Patching a method on the placeholder also patches internal `self.<method>` calls.
+    """
+    handler = lazy_instance(__name__, "_Handler")
+
+    with patch.object(handler, "_make_request", MagicMock(return_value="mocked")):
+        assert handler.completion() == "mocked"
+
+    assert handler.completion() == "real"
+
+
+def test_lazy_module_and_attribute():
+    json_module = lazy_module("json")
+    dumps = lazy_attribute("json", "dumps")
+
+    assert json_module.dumps({"a": 1}) == '{"a": 1}'
+    assert dumps({"a": 1}) == '{"a": 1}'
+    assert "not loaded" in repr(lazy_module("json"))
+
+
+def test_lazy_import_error_is_raised_on_first_use():
+    missing = lazy_instance("litellm.does_not_exist", "Handler")
+
+    with pytest.raises(ModuleNotFoundError):
+        missing.completion
+
+    assert type(missing) is LazyObject
+    assert is_loaded(missing) is False
+
+
+def test_load_lazy_objects_loads_module_placeholders():
+    import types
+
+    from litellm.litellm_core_utils.lazy_loading import load_lazy_objects
+
+    module = types.ModuleType("test_lazy_module")
+    module.handler = lazy_instance(__name__, "_Handler")  # type: ignore
+    module.missing = lazy_instance("litellm.does_not_exist", "Handler")  # type: ignore
+    module.value = 1  # type: ignore
+
+    assert load_lazy_objects(module) == 1
+    assert is_loaded(module.handler) is True
+    assert is_loaded(module.missing) is False
+    assert load_lazy_objects(module) == 0
@@ -394,3 +394,192 @@ def test_get_masked_values():
         sensitive_object, unmasked_length=4, number_of_asterisks=4
     )
     assert masked_values["presidio_anonymizer_api_base"] is None
+
+
+def test_get_standard_logging_object_payload_skipped_if_no_fields_needed(
+    logging_obj,
+):
+    from datetime import datetime
+
+    from litellm.litellm_core_utils.litellm_logging import (
+        get_standard_logging_object_payload,
+    )
+
+    payload = get_standard_logging_object_payload(
+        kwargs={},
+        init_response_obj={},
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+        logging_obj=logging_obj,
+        status="success",
+        payload_fields=frozenset(),
+    )
+    assert payload is None
+
+
+def test_get_standard_logging_object_payload_without_response_field(logging_obj):
+    """
+    If no callback reads `response`, the response object is not serialized, but id / usage are still logged
+    """
+    from datetime import datetime
+
+    from litellm.litellm_core_utils.litellm_logging import (
+        get_standard_logging_object_payload,
+    )
+    from litellm.types.utils import EmbeddingResponse, Usage
+
+    response = EmbeddingResponse(
+        model="text-embedding-3-small",
+        data=[{"object": "embedding", "index": 0, "embedding": [0.1] * 1536}],
+        usage=Usage(prompt_tokens=5, completion_tokens=0, total_tokens=5),
+    )
+
+    with patch.object(
+        EmbeddingResponse,
+        "model_dump",
+        side_effect=EmbeddingResponse.model_dump,
+        autospec=True,
+    ) as mock_model_dump:
+        payload = get_standard_logging_object_payload(
+            kwargs={"model": "text-embedding-3-small"},
+            init_response_obj=response,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            logging_obj=logging_obj,
+            status="success",
+            payload_fields=frozenset({"model", "total_tokens"}),
+        )
+        mock_model_dump.assert_not_called()
+
+    assert payload is not None
+    assert payload["response"] is None
+    assert payload["total_tokens"] == 5
+    assert payload["prompt_tokens"] == 5
+
+    full_payload = get_standard_logging_object_payload(
+        kwargs={"model": "text-embedding-3-small"},
+        init_response_obj=response,
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+        logging_obj=logging_obj,
+        status="success",
+    )
+    assert full_payload is not None
+    assert full_payload["response"] is not None
+    assert full_payload["id"] == payload["id"]
+    assert full_payload["total_tokens"] == payload["total_tokens"]
+
+
+@pytest.mark.asyncio
+async def test_logging_payload_fields_declared_by_callback():
+    import asyncio
+
+    import litellm
+    from litellm.integrations.custom_logger import CustomLogger
+
+    class TokenCountingLogger(CustomLogger):
+        standard_logging_payload_fields = frozenset({"model", "total_tokens"})
+
+        def __init__(self):
+            super().__init__()
+            self.standard_logging_objects = []
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            self.standard_logging_objects.append(kwargs["standard_logging_object"])
+
+    token_counting_logger = TokenCountingLogger()
+    litellm.callbacks = [token_counting_logger]
+    try:
+        await litellm.acompletion(
+            model="openai/gpt-4o",
+            messages=[{"role": "user", "content": "Hey"}],
+            mock_response="Hello, world!",
+        )
+        await asyncio.sleep(1)
+    finally:
+        litellm.callbacks = []
+
+    assert len(token_counting_logger.standard_logging_objects) == 1
+    standard_logging_object = token_counting_logger.standard_logging_objects[0]
+    assert standard_logging_object["response"] is None
+    assert standard_logging_object["total_tokens"] > 0
+
+
+def test_get_response_obj_summary():
+    from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSetup
+    from litellm.types.utils import ModelResponse, Usage
+
+    usage = Usage(prompt_tokens=5, completion_tokens=2, total_tokens=7)
+    response = ModelResponse(id="chatcmpl-123", usage=usage)
+
+    summary = StandardLoggingPayloadSetup.get_response_obj_summary(response)
+
+    assert summary == {"id": "chatcmpl-123", "usage": usage}
+    assert StandardLoggingPayloadSetup.get_response_obj_summary(Usage()) == {}
+
+
+def test_get_payload_fields(monkeypatch):
+    from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSetup
+
+    monkeypatch.delenv("LITELLM_PRINT_STANDARD_LOGGING_PAYLOAD", raising=False)
+    assert StandardLoggingPayloadSetup.get_payload_fields({"id"}) == {"id"}
+    assert StandardLoggingPayloadSetup.get_payload_fields(None) is None
+
+    monkeypatch.setenv("LITELLM_PRINT_STANDARD_LOGGING_PAYLOAD", "true")
+    assert StandardLoggingPayloadSetup.get_payload_fields(set()) is None
+
+
+def test_get_response_obj_and_hidden_params():
+    from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSetup
+    from litellm.types.utils import ModelResponse, Usage
+
+    usage = Usage(prompt_tokens=5, completion_tokens=2, total_tokens=7)
+    response = ModelResponse(id="chatcmpl-123", usage=usage)
+    response._hidden_params = {"model_id": "model-123"}
+
+    (
+        response_obj,
+        hidden_params,
+    ) = StandardLoggingPayloadSetup.get_response_obj_and_hidden_params(
+        init_response_obj=response, original_exception=None, include_response=True
+    )
+    assert response_obj == response.model_dump()
+    assert hidden_params == {"model_id": "model-123"}
+
+    (
+        response_obj,
+        hidden_params,
+    ) = StandardLoggingPayloadSetup.get_response_obj_and_hidden_params(
+        init_response_obj=response, original_exception=None, include_response=False
+    )
+    assert response_obj == {"id": "chatcmpl-123", "usage": usage}
+
+    assert StandardLoggingPayloadSetup.get_response_obj_and_hidden_params(
+        init_response_obj=None, original_exception=None, include_response=True
+    ) == ({}, None)
+
+
+def test_get_payload_response():
+    from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSetup
+
+    response_obj = {"id": "chatcmpl-123"}
+    assert (
+        StandardLoggingPayloadSetup.get_payload_response(
+            response_obj=response_obj,
+            init_response_obj=response_obj,
+            kwargs={},
+            include_response=False,
+        )
+        is None
+    )
+    assert (
+        StandardLoggingPayloadSetup.get_payload_response(
+            response_obj=response_obj,
+            init_response_obj=response_obj,
+            kwargs={},
+            include_response=True,
+        )
+        == response_obj
+    )
@@ -0,0 +1,174 @@
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.logging_callback_manager import LoggingCallbackManager
+
+
+class PreCallHookLogger(CustomLogger):
+    async def async_pre_call_hook(self, user_api_key_dict, cache, data, call_type):
+        return data
+
+
+class SubclassedPreCallHookLogger(PreCallHookLogger):
+    pass
+
+
+class SuccessEventLogger(CustomLogger):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        pass
+
+
+@pytest.fixture
+def callback_manager():
+    manager = LoggingCallbackManager()
+    manager._reset_all_callbacks()
+    yield manager
+    manager._reset_all_callbacks()
+
+
+def test_get_callbacks_for_hook_only_returns_overriding_callbacks(callback_manager):
+    pre_call_logger = PreCallHookLogger()
+    subclassed_logger = SubclassedPreCallHookLogger()
+    success_logger = SuccessEventLogger()
+    litellm.callbacks = [pre_call_logger, success_logger, subclassed_logger]
+
+    assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == [
+        pre_call_logger,
+        subclassed_logger,
+    ]
+    assert callback_manager.get_callbacks_for_hook("async_log_success_event") == [
+        success_logger
+    ]
+    assert callback_manager.get_callbacks_for_hook("async_moderation_hook") == []
+
+
+def test_get_callbacks_for_hook_tracks_callback_changes(callback_manager):
+    pre_call_logger = PreCallHookLogger()
+    assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == []
+
+    # added via the manager
+    callback_manager.add_litellm_callback(pre_call_logger)
+    assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == [
+        pre_call_logger
+    ]
+
+    # direct list changes are picked up too
+    litellm.callbacks.remove(pre_call_logger)
+    assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == []
+    new_logger = PreCallHookLogger()
+    litellm.callbacks = [new_logger]
+    assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == [
+        new_logger
+    ]
+
+
+def test_get_callbacks_for_hook_instance_patched_hook(callback_manager):
+    success_logger = SuccessEventLogger()
+    litellm.callbacks = [success_logger]
+    assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == []
+
+    with patch.object(success_logger, "async_pre_call_hook", new=AsyncMock()):
+        assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == [
+            success_logger
+        ]
+
+
+def test_get_callbacks_for_hook_class_patched_hook(callback_manager):
+    class PatchedLogger(CustomLogger):
+        pass
+
+    assert not callback_manager.callback_overrides_hook(
+        PatchedLogger(), "async_pre_call_hook"
+    )
+
+    with patch.object(PatchedLogger, "async_pre_call_hook", new=AsyncMock()):
+        patched_logger = PatchedLogger()
+        callback_manager.add_litellm_callback(patched_logger)
+        assert callback_manager.get_callbacks_for_hook("async_pre_call_hook") == [
+            patched_logger
+        ]
+
+    callback_manager.remove_callback_from_list_by_object(
+        litellm.callbacks, patched_logger, require_self=False
+    )
+    assert not callback_manager.callback_overrides_hook(
+        PatchedLogger(), "async_pre_call_hook"
+    )
+
+
+def test_get_callbacks_for_hook_custom_callback_list(callback_manager):
+    success_logger = SuccessEventLogger()
+    callbacks = ["langfuse", success_logger, CustomLogger()]
+    assert callback_manager.get_callbacks_for_hook(
+        "async_log_success_event", callbacks
+    ) == [success_logger]
+
+
+def test_function_setup_skips_resync_when_callbacks_unchanged():
+    import datetime
+
+    from litellm.utils import function_setup
+
+    litellm.logging_callback_manager._reset_all_callbacks()
+    try:
+        success_logger = SuccessEventLogger()
+        litellm.callbacks = [success_logger]
+        function_setup(
+            "completion",
+            None,
+            datetime.datetime.now(),
+            model="gpt-4o",
+            messages=[],
+            litellm_call_id="1234",
+        )
+        assert success_logger in litellm._async_success_callback
+        assert litellm.logging_callback_manager.callback_lists_synced() is True
+
+        litellm.callbacks.append(PreCallHookLogger())
+        assert litellm.logging_callback_manager.callback_lists_synced() is False
+    finally:
+        litellm.logging_callback_manager._reset_all_callbacks()
+
+
+def test_get_standard_logging_payload_fields(callback_manager):
+    class ModelGroupLogger(CustomLogger):
+        standard_logging_payload_fields = frozenset({"model_group"})
+
+    class NoPayloadLogger(CustomLogger):
+        standard_logging_payload_fields = frozenset()
+
+    assert callback_manager.get_standard_logging_payload_fields([], None) == frozenset()
+    assert (
+        callback_manager.get_standard_logging_payload_fields([NoPayloadLogger()])
+        == frozenset()
+    )
+    assert callback_manager.get_standard_logging_payload_fields(
+        [ModelGroupLogger()], None, [NoPayloadLogger()]
+    ) == frozenset({"model_group"})
+
+    # strings, functions and callbacks without declared fields need the full payload
+    assert (
+        callback_manager.get_standard_logging_payload_fields(
+            [ModelGroupLogger()], ["langfuse"]
+        )
+        is None
+    )
+    assert (
+        callback_manager.get_standard_logging_payload_fields([lambda *args: None])
+        is None
+    )
+    assert (
+        callback_manager.get_standard_logging_payload_fields(
+            [ModelGroupLogger(), CustomLogger()]
+        )
+        is None
+    )
@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.logging_payload_size_policy import (
+    LoggingPayloadSizePolicy,
+    apply_callback_logging_payload_size_policy,
+)
+
+
+def test_summarize_large_str():
+    policy = LoggingPayloadSizePolicy(max_str_length=100, preview_length=10)
+    image_url = "data:image/png;base64," + "A" * 1000
+
+    summary = policy.summarize(image_url)
+
+    assert summary.startswith("data:image")
+    assert "length={}".format(len(image_url)) in summary
+    assert hashlib.sha256(image_url.encode()).hexdigest() in summary
+    assert len(summary) < 200
+
+
+def test_summarize_is_copy_on_write():
+    policy = LoggingPayloadSizePolicy(max_str_length=100, max_list_length=10)
+    small_message = {"role": "system", "content": "You are a helpful assistant"}
+    large_message = {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": "What's in this image?"},
+            {"type": "image_url", "image_url": {"url": "A" * 1000}},
+        ],
+    }
+    messages = [small_message, large_message]
+
+    summarized_messages = policy.summarize(messages)
+
+    # the original messages are not modified
+    assert large_message["content"][1]["image_url"]["url"] == "A" * 1000
+    # unchanged values are kept by reference
+    assert summarized_messages[0] is small_message
+    assert summarized_messages[1]["content"][0] is large_message["content"][0]
+    assert (
+        "truncated by litellm"
+        in summarized_messages[1]["content"][1]["image_url"]["url"]
+    )
+
+    # nothing to summarize - same object
+    assert policy.summarize(small_message) is small_message
+
+
+def test_summarize_embedding_vectors():
+    policy = LoggingPayloadSizePolicy(max_list_length=100, preview_length=20)
+    response = {
+        "object": "list",
+        "data": [
+            {"object": "embedding", "index": 0, "embedding": [0.1] * 1536},
+        ],
+    }
+
+    summarized_response = policy.summarize(response)
+
+    summarized_embedding = summarized_response["data"][0]["embedding"]
+    assert isinstance(summarized_embedding, str)
+    assert summarized_embedding.startswith("[0.1, 0.1")
+    assert "length=1536" in summarized_embedding
+    assert summarized_response["object"] == "list"
+
+
+def test_apply_to_standard_logging_payload():
+    policy = LoggingPayloadSizePolicy(max_str_length=100)
+    payload = {"model": "gpt-4o", "messages": "A" * 1000, "response": {"id": "1"}}
+
+    bounded_payload = policy.apply_to_standard_logging_payload(payload)  # type: ignore
+
+    assert bounded_payload is not payload
+    assert payload["messages"] == "A" * 1000
+    assert "truncated by litellm" in bounded_payload["messages"]
+    assert bounded_payload["response"] is payload["response"]
+
+    small_payload = {"model": "gpt-4o", "messages": "Hey"}
+    assert policy.apply_to_standard_logging_payload(small_payload) is small_payload  # type: ignore
+
+
+def test_apply_callback_logging_payload_size_policy():
+    class BoundedLogger(CustomLogger):
+        logging_payload_size_policy = LoggingPayloadSizePolicy(max_str_length=100)
+
+    model_call_details = {
+        "model": "gpt-4o",
+        "standard_logging_object": {"messages": "A" * 1000},
+    }
+
+    assert (
+        apply_callback_logging_payload_size_policy(
+            callback=CustomLogger(), model_call_details=model_call_details
+        )
+        is model_call_details
+    )
+    bounded_model_call_details = apply_callback_logging_payload_size_policy(
+        callback=BoundedLogger(), model_call_details=model_call_details
+    )
+    assert bounded_model_call_details is not model_call_details
+    assert (
+        "truncated by litellm"
+        in bounded_model_call_details["standard_logging_object"]["messages"]
+    )
+    assert model_call_details["standard_logging_object"]["messages"] == "A" * 1000
+
+
+@pytest.mark.asyncio
+async def test_callback_receives_size_bounded_payload():
+    class BoundedLogger(CustomLogger):
+        logging_payload_size_policy = LoggingPayloadSizePolicy(max_str_length=100)
+
+        def __init__(self):
+            super().__init__()
+            self.standard_logging_objects = []
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            self.standard_logging_objects.append(kwargs["standard_logging_object"])
+
+    class FullPayloadLogger(BoundedLogger):
+        logging_payload_size_policy = None
+
+    bounded_logger = BoundedLogger()
+    full_payload_logger = FullPayloadLogger()
+    litellm.callbacks = [bounded_logger, full_payload_logger]
+    try:
+        await litellm.acompletion(
+            model="openai/gpt-4o",
+            messages=[{"role": "user", "content": "A" * 1000}],
+            mock_response="Hello, world!",
+        )
+        await asyncio.sleep(1)
+    finally:
+        litellm.callbacks = []
+
+    assert len(bounded_logger.standard_logging_objects) == 1
+    assert len(full_payload_logger.standard_logging_objects) == 1
+    bounded_messages = bounded_logger.standard_logging_objects[0]["messages"]
+    assert "truncated by litellm" in bounded_messages[0]["content"]
+    full_messages = full_payload_logger.standard_logging_objects[0]["messages"]
+    assert full_messages[0]["content"] == "A" * 1000
+
+
+def test_global_logging_payload_size_policy_bounds_original_response(monkeypatch):
+    import time
+
+    from litellm.litellm_core_utils.litellm_logging import Logging
+
+    monkeypatch.setattr(
+        litellm,
+        "logging_payload_size_policy",
+        LoggingPayloadSizePolicy(max_str_length=100, max_list_length=10),
+    )
+    logging_obj = Logging(
+        model="text-embedding-3-small",
+        messages=[],
+        stream=False,
+        call_type="embedding",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+
+    logging_obj.post_call(
+        input=["hello"] * 100,
+        original_response="A" * 1000,
+    )
+
+    assert "length=100" in logging_obj.model_call_details["input"]
+    assert "length=1000" in logging_obj.model_call_details["original_response"]
@@ -0,0 +1,180 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.logging_worker import LoggingDispatcher
+
+
+def test_logging_dispatcher_runs_sync_work():
+    dispatcher = LoggingDispatcher(num_workers=2, max_queue_size=10)
+    results = []
+
+    for i in range(5):
+        assert dispatcher.submit(results.append, i) is True
+
+    assert dispatcher.flush(timeout=5) is True
+    assert sorted(results) == [0, 1, 2, 3, 4]
+
+    metrics = dispatcher.get_metrics()
+    assert metrics["submitted"] == 5
+    assert metrics["completed"] == 5
+    assert metrics["dropped"] == 0
+    assert metrics["queue_depth"] == 0
+
+
+def test_logging_dispatcher_is_bounded_by_default():
+    """
+    "spill" is opt-in - by default a full queue drops (and counts) logging events that opted in to being dropped.
+    """
+    dispatcher = LoggingDispatcher(num_workers=1, max_queue_size=1)
+    assert dispatcher.queue_full_policy == "drop"
+    assert dispatcher.get_metrics()["queue_full_policy"] == "drop"
+
+
+def test_logging_dispatcher_drop_policy_when_queue_full():
+    dispatcher = LoggingDispatcher(
+        num_workers=1, max_queue_size=1, queue_full_policy="drop"
+    )
+    release = threading.Event()
+    started = threading.Event()
+
+    def _blocking_log():
+        started.set()
+        release.wait(timeout=5)
+
+    dispatcher.submit(_blocking_log)
+    assert started.wait(timeout=5)
+
+    assert dispatcher.submit_droppable(lambda: None) is True  # fills the queue
+    assert dispatcher.submit_droppable(lambda: None) is False  # dropped
+
+    release.set()
+    assert dispatcher.flush(timeout=5) is True
+    assert dispatcher.get_metrics()["dropped"] == 1
+
+
+def test_logging_dispatcher_never_drops_success_failure_handlers():
+    """
+    `submit` is used for success / failure handlers (spend, budget, cache accounting) - a full queue spills them
+    to the shared executor even with the "drop" policy.
+    """
+    dispatcher = LoggingDispatcher(
+        num_workers=1, max_queue_size=1, queue_full_policy="drop"
+    )
+    release = threading.Event()
+    started = threading.Event()
+    spilled = threading.Event()
+
+    def _blocking_log():
+        started.set()
+        release.wait(timeout=5)
+
+    dispatcher.submit(_blocking_log)
+    assert started.wait(timeout=5)
+    dispatcher.submit(lambda: None)
+
+    assert dispatcher.submit(spilled.set) is True
+    assert spilled.wait(timeout=5)
+
+    release.set()
+    assert dispatcher.flush(timeout=5) is True
+    metrics = dispatcher.get_metrics()
+    assert metrics["dropped"] == 0
+    assert metrics["spilled"] == 1
+
+
+def test_logging_dispatcher_spill_policy_when_queue_full():
+    dispatcher = LoggingDispatcher(
+        num_workers=1, max_queue_size=1, queue_full_policy="spill"
+    )
+    release = threading.Event()
+    started = threading.Event()
+    spilled = threading.Event()
+
+    def _blocking_log():
+        started.set()
+        release.wait(timeout=5)
+
+    dispatcher.submit(_blocking_log)
+    assert started.wait(timeout=5)
+    dispatcher.submit(lambda: None)
+
+    assert dispatcher.submit(spilled.set) is True
+    assert spilled.wait(timeout=5)  # ran on the shared executor, not the busy worker
+
+    release.set()
+    assert dispatcher.flush(timeout=5) is True
+    assert dispatcher.get_metrics()["spilled"] == 1
+
+
+def test_logging_dispatcher_logs_errors_without_raising():
+    dispatcher = LoggingDispatcher(num_workers=1, max_queue_size=10)
+
+    def _bad_log():
+        raise ValueError("bad callback")
+
+    dispatcher.submit(_bad_log)
+    assert dispatcher.flush(timeout=5) is True
+    assert dispatcher.get_metrics()["failed"] == 1
+
+
+def test_logging_dispatcher_invalid_config():
+    with pytest.raises(ValueError):
+        LoggingDispatcher(queue_full_policy="block")  # type: ignore
+    with pytest.raises(ValueError):
+        LoggingDispatcher(num_workers=0)
+
+
+@pytest.mark.asyncio
+async def test_logging_dispatcher_async_drop_policy():
+    dispatcher = LoggingDispatcher(max_queue_size=1, queue_full_policy="drop")
+    release = asyncio.Event()
+    results = []
+
+    async def _log(value):
+        await release.wait()
+        results.append(value)
+
+    assert dispatcher.submit_coroutine(_log(1), droppable=True) is True
+    assert dispatcher.submit_coroutine(_log(2), droppable=True) is False
+    assert dispatcher.get_metrics()["async_tasks_in_flight"] == 1
+
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert results == [1]
+    metrics = dispatcher.get_metrics()
+    assert metrics["async_tasks_in_flight"] == 0
+    assert metrics["dropped"] == 1
+    assert metrics["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_logging_dispatcher_async_never_drops_success_failure_handlers():
+    dispatcher = LoggingDispatcher(max_queue_size=1, queue_full_policy="drop")
+    release = asyncio.Event()
+    results = []
+
+    async def _log(value):
+        await release.wait()
+        results.append(value)
+
+    assert dispatcher.submit_coroutine(_log(1)) is True
+    assert dispatcher.submit_coroutine(_log(2)) is True
+    assert dispatcher.get_metrics()["async_tasks_in_flight"] == 2
+
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert sorted(results) == [1, 2]
+    metrics = dispatcher.get_metrics()
+    assert metrics["dropped"] == 0
+    assert metrics["spilled"] == 1
+    assert metrics["completed"] == 2
@@ -0,0 +1,84 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils import optional_params_plan
+from litellm.litellm_core_utils.optional_params_plan import (
+    get_optional_params_plan,
+    invalidate_optional_params_plans,
+)
+from litellm.utils import get_optional_params
+
+
+@pytest.fixture(autouse=True)
+def clear_optional_params_plans():
+    invalidate_optional_params_plans()
+    yield
+    invalidate_optional_params_plans()
+
+
+def test_optional_params_plan_is_cached():
+    plan = get_optional_params_plan(
+        model="claude-3-5-sonnet-20240620", custom_llm_provider="anthropic"
+    )
+    assert type(plan.provider_config) is litellm.AnthropicConfig
+    assert "max_tokens" in plan.supported_params
+    with patch.object(
+        optional_params_plan, "get_supported_openai_params"
+    ) as mock_get_supported_openai_params:
+        assert (
+            get_optional_params_plan(
+                model="claude-3-5-sonnet-20240620", custom_llm_provider="anthropic"
+            )
+            is plan
+        )
+    mock_get_supported_openai_params.assert_not_called()
+
+
+def test_optional_params_plan_unmapped_provider_uses_openai_params():
+    plan = get_optional_params_plan(
+        model="my-model", custom_llm_provider="my-unknown-provider"
+    )
+    assert plan.provider_config is None
+    assert plan.supported_params == frozenset(
+        litellm.get_supported_openai_params(
+            model="my-model", custom_llm_provider="openai"
+        )
+    )
+
+
+def test_register_model_invalidates_optional_params_plans():
+    get_optional_params_plan(model="gpt-4o", custom_llm_provider="openai")
+    assert len(optional_params_plan._optional_params_plans) == 1
+    litellm.register_model(
+        {"gpt-4o": {"litellm_provider": "openai", "mode": "chat"}}
+    )
+    assert len(optional_params_plan._optional_params_plans) == 0
+
+
+def test_allowed_openai_params_do_not_change_cached_plan():
+    optional_params = get_optional_params(
+        model="claude-3-5-sonnet-20240620",
+        custom_llm_provider="anthropic",
+        logit_bias={"1": 1},
+        allowed_openai_params=["logit_bias"],
+    )
+    assert optional_params["logit_bias"] == {"1": 1}
+
+    plan = get_optional_params_plan(
+        model="claude-3-5-sonnet-20240620", custom_llm_provider="anthropic"
+    )
+    assert "logit_bias" not in plan.supported_params
+    with pytest.raises(litellm.UnsupportedParamsError):
+        get_optional_params(
+            model="claude-3-5-sonnet-20240620",
+            custom_llm_provider="anthropic",
+            logit_bias={"1": 1},
+        )
@@ -0,0 +1,122 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.provider_config_registry import (
+    PROVIDER_CHAT_CONFIGS,
+    get_provider_config_instance,
+)
+from litellm.types.utils import LlmProviders
+from litellm.utils import ProviderConfigManager
+
+
+@pytest.mark.parametrize(
+    "model, provider, expected_config_class",
+    [
+        ("gpt-4o", LlmProviders.OPENAI, litellm.OpenAIGPTConfig),
+        ("o3-mini", LlmProviders.OPENAI, litellm.OpenAIOSeriesConfig),
+        ("gpt-4o", LlmProviders.AZURE, litellm.AzureOpenAIConfig),
+        ("o1", LlmProviders.AZURE, litellm.AzureOpenAIO1Config),
+        ("gemini-1.5-pro", LlmProviders.VERTEX_AI, litellm.VertexGeminiConfig),
+        (
+            "claude-3-5-sonnet@20240620",
+            LlmProviders.VERTEX_AI,
+            litellm.VertexAIAnthropicConfig,
+        ),
+        ("meta/llama3-405b", LlmProviders.VERTEX_AI, litellm.VertexAILlama3Config),
+        (
+            "anthropic.claude-3-5-sonnet-20240620-v1:0",
+            LlmProviders.BEDROCK,
+            litellm.AmazonConverseConfig,
+        ),
+        (
+            "invoke/anthropic.claude-3-5-sonnet-20240620-v1:0",
+            LlmProviders.BEDROCK,
+            litellm.AmazonAnthropicClaude3Config,
+        ),
+        (
+            "invoke/amazon.titan-text-express-v1",
+            LlmProviders.BEDROCK,
+            litellm.AmazonTitanConfig,
+        ),
+        ("llama3", LlmProviders.GROQ, litellm.GroqChatConfig),
+        ("my-model", LlmProviders.OPENAI_LIKE, litellm.OpenAILikeChatConfig),
+        ("codestral-latest", LlmProviders.CODESTRAL, litellm.MistralConfig),
+    ],
+)
+def test_get_provider_chat_config(model, provider, expected_config_class):
+    config = ProviderConfigManager.get_provider_chat_config(
+        model=model, provider=provider
+    )
+    assert type(config) is expected_config_class
+
+
+def test_get_provider_chat_config_unknown_provider():
+    assert (
+        ProviderConfigManager.get_provider_chat_config(
+            model="my-model", provider=LlmProviders.VOYAGE
+        )
+        is None
+    )
+
+
+def test_provider_config_instances_are_reused():
+    for provider, get_config_class in PROVIDER_CHAT_CONFIGS.items():
+        first_config = ProviderConfigManager.get_provider_chat_config(
+            model="my-model", provider=provider
+        )
+        assert first_config is not None
+        assert (
+            ProviderConfigManager.get_provider_chat_config(
+                model="my-model", provider=provider
+            )
+            is first_config
+        )
+        assert type(first_config) is get_config_class("my-model")
+
+
+def test_get_provider_config_instance_picks_up_patched_classes():
+    class MyGroqChatConfig(litellm.GroqChatConfig):
+        pass
+
+    with patch.object(litellm, "GroqChatConfig", MyGroqChatConfig):
+        config = ProviderConfigManager.get_provider_chat_config(
+            model="llama3", provider=LlmProviders.GROQ
+        )
+        assert type(config) is MyGroqChatConfig
+        assert config is get_provider_config_instance(MyGroqChatConfig)
+
+    assert (
+        type(
+            ProviderConfigManager.get_provider_chat_config(
+                model="llama3", provider=LlmProviders.GROQ
+            )
+        )
+        is litellm.GroqChatConfig
+    )
+
+
+def test_get_provider_text_completion_config_default():
+    assert (
+        type(
+            ProviderConfigManager.get_provider_text_completion_config(
+                model="my-model", provider=LlmProviders.OPENAI
+            )
+        )
+        is litellm.OpenAITextCompletionConfig
+    )
+    assert (
+        type(
+            ProviderConfigManager.get_provider_text_completion_config(
+                model="my-model", provider=LlmProviders.TOGETHER_AI
+            )
+        )
+        is litellm.TogetherAITextCompletionConfig
+    )
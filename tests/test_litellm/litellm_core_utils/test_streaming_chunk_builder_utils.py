@@ -243,3 +243,87 @@ def test_cache_read_input_tokens_retained():
     assert usage.cache_creation_input_tokens == 4
     assert usage.cache_read_input_tokens == 11775
     assert usage.prompt_tokens_details.cached_tokens == 11775
+
+
+def _make_stream_chunk(delta: Delta, finish_reason=None, usage=None):
+    chunk = ModelResponseStream(
+        id="chatcmpl-123",
+        created=1744771912,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+        choices=[StreamingChoices(finish_reason=finish_reason, index=0, delta=delta)],
+    )
+    if usage is not None:
+        setattr(chunk, "usage", usage)
+    return chunk
+
+
+def test_streaming_chunk_accumulator_matches_stream_chunk_builder():
+    import litellm
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingChunkAccumulator,
+    )
+
+    chunks = [
+        _make_stream_chunk(Delta(role="assistant", reasoning_content="Let me ")),
+        _make_stream_chunk(Delta(reasoning_content="think.")),
+        _make_stream_chunk(Delta(content="Hello")),
+        _make_stream_chunk(Delta(content=" world")),
+        _make_stream_chunk(
+            Delta(
+                tool_calls=[
+                    ChatCompletionDeltaToolCall(
+                        id="call_1",
+                        function=Function(arguments='{"a":', name="get_weather"),
+                        type="function",
+                        index=0,
+                    )
+                ]
+            )
+        ),
+        _make_stream_chunk(
+            Delta(
+                tool_calls=[
+                    ChatCompletionDeltaToolCall(
+                        function=Function(arguments=" 1}"), index=0
+                    )
+                ]
+            )
+        ),
+        _make_stream_chunk(
+            Delta(content=None),
+            finish_reason="tool_calls",
+            usage=Usage(prompt_tokens=10, completion_tokens=20, total_tokens=30),
+        ),
+    ]
+
+    accumulator = StreamingChunkAccumulator(recent_chunks_limit=2)
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+
+    expected = litellm.stream_chunk_builder(chunks=chunks)
+    result = accumulator.build_complete_streaming_response()
+
+    assert len(accumulator) == len(chunks)
+    assert len(accumulator.recent_chunks) == 2
+    assert result.choices[0].message.content == expected.choices[0].message.content
+    assert (
+        result.choices[0].message.reasoning_content
+        == expected.choices[0].message.reasoning_content
+    )
+    assert result.choices[0].message.tool_calls[0].function.arguments == '{"a": 1}'
+    assert (
+        result.choices[0].message.tool_calls
+        == expected.choices[0].message.tool_calls
+    )
+    assert result.choices[0].finish_reason == expected.choices[0].finish_reason
+    assert result.usage == expected.usage
+    assert accumulator.calculate_total_usage().total_tokens == 30
+
+
+def test_streaming_chunk_accumulator_empty():
+    from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+        StreamingChunkAccumulator,
+    )
+
+    assert StreamingChunkAccumulator().build_complete_streaming_response() is None
@@ -716,6 +716,61 @@ def test_streaming_handler_with_created_time_propagation(
             assert created == chunk.created
 
 
+def test_streaming_chunks_keep_stream_order_when_clock_steps_back(
+    logging_obj: Logging,
+):
+    """
+    `stream_chunk_builder` orders chunks by `created_at`, the chunk accumulator folds them as they are streamed -
+    `created_at` must never go back, or the two would build different responses.
+    """
+    from litellm.litellm_core_utils import streaming_handler
+
+    contents = ["Hello", " world", ", how", " are", " you?"]
+    test_chunks = [
+        ModelResponseStream(
+            id="chatcmpl-123",
+            created=1742056047,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            choices=[
+                StreamingChoices(
+                    index=0,
+                    delta=Delta(role="assistant", content=content),
+                    finish_reason="stop" if i == len(contents) - 1 else None,
+                )
+            ],
+        )
+        for i, content in enumerate(contents)
+    ]
+    # wall clock stepping back on every call
+    clock = iter(range(1_000_000, 0, -1))
+    mock_time = MagicMock(wraps=time)
+    mock_time.time.side_effect = lambda: float(next(clock))
+
+    with patch.object(streaming_handler, "time", mock_time):
+        response = CustomStreamWrapper(
+            completion_stream=ModelResponseListIterator(model_responses=test_chunks),
+            model="gpt-4o",
+            custom_llm_provider="openai",
+            logging_obj=logging_obj,
+        )
+        streamed_chunks = list(response)
+
+    created_at = [chunk._hidden_params["created_at"] for chunk in streamed_chunks]
+    assert created_at == sorted(created_at)
+    expected_content = "".join(contents)
+    assert (
+        litellm.stream_chunk_builder(chunks=streamed_chunks).choices[0].message.content
+        == expected_content
+    )
+    assert (
+        response.chunk_accumulator.build_complete_streaming_response()
+        .choices[0]
+        .message.content
+        == expected_content
+    )
+
+
 def test_streaming_handler_with_stream_options(
     initialized_custom_stream_wrapper: CustomStreamWrapper,
 ):
@@ -813,3 +868,94 @@ def test_optional_combine_thinking_block_with_none_content(
     assert final_response.choices[0].delta.content == "</think>The answer is 42"
     assert initialized_custom_stream_wrapper.sent_last_thinking_block is True
     assert not hasattr(final_response.choices[0].delta, "reasoning_content")
+
+
+class _ClosableChunkIterator(ModelResponseListIterator):
+    def __init__(self, model_responses):
+        super().__init__(model_responses=model_responses)
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_upstream_and_logs_partial_usage(logging_obj: Logging):
+    completion_stream = _ClosableChunkIterator(model_responses=bedrock_chunks)
+    upstream_response = MagicMock()
+    upstream_response.aclose = MagicMock(return_value=None)
+    response = CustomStreamWrapper(
+        completion_stream=completion_stream,
+        model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+        custom_llm_provider="bedrock",
+        logging_obj=logging_obj,
+        upstream_response=upstream_response,
+    )
+
+    with patch(
+        "litellm.litellm_core_utils.streaming_handler.logging_dispatcher"
+    ) as mock_dispatcher:
+        await response.__anext__()
+        await response.__anext__()
+        await response.aclose()
+        await response.aclose()  # idempotent
+
+        assert completion_stream.closed is True
+        upstream_response.aclose.assert_called_once()
+        assert logging_obj.model_call_details["stream_client_disconnected"] is True
+
+        mock_dispatcher.submit_coroutine.assert_called_once()
+        mock_dispatcher.submit.assert_called_once()
+        assert mock_dispatcher.submit.call_args.args[0] == logging_obj.success_handler
+        partial_response = mock_dispatcher.submit.call_args.args[1]
+        assert partial_response.usage.completion_tokens > 0
+        mock_dispatcher.submit_coroutine.call_args.args[0].close()
+
+    with pytest.raises(StopAsyncIteration):
+        await response.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_aclose_before_first_chunk_logs_failure(logging_obj: Logging):
+    response = CustomStreamWrapper(
+        completion_stream=_ClosableChunkIterator(model_responses=bedrock_chunks),
+        model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+        custom_llm_provider="bedrock",
+        logging_obj=logging_obj,
+    )
+
+    with patch(
+        "litellm.litellm_core_utils.streaming_handler.logging_dispatcher"
+    ) as mock_dispatcher:
+        await response.aclose()
+
+        assert mock_dispatcher.submit.call_args.args[0] == logging_obj.failure_handler
+        mock_dispatcher.submit_coroutine.assert_called_once()
+        mock_dispatcher.submit_coroutine.call_args.args[0].close()
+
+
+@pytest.mark.asyncio
+async def test_aclose_after_stream_end_does_not_log_again(logging_obj: Logging):
+    response = CustomStreamWrapper(
+        completion_stream=_ClosableChunkIterator(model_responses=bedrock_chunks),
+        model="bedrock/claude-3-5-sonnet-20240620-v1:0",
+        custom_llm_provider="bedrock",
+        logging_obj=logging_obj,
+    )
+
+    with patch(
+        "litellm.litellm_core_utils.streaming_handler.logging_dispatcher"
+    ) as mock_dispatcher:
+        async for _ in response:
+            pass
+        calls_at_stream_end = (
+            mock_dispatcher.submit.call_count,
+            mock_dispatcher.submit_coroutine.call_count,
+        )
+        await response.aclose()
+        assert (
+            mock_dispatcher.submit.call_count,
+            mock_dispatcher.submit_coroutine.call_count,
+        ) == calls_at_stream_end
+        for call in mock_dispatcher.submit_coroutine.call_args_list:
+            call.args[0].close()
@@ -0,0 +1,140 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
+from litellm.llms.custom_httpx.sse_decoder import (
+    SSEDecoder,
+    aiter_sse_json_chunks,
+    iter_sse_events,
+    iter_sse_json_chunks,
+)
+
+SAMPLE_STREAM = (
+    b'data: {"id": "1", "choices": [{"delta": {"content": "Hello"}}]}\n\n'
+    b": keep-alive comment\n\n"
+    b'data: {"id": "2", "choices": [{"delta": {"content": " w\xc3\xb6rld"}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+EXPECTED_CHUNKS = [
+    {"id": "1", "choices": [{"delta": {"content": "Hello"}}]},
+    {"id": "2", "choices": [{"delta": {"content": " wörld"}}]},
+    "[DONE]",
+]
+
+
+def test_sse_decoder_handles_every_buffer_split_point():
+    for split_at in range(len(SAMPLE_STREAM) + 1):
+        chunks = list(
+            iter_sse_json_chunks([SAMPLE_STREAM[:split_at], SAMPLE_STREAM[split_at:]])
+        )
+        assert chunks == EXPECTED_CHUNKS, f"failed when splitting at {split_at}"
+
+
+def test_sse_decoder_handles_one_byte_buffers():
+    byte_buffers = [SAMPLE_STREAM[i : i + 1] for i in range(len(SAMPLE_STREAM))]
+    assert list(iter_sse_json_chunks(byte_buffers)) == EXPECTED_CHUNKS
+
+
+@pytest.mark.parametrize("line_ending", [b"\n", b"\r\n", b"\r"])
+def test_sse_decoder_line_endings(line_ending):
+    stream = line_ending.join(
+        [b"event: message_start", b'data: {"type": "message_start"}', b"", b""]
+    )
+    events = list(iter_sse_events([stream]))
+    assert len(events) == 1
+    assert events[0].event == "message_start"
+    assert events[0].json() == {"type": "message_start"}
+
+
+@pytest.mark.parametrize("line_ending", [b"\n", b"\r\n", b"\r"])
+def test_sse_decoder_long_event_split_across_many_buffers(line_ending):
+    content = "x" * 200_000
+    stream = (
+        b"data: "
+        + json.dumps({"content": content}).encode()
+        + line_ending * 2
+        + b"data: [DONE]"
+        + line_ending * 2
+    )
+    decoder = SSEDecoder()
+    events = []
+    for i in range(0, len(stream), 64):
+        events.extend(decoder.decode(stream[i : i + 64]))
+    events.extend(decoder.flush())
+
+    assert [event.data for event in events][1:] == ["[DONE]"]
+    assert events[0].json() == {"content": content}
+
+
+def test_sse_decoder_crlf_split_across_buffers():
+    decoder = SSEDecoder()
+    assert decoder.decode(b'data: {"a": 1}\r') == []
+    events = decoder.decode(b"\n\r\n")
+    assert len(events) == 1
+    assert events[0].json() == {"a": 1}
+
+
+def test_sse_decoder_multi_line_data_and_fields():
+    stream = b'id: 42\nretry: 1000\ndata: {"a":\ndata: 1}\n\n'
+    events = list(iter_sse_events([stream]))
+    assert len(events) == 1
+    assert events[0].id == "42"
+    assert events[0].retry == 1000
+    assert events[0].data == '{"a":\n1}'
+    assert events[0].json() == {"a": 1}
+
+
+def test_sse_decoder_flushes_event_without_trailing_blank_line():
+    assert list(iter_sse_json_chunks([b'data: {"a": 1}'])) == [{"a": 1}]
+
+
+def test_sse_decoder_newline_delimited_json():
+    stream = b'{"a": 1}\n{"b": 2}\n'
+    assert list(iter_sse_json_chunks([stream])) == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.asyncio
+async def test_aiter_sse_json_chunks():
+    async def _byte_iterator():
+        for i in range(0, len(SAMPLE_STREAM), 7):
+            yield SAMPLE_STREAM[i : i + 7]
+
+    chunks = [chunk async for chunk in aiter_sse_json_chunks(_byte_iterator())]
+    assert chunks == EXPECTED_CHUNKS
+
+
+def test_base_model_response_iterator_accepts_parsed_chunks():
+    class _Iterator(BaseModelResponseIterator):
+        def chunk_parser(self, chunk: dict):
+            return chunk
+
+    iterator = _Iterator(
+        streaming_response=iter_sse_json_chunks([SAMPLE_STREAM]), sync_stream=True
+    )
+    parsed = list(iterator)
+    assert parsed[0] == EXPECTED_CHUNKS[0]
+    assert parsed[1] == EXPECTED_CHUNKS[1]
+    assert parsed[2]["is_finished"] is True
+
+
+def test_sse_decoder_matches_line_based_parsing():
+    """
+    The decoder should produce the same payloads as the previous `iter_lines()` + `json.loads` path.
+    """
+    line_based = [
+        json.loads(line[len("data: ") :])
+        for line in SAMPLE_STREAM.decode("utf-8").splitlines()
+        if line.startswith("data: {")
+    ]
+    decoded = [
+        chunk for chunk in iter_sse_json_chunks([SAMPLE_STREAM]) if isinstance(chunk, dict)
+    ]
+    assert decoded == line_based
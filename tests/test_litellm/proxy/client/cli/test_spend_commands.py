@@ -0,0 +1,82 @@
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+
+from litellm.proxy.client.cli.main import cli
+
+
+@pytest.fixture
+def mock_spend_client(monkeypatch):
+    """Patch the SpendManagementClient used by the CLI commands."""
+    mock_client = MagicMock()
+    monkeypatch.setattr(
+        "litellm.proxy.client.cli.commands.spend.SpendManagementClient",
+        mock_client,
+    )
+    return mock_client
+
+
+@pytest.fixture
+def cli_runner():
+    return CliRunner()
+
+
+def test_recalculate_spend_logs(cli_runner, mock_spend_client):
+    mock_instance = mock_spend_client.return_value
+    mock_instance.recalculate_spend_logs.return_value = iter(
+        [
+            {"batch": 1, "rows": 2, "updated_rows": 1, "spend_delta": 0.5},
+            {"batch": 2, "rows": 1, "updated_rows": 1, "spend_delta": 0.25},
+        ]
+    )
+
+    result = cli_runner.invoke(
+        cli,
+        [
+            "spend",
+            "recalculate",
+            "--start-date",
+            "2025-01-01",
+            "--model",
+            "gpt-4o",
+            "--batch-size",
+            "2",
+            "--dry-run",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "Batch 1: 2 rows, 1 updated" in result.output
+    assert "Batch 2: 1 rows, 1 updated" in result.output
+    assert "Dry run - Recalculated 3 spend logs: 2 updated" in result.output
+    mock_instance.recalculate_spend_logs.assert_called_once_with(
+        start_date="2025-01-01",
+        end_date=None,
+        model="gpt-4o",
+        batch_size=2,
+        dry_run=True,
+    )
+
+
+def test_recalculate_spend_logs_http_error(cli_runner, mock_spend_client):
+    mock_response = MagicMock()
+    mock_response.status_code = 403
+    mock_response.json.return_value = {"error": "Only proxy admins"}
+    mock_instance = mock_spend_client.return_value
+    mock_instance.recalculate_spend_logs.side_effect = requests.exceptions.HTTPError(
+        response=mock_response
+    )
+
+    result = cli_runner.invoke(cli, ["spend", "recalculate"])
+
+    assert result.exit_code != 0
+    assert "Error: HTTP 403" in result.output
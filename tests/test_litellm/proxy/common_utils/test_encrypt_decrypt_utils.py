@@ -0,0 +1,120 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+import litellm.proxy.common_utils.encrypt_decrypt_utils as encrypt_decrypt_utils
+from litellm.proxy.common_utils.encrypt_decrypt_utils import (
+    decrypt_value_helper,
+    encrypt_value_helper,
+    get_decrypt_stats,
+    invalidate_decrypted_value_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def salt_key(monkeypatch):
+    monkeypatch.setenv("LITELLM_SALT_KEY", "sk-test-salt-key")
+    invalidate_decrypted_value_cache()
+    yield
+    invalidate_decrypted_value_cache()
+
+
+def test_decrypt_value_helper_decrypts_each_ciphertext_once():
+    encrypted_value = encrypt_value_helper("sk-my-api-key")
+
+    with patch.object(
+        encrypt_decrypt_utils,
+        "decrypt_value",
+        wraps=encrypt_decrypt_utils.decrypt_value,
+    ) as mock_decrypt_value:
+        for _ in range(3):
+            assert (
+                decrypt_value_helper(value=encrypted_value, key="api_key")
+                == "sk-my-api-key"
+            )
+
+    assert mock_decrypt_value.call_count == 1
+
+
+def test_decrypt_value_helper_cache_is_keyed_by_signing_key(monkeypatch):
+    encrypted_value = encrypt_value_helper("sk-my-api-key")
+    assert decrypt_value_helper(value=encrypted_value, key="api_key") == "sk-my-api-key"
+
+    # a changed salt key can't decrypt the value - the cached plaintext must not be returned
+    monkeypatch.setenv("LITELLM_SALT_KEY", "sk-other-salt-key")
+    assert (
+        decrypt_value_helper(
+            value=encrypted_value, key="api_key", exception_type="debug"
+        )
+        is None
+    )
+
+
+def test_decrypt_value_helper_cache_expires(monkeypatch):
+    encrypted_value = encrypt_value_helper("sk-my-api-key")
+    monkeypatch.setattr(encrypt_decrypt_utils, "DECRYPTED_VALUE_CACHE_TTL", 10)
+
+    with patch.object(
+        encrypt_decrypt_utils,
+        "decrypt_value",
+        wraps=encrypt_decrypt_utils.decrypt_value,
+    ) as mock_decrypt_value, patch.object(encrypt_decrypt_utils, "time") as mock_time:
+        mock_time.time.return_value = 1000.0
+        decrypt_value_helper(value=encrypted_value, key="api_key")
+        mock_time.time.return_value = 1005.0
+        decrypt_value_helper(value=encrypted_value, key="api_key")
+        assert mock_decrypt_value.call_count == 1
+
+        mock_time.time.return_value = 1011.0
+        assert (
+            decrypt_value_helper(value=encrypted_value, key="api_key")
+            == "sk-my-api-key"
+        )
+        assert mock_decrypt_value.call_count == 2
+
+
+def test_decrypt_value_helper_cache_disabled(monkeypatch):
+    encrypted_value = encrypt_value_helper("sk-my-api-key")
+    monkeypatch.setattr(encrypt_decrypt_utils, "DECRYPTED_VALUE_CACHE_TTL", 0)
+
+    with patch.object(
+        encrypt_decrypt_utils,
+        "decrypt_value",
+        wraps=encrypt_decrypt_utils.decrypt_value,
+    ) as mock_decrypt_value:
+        decrypt_value_helper(value=encrypted_value, key="api_key")
+        decrypt_value_helper(value=encrypted_value, key="api_key")
+
+    assert mock_decrypt_value.call_count == 2
+    assert get_decrypt_stats()["decrypted_value_cache_size"] == 0
+
+
+def test_get_decrypt_stats_reports_last_full_minute(monkeypatch):
+    encrypted_value = encrypt_value_helper("sk-my-api-key")
+    monkeypatch.setattr(encrypt_decrypt_utils, "_decrypt_stats_window_start", 1000.0)
+    monkeypatch.setattr(
+        encrypt_decrypt_utils, "_decrypt_stats", {"calls": 0, "cache_hits": 0}
+    )
+
+    with patch.object(encrypt_decrypt_utils, "time") as mock_time:
+        mock_time.time.return_value = 1010.0
+        for _ in range(3):
+            decrypt_value_helper(value=encrypted_value, key="api_key")
+
+        mock_time.time.return_value = 1065.0
+        assert get_decrypt_stats() == {
+            "decrypt_calls_per_minute": 3,
+            "decrypt_cache_hits_per_minute": 2,
+            "decryptions_per_minute": 1,
+            "decrypted_value_cache_size": 1,
+        }
+
+        # no calls for a full minute
+        mock_time.time.return_value = 1190.0
+        assert get_decrypt_stats()["decrypt_calls_per_minute"] == 0
@@ -0,0 +1,103 @@
+import json
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.common_utils.startup_profiler import StartupProfiler
+
+
+def test_startup_profiler_disabled_is_noop(monkeypatch):
+    monkeypatch.delenv("LITELLM_PROFILE_STARTUP", raising=False)
+    profiler = StartupProfiler()
+
+    profiler.mark("load_config")
+    profiler.record_timings("load_config", {"router": 0.1})
+
+    assert profiler.enabled is False
+    assert profiler.phases == []
+    assert profiler.write_report() is None
+
+
+def test_startup_profiler_writes_report_once(tmp_path):
+    report_path = tmp_path / "startup.json"
+    profiler = StartupProfiler()
+    profiler.enable(report_path=str(report_path))
+
+    profiler.mark("import_proxy_server")
+    profiler.mark("load_config")
+    profiler.record_timings("load_config", {"router": 0.1})
+    report = profiler.write_report()
+
+    assert report is not None
+    written_report_path = tmp_path / f"startup.{os.getpid()}.json"
+    assert json.loads(written_report_path.read_text()) == report
+    assert not report_path.exists()
+    assert [phase["name"] for phase in report["phases"]] == [
+        "import_proxy_server",
+        "load_config",
+    ]
+    first_phase, second_phase = report["phases"]
+    assert second_phase["start_seconds"] == (
+        first_phase["start_seconds"] + first_phase["duration_seconds"]
+    )
+    assert report["timings"] == {"load_config": {"router": 0.1}}
+    assert report["total_seconds"] >= second_phase["start_seconds"]
+    assert "imports" not in report
+    assert profiler.write_report() is None
+
+
+def test_startup_profiler_enabled_from_env(monkeypatch, tmp_path):
+    report_path = tmp_path / "startup.json"
+    monkeypatch.setenv("LITELLM_PROFILE_STARTUP", str(report_path))
+
+    profiler = StartupProfiler()
+
+    assert profiler.enabled is True
+    assert profiler.report_path == str(report_path)
+    assert profiler.profile_imports is False
+
+
+def test_startup_profiler_reports_slowest_imports(monkeypatch, tmp_path):
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    (module_dir / "startup_profiler_test_module.py").write_text(
+        "import time\ntime.sleep(0.05)\n"
+    )
+    monkeypatch.syspath_prepend(str(module_dir))
+    report_path = tmp_path / "startup.json"
+    profiler = StartupProfiler()
+    profiler.enable(report_path=str(report_path), profile_imports=True)
+
+    try:
+        import startup_profiler_test_module  # noqa: F401
+
+        report = profiler.write_report()
+    finally:
+        sys.modules.pop("startup_profiler_test_module", None)
+
+    assert report is not None
+    imports = {entry["module"]: entry for entry in report["imports"]}
+    assert imports["startup_profiler_test_module"]["cumulative_seconds"] >= 0.05
+    assert report["profile_path"] == str(tmp_path / f"startup.{os.getpid()}.prof")
+    assert os.path.exists(report["profile_path"])
+
+
+def test_startup_profiler_phase(tmp_path):
+    profiler = StartupProfiler()
+    profiler.enable(report_path=str(tmp_path / "startup.json"))
+
+    with profiler.phase("load_config"):
+        assert profiler.phases == []
+
+    assert [phase["name"] for phase in profiler.phases] == ["load_config"]
+
+
+def test_startup_profiler_get_report_path():
+    pid = os.getpid()
+    assert StartupProfiler.get_report_path("/tmp/startup.json") == (
+        f"/tmp/startup.{pid}.json"
+    )
+    assert StartupProfiler.get_report_path("startup") == f"startup.{pid}.json"
@@ -12,7 +12,7 @@ sys.path.insert(
     0, os.path.abspath("../../../..")
 )  # Adds the parent directory to the system path
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import litellm
 from litellm.proxy._types import SpendLogsPayload
@@ -1234,3 +1234,226 @@ async def test_view_spend_logs_summarize_parameter(client, monkeypatch):
     assert "spend" in data[0]
     assert "users" in data[0]
     assert "models" in data[0]
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_recalculate_spend_logs(client, monkeypatch, dry_run):
+    from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+    from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+
+    rows = [
+        {
+            "request_id": "req-1",
+            "model": "gpt-4o",
+            "custom_llm_provider": "openai",
+            "prompt_tokens": 1000,
+            "completion_tokens": 500,
+            "cached_tokens": 0,
+            "spend": 0.0,
+        },
+        {
+            "request_id": "req-2",
+            "model": "my-unmapped-model",
+            "custom_llm_provider": None,
+            "prompt_tokens": 10,
+            "completion_tokens": 10,
+            "cached_tokens": 0,
+            "spend": 1.0,
+        },
+    ]
+    expected_prompt_cost, expected_completion_cost = litellm.cost_per_token(
+        model="gpt-4o", prompt_tokens=1000, completion_tokens=500
+    )
+    expected_cost = expected_prompt_cost + expected_completion_cost
+
+    mock_prisma_client = MagicMock()
+    mock_prisma_client.db.query_raw = AsyncMock(side_effect=[rows, []])
+    mock_batcher = MagicMock()
+    mock_prisma_client.db.batch_.return_value.__aenter__ = AsyncMock(
+        return_value=mock_batcher
+    )
+    mock_prisma_client.db.batch_.return_value.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr("litellm.proxy.proxy_server.prisma_client", mock_prisma_client)
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        user_role=LitellmUserRoles.PROXY_ADMIN
+    )
+    try:
+        response = client.post(
+            "/spend/logs/recalculate",
+            json={"start_date": "2025-01-01", "batch_size": 2, "dry_run": dry_run},
+        )
+    finally:
+        app.dependency_overrides.pop(user_api_key_auth, None)
+
+    assert response.status_code == 200
+    batches = [json.loads(line) for line in response.text.splitlines() if line]
+    assert len(batches) == 1
+    assert batches[0]["rows"] == 2
+    assert batches[0]["updated_rows"] == 1
+    assert batches[0]["spend_delta"] == pytest.approx(expected_cost)
+    assert batches[0]["last_request_id"] == "req-2"
+
+    # paginated on the last request_id of the previous batch
+    second_query_args = mock_prisma_client.db.query_raw.call_args_list[1].args
+    assert second_query_args[1] == "req-2"
+    assert second_query_args[2] == "2025-01-01"
+    assert second_query_args[5] == 2
+
+    if dry_run:
+        mock_batcher.litellm_spendlogs.update.assert_not_called()
+    else:
+        mock_batcher.litellm_spendlogs.update.assert_called_once_with(
+            where={"request_id": "req-1"}, data={"spend": expected_cost}
+        )
+
+
+def test_recalculate_spend_logs_keeps_spend_not_derivable_from_tokens(
+    client, monkeypatch
+):
+    from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+    from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+
+    row_defaults = {
+        "custom_llm_provider": None,
+        "prompt_tokens": 1000,
+        "completion_tokens": 100,
+        "cached_tokens": 0,
+        "spend": 0.5,
+    }
+    rows = [
+        {**row_defaults, "request_id": "req-1", "model": "whisper-1"},
+        {**row_defaults, "request_id": "req-2", "model": "tts-1"},
+        {
+            **row_defaults,
+            "request_id": "req-3",
+            "model": "claude-3-5-sonnet-20240620",
+            "cache_creation_tokens": 800,
+        },
+        {
+            **row_defaults,
+            "request_id": "req-4",
+            "model": "gpt-4o-audio-preview",
+            "audio_tokens": 200,
+        },
+        {
+            **row_defaults,
+            "request_id": "req-5",
+            "model": "o1",
+            "reasoning_tokens": 50,
+        },
+    ]
+
+    mock_prisma_client = MagicMock()
+    mock_prisma_client.db.query_raw = AsyncMock(side_effect=[rows, []])
+    mock_batcher = MagicMock()
+    mock_prisma_client.db.batch_.return_value.__aenter__ = AsyncMock(
+        return_value=mock_batcher
+    )
+    mock_prisma_client.db.batch_.return_value.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr("litellm.proxy.proxy_server.prisma_client", mock_prisma_client)
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        user_role=LitellmUserRoles.PROXY_ADMIN
+    )
+    try:
+        response = client.post(
+            "/spend/logs/recalculate",
+            json={"start_date": "2025-01-01", "batch_size": 10},
+        )
+    finally:
+        app.dependency_overrides.pop(user_api_key_auth, None)
+
+    assert response.status_code == 200
+    batches = [json.loads(line) for line in response.text.splitlines() if line]
+    assert batches[0]["rows"] == 5
+    assert batches[0]["updated_rows"] == 0
+    assert batches[0]["spend_delta"] == 0
+    mock_batcher.litellm_spendlogs.update.assert_not_called()
+
+
+def test_recalculate_spend_logs_uses_deployment_custom_pricing(client, monkeypatch):
+    """
+    Rows are priced with their deployment's (`model_id`) custom pricing, rows of an unknown deployment keep their spend.
+    """
+    from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+    from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+
+    monkeypatch.setattr(litellm, "model_cost", dict(litellm.model_cost))
+    Router(
+        model_list=[
+            {
+                "model_name": "custom-priced-gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "sk-test",
+                    "input_cost_per_token": 0.001,
+                    "output_cost_per_token": 0.002,
+                },
+                "model_info": {"id": "recalculate-custom-deployment"},
+            }
+        ]
+    )
+    row_defaults = {
+        "model": "gpt-4o",
+        "custom_llm_provider": "openai",
+        "prompt_tokens": 1000,
+        "completion_tokens": 500,
+        "cached_tokens": 0,
+        "spend": 0.5,
+    }
+    rows = [
+        {
+            **row_defaults,
+            "request_id": "req-1",
+            "model_id": "recalculate-custom-deployment",
+        },
+        {
+            **row_defaults,
+            "request_id": "req-2",
+            "model_id": "recalculate-deleted-deployment",
+        },
+    ]
+
+    mock_prisma_client = MagicMock()
+    mock_prisma_client.db.query_raw = AsyncMock(side_effect=[rows, []])
+    mock_batcher = MagicMock()
+    mock_prisma_client.db.batch_.return_value.__aenter__ = AsyncMock(
+        return_value=mock_batcher
+    )
+    mock_prisma_client.db.batch_.return_value.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr("litellm.proxy.proxy_server.prisma_client", mock_prisma_client)
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        user_role=LitellmUserRoles.PROXY_ADMIN
+    )
+    try:
+        response = client.post(
+            "/spend/logs/recalculate",
+            json={"start_date": "2025-01-01", "batch_size": 10},
+        )
+    finally:
+        app.dependency_overrides.pop(user_api_key_auth, None)
+
+    assert response.status_code == 200
+    batches = [json.loads(line) for line in response.text.splitlines() if line]
+    assert batches[0]["rows"] == 2
+    assert batches[0]["updated_rows"] == 1
+    assert "model_id" in mock_prisma_client.db.query_raw.call_args_list[0].args[0]
+    mock_batcher.litellm_spendlogs.update.assert_called_once_with(
+        where={"request_id": "req-1"},
+        data={"spend": pytest.approx(1000 * 0.001 + 500 * 0.002)},
+    )
+
+
+def test_recalculate_spend_logs_requires_proxy_admin(client, monkeypatch):
+    from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+    from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+
+    monkeypatch.setattr("litellm.proxy.proxy_server.prisma_client", MagicMock())
+    app.dependency_overrides[user_api_key_auth] = lambda: UserAPIKeyAuth(
+        user_role=LitellmUserRoles.INTERNAL_USER
+    )
+    try:
+        response = client.post("/spend/logs/recalculate", json={})
+    finally:
+        app.dependency_overrides.pop(user_api_key_auth, None)
+
+    assert response.status_code == 403
@@ -136,6 +136,67 @@ class TestProxyInitializationHelpers:
             mock_app, "localhost", 8000, "cert.pem", "key.pem", "ECDHE"
         )
 
+    @pytest.mark.parametrize("num_workers", [1, 4])
+    @patch("builtins.print")
+    def test_run_gunicorn_server_preloads_shared_state_for_workers(
+        self, mock_print, num_workers
+    ):
+        gunicorn_app_base = pytest.importorskip("gunicorn.app.base")
+
+        with patch.object(
+            gunicorn_app_base.BaseApplication, "run"
+        ) as mock_run, patch.object(
+            ProxyInitializationHelpers, "_preload_shared_state"
+        ) as mock_preload, patch.object(
+            gunicorn_app_base.BaseApplication, "__init__", return_value=None
+        ) as mock_init:
+            ProxyInitializationHelpers._run_gunicorn_server(
+                host="localhost",
+                port=8000,
+                app=MagicMock(),
+                num_workers=num_workers,
+                ssl_certfile_path=None,
+                ssl_keyfile_path=None,
+            )
+
+        mock_run.assert_called_once()
+        assert mock_preload.call_count == (1 if num_workers > 1 else 0)
+
+    def test_gunicorn_pre_fork_freezes_gc(self):
+        with patch("litellm.proxy.proxy_cli.gc.freeze") as mock_freeze:
+            ProxyInitializationHelpers._gunicorn_pre_fork(
+                server=MagicMock(), worker=MagicMock()
+            )
+
+        mock_freeze.assert_called_once()
+
+    def test_preload_shared_state_loads_lazy_handlers(self):
+        import json
+        import subprocess
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import json, litellm;"
+                "from litellm.litellm_core_utils.lazy_loading import is_loaded;"
+                "from litellm.proxy.proxy_cli import ProxyInitializationHelpers;"
+                "before = is_loaded(litellm.main.vertex_chat_completion);"
+                "ProxyInitializationHelpers._preload_shared_state();"
+                "print(json.dumps({'before': before, 'after': is_loaded(litellm.main.vertex_chat_completion), "
+                "'provider_config_loaded': 'OpenAIGPTConfig' in vars(litellm)}))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == {
+            "before": False,
+            "after": True,
+            "provider_config_loaded": True,
+        }
+
     @patch("subprocess.Popen")
     def test_run_ollama_serve(self, mock_popen):
         # Execute
@@ -313,6 +374,52 @@ class TestProxyInitializationHelpers:
             call_args = mock_uvicorn_run.call_args
             assert call_args[1]["timeout_keep_alive"] == 30
 
+    @patch("uvicorn.run")
+    @patch("builtins.print")
+    def test_profile_startup_flag(self, mock_print, mock_uvicorn_run, tmp_path):
+        """--profile_startup enables the startup profiler, for this process and new worker processes"""
+        from click.testing import CliRunner
+
+        from litellm.proxy.common_utils.startup_profiler import StartupProfiler
+        from litellm.proxy.proxy_cli import run_server
+
+        runner = CliRunner()
+        report_path = str(tmp_path / "startup.json")
+        profiler = StartupProfiler()
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "proxy_server": MagicMock(
+                    app=MagicMock(),
+                    ProxyConfig=MagicMock(),
+                    KeyManagementSettings=MagicMock(),
+                    save_worker_config=MagicMock(),
+                )
+            },
+        ), patch.dict(os.environ, {}), patch(
+            "litellm.proxy.common_utils.startup_profiler.startup_profiler", profiler
+        ):
+            result = runner.invoke(
+                run_server,
+                [
+                    "--local",
+                    "--skip_server_startup",
+                    "--profile-startup",
+                    report_path,
+                    "--profile_startup_imports",
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert os.environ["LITELLM_PROFILE_STARTUP"] == report_path
+            assert os.environ["LITELLM_PROFILE_STARTUP_IMPORTS"] == "True"
+
+        profiler.write_report()  # stops the import profiler
+        assert profiler.report_path == report_path
+        assert profiler.profile_imports is True
+        assert [phase["name"] for phase in profiler.phases] == ["import_proxy_server"]
+
     @patch.dict(os.environ, {}, clear=True)
     def test_construct_database_url_from_env_vars(self):
         """Test the construct_database_url_from_env_vars function with various scenarios"""
@@ -213,6 +213,52 @@ async def test_aaaproxy_startup_master_key(mock_prisma, monkeypatch, tmp_path):
         assert master_key == test_resolved_key
 
 
+@pytest.mark.asyncio
+async def test_proxy_startup_event_writes_startup_profile(monkeypatch, tmp_path):
+    import yaml
+    from fastapi import FastAPI
+
+    from litellm.proxy.common_utils.startup_profiler import StartupProfiler
+    from litellm.proxy.proxy_server import proxy_startup_event
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                "model_list": [
+                    {
+                        "model_name": "gpt-4o",
+                        "litellm_params": {"model": "gpt-4o", "api_key": "sk-1"},
+                    }
+                ]
+            }
+        )
+    )
+    monkeypatch.setenv("CONFIG_FILE_PATH", str(config_path))
+    report_path = tmp_path / "startup.json"
+    profiler = StartupProfiler()
+    profiler.enable(report_path=str(report_path))
+
+    with patch(
+        "litellm.proxy.proxy_server.ProxyStartupEvent._setup_prisma_client",
+        return_value=None,
+    ), patch("litellm.proxy.proxy_server.startup_profiler", profiler):
+        async with proxy_startup_event(FastAPI()):
+            report = json.loads((tmp_path / f"startup.{os.getpid()}.json").read_text())
+
+    assert [phase["name"] for phase in report["phases"]] == [
+        "server_init",
+        "load_config",
+        "prisma_connect",
+        "callbacks",
+        "jwt_auth",
+        "background_jobs",
+        "dd_tracer",
+    ]
+    assert "router" in report["timings"]["load_config"]
+    assert report["timings"]["router_init"]["num_deployments"] == 1
+
+
 def test_team_info_masking():
     """
     Test that sensitive team information is properly masked
@@ -542,6 +588,152 @@ async def test_delete_deployment_type_mismatch():
         ), f"Model 12345679 should NOT be deleted. Deleted IDs: {deleted_ids}"
 
 
+def _make_db_model(model_id: str, api_base: str):
+    from types import SimpleNamespace
+
+    return SimpleNamespace(
+        model_id=model_id,
+        model_name="gpt-4o",
+        litellm_params={"model": "gpt-4o", "api_key": "sk-1", "api_base": api_base},
+        model_info={},
+    )
+
+
+def _make_model_table_prisma_client(db_models: dict):
+    """
+    prisma client over `db_models` (model_id -> (updated_at, db model)), records which rows were fetched
+    """
+    prisma_client = MagicMock()
+    fetched_model_ids = []
+
+    async def query_raw(query):
+        return [
+            {"model_id": model_id, "updated_at": updated_at}
+            for model_id, (updated_at, _) in db_models.items()
+        ]
+
+    async def find_many(where=None):
+        model_ids = list(db_models) if where is None else where["model_id"]["in"]
+        fetched_model_ids.extend(model_ids)
+        return [db_models[model_id][1] for model_id in model_ids]
+
+    prisma_client.db.query_raw = AsyncMock(side_effect=query_raw)
+    prisma_client.db.litellm_proxymodeltable.find_many = AsyncMock(
+        side_effect=find_many
+    )
+    prisma_client.db.litellm_config.find_first = AsyncMock(return_value=None)
+    return prisma_client, fetched_model_ids
+
+
+@pytest.mark.asyncio
+async def test_add_deployment_only_fetches_changed_db_models():
+    """
+    Each sync reads model_id / updated_at for the whole table, fetches and upserts only changed rows and removes deleted rows by id.
+    """
+    import litellm.proxy.proxy_server as proxy_server
+    from litellm.proxy.proxy_server import ProxyConfig
+
+    pc = ProxyConfig()
+    pc.get_config = AsyncMock(return_value={})
+    pc._init_non_llm_objects_in_db = AsyncMock()
+    db_models = {
+        "model-1": ("2025-01-01T00:00:00", _make_db_model("model-1", "https://a")),
+        "model-2": ("2025-01-01T00:00:00", _make_db_model("model-2", "https://b")),
+    }
+    prisma_client, fetched_model_ids = _make_model_table_prisma_client(db_models)
+
+    with patch.object(proxy_server, "llm_router", None), patch.object(
+        proxy_server, "master_key", "sk-1234"
+    ), patch.object(proxy_server, "user_config_file_path", None), patch.object(
+        proxy_server,
+        "decrypt_value_helper",
+        side_effect=lambda value, key, **kwargs: value,
+    ):
+        await pc.add_deployment(
+            prisma_client=prisma_client, proxy_logging_obj=MagicMock()
+        )
+        assert sorted(fetched_model_ids) == ["model-1", "model-2"]
+        assert sorted(proxy_server.llm_router.get_model_ids()) == [
+            "model-1",
+            "model-2",
+        ]
+
+        # nothing changed - no rows fetched
+        fetched_model_ids.clear()
+        await pc.add_deployment(
+            prisma_client=prisma_client, proxy_logging_obj=MagicMock()
+        )
+        assert fetched_model_ids == []
+
+        # model-2 updated, model-1 deleted, model-3 added
+        db_models["model-2"] = (
+            "2025-01-02T00:00:00",
+            _make_db_model("model-2", "https://b-2"),
+        )
+        del db_models["model-1"]
+        db_models["model-3"] = (
+            "2025-01-02T00:00:00",
+            _make_db_model("model-3", "https://c"),
+        )
+        await pc.add_deployment(
+            prisma_client=prisma_client, proxy_logging_obj=MagicMock()
+        )
+        assert sorted(fetched_model_ids) == ["model-2", "model-3"]
+        assert sorted(proxy_server.llm_router.get_model_ids()) == [
+            "model-2",
+            "model-3",
+        ]
+        deployment = proxy_server.llm_router.get_deployment(model_id="model-2")
+        assert deployment is not None
+        assert deployment.litellm_params.api_base == "https://b-2"
+
+
+@pytest.mark.asyncio
+async def test_add_deployment_refetches_db_models_for_new_router():
+    """
+    A replaced router (e.g. config reload) gets every db model again, and a failed version query falls back to a full fetch.
+    """
+    import litellm.proxy.proxy_server as proxy_server
+    from litellm import Router
+    from litellm.proxy.proxy_server import ProxyConfig
+
+    pc = ProxyConfig()
+    pc.get_config = AsyncMock(return_value={})
+    pc._init_non_llm_objects_in_db = AsyncMock()
+    db_models = {
+        "model-1": ("2025-01-01T00:00:00", _make_db_model("model-1", "https://a")),
+    }
+    prisma_client, fetched_model_ids = _make_model_table_prisma_client(db_models)
+
+    with patch.object(proxy_server, "llm_router", None), patch.object(
+        proxy_server, "master_key", "sk-1234"
+    ), patch.object(proxy_server, "user_config_file_path", None), patch.object(
+        proxy_server,
+        "decrypt_value_helper",
+        side_effect=lambda value, key, **kwargs: value,
+    ):
+        await pc.add_deployment(
+            prisma_client=prisma_client, proxy_logging_obj=MagicMock()
+        )
+        assert fetched_model_ids == ["model-1"]
+
+        proxy_server.llm_router = Router(model_list=[])
+        fetched_model_ids.clear()
+        await pc.add_deployment(
+            prisma_client=prisma_client, proxy_logging_obj=MagicMock()
+        )
+        assert fetched_model_ids == ["model-1"]
+        assert proxy_server.llm_router.get_model_ids() == ["model-1"]
+
+        prisma_client.db.query_raw.side_effect = Exception("db unavailable")
+        fetched_model_ids.clear()
+        await pc.add_deployment(
+            prisma_client=prisma_client, proxy_logging_obj=MagicMock()
+        )
+        assert fetched_model_ids == ["model-1"]
+        assert proxy_server.llm_router.get_model_ids() == ["model-1"]
+
+
 @pytest.mark.asyncio
 async def test_get_config_from_file(tmp_path, monkeypatch):
     """
@@ -614,6 +806,97 @@ async def test_get_config_from_file(tmp_path, monkeypatch):
     assert result == test_config
 
 
+@pytest.mark.asyncio
+async def test_get_config_from_file_parses_unchanged_file_once(tmp_path):
+    from litellm.proxy.proxy_server import ProxyConfig
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                "model_list": [
+                    {"model_name": "gpt-4", "litellm_params": {"model": "gpt-4"}}
+                ]
+            }
+        )
+    )
+    proxy_config = ProxyConfig()
+
+    with patch(
+        "litellm.proxy.proxy_server.yaml.safe_load", wraps=yaml.safe_load
+    ) as mock_safe_load:
+        config = await proxy_config._get_config_from_file(str(config_path))
+        config["model_list"][0]["litellm_params"]["model"] = "modified-by-caller"
+        config = await proxy_config._get_config_from_file(str(config_path))
+        assert mock_safe_load.call_count == 1
+        assert config["model_list"][0]["litellm_params"]["model"] == "gpt-4"
+
+        config_path.write_text(
+            yaml.dump({"model_list": [], "general_settings": {"master_key": "sk-1"}})
+        )
+        config = await proxy_config._get_config_from_file(str(config_path))
+        assert mock_safe_load.call_count == 2
+        assert config["general_settings"] == {"master_key": "sk-1"}
+
+
+@pytest.mark.asyncio
+async def test_load_config_resolves_model_list_secrets_once_and_records_timings(
+    tmp_path, monkeypatch
+):
+    from litellm.proxy.proxy_server import ProxyConfig
+    from litellm.secret_managers import main as secret_managers_main
+
+    monkeypatch.setenv("TEST_LOAD_CONFIG_API_KEY", "sk-from-env")
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump(
+            {
+                "model_list": [
+                    {
+                        "model_name": "gpt-4o",
+                        "litellm_params": {
+                            "model": "gpt-4o",
+                            "api_key": "os.environ/TEST_LOAD_CONFIG_API_KEY",
+                            "api_base": f"https://example-{i}.com",
+                        },
+                    }
+                    for i in range(3)
+                ]
+            }
+        )
+    )
+    proxy_config = ProxyConfig()
+
+    with patch.object(
+        secret_managers_main, "get_secret", wraps=secret_managers_main.get_secret
+    ) as mock_get_secret:
+        router, model_list, _ = await proxy_config.load_config(
+            router=None, config_file_path=str(config_path)
+        )
+
+    assert [
+        call.args[0]
+        for call in mock_get_secret.call_args_list
+        if call.args and call.args[0].startswith("os.environ/")
+    ] == ["os.environ/TEST_LOAD_CONFIG_API_KEY"]
+    assert [model["litellm_params"]["api_key"] for model in model_list] == [
+        "sk-from-env"
+    ] * 3
+    assert list(proxy_config.load_config_timings) == [
+        "get_config",
+        "litellm_settings",
+        "general_settings",
+        "model_list",
+        "endpoint_settings",
+        "router",
+        "guardrails",
+        "credentials",
+        "non_llm_configs",
+        "total",
+    ]
+    assert all(seconds >= 0 for seconds in proxy_config.load_config_timings.values())
+
+
 @pytest.mark.asyncio
 async def test_add_proxy_budget_to_db_only_creates_user_no_keys():
     """
@@ -942,6 +1225,57 @@ async def test_write_config_to_file_when_store_model_in_db_false(monkeypatch):
         )
 
 
+@pytest.mark.asyncio
+async def test_async_data_generator_client_disconnect_closes_upstream_stream():
+    """
+    The upstream `aclose` task is referenced until it's done, so it can't be garbage collected mid-close.
+    """
+    from litellm.proxy import proxy_server
+    from litellm.proxy._types import UserAPIKeyAuth
+    from litellm.proxy.proxy_server import async_data_generator
+    from litellm.proxy.utils import ProxyLogging
+
+    close_started = asyncio.Event()
+    finish_close = asyncio.Event()
+
+    async def mock_aclose():
+        close_started.set()
+        await finish_close.wait()
+
+    mock_response = MagicMock(spec=litellm.CustomStreamWrapper)
+    mock_response.aclose = AsyncMock(side_effect=mock_aclose)
+    mock_response.completion_stream = MagicMock()
+
+    async def mock_streaming_iterator(*args, **kwargs):
+        while True:
+            yield {"choices": [{"delta": {"content": "Hello"}}]}
+
+    mock_proxy_logging_obj = MagicMock(spec=ProxyLogging)
+    mock_proxy_logging_obj.async_post_call_streaming_iterator_hook = (
+        mock_streaming_iterator
+    )
+    mock_proxy_logging_obj.async_post_call_streaming_hook = AsyncMock(
+        side_effect=lambda *args, **kwargs: kwargs.get("response")
+    )
+
+    with patch("litellm.proxy.proxy_server.proxy_logging_obj", mock_proxy_logging_obj):
+        generator = async_data_generator(
+            mock_response,
+            MagicMock(spec=UserAPIKeyAuth),
+            {"model": "gpt-3.5-turbo", "messages": []},
+        )
+        assert (await generator.__anext__()).startswith("data: ")
+        await generator.aclose()  # client disconnected
+
+        assert len(proxy_server._stream_close_tasks) == 1
+        await asyncio.wait_for(close_started.wait(), timeout=5)
+        finish_close.set()
+        await asyncio.gather(*proxy_server._stream_close_tasks)
+
+    mock_response.aclose.assert_awaited_once()
+    assert len(proxy_server._stream_close_tasks) == 0
+
+
 @pytest.mark.asyncio
 async def test_async_data_generator_midstream_error():
     """
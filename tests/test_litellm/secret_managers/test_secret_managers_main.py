@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from litellm.secret_managers.main import get_secret
+from litellm.secret_managers.main import get_secret, get_secrets
 
 # Set up logging for debugging
 logging.basicConfig(level=logging.DEBUG)
@@ -195,3 +195,48 @@ def test_unsupported_oidc_provider():
 
     with pytest.raises(ValueError, match="Unsupported OIDC provider"):
         get_secret(secret_name)
+
+
+def test_get_secrets_resolves_each_name_once(monkeypatch):
+    monkeypatch.setenv("TEST_GET_SECRETS_KEY", "sk-1")
+    monkeypatch.setenv("TEST_GET_SECRETS_BASE", "https://example.com")
+
+    with patch(
+        "litellm.secret_managers.main.get_secret", wraps=get_secret
+    ) as mock_get_secret:
+        result = get_secrets(
+            [
+                "os.environ/TEST_GET_SECRETS_KEY",
+                "os.environ/TEST_GET_SECRETS_BASE",
+                "os.environ/TEST_GET_SECRETS_KEY",
+            ]
+        )
+
+    assert result == {
+        "os.environ/TEST_GET_SECRETS_KEY": "sk-1",
+        "os.environ/TEST_GET_SECRETS_BASE": "https://example.com",
+    }
+    assert mock_get_secret.call_count == 2
+
+
+def test_get_secrets_uses_thread_pool_with_secret_manager(monkeypatch):
+    import threading
+
+    import litellm
+    from litellm.types.secret_managers.main import KeyManagementSystem
+
+    monkeypatch.setattr(
+        litellm, "_key_management_system", KeyManagementSystem.AWS_SECRET_MANAGER
+    )
+    lookup_threads = {}
+
+    def mock_get_secret(secret_name):
+        lookup_threads[secret_name] = threading.get_ident()
+        return secret_name.upper()
+
+    secret_names = [f"os.environ/SECRET_{i}" for i in range(3)]
+    with patch("litellm.secret_managers.main.get_secret", side_effect=mock_get_secret):
+        result = get_secrets(secret_names)
+
+    assert result == {name: name.upper() for name in secret_names}
+    assert threading.get_ident() not in lookup_threads.values()
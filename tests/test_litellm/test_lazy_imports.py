@@ -0,0 +1,151 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+
+# `import litellm` only loads the shared base configs / cost calculators - provider configs, handlers
+# and logging integrations are loaded on first use. Measured: 79 `litellm.llms.*` / 23 `litellm.integrations.*`.
+MAX_LLMS_MODULES_ON_IMPORT = 85
+MAX_INTEGRATIONS_MODULES_ON_IMPORT = 26
+
+# logging integrations `litellm_logging` / `_service_logger` used to import on `import litellm`
+DEFERRED_INTEGRATION_MODULES = [
+    "litellm.integrations.langfuse.langfuse",
+    "litellm.integrations.langfuse.langfuse_prompt_management",
+    "litellm.integrations.langsmith",
+    "litellm.integrations.datadog.datadog",
+    "litellm.integrations.opentelemetry",
+    "litellm.integrations.prometheus_services",
+    "litellm.integrations.s3_v2",
+    "litellm.integrations.sqs",
+    "litellm.integrations.gcs_bucket.gcs_bucket",
+    "litellm.integrations.opik.opik",
+]
+
+
+def _run_python(code: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.path.join(os.path.dirname(__file__), "../.."),
+        env={**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"},
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("name", sorted(litellm._lazy_imports))
+def test_lazy_import_resolves(name):
+    module_name, attr_name = litellm._lazy_imports[name]
+    module = importlib.import_module(module_name, "litellm")
+
+    assert getattr(litellm, name) is getattr(module, attr_name)
+    assert name in dir(litellm)
+
+
+@pytest.mark.parametrize("name", sorted(litellm._lazy_instances))
+def test_lazy_instance_is_shared(name):
+    instance = getattr(litellm, name)
+
+    assert isinstance(instance, getattr(litellm, litellm._lazy_instances[name]))
+    assert getattr(litellm, name) is instance
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        litellm.NotARealProviderConfig
+
+    assert not hasattr(litellm, "NotARealProviderConfig")
+
+
+def test_provider_configs_not_imported_on_import():
+    """
+    Import time / memory regression test - `import litellm` doesn't load the provider configs, handlers or logging integrations.
+    """
+    result = _run_python(
+        "import json, sys, litellm;"
+        "before = 'litellm.llms.hyperbolic.chat.transformation' in sys.modules;"
+        "llms_modules = len([m for m in sys.modules if m.startswith('litellm.llms.')]);"
+        "integrations_modules = len([m for m in sys.modules if m.startswith('litellm.integrations.')]);"
+        f"deferred_modules = [m for m in {DEFERRED_INTEGRATION_MODULES!r} + ['litellm.llms.openai.openai', 'litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini'] if m in sys.modules];"
+        "litellm.HyperbolicChatConfig;"
+        "print(json.dumps({"
+        "'before': before,"
+        "'after': 'litellm.llms.hyperbolic.chat.transformation' in sys.modules,"
+        "'llms_modules': llms_modules,"
+        "'integrations_modules': integrations_modules,"
+        "'deferred_modules': deferred_modules,"
+        "}))"
+    )
+
+    assert result["before"] is False
+    assert result["after"] is True
+    assert result["deferred_modules"] == []
+    assert result["llms_modules"] <= MAX_LLMS_MODULES_ON_IMPORT
+    assert result["integrations_modules"] <= MAX_INTEGRATIONS_MODULES_ON_IMPORT
+
+
+def test_import_defers_modules_of_eager_import():
+    """
+    `import litellm` loads fewer modules than the old eager import - checked on `sys.modules`, not wall-clock time.
+    """
+    result = _run_python(
+        "import importlib, json, sys;"
+        "import litellm;"
+        "lazy_modules = {m for m in sys.modules if m.startswith('litellm.')};"
+        "from litellm.litellm_core_utils.lazy_loading import LazyObject;"
+        "[getattr(litellm, name) for name in list(litellm._lazy_imports) + list(litellm._lazy_instances)];"
+        "[value.__class__ for module in list(sys.modules.values()) if getattr(module, '__name__', '').startswith('litellm') for value in list(vars(module).values()) if type(value) is LazyObject];"
+        f"[importlib.import_module(m) for m in {DEFERRED_INTEGRATION_MODULES!r}];"
+        "eager_modules = {m for m in sys.modules if m.startswith('litellm.')};"
+        "print(json.dumps({'lazy_modules': sorted(lazy_modules), 'eager_modules': sorted(eager_modules)}))"
+    )
+    lazy_modules = set(result["lazy_modules"])
+    eager_modules = set(result["eager_modules"])
+
+    assert lazy_modules < eager_modules
+    for module_name in DEFERRED_INTEGRATION_MODULES + [
+        "litellm.llms.openai.openai",
+        "litellm.llms.hyperbolic.chat.transformation",
+    ]:
+        assert module_name not in lazy_modules
+        assert module_name in eager_modules
+
+
+def test_lazy_handlers_are_created_on_first_use():
+    from litellm.litellm_core_utils.lazy_loading import LazyObject, is_loaded
+
+    result = _run_python(
+        "import json, litellm;"
+        "from litellm.litellm_core_utils.lazy_loading import is_loaded;"
+        "before = is_loaded(litellm.main.vertex_chat_completion);"
+        "litellm.main.vertex_chat_completion.completion;"
+        "print(json.dumps({'before': before, 'after': is_loaded(litellm.main.vertex_chat_completion)}))"
+    )
+    assert result == {"before": False, "after": True}
+
+    handler = litellm.main.openai_chat_completions
+    assert type(handler) is LazyObject
+    assert isinstance(handler, getattr(litellm, "OpenAIChatCompletion"))
+    assert is_loaded(handler)
+
+
+def test_from_import_of_lazy_provider_config():
+    result = _run_python(
+        "import json;"
+        "from litellm import AnthropicConfig, openAIGPTConfig;"
+        "print(json.dumps({'name': AnthropicConfig.__name__, 'instance': type(openAIGPTConfig).__name__}))"
+    )
+
+    assert result == {"name": "AnthropicConfig", "instance": "OpenAIGPTConfig"}
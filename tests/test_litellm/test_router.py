@@ -351,6 +351,299 @@ def test_arouter_ignore_invalid_deployments():
     assert router.get_model_list() == []
 
 
+def test_router_resolves_each_model_list_secret_once(monkeypatch):
+    monkeypatch.setenv("TEST_ROUTER_API_KEY", "sk-from-env")
+    model_list = [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {
+                "model": "gpt-4o",
+                "api_key": "os.environ/TEST_ROUTER_API_KEY",
+                "api_base": f"https://example-{i}.com",
+            },
+        }
+        for i in range(3)
+    ]
+    original_model_list = copy.deepcopy(model_list)
+
+    from litellm.secret_managers import main as secret_managers_main
+
+    with patch.object(
+        secret_managers_main, "get_secret", wraps=secret_managers_main.get_secret
+    ) as mock:
+        router = litellm.Router(model_list=model_list)
+
+    assert [
+        call.args[0]
+        for call in mock.call_args_list
+        if call.args and call.args[0].startswith("os.environ/")
+    ] == ["os.environ/TEST_ROUTER_API_KEY"]
+    assert model_list == original_model_list  # caller's list is not modified
+    assert [
+        deployment["litellm_params"]["api_key"]
+        for deployment in router.get_model_list()
+    ] == ["sk-from-env"] * 3
+    assert router.deployment_init_timings["num_deployments"] == 3
+    assert router.deployment_init_timings["num_secrets"] == 1
+    for stage in (
+        "secret_resolution_seconds",
+        "deployment_creation_seconds",
+        "total_seconds",
+    ):
+        assert router.deployment_init_timings[stage] >= 0
+
+
+def test_router_resolves_secret_manager_values_on_thread_pool(monkeypatch):
+    import threading
+
+    from litellm.types.secret_managers.main import KeyManagementSystem
+
+    monkeypatch.setattr(
+        litellm, "_key_management_system", KeyManagementSystem.AZURE_KEY_VAULT
+    )
+    lookup_threads = {}
+    get_secret = litellm.secret_managers.main.get_secret
+
+    def mock_get_secret(secret_name, *args, **kwargs):
+        if not secret_name.startswith("os.environ/"):
+            return get_secret(secret_name, *args, **kwargs)
+        lookup_threads[secret_name] = threading.get_ident()
+        return secret_name.replace("os.environ/", "resolved-")
+
+    model_list = [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {
+                "model": "gpt-4o",
+                "api_key": f"os.environ/API_KEY_{i}",
+            },
+        }
+        for i in range(4)
+    ]
+    with patch("litellm.secret_managers.main.get_secret", side_effect=mock_get_secret):
+        router = litellm.Router(model_list=model_list)
+
+    assert sorted(lookup_threads) == [f"os.environ/API_KEY_{i}" for i in range(4)]
+    assert threading.get_ident() not in lookup_threads.values()
+    assert [
+        deployment["litellm_params"]["api_key"]
+        for deployment in router.get_model_list()
+    ] == [f"resolved-API_KEY_{i}" for i in range(4)]
+
+
+def test_compile_deployment_price_records():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "openai/gpt-4o",
+                    "api_key": "sk-1",
+                    "input_cost_per_token": 0.000001,
+                },
+                "model_info": {"id": "my-model-id"},
+            }
+        ]
+    )
+    deployment = router.get_deployment(model_id="my-model-id")
+
+    with patch("litellm.router.compile_deployment_price_records") as mock_compile:
+        router._compile_deployment_price_records(
+            deployment=deployment, custom_llm_provider="openai"
+        )
+    mock_compile.assert_called_once_with(
+        model="openai/gpt-4o",
+        custom_llm_provider="openai",
+        model_id="my-model-id",
+        custom_pricing=True,
+    )
+
+    # a failure to compile doesn't fail adding the deployment
+    with patch(
+        "litellm.router.compile_deployment_price_records",
+        side_effect=Exception("bad model"),
+    ):
+        router._compile_deployment_price_records(
+            deployment=deployment, custom_llm_provider="openai"
+        )
+
+
+def test_resolve_model_list_secrets(monkeypatch):
+    monkeypatch.setenv("TEST_ROUTER_API_KEY", "sk-from-env")
+    router = litellm.Router(model_list=[])
+
+    secrets = router._resolve_model_list_secrets(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "gpt-4o",
+                    "api_key": "os.environ/TEST_ROUTER_API_KEY",
+                },
+            },
+            {
+                "model_name": "gpt-4o-mini",
+                "litellm_params": {
+                    "model": "gpt-4o-mini",
+                    "api_key": "os.environ/TEST_ROUTER_API_KEY",
+                    "api_base": "https://example.com",
+                },
+            },
+            {"model_name": "no-litellm-params"},
+        ]
+    )
+
+    assert secrets == {"os.environ/TEST_ROUTER_API_KEY": "sk-from-env"}
+
+
+def _make_deployment(model_id: str, api_base: str, model_name: str = "gpt-4o"):
+    from litellm.types.router import Deployment
+
+    return Deployment(
+        model_name=model_name,
+        litellm_params={"model": "gpt-4o", "api_key": "sk-1", "api_base": api_base},  # type: ignore
+        model_info={"id": model_id},  # type: ignore
+    )
+
+
+def test_upsert_deployment_skips_unchanged_deployment_by_content_hash():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "gpt-4o",
+                    "api_key": "sk-1",
+                    "api_base": "https://a",
+                },
+                "model_info": {"id": "model-1"},
+            }
+        ]
+    )
+
+    with patch.object(router, "get_deployment") as mock_get_deployment:
+        assert (
+            router.upsert_deployment(_make_deployment("model-1", "https://a")) is None
+        )
+    mock_get_deployment.assert_not_called()
+
+    assert (
+        router.upsert_deployment(_make_deployment("model-1", "https://b")) is not None
+    )
+    assert router.get_model_list()[0]["litellm_params"]["api_base"] == "https://b"
+    assert router.upsert_deployment(_make_deployment("model-1", "https://b")) is None
+
+    # model_list cleared outside the router - the deployment is added again
+    router.model_list.clear()
+    assert (
+        router.upsert_deployment(_make_deployment("model-1", "https://b")) is not None
+    )
+    assert router.get_model_ids() == ["model-1"]
+
+    router.delete_deployment(id="model-1")
+    assert (
+        router.upsert_deployment(_make_deployment("model-1", "https://b")) is not None
+    )
+
+
+def test_bulk_upsert_deployments_applies_only_changed_deployments():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "gpt-4o",
+                    "api_key": "sk-1",
+                    "api_base": f"https://{model_id}",
+                },
+                "model_info": {"id": model_id},
+            }
+            for model_id in ("model-1", "model-2")
+        ]
+    )
+    model_list = router.model_list
+
+    with patch.object(
+        router, "_add_deployment", wraps=router._add_deployment
+    ) as mock_add_deployment:
+        upserted = router.bulk_upsert_deployments(
+            deployments=[
+                _make_deployment("model-1", "https://model-1"),  # unchanged
+                _make_deployment("model-2", "https://model-2-new"),  # changed
+                _make_deployment("model-3", "https://model-3", "gpt-4o-mini"),  # new
+            ]
+        )
+
+    assert [deployment.model_info.id for deployment in upserted] == [
+        "model-2",
+        "model-3",
+    ]
+    assert mock_add_deployment.call_count == 2
+    assert router.model_list is model_list
+    assert router.get_model_ids() == ["model-1", "model-2", "model-3"]
+    assert (
+        router.get_deployment(model_id="model-2").litellm_params.api_base
+        == "https://model-2-new"
+    )
+    assert "gpt-4o-mini" in router.model_names
+
+    # applying the same set again is a no-op
+    with patch.object(router, "_add_deployment") as mock_add_deployment:
+        assert (
+            router.bulk_upsert_deployments(
+                deployments=[
+                    _make_deployment("model-2", "https://model-2-new"),
+                    _make_deployment("model-3", "https://model-3", "gpt-4o-mini"),
+                ]
+            )
+            == []
+        )
+    mock_add_deployment.assert_not_called()
+
+
+def test_bulk_upsert_deployments_ignores_invalid_deployments():
+    from litellm.types.router import Deployment
+
+    router = litellm.Router(model_list=[], ignore_invalid_deployments=True)
+
+    upserted = router.bulk_upsert_deployments(
+        deployments=[
+            Deployment(
+                model_name="gpt-4o",
+                litellm_params={"model": "my-bad-model"},  # type: ignore
+                model_info={"id": "bad-model"},  # type: ignore
+            ),
+            _make_deployment("model-1", "https://a"),
+        ]
+    )
+
+    assert [deployment.model_info.id for deployment in upserted] == ["model-1"]
+    assert router.get_model_ids() == ["model-1"]
+
+
+def test_deployment_content_hash_tracks_litellm_params():
+    router = litellm.Router(model_list=[])
+    deployment = _make_deployment("model-1", "https://a")
+
+    content_hash = router._get_deployment_content_hash(deployment)
+    assert content_hash == router._get_deployment_content_hash(
+        _make_deployment("model-1", "https://a")
+    )
+    assert content_hash != router._get_deployment_content_hash(
+        _make_deployment("model-1", "https://b")
+    )
+
+    router._set_deployment_content_hash(model_id="model-1", content_hash=content_hash)
+    assert router._get_deployment_content_hashes() == {"model-1": content_hash}
+    router._set_deployment_content_hash(model_id="model-1", content_hash=None)
+    assert router._get_deployment_content_hashes() == {}
+
+    # replacing `model_list` directly drops the recorded hashes
+    router._set_deployment_content_hash(model_id="model-1", content_hash=content_hash)
+    router.model_list = [deployment.to_json(exclude_none=True)]
+    assert router._get_deployment_content_hashes() == {}
+
+
 @pytest.mark.asyncio
 async def test_arouter_aretrieve_batch():
     """
@@ -2187,6 +2187,67 @@ def test_is_valid_api_key():
     assert not is_valid_api_key("a" * 65)
 
 
+def test_get_model_info_uses_model_cost_key_index():
+    """
+    Repeated lookups (incl. unmapped models) reuse the indexed model_cost key, instead of re-resolving the model name
+    """
+    from litellm.utils import _get_model_info_helper
+
+    _get_model_info_helper(model="gpt-4o", custom_llm_provider=None)
+    with pytest.raises(Exception):
+        _get_model_info_helper(model="my-unmapped-model", custom_llm_provider="openai")
+
+    with patch("litellm.utils._get_potential_model_names") as mock_potential_names:
+        model_info = _get_model_info_helper(model="gpt-4o", custom_llm_provider=None)
+        with pytest.raises(Exception, match="This model isn't mapped yet"):
+            _get_model_info_helper(
+                model="my-unmapped-model", custom_llm_provider="openai"
+            )
+        mock_potential_names.assert_not_called()
+
+    assert model_info["key"] == "gpt-4o"
+    assert model_info["litellm_provider"] == "openai"
+
+
+def test_get_model_info_index_invalidated_by_register_model():
+    from litellm.utils import _get_model_info_helper
+
+    with pytest.raises(Exception):
+        _get_model_info_helper(
+            model="my-custom-indexed-model", custom_llm_provider="openai"
+        )
+
+    original_model_cost = litellm.model_cost
+    litellm.model_cost = dict(original_model_cost)
+    try:
+        litellm.register_model(
+            {
+                "openai/my-custom-indexed-model": {
+                    "input_cost_per_token": 1e-6,
+                    "output_cost_per_token": 2e-6,
+                    "litellm_provider": "openai",
+                    "mode": "chat",
+                }
+            }
+        )
+        model_info = _get_model_info_helper(
+            model="my-custom-indexed-model", custom_llm_provider="openai"
+        )
+        assert model_info["key"] == "openai/my-custom-indexed-model"
+        assert model_info["input_cost_per_token"] == 1e-6
+
+        # in-place price updates are picked up - only the key is indexed
+        litellm.model_cost["openai/my-custom-indexed-model"][
+            "input_cost_per_token"
+        ] = 3e-6
+        model_info = _get_model_info_helper(
+            model="my-custom-indexed-model", custom_llm_provider="openai"
+        )
+        assert model_info["input_cost_per_token"] == 3e-6
+    finally:
+        litellm.model_cost = original_model_cost
+
+
 if __name__ == "__main__":
     # Allow running this test file directly for debugging
     pytest.main([__file__, "-v"])